@@ -7,7 +7,7 @@ import uuid
 import warnings
 import weakref
 from hmac import compare_digest
-from typing import Callable, Coroutine, Optional, Pattern, Sequence, cast
+from typing import Callable, Coroutine, Dict, Optional, Pattern, Sequence, Tuple, cast
 
 import aiohttp_cors
 import jwt
@@ -35,6 +35,7 @@ from ..storage.error import StorageNotFoundError
 from ..transport.outbound.message import OutboundMessage
 from ..transport.outbound.status import OutboundSendStatus
 from ..transport.queue.basic import BasicMessageQueue
+from ..utils.crypto_executor import CryptoExecutor
 from ..utils.stats import Collector
 from ..utils.task_queue import TaskQueue
 from ..version import __version__
@@ -47,6 +48,8 @@ LOGGER = logging.getLogger(__name__)
 EVENT_PATTERN_WEBHOOK = re.compile("^acapy::webhook::(.*)$")
 EVENT_PATTERN_RECORD = re.compile("^acapy::record::([^:]*)(?:::.*)?$")
 
+WEBHOOK_BATCH_TOPIC = "batch"
+
 EVENT_WEBHOOK_MAPPING = {
     "acapy::basicmessage::received": "basicmessages",
     "acapy::problem_report": "problem_report",
@@ -267,6 +270,15 @@ class AdminServer(BaseAdminServer):
         self.root_profile = root_profile
         self.task_queue = task_queue
         self.webhook_router = webhook_router
+        self.webhook_batch_size = context.settings.get("admin.webhook_batch_size")
+        self.webhook_batch_window = context.settings.get(
+            "admin.webhook_batch_window", 1.0
+        )
+        # buffered webhook bodies and flush timers, by (endpoint, wallet id)
+        self._webhook_batches: Dict[Tuple[str, Optional[str]], list] = {}
+        self._webhook_batch_timers: Dict[
+            Tuple[str, Optional[str]], asyncio.TimerHandle
+        ] = {}
         self.websocket_queues = {}
         self.site = None
         self.multitenant_manager = context.inject_or(BaseMultitenantManager)
@@ -387,6 +399,25 @@ class AdminServer(BaseAdminServer):
 
             middlewares.append(check_multitenant_authorization)
 
+        crypto_executor = self.context.inject_or(CryptoExecutor)
+        if crypto_executor and crypto_executor.queue_limit:
+
+            @web.middleware
+            async def crypto_admission(request: web.Request, handler):
+                # queries are still served while credential operations are backed up
+                if (
+                    crypto_executor.saturated
+                    and request.method not in ("GET", "HEAD", "OPTIONS")
+                    and not is_unprotected_path(request.path)
+                ):
+                    raise web.HTTPServiceUnavailable(
+                        reason="Credential operation queue is full",
+                        headers={"Retry-After": "1"},
+                    )
+                return await handler(request)
+
+            middlewares.append(crypto_admission)
+
         @web.middleware
         async def setup_context(request: web.Request, handler):
             authorization_header = request.headers.get("Authorization")
@@ -581,6 +612,7 @@ class AdminServer(BaseAdminServer):
     async def stop(self) -> None:
         """Stop the webserver."""
         self.app._state["ready"] = False  # in case call does not come through OpenAPI
+        self.flush_webhook_batches()
         for queue in self.websocket_queues.values():
             queue.stop()
         if self.site:
@@ -897,13 +929,18 @@ class AdminServer(BaseAdminServer):
 
         if self.webhook_router:
             for endpoint in webhook_urls:
-                self.webhook_router(
-                    topic,
-                    payload,
-                    endpoint,
-                    None,
-                    metadata,
-                )
+                if self.webhook_batch_size:
+                    self._batch_webhook(
+                        endpoint, wallet_id, {"topic": topic, "payload": payload}
+                    )
+                else:
+                    self.webhook_router(
+                        topic,
+                        payload,
+                        endpoint,
+                        None,
+                        metadata,
+                    )
 
         # set ws webhook body, optionally add wallet id for multitenant mode
         webhook_body = {"topic": topic, "payload": payload}
@@ -913,3 +950,32 @@ class AdminServer(BaseAdminServer):
         for queue in self.websocket_queues.values():
             if queue.authenticated or topic in ("ping", "settings"):
                 await queue.enqueue(webhook_body)
+
+    def _batch_webhook(self, endpoint: str, wallet_id: Optional[str], body: dict):
+        """Buffer a webhook body for batched delivery to an endpoint."""
+        key = (endpoint, wallet_id)
+        batch = self._webhook_batches.setdefault(key, [])
+        batch.append(body)
+        if len(batch) >= self.webhook_batch_size:
+            self._flush_webhook_batch(key)
+        elif len(batch) == 1:
+            self._webhook_batch_timers[key] = asyncio.get_event_loop().call_later(
+                self.webhook_batch_window, self._flush_webhook_batch, key
+            )
+
+    def _flush_webhook_batch(self, key: Tuple[str, Optional[str]]):
+        """Send the buffered webhook bodies for an endpoint as a single webhook."""
+        timer = self._webhook_batch_timers.pop(key, None)
+        if timer:
+            timer.cancel()
+        batch = self._webhook_batches.pop(key, None)
+        if not batch:
+            return
+        endpoint, wallet_id = key
+        metadata = {"x-wallet-id": wallet_id} if wallet_id else None
+        self.webhook_router(WEBHOOK_BATCH_TOPIC, batch, endpoint, None, metadata)
+
+    def flush_webhook_batches(self):
+        """Send all buffered webhook batches."""
+        for key in list(self._webhook_batches):
+            self._flush_webhook_batch(key)
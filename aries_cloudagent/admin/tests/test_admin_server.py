@@ -1,3 +1,4 @@
+import asyncio
 import gc
 import json
 
@@ -13,6 +14,7 @@ from ...core.event_bus import Event
 from ...core.in_memory import InMemoryProfile
 from ...core.protocol_registry import ProtocolRegistry
 from ...core.goal_code_registry import GoalCodeRegistry
+from ...utils.crypto_executor import CryptoExecutor
 from ...utils.stats import Collector
 from ...utils.task_queue import TaskQueue
 
@@ -439,6 +441,35 @@ class TestAdminServer(IsolatedAsyncioTestCase):
             assert response.status == 200
         await server.stop()
 
+    async def test_visit_crypto_executor_saturated(self):
+        settings = {
+            "admin.admin_insecure_mode": True,
+        }
+        context = InjectionContext()
+        crypto_executor = CryptoExecutor(workers=1, queue_limit=1)
+        context.injector.bind_instance(CryptoExecutor, crypto_executor)
+        server = self.get_admin_server(settings, context)
+        await server.start()
+
+        crypto_executor._waiting["issue"] = 1
+        async with self.client_session.post(
+            f"http://127.0.0.1:{self.port}/status/reset", headers={}
+        ) as response:
+            assert response.status == 503
+            assert response.headers["Retry-After"] == "1"
+
+        async with self.client_session.get(
+            f"http://127.0.0.1:{self.port}/status", headers={}
+        ) as response:
+            assert response.status == 200
+
+        crypto_executor._waiting["issue"] = 0
+        async with self.client_session.post(
+            f"http://127.0.0.1:{self.port}/status/reset", headers={}
+        ) as response:
+            assert response.status == 200
+        await server.stop()
+
     async def test_server_health_state(self):
         settings = {
             "admin.admin_insecure_mode": True,
@@ -472,6 +503,91 @@ class TestAdminServer(IsolatedAsyncioTestCase):
             assert response.status == 503
         await server.stop()
 
+    async def test_send_webhook(self):
+        server = self.get_admin_server()
+        profile = InMemoryProfile.test_profile(
+            settings={"admin.webhook_urls": ["http://hook"], "wallet.id": "w1"}
+        )
+        await server.send_webhook(profile, "topic", {"a": 1})
+        assert self.webhook_results == [
+            ("topic", {"a": 1}, "http://hook", None, {"x-wallet-id": "w1"})
+        ]
+
+    async def test_send_webhook_batch_size(self):
+        server = self.get_admin_server(
+            {"admin.webhook_batch_size": 2, "admin.webhook_batch_window": 60}
+        )
+        profile = InMemoryProfile.test_profile(
+            settings={"admin.webhook_urls": ["http://hook1", "http://hook2"]}
+        )
+        await server.send_webhook(profile, "topic1", {"a": 1})
+        assert not self.webhook_results
+        await server.send_webhook(profile, "topic2", {"a": 2})
+
+        batch = [
+            {"topic": "topic1", "payload": {"a": 1}},
+            {"topic": "topic2", "payload": {"a": 2}},
+        ]
+        assert self.webhook_results == [
+            (test_module.WEBHOOK_BATCH_TOPIC, batch, "http://hook1", None, None),
+            (test_module.WEBHOOK_BATCH_TOPIC, batch, "http://hook2", None, None),
+        ]
+        assert not server._webhook_batches
+        assert not server._webhook_batch_timers
+
+    async def test_send_webhook_batch_window(self):
+        server = self.get_admin_server(
+            {"admin.webhook_batch_size": 100, "admin.webhook_batch_window": 0.01}
+        )
+        for wallet_id in ("w1", "w2", "w1"):
+            profile = InMemoryProfile.test_profile(
+                settings={"admin.webhook_urls": ["http://hook"], "wallet.id": wallet_id}
+            )
+            await server.send_webhook(profile, "topic", {"wallet": wallet_id})
+        assert not self.webhook_results
+
+        await asyncio.sleep(0.05)
+        # batches are kept separate per wallet, to send the wallet id header
+        assert sorted(self.webhook_results, key=lambda r: r[4]["x-wallet-id"]) == [
+            (
+                test_module.WEBHOOK_BATCH_TOPIC,
+                [
+                    {"topic": "topic", "payload": {"wallet": "w1"}},
+                    {"topic": "topic", "payload": {"wallet": "w1"}},
+                ],
+                "http://hook",
+                None,
+                {"x-wallet-id": "w1"},
+            ),
+            (
+                test_module.WEBHOOK_BATCH_TOPIC,
+                [{"topic": "topic", "payload": {"wallet": "w2"}}],
+                "http://hook",
+                None,
+                {"x-wallet-id": "w2"},
+            ),
+        ]
+
+    async def test_flush_webhook_batches(self):
+        server = self.get_admin_server(
+            {"admin.webhook_batch_size": 100, "admin.webhook_batch_window": 60}
+        )
+        profile = InMemoryProfile.test_profile(
+            settings={"admin.webhook_urls": ["http://hook"]}
+        )
+        await server.send_webhook(profile, "topic", {"a": 1})
+        server.flush_webhook_batches()
+        assert self.webhook_results == [
+            (
+                test_module.WEBHOOK_BATCH_TOPIC,
+                [{"topic": "topic", "payload": {"a": 1}}],
+                "http://hook",
+                None,
+                None,
+            )
+        ]
+        assert not server._webhook_batch_timers
+
 
 @pytest.fixture
 async def server():
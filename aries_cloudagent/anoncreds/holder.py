@@ -1,10 +1,10 @@
 """Indy holder implementation."""
 
-import asyncio
 import json
 import logging
 import re
 import uuid
+from functools import partial
 from typing import Dict, Optional, Sequence, Tuple, Union
 
 from anoncreds import (
@@ -22,7 +22,12 @@ from ..anoncreds.models.anoncreds_schema import AnonCredsSchema
 from ..askar.profile_anon import AskarAnoncredsProfile
 from ..core.error import BaseError
 from ..core.profile import Profile
+from ..indy.credential_search import (
+    UnknownReferentError,
+    search_credentials_by_referent,
+)
 from ..ledger.base import BaseLedger
+from ..utils.crypto_executor import OP_PROVE, OP_REVOCATION, run_crypto
 from ..wallet.error import WalletNotFoundError
 from .models.anoncreds_cred_def import CredDef
 
@@ -139,8 +144,9 @@ class AnonCredsHolder:
             (
                 cred_req,
                 cred_req_metadata,
-            ) = await asyncio.get_event_loop().run_in_executor(
-                None,
+            ) = await run_crypto(
+                self._profile,
+                OP_PROVE,
                 CredentialRequest.create,
                 None,
                 holder_did,
@@ -193,8 +199,9 @@ class AnonCredsHolder:
         try:
             secret = await self.get_master_secret()
             cred = Credential.load(credential_data)
-            cred_recvd = await asyncio.get_event_loop().run_in_executor(
-                None,
+            cred_recvd = await run_crypto(
+                self._profile,
+                OP_PROVE,
                 cred.process,
                 credential_request_metadata,
                 secret,
@@ -306,69 +313,35 @@ class AnonCredsHolder:
             extra_query: wql query dict
 
         """
-
         if not referents:
             referents = (
                 *presentation_request["requested_attributes"],
                 *presentation_request["requested_predicates"],
             )
-        extra_query = extra_query or {}
-
-        creds = {}
-
-        for reft in referents:
-            names = set()
-            if reft in presentation_request["requested_attributes"]:
-                attr = presentation_request["requested_attributes"][reft]
-                if "name" in attr:
-                    names.add(_normalize_attr_name(attr["name"]))
-                elif "names" in attr:
-                    names.update(_normalize_attr_name(name) for name in attr["names"])
-                # for name in names:
-                #     tag_filter[f"attr::{_normalize_attr_name(name)}::marker"] = "1"
-                restr = attr.get("restrictions")
-            elif reft in presentation_request["requested_predicates"]:
-                pred = presentation_request["requested_predicates"][reft]
-                if "name" in pred:
-                    names.add(_normalize_attr_name(pred["name"]))
-                # tag_filter[f"attr::{_normalize_attr_name(name)}::marker"] = "1"
-                restr = pred.get("restrictions")
-            else:
-                raise AnonCredsHolderError(
-                    f"Unknown presentation request referent: {reft}"
-                )
 
-            tag_filter = {"$exist": [f"attr::{name}::value" for name in names]}
-            if restr:
-                # FIXME check if restr is a list or dict? validate WQL format
-                tag_filter = {"$and": [tag_filter] + restr}
-            if extra_query:
-                tag_filter = {"$and": [tag_filter, extra_query]}
-
-            rows = self.profile.store.scan(
+        def scan(tag_filter: dict, offset: Optional[int], limit: Optional[int]):
+            return self.profile.store.scan(
                 CATEGORY_CREDENTIAL,
                 tag_filter,
-                start,
-                count,
+                offset,
+                limit,
                 self.profile.settings.get("wallet.askar_profile"),
             )
-            async for row in rows:
-                if row.name in creds:
-                    creds[row.name]["presentation_referents"].add(reft)
-                else:
-                    cred_info = _make_cred_info(
-                        row.name, Credential.load(row.raw_value)
-                    )
-                    creds[row.name] = {
-                        "cred_info": cred_info,
-                        "interval": presentation_request.get("non_revoked"),
-                        "presentation_referents": {reft},
-                    }
-
-        for cred in creds.values():
-            cred["presentation_referents"] = list(cred["presentation_referents"])
 
-        return list(creds.values())
+        try:
+            return await search_credentials_by_referent(
+                scan,
+                lambda cred_id, raw_value: _make_cred_info(
+                    cred_id, Credential.load(raw_value)
+                ),
+                presentation_request,
+                referents,
+                start,
+                count,
+                extra_query,
+            )
+        except UnknownReferentError as err:
+            raise AnonCredsHolderError(str(err)) from err
 
     async def get_credential(self, credential_id: str) -> str:
         """Get a credential stored in the wallet.
@@ -541,8 +514,9 @@ class AnonCredsHolder:
 
         try:
             secret = await self.get_master_secret()
-            presentation = await asyncio.get_event_loop().run_in_executor(
-                None,
+            presentation = await run_crypto(
+                self._profile,
+                OP_PROVE,
                 Presentation.create,
                 presentation_request,
                 present_creds,
@@ -583,8 +557,9 @@ class AnonCredsHolder:
         """
 
         try:
-            rev_state = await asyncio.get_event_loop().run_in_executor(
-                None,
+            rev_state = await run_crypto(
+                self._profile,
+                OP_REVOCATION,
                 CredentialRevocationState.create,
                 rev_reg_def,
                 rev_list,
@@ -594,3 +569,48 @@ class AnonCredsHolder:
         except AnoncredsError as err:
             raise AnonCredsHolderError("Error creating revocation state") from err
         return rev_state.to_json()
+
+    async def update_revocation_state(
+        self,
+        cred_rev_id: str,
+        rev_reg_def: dict,
+        rev_state: dict,
+        old_rev_list: dict,
+        rev_list: dict,
+        tails_file_path: str,
+    ) -> str:
+        """Update an existing revocation state for a received credential.
+
+        Only the witness changes between the two revocation lists are applied,
+        rather than computing the witness over the full tails file.
+
+        Args:
+            cred_rev_id: credential revocation id in revocation registry
+            rev_reg_def: revocation registry definition
+            rev_state: revocation state to update
+            old_rev_list: revocation list the state was created from
+            rev_list: revocation list to update the state to
+            tails_file_path: path to the local tails file
+
+        Returns:
+            the updated revocation state
+
+        """
+
+        try:
+            rev_state = await run_crypto(
+                self._profile,
+                OP_REVOCATION,
+                partial(
+                    CredentialRevocationState.create,
+                    rev_reg_def,
+                    rev_list,
+                    int(cred_rev_id),
+                    tails_file_path,
+                    rev_state=json.dumps(rev_state),
+                    old_rev_status_list=json.dumps(old_rev_list),
+                ),
+            )
+        except AnoncredsError as err:
+            raise AnonCredsHolderError("Error updating revocation state") from err
+        return rev_state.to_json()
@@ -1,7 +1,7 @@
 """anoncreds-rs issuer implementation."""
 
-import asyncio
 import logging
+from functools import partial
 from time import time
 from typing import Optional, Sequence
 
@@ -23,6 +23,7 @@ from ..askar.profile_anon import (
 from ..core.error import BaseError
 from ..core.event_bus import Event, EventBus
 from ..core.profile import Profile
+from ..utils.crypto_executor import OP_ISSUE, run_crypto
 from .base import (
     AnonCredsSchemaAlreadyExists,
     BaseAnonCredsError,
@@ -320,9 +321,11 @@ class AnonCredsIssuer:
             cred_def,
             cred_def_private,
             key_proof,
-        ) = await asyncio.get_event_loop().run_in_executor(
-            None,
-            lambda: CredentialDefinition.create(
+        ) = await run_crypto(
+            self._profile,
+            OP_ISSUE,
+            partial(
+                CredentialDefinition.create,
                 schema_id,
                 schema_result.schema.serialize(),
                 issuer_id,
@@ -618,15 +621,15 @@ class AnonCredsIssuer:
             raw_values[attribute] = str(credential_value)
 
         try:
-            credential = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: Credential.create(
-                    cred_def.raw_value,
-                    cred_def_private.raw_value,
-                    credential_offer,
-                    credential_request,
-                    raw_values,
-                ),
+            credential = await run_crypto(
+                self._profile,
+                OP_ISSUE,
+                Credential.create,
+                cred_def.raw_value,
+                cred_def_private.raw_value,
+                credential_offer,
+                credential_request,
+                raw_values,
             )
         except AnoncredsError as err:
             raise AnonCredsIssuerError("Error creating credential") from err
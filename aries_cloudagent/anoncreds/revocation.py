@@ -1,18 +1,16 @@
 """Revocation through ledger agnostic AnonCreds interface."""
 
 import asyncio
-import hashlib
-import http
 import json
 import logging
 import os
 import time
+from functools import partial
 from pathlib import Path
 from typing import List, NamedTuple, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 from uuid import uuid4
 
-import base58
 from anoncreds import (
     AnoncredsError,
     Credential,
@@ -22,7 +20,6 @@ from anoncreds import (
     RevocationStatusList,
 )
 from aries_askar.error import AskarError
-from requests import RequestException, Session
 
 from aries_cloudagent.anoncreds.models.anoncreds_cred_def import CredDef
 
@@ -34,6 +31,9 @@ from ..core.error import BaseError
 from ..core.event_bus import Event, EventBus
 from ..core.profile import Profile, ProfileSession
 from ..tails.base import BaseTailsServer
+from ..tails.error import TailsFetchError
+from ..tails.fetcher import fetch_tails
+from ..utils.crypto_executor import OP_ISSUE, OP_REVOCATION, run_crypto
 from .events import RevListFinishedEvent, RevRegDefFinishedEvent
 from .issuer import (
     CATEGORY_CRED_DEF,
@@ -49,6 +49,7 @@ from .models.anoncreds_revocation import (
     RevRegDefState,
 )
 from .registry import AnonCredsRegistry
+from .revocation_index import IssuanceRegistry, RevocationIndexAllocator
 from .util import indy_client_dir
 
 LOGGER = logging.getLogger(__name__)
@@ -181,9 +182,11 @@ class AnonCredsRevocation:
             (
                 rev_reg_def,
                 rev_reg_def_private,
-            ) = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: RevocationRegistryDefinition.create(
+            ) = await run_crypto(
+                self._profile,
+                OP_REVOCATION,
+                partial(
+                    RevocationRegistryDefinition.create,
                     cred_def_id,
                     cred_def.raw_value,
                     issuer_id,
@@ -636,42 +639,14 @@ class AnonCredsRevocation:
             rev_reg_def.value.tails_hash,
         )
 
-        tails_file_path = Path(self.get_local_tails_path(rev_reg_def))
-        tails_file_dir = tails_file_path.parent
-        if not tails_file_dir.exists():
-            tails_file_dir.mkdir(parents=True)
-
-        buffer_size = 65536  # should be multiple of 32 bytes for sha256
-        file_hasher = hashlib.sha256()
-        with open(tails_file_path, "wb", buffer_size) as tails_file:
-            with Session() as req_session:
-                try:
-                    resp = req_session.get(
-                        rev_reg_def.value.tails_location, stream=True
-                    )
-                    # Should this directly raise an Error?
-                    if resp.status_code != http.HTTPStatus.OK:
-                        LOGGER.warning(
-                            f"Unexpected status code for tails file: {resp.status_code}"
-                        )
-                    for buf in resp.iter_content(chunk_size=buffer_size):
-                        tails_file.write(buf)
-                        file_hasher.update(buf)
-                except RequestException as rx:
-                    raise AnonCredsRevocationError(f"Error retrieving tails file: {rx}")
-
-        download_tails_hash = base58.b58encode(file_hasher.digest()).decode("utf-8")
-        if download_tails_hash != rev_reg_def.value.tails_hash:
-            try:
-                os.remove(tails_file_path)
-            except OSError as err:
-                LOGGER.warning(f"Could not delete invalid tails file: {err}")
-
-            raise AnonCredsRevocationError(
-                "The hash of the downloaded tails file does not match."
+        try:
+            return await fetch_tails(
+                rev_reg_def.value.tails_location,
+                rev_reg_def.value.tails_hash,
+                self.get_local_tails_path(rev_reg_def),
             )
-
-        return str(tails_file_path)
+        except TailsFetchError as err:
+            raise AnonCredsRevocationError(err.roll_up) from err
 
     def _check_url(self, url) -> None:
         parsed = urlparse(url)
@@ -887,6 +862,44 @@ class AnonCredsRevocation:
 
     # Credential Operations
 
+    async def _get_issuance_registry(
+        self, allocator: RevocationIndexAllocator, rev_reg_def_id: str
+    ) -> IssuanceRegistry:
+        """Load a revocation registry definition and private key for issuance."""
+        registry = allocator.get_registry(rev_reg_def_id)
+        if registry:
+            return registry
+
+        try:
+            async with self.profile.session() as session:
+                rev_reg_def = await session.handle.fetch(
+                    CATEGORY_REV_REG_DEF, rev_reg_def_id
+                )
+                rev_key = await session.handle.fetch(
+                    CATEGORY_REV_REG_DEF_PRIVATE, rev_reg_def_id
+                )
+        except AskarError as err:
+            raise AnonCredsRevocationError(
+                "Error retrieving revocation registry definition"
+            ) from err
+        if not rev_reg_def:
+            raise AnonCredsRevocationError("Revocation registry definition not found")
+        if not rev_key:
+            raise AnonCredsRevocationError(
+                "Revocation registry definition private data not found"
+            )
+        try:
+            registry = IssuanceRegistry(
+                RevocationRegistryDefinition.load(rev_reg_def.raw_value),
+                bytes(rev_key.raw_value),
+            )
+        except AnoncredsError as err:
+            raise AnonCredsRevocationError(
+                "Error loading revocation registry definition"
+            ) from err
+        allocator.set_registry(rev_reg_def_id, registry)
+        return registry
+
     async def _create_credential(
         self,
         credential_definition_id: str,
@@ -929,64 +942,60 @@ class AnonCredsRevocation:
             raw_values[attribute] = str(credential_value)
 
         if rev_reg_def_id and tails_file_path:
+            allocator = RevocationIndexAllocator.for_profile(self.profile)
+            registry = await self._get_issuance_registry(allocator, rev_reg_def_id)
             try:
-                async with self.profile.transaction() as txn:
-                    rev_list = await txn.handle.fetch(CATEGORY_REV_LIST, rev_reg_def_id)
-                    rev_reg_def = await txn.handle.fetch(
-                        CATEGORY_REV_REG_DEF, rev_reg_def_id
-                    )
-                    rev_key = await txn.handle.fetch(
-                        CATEGORY_REV_REG_DEF_PRIVATE, rev_reg_def_id
+                async with self.profile.session() as session:
+                    rev_list_entry = await session.handle.fetch(
+                        CATEGORY_REV_LIST, rev_reg_def_id
                     )
-                    if not rev_list:
-                        raise AnonCredsRevocationError("Revocation registry not found")
-                    if not rev_reg_def:
-                        raise AnonCredsRevocationError(
-                            "Revocation registry definition not found"
-                        )
-                    if not rev_key:
-                        raise AnonCredsRevocationError(
-                            "Revocation registry definition private data not found"
-                        )
-                    # NOTE: we increment the index ahead of time to keep the
-                    # transaction short. The revocation registry itself will NOT
-                    # be updated because we always use ISSUANCE_BY_DEFAULT.
-                    # If something goes wrong later, the index will be skipped.
-                    # FIXME - double check issuance type in case of upgraded wallet?
-                    rev_info = rev_list.value_json
-                    rev_info_tags = rev_list.tags
-                    rev_reg_index = rev_info["next_index"]
-                    try:
-                        rev_reg_def = RevocationRegistryDefinition.load(
-                            rev_reg_def.raw_value
-                        )
-                        rev_list = RevocationStatusList.load(rev_info["rev_list"])
-                    except AnoncredsError as err:
-                        raise AnonCredsRevocationError(
-                            "Error loading revocation registry definition"
-                        ) from err
-                    if rev_reg_index > rev_reg_def.max_cred_num:
-                        raise AnonCredsRevocationRegistryFullError(
-                            "Revocation registry is full"
-                        )
-                    rev_info["next_index"] = rev_reg_index + 1
-                    await txn.handle.replace(
-                        CATEGORY_REV_LIST,
-                        rev_reg_def_id,
-                        value_json=rev_info,
-                        tags=rev_info_tags,
+            except AskarError as err:
+                raise AnonCredsRevocationError(
+                    "Error retrieving revocation list"
+                ) from err
+            if not rev_list_entry:
+                raise AnonCredsRevocationError("Revocation registry not found")
+            rev_list = allocator.get_status_list(rev_reg_def_id, rev_list_entry.value)
+            if not rev_list:
+                try:
+                    rev_list = RevocationStatusList.load(
+                        rev_list_entry.value_json["rev_list"]
                     )
-                    await txn.commit()
+                except AnoncredsError as err:
+                    raise AnonCredsRevocationError(
+                        "Error loading revocation registry definition"
+                    ) from err
+                allocator.set_status_list(
+                    rev_reg_def_id, rev_list_entry.value, rev_list
+                )
+
+            # NOTE: the index is allocated ahead of time, from a block reserved by
+            # this worker, to keep the revocation list record out of issuance.
+            # The revocation registry itself will NOT be updated because we always
+            # use ISSUANCE_BY_DEFAULT. If something goes wrong later, the index
+            # will be skipped.
+            # FIXME - double check issuance type in case of upgraded wallet?
+            try:
+                rev_reg_index = await allocator.allocate(
+                    self.profile,
+                    rev_reg_def_id,
+                    registry.rev_reg_def.max_cred_num,
+                    lambda: rev_list_entry.value_json["next_index"],
+                )
             except AskarError as err:
                 raise AnonCredsRevocationError(
                     "Error updating revocation registry index"
                 ) from err
+            if rev_reg_index is None:
+                raise AnonCredsRevocationRegistryFullError(
+                    "Revocation registry is full"
+                )
 
-            # rev_info["next_index"] is 1 based but getting from
+            # next_index is 1 based but getting from
             # rev_list is zero based...
             revoc = CredentialRevocationConfig(
-                rev_reg_def,
-                rev_key.raw_value,
+                registry.rev_reg_def,
+                registry.rev_key,
                 rev_list,
                 rev_reg_index,
             )
@@ -997,17 +1006,17 @@ class AnonCredsRevocation:
             rev_list = None
 
         try:
-            credential = await asyncio.get_event_loop().run_in_executor(
+            credential = await run_crypto(
+                self._profile,
+                OP_ISSUE,
+                Credential.create,
+                cred_def.raw_value,
+                cred_def_private.raw_value,
+                credential_offer,
+                credential_request,
+                raw_values,
                 None,
-                lambda: Credential.create(
-                    cred_def.raw_value,
-                    cred_def_private.raw_value,
-                    credential_offer,
-                    credential_request,
-                    raw_values,
-                    None,
-                    revoc,
-                ),
+                revoc,
             )
         except AnoncredsError as err:
             raise AnonCredsRevocationError("Error creating credential") from err
@@ -1141,6 +1150,9 @@ class AnonCredsRevocation:
                     rev_reg_def_private_entry = await session.handle.fetch(
                         CATEGORY_REV_REG_DEF_PRIVATE, revoc_reg_id
                     )
+                    next_index = await RevocationIndexAllocator.get_next_index(
+                        session, revoc_reg_id
+                    )
             except AskarError as err:
                 raise AnonCredsRevocationError(
                     "Error retrieving revocation registry"
@@ -1198,6 +1210,8 @@ class AnonCredsRevocation:
             rev_info = rev_list_entry.value_json
             cred_revoc_ids = (rev_info["pending"] or []) + (additional_crids or [])
             rev_list = RevList.deserialize(rev_info["rev_list"])
+            if next_index is None:
+                next_index = rev_info["next_index"]
 
             for rev_id in cred_revoc_ids:
                 if rev_id < 1 or rev_id > max_cred_num:
@@ -1208,7 +1222,7 @@ class AnonCredsRevocation:
                         rev_id,
                     )
                     failed_crids.add(rev_id)
-                elif rev_id >= rev_info["next_index"]:
+                elif rev_id >= next_index:
                     LOGGER.warn(
                         "Skipping requested credential revocation"
                         "on rev reg id %s, cred rev id=%s not yet issued",
@@ -1237,9 +1251,11 @@ class AnonCredsRevocation:
             rev_crids = rev_crids - skipped_crids
 
             try:
-                updated_list = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: rev_list.to_native().update(
+                updated_list = await run_crypto(
+                    self._profile,
+                    OP_REVOCATION,
+                    partial(
+                        rev_list.to_native().update,
                         cred_def=cred_def.to_native(),
                         rev_reg_def=rev_reg_def.to_native(),
                         rev_reg_def_private=rev_reg_def_private,
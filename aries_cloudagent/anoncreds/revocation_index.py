@@ -0,0 +1,299 @@
+"""Block allocation of credential revocation indexes for issuance."""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from uuid import uuid4
+from weakref import WeakKeyDictionary, WeakSet, ref
+
+from anoncreds import RevocationRegistryDefinition, RevocationStatusList
+
+from ..core.event_bus import Event, EventBus
+from ..core.profile import Profile
+from ..core.util import SHUTDOWN_EVENT_PATTERN
+
+LOGGER = logging.getLogger(__name__)
+
+CATEGORY_REV_LIST_INDEX = "revocation_list_index"
+
+DEFAULT_BLOCK_SIZE = 1
+MAX_CACHED_REGISTRIES = 16
+
+
+class IssuanceRegistry(NamedTuple):
+    """A revocation registry loaded for issuing credentials."""
+
+    rev_reg_def: RevocationRegistryDefinition
+    rev_key: bytes
+
+
+class RevocationIndexAllocator:
+    """Allocate credential revocation indexes for a single wallet.
+
+    The next free index of each revocation registry is stored in its own
+    record, apart from the revocation list. Each allocator is a worker with a
+    unique id which reserves a block of indexes at a time in one transaction,
+    then hands them out from memory. The reservation is recorded against the
+    worker id, so that indexes are never handed out twice:
+
+    - when a block is used up, the reservation is removed; a block of a
+      single index is handed out right away and never recorded
+    - when the worker is released, the unused indexes are returned if no
+      block was reserved after them, otherwise they are recorded as skipped
+    - when a worker stops without being released, its last reservation is
+      left in place and those indexes are treated as issued
+
+    Profiles opened for the same wallet, such as the profiles created for an
+    Askar profile subwallet, share one allocator.
+
+    The loaded registry definitions and private keys, and the last revocation
+    status list loaded for each registry, are kept for reuse across credentials.
+    """
+
+    _allocators: (
+        "WeakKeyDictionary[Any, Dict[Optional[str], RevocationIndexAllocator]]"
+    ) = WeakKeyDictionary()
+    _event_buses: "WeakSet[EventBus]" = WeakSet()
+
+    def __init__(self, block_size: int = DEFAULT_BLOCK_SIZE):
+        """Initialize the allocator instance.
+
+        Args:
+            block_size: the number of indexes to reserve at a time
+
+        """
+        self.block_size = max(1, block_size)
+        self.worker_id = uuid4().hex
+        self._profile: Optional[ref] = None
+        self._blocks: Dict[str, List[int]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._registries: "OrderedDict[str, IssuanceRegistry]" = OrderedDict()
+        self._status_lists: "OrderedDict[str, Tuple[bytes, RevocationStatusList]]" = (
+            OrderedDict()
+        )
+
+    @staticmethod
+    def _wallet_key(profile: Profile) -> Tuple[Any, Optional[str]]:
+        """Get the opened store, or the profile itself, and the Askar profile id."""
+        return (
+            getattr(profile, "opened", None) or profile,
+            getattr(profile, "profile_id", None),
+        )
+
+    @classmethod
+    def for_profile(cls, profile: Profile) -> "RevocationIndexAllocator":
+        """Get the index allocator for the wallet of a profile."""
+        owner, profile_id = cls._wallet_key(profile)
+        allocators = cls._allocators.get(owner)
+        allocator = allocators and allocators.get(profile_id)
+        if allocator is None:
+            block_size = profile.settings.get(
+                "revocation.anoncreds_index_block_size", DEFAULT_BLOCK_SIZE
+            )
+            allocator = cls(int(block_size))
+            cls._allocators.setdefault(owner, {})[profile_id] = allocator
+            event_bus = profile.inject_or(EventBus)
+            if event_bus and event_bus not in cls._event_buses:
+                event_bus.subscribe(SHUTDOWN_EVENT_PATTERN, cls.on_shutdown)
+                cls._event_buses.add(event_bus)
+        # the last profile opened for the wallet is used to release it
+        allocator._profile = ref(profile)
+        return allocator
+
+    @classmethod
+    async def on_shutdown(cls, profile: Profile, event: Event):
+        """Release the unused indexes of every allocator."""
+        allocators = [
+            allocator
+            for wallet_allocators in list(cls._allocators.values())
+            for allocator in wallet_allocators.values()
+        ]
+        for allocator in allocators:
+            alloc_profile = allocator._profile and allocator._profile()
+            if not alloc_profile:
+                continue
+            try:
+                await allocator.release(alloc_profile)
+            except Exception:
+                LOGGER.exception("Error releasing reserved revocation indexes")
+
+    @staticmethod
+    async def get_next_index(session, rev_reg_def_id: str) -> Optional[int]:
+        """Get the next revocation index not yet reserved for a registry.
+
+        Returns:
+            The next index, or None if no index has been allocated through an
+            allocator, in which case it is kept in the revocation list record
+
+        """
+        entry = await session.handle.fetch(CATEGORY_REV_LIST_INDEX, rev_reg_def_id)
+        return entry.value_json["next_index"] if entry else None
+
+    def get_registry(self, rev_reg_def_id: str) -> Optional[IssuanceRegistry]:
+        """Fetch the loaded registry definition and private key, if cached."""
+        registry = self._registries.get(rev_reg_def_id)
+        if registry:
+            self._registries.move_to_end(rev_reg_def_id)
+        return registry
+
+    def set_registry(self, rev_reg_def_id: str, registry: IssuanceRegistry):
+        """Cache the loaded registry definition and private key."""
+        self._registries[rev_reg_def_id] = registry
+        self._registries.move_to_end(rev_reg_def_id)
+        while len(self._registries) > MAX_CACHED_REGISTRIES:
+            self._registries.popitem(last=False)
+
+    def get_status_list(
+        self, rev_reg_def_id: str, raw: bytes
+    ) -> Optional[RevocationStatusList]:
+        """Fetch the loaded revocation status list, if cached for the same value."""
+        cached = self._status_lists.get(rev_reg_def_id)
+        if cached and cached[0] == raw:
+            self._status_lists.move_to_end(rev_reg_def_id)
+            return cached[1]
+        return None
+
+    def set_status_list(
+        self, rev_reg_def_id: str, raw: bytes, status_list: RevocationStatusList
+    ):
+        """Cache the loaded revocation status list for the stored value."""
+        self._status_lists[rev_reg_def_id] = (raw, status_list)
+        self._status_lists.move_to_end(rev_reg_def_id)
+        while len(self._status_lists) > MAX_CACHED_REGISTRIES:
+            self._status_lists.popitem(last=False)
+
+    async def allocate(
+        self,
+        profile: Profile,
+        rev_reg_def_id: str,
+        max_cred_num: int,
+        initial_index: Callable[[], int],
+    ) -> Optional[int]:
+        """Allocate the next revocation index of a registry.
+
+        Args:
+            profile: the profile holding the registry
+            rev_reg_def_id: the revocation registry definition identifier
+            max_cred_num: the capacity of the registry
+            initial_index: get the next index from the revocation list record,
+                for a registry with no index record yet
+
+        Returns:
+            The revocation index, or None if the registry is full
+
+        """
+        lock = self._locks.setdefault(rev_reg_def_id, asyncio.Lock())
+        async with lock:
+            block = self._blocks.pop(rev_reg_def_id, None)
+            if block:
+                index = block[0]
+                block[0] += 1
+                if block[0] < block[1]:
+                    self._blocks[rev_reg_def_id] = block
+                else:
+                    await self._clear_reservation(profile, rev_reg_def_id)
+                return index
+            block = await self._reserve(
+                profile, rev_reg_def_id, max_cred_num, initial_index
+            )
+            if not block:
+                return None
+            index = block[0]
+            block[0] += 1
+            if block[0] < block[1]:
+                self._blocks[rev_reg_def_id] = block
+            return index
+
+    async def _reserve(
+        self,
+        profile: Profile,
+        rev_reg_def_id: str,
+        max_cred_num: int,
+        initial_index: Callable[[], int],
+    ) -> Optional[List[int]]:
+        async with profile.transaction() as txn:
+            entry = await txn.handle.fetch(
+                CATEGORY_REV_LIST_INDEX, rev_reg_def_id, for_update=True
+            )
+            if entry:
+                info = entry.value_json
+            else:
+                info = {
+                    "next_index": initial_index(),
+                    "reserved": {},
+                    "skipped": [],
+                }
+            start = info["next_index"]
+            if start > max_cred_num:
+                return None
+            end = min(start + self.block_size, max_cred_num + 1)
+            info["next_index"] = end
+            if end - start > 1:
+                info["reserved"][self.worker_id] = [start, end]
+            else:
+                info["reserved"].pop(self.worker_id, None)
+            if entry:
+                await txn.handle.replace(
+                    CATEGORY_REV_LIST_INDEX, rev_reg_def_id, value_json=info
+                )
+            else:
+                await txn.handle.insert(
+                    CATEGORY_REV_LIST_INDEX, rev_reg_def_id, value_json=info
+                )
+            await txn.commit()
+        return [start, end]
+
+    async def _clear_reservation(self, profile: Profile, rev_reg_def_id: str):
+        async with profile.transaction() as txn:
+            entry = await txn.handle.fetch(
+                CATEGORY_REV_LIST_INDEX, rev_reg_def_id, for_update=True
+            )
+            if not entry:
+                return
+            info = entry.value_json
+            if info["reserved"].pop(self.worker_id, None) is not None:
+                await txn.handle.replace(
+                    CATEGORY_REV_LIST_INDEX, rev_reg_def_id, value_json=info
+                )
+                await txn.commit()
+
+    async def release(self, profile: Profile, rev_reg_def_id: Optional[str] = None):
+        """Give up the unused indexes reserved by this worker.
+
+        Args:
+            profile: the profile holding the registries
+            rev_reg_def_id: the registry to release, or None for all of them
+
+        """
+        ids = [rev_reg_def_id] if rev_reg_def_id else list(self._blocks)
+        for reg_id in ids:
+            lock = self._locks.setdefault(reg_id, asyncio.Lock())
+            async with lock:
+                block = self._blocks.pop(reg_id, None)
+                if not block:
+                    continue
+                async with profile.transaction() as txn:
+                    entry = await txn.handle.fetch(
+                        CATEGORY_REV_LIST_INDEX, reg_id, for_update=True
+                    )
+                    if not entry:
+                        continue
+                    info = entry.value_json
+                    info["reserved"].pop(self.worker_id, None)
+                    unused, end = block
+                    if unused < end:
+                        if info["next_index"] == end:
+                            info["next_index"] = unused
+                        else:
+                            info["skipped"].append([unused, end])
+                            LOGGER.info(
+                                "Skipping unused revocation indexes %s-%s on %s",
+                                unused,
+                                end - 1,
+                                reg_id,
+                            )
+                    await txn.handle.replace(
+                        CATEGORY_REV_LIST_INDEX, reg_id, value_json=info
+                    )
+                    await txn.commit()
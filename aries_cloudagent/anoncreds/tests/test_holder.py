@@ -654,3 +654,38 @@ class TestAnonCredsHolder(IsolatedAsyncioTestCase):
                 rev_list={"accum": "1"},
                 tails_file_path="/tmp/some.tails",
             )
+
+    @mock.patch.object(CredentialRevocationState, "create")
+    async def test_update_revocation_state(self, mock_create):
+        mock_create.return_value = mock.MagicMock(
+            to_json=mock.MagicMock(return_value='{"timestamp": 2}')
+        )
+        result = await self.holder.update_revocation_state(
+            cred_rev_id="1",
+            rev_reg_def={"def": 1},
+            rev_state={"timestamp": 1},
+            old_rev_list={"accum": "1"},
+            rev_list={"accum": "2"},
+            tails_file_path="/tmp/some.tails",
+        )
+        assert json.loads(result) == {"timestamp": 2}
+        mock_create.assert_called_once_with(
+            {"def": 1},
+            {"accum": "2"},
+            1,
+            "/tmp/some.tails",
+            rev_state='{"timestamp": 1}',
+            old_rev_status_list='{"accum": "1"}',
+        )
+
+        # error
+        mock_create.side_effect = AnoncredsError(AnoncredsErrorCode.UNEXPECTED, "test")
+        with self.assertRaises(AnonCredsHolderError):
+            await self.holder.update_revocation_state(
+                cred_rev_id="1",
+                rev_reg_def={"def": 1},
+                rev_state={"timestamp": 1},
+                old_rev_list={"accum": "1"},
+                rev_list={"accum": "2"},
+                tails_file_path="/tmp/some.tails",
+            )
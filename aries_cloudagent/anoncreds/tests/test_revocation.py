@@ -1,6 +1,4 @@
-import http
 import json
-import os
 from unittest import IsolatedAsyncioTestCase
 
 import pytest
@@ -13,7 +11,6 @@ from anoncreds import (
     Schema,
 )
 from aries_askar import AskarError, AskarErrorCode
-from requests import RequestException, Session
 
 from aries_cloudagent.anoncreds.issuer import AnonCredsIssuer
 from aries_cloudagent.anoncreds.models.anoncreds_cred_def import CredDef
@@ -31,6 +28,7 @@ from aries_cloudagent.anoncreds.models.anoncreds_schema import (
     GetSchemaResult,
 )
 from aries_cloudagent.anoncreds.registry import AnonCredsRegistry
+from aries_cloudagent.anoncreds.revocation_index import CATEGORY_REV_LIST_INDEX
 from aries_cloudagent.anoncreds.tests.mock_objects import (
     MOCK_REV_REG_DEF,
 )
@@ -43,6 +41,7 @@ from aries_cloudagent.core.in_memory.profile import (
     InMemoryProfile,
     InMemoryProfileSession,
 )
+from aries_cloudagent.tails.error import TailsFetchError
 from aries_cloudagent.tests import mock
 
 from .. import revocation as test_module
@@ -794,55 +793,23 @@ class TestAnonCredsRevocation(IsolatedAsyncioTestCase):
         with self.assertRaises(test_module.AnonCredsRevocationError):
             await self.revocation.get_revocation_lists_with_pending_revocations()
 
-    @mock.patch.object(Session, "get")
-    @mock.patch.object(os, "remove")
-    async def test_retrieve_tails(self, mock_remove, mock_get):
-        class MockResponse:
-            def __init__(self, status=http.HTTPStatus.OK):
-                self.status_code = status
-
-            def iter_content(self, chunk_size: int = 1):
-                yield b"tails-hash"
-
-        mock_get.side_effect = [
-            MockResponse(),
-            MockResponse(),
-            RequestException(request=mock.AsyncMock(), response=mock.AsyncMock()),
-            MockResponse(status=http.HTTPStatus.BAD_REQUEST),
-        ]
-
+    @mock.patch.object(test_module, "fetch_tails")
+    async def test_retrieve_tails(self, mock_fetch):
+        mock_fetch.return_value = "tails-path"
         result = await self.revocation.retrieve_tails(rev_reg_def)
 
-        assert isinstance(result, str)
-        assert mock_get.call_count == 1
-
-        # tails hash does not match
-        with self.assertRaises(test_module.AnonCredsRevocationError):
-            await self.revocation.retrieve_tails(
-                RevRegDef(
-                    tag="tag",
-                    cred_def_id="CsQY9MGeD3CQP4EyuVFo5m:3:CL:14951:MYCO_Biomarker",
-                    value=RevRegDefValue(
-                        max_cred_num=100,
-                        public_keys={
-                            "accum_key": {"z": "1 0BB...386"},
-                        },
-                        tails_hash="not-correct-hash",
-                        tails_location="http://tails-server.com",
-                    ),
-                    issuer_id="CsQY9MGeD3CQP4EyuVFo5m",
-                    type="CL_ACCUM",
-                )
-            )
-            assert mock_remove.call_count == 1
+        assert result == "tails-path"
+        mock_fetch.assert_called_once_with(
+            rev_reg_def.value.tails_location,
+            rev_reg_def.value.tails_hash,
+            self.revocation.get_local_tails_path(rev_reg_def),
+        )
 
-        # http request fails
+        # download or hash check fails
+        mock_fetch.side_effect = TailsFetchError("failed")
         with self.assertRaises(test_module.AnonCredsRevocationError):
             await self.revocation.retrieve_tails(rev_reg_def)
 
-        # doesn't crash on non 200 response
-        await self.revocation.retrieve_tails(rev_reg_def)
-
     def test_generate_public_tails_uri(self):
         self.revocation.generate_public_tails_uri(rev_reg_def)
 
@@ -856,7 +823,8 @@ class TestAnonCredsRevocation(IsolatedAsyncioTestCase):
         with self.assertRaises(test_module.AnonCredsRevocationError):
             self.revocation.generate_public_tails_uri(rev_reg_def)
 
-    async def test_upload_tails_file(self):
+    @mock.patch.object(test_module.Path, "is_file", return_value=True)
+    async def test_upload_tails_file(self, _):
         self.profile.inject_or = mock.Mock(
             return_value=mock.MagicMock(
                 upload_tails_file=mock.CoroutineMock(
@@ -1090,62 +1058,77 @@ class TestAnonCredsRevocation(IsolatedAsyncioTestCase):
                 tails_file_path="tails-file-path",
             )
 
-        # missing rev list
-        mock_handle.fetch = mock.CoroutineMock(
-            side_effect=[MockEntry(), MockEntry(), None, MockEntry(), MockEntry()]
-        )
-        with self.assertRaises(test_module.AnonCredsRevocationError):
-            await call_test_func()
         # missing rev def
         mock_handle.fetch = mock.CoroutineMock(
-            side_effect=[MockEntry(), MockEntry(), MockEntry(), None, MockEntry()]
+            side_effect=[MockEntry(), MockEntry(), None, MockEntry()]
         )
         with self.assertRaises(test_module.AnonCredsRevocationError):
             await call_test_func()
         # missing rev key
         mock_handle.fetch = mock.CoroutineMock(
-            side_effect=[MockEntry(), MockEntry(), MockEntry(), MockEntry(), None]
+            side_effect=[MockEntry(), MockEntry(), MockEntry(), None]
         )
         with self.assertRaises(test_module.AnonCredsRevocationError):
             await call_test_func()
-
-        # valid
-        mock_handle.replace = mock.CoroutineMock(return_value=None)
+        # missing rev list
         mock_handle.fetch = mock.CoroutineMock(
             side_effect=[
                 MockEntry(),
                 MockEntry(),
-                MockEntry(
-                    value_json={
-                        "rev_list": rev_list.serialize(),
-                        "next_index": 0,
-                    }
-                ),
                 MockEntry(raw_value=rev_reg_def.serialize()),
-                MockEntry(),
+                MockEntry(raw_value=b"rev-key"),
+                None,
             ]
         )
+        with self.assertRaises(test_module.AnonCredsRevocationError):
+            await call_test_func()
+
+        # valid, with the registry definition and key loaded before
+        rev_list_entry = MockEntry(
+            value_json={
+                "rev_list": rev_list.serialize(),
+                "next_index": 1,
+            }
+        )
+        mock_handle.insert = mock.CoroutineMock(return_value=None)
+        mock_handle.fetch = mock.CoroutineMock(
+            side_effect=[MockEntry(), MockEntry(), rev_list_entry, None]
+        )
         await call_test_func()
         assert mock_create.called
-        assert mock_handle.replace.called
-        assert mock_handle.fetch.call_count == 5
+        assert mock_handle.insert.call_args.args[0] == (CATEGORY_REV_LIST_INDEX)
+        assert mock_handle.insert.call_args.kwargs["value_json"]["next_index"] == 2
+        assert mock_config.call_args.args[1] == b"rev-key"
+        assert mock_config.call_args.args[3] == 1
+        assert mock_handle.fetch.call_count == 4
+        assert mock_load_rev_reg_def.call_count == 1
+
+        # the loaded revocation list is reused while unchanged
+        with mock.patch.object(RevocationStatusList, "load") as mock_load_rev_list:
+            mock_handle.replace = mock.CoroutineMock(return_value=None)
+            mock_handle.fetch = mock.CoroutineMock(
+                side_effect=[
+                    MockEntry(),
+                    MockEntry(),
+                    rev_list_entry,
+                    MockEntry(value_json={"next_index": 2, "reserved": {}}),
+                ]
+            )
+            await call_test_func()
+            assert not mock_load_rev_list.called
+        assert mock_handle.replace.call_args.kwargs["value_json"]["next_index"] == 3
+        assert mock_config.call_args.args[3] == 2
 
         # revocation registry is full
         mock_handle.fetch = mock.CoroutineMock(
             side_effect=[
                 MockEntry(),
                 MockEntry(),
-                MockEntry(
-                    value_json={
-                        "rev_list": rev_list.serialize(),
-                        "next_index": 101,
-                    }
-                ),
-                MockEntry(raw_value=rev_reg_def.serialize()),
-                MockEntry(),
+                rev_list_entry,
+                MockEntry(value_json={"next_index": 101, "reserved": {}}),
             ]
         )
-        with self.assertRaises(test_module.AnonCredsRevocationError):
+        with self.assertRaises(test_module.AnonCredsRevocationRegistryFullError):
             await call_test_func()
 
     @mock.patch.object(
@@ -1224,14 +1207,17 @@ class TestAnonCredsRevocation(IsolatedAsyncioTestCase):
                 None,
                 MockEntry(value_json=json.dumps({})),
                 MockEntry(value_json=json.dumps({})),
+                None,
                 # missing rev list
                 MockEntry(value_json=json.dumps({})),
                 None,
                 MockEntry(value_json=json.dumps({})),
+                None,
                 # missing rev private
                 MockEntry(value_json=json.dumps({})),
                 MockEntry(value_json=json.dumps({})),
                 None,
+                None,
             ]
         )
 
@@ -1261,23 +1247,25 @@ class TestAnonCredsRevocation(IsolatedAsyncioTestCase):
             side_effect=[
                 # rev_reg_def_entry
                 MockEntry(value_json=MOCK_REV_REG_DEF),
-                # rev_list_entry
+                # rev_list_entry, with the next index kept apart
                 MockEntry(
                     value_json={
                         "pending": [0, 1, 4, 3],
-                        "next_index": 4,
+                        "next_index": 1,
                         "rev_list": rev_list.serialize(),
                     }
                 ),
                 # private rev reg def
                 MockEntry(),
+                # rev list index
+                MockEntry(value_json={"next_index": 4}),
                 # cred def
                 MockEntry(),
                 # updated rev list entry
                 MockEntry(
                     value_json={
                         "pending": [0, 1, 4, 3],
-                        "next_index": 4,
+                        "next_index": 1,
                         "rev_list": rev_list.serialize(),
                     },
                     tags={"pending": []},
@@ -1290,7 +1278,7 @@ class TestAnonCredsRevocation(IsolatedAsyncioTestCase):
             revoc_reg_id="test-rev-reg-id",
         )
 
-        assert mock_handle.fetch.call_count == 5
+        assert mock_handle.fetch.call_count == 6
         assert mock_handle.replace.called
         assert mock_rev_list_from_native.called
         assert mock_rev_list_to_native.called
@@ -1298,6 +1286,8 @@ class TestAnonCredsRevocation(IsolatedAsyncioTestCase):
         assert mock_load_rev_reg.called
         assert mock_deserialize_cred_def.called
         assert isinstance(result, test_module.RevokeResult)
+        assert result.revoked == [3]
+        assert result.failed == ["0", "1", "4"]
 
     @mock.patch.object(InMemoryProfileSession, "handle")
     async def test_mark_pending_revocations(self, mock_handle):
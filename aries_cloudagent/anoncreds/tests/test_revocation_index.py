@@ -0,0 +1,177 @@
+from unittest import IsolatedAsyncioTestCase
+
+import pytest
+
+from ...askar.profile_anon import AskarAnoncredsProfile, AskarAnonProfileManager
+from ...config.injection_context import InjectionContext
+from ...core.event_bus import Event, EventBus
+from ...core.util import SHUTDOWN_EVENT_TOPIC
+from ...tests import mock
+from .. import revocation_index as test_module
+from ..revocation_index import CATEGORY_REV_LIST_INDEX, RevocationIndexAllocator
+
+REV_REG_ID = "CsQY9MGeD3CQP4EyuVFo5m:4:CsQY9MGeD3CQP4EyuVFo5m:3:CL:1:tag:CL_ACCUM:0"
+
+
+@pytest.mark.askar
+@pytest.mark.anoncreds
+class TestRevocationIndexAllocator(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.profile = await AskarAnonProfileManager().provision(
+            InjectionContext(),
+            {
+                "name": ":memory:",
+                "key": await AskarAnonProfileManager.generate_store_key(),
+                "key_derivation_method": "RAW",
+            },
+        )
+
+    async def asyncTearDown(self):
+        await self.profile.close()
+
+    async def index_record(self) -> dict:
+        async with self.profile.session() as session:
+            entry = await session.handle.fetch(CATEGORY_REV_LIST_INDEX, REV_REG_ID)
+        return entry.value_json if entry else None
+
+    async def allocate(self, allocator, max_cred_num=100, initial_index=1):
+        return await allocator.allocate(
+            self.profile, REV_REG_ID, max_cred_num, lambda: initial_index
+        )
+
+    async def test_allocate_blocks(self):
+        allocator = RevocationIndexAllocator(block_size=3)
+        with mock.patch.object(
+            allocator, "_reserve", wraps=allocator._reserve
+        ) as mock_reserve:
+            assert [await self.allocate(allocator) for _ in range(4)] == [1, 2, 3, 4]
+            assert mock_reserve.call_count == 2
+        assert await self.index_record() == {
+            "next_index": 7,
+            "reserved": {allocator.worker_id: [4, 7]},
+            "skipped": [],
+        }
+        async with self.profile.session() as session:
+            assert (
+                await RevocationIndexAllocator.get_next_index(session, REV_REG_ID) == 7
+            )
+
+    async def test_allocate_used_up(self):
+        allocator = RevocationIndexAllocator(block_size=2)
+        assert await self.allocate(allocator) == 1
+        assert (await self.index_record())["reserved"] == {allocator.worker_id: [1, 3]}
+        assert await self.allocate(allocator) == 2
+        assert await self.index_record() == {
+            "next_index": 3,
+            "reserved": {},
+            "skipped": [],
+        }
+
+        # single index blocks are not recorded
+        allocator = RevocationIndexAllocator()
+        assert await self.allocate(allocator) == 3
+        assert await self.index_record() == {
+            "next_index": 4,
+            "reserved": {},
+            "skipped": [],
+        }
+
+    async def test_allocate_initial_index(self):
+        async with self.profile.session() as session:
+            assert (
+                await RevocationIndexAllocator.get_next_index(session, REV_REG_ID)
+                is None
+            )
+        allocator = RevocationIndexAllocator(block_size=2)
+        assert await self.allocate(allocator, initial_index=5) == 5
+        assert await self.allocate(allocator, initial_index=1) == 6
+        assert await self.allocate(allocator, initial_index=1) == 7
+
+    async def test_allocate_full(self):
+        allocator = RevocationIndexAllocator(block_size=3)
+        assert [await self.allocate(allocator, max_cred_num=4) for _ in range(5)] == [
+            1,
+            2,
+            3,
+            4,
+            None,
+        ]
+        assert (await self.index_record())["next_index"] == 5
+
+    async def test_allocate_workers(self):
+        first = RevocationIndexAllocator(block_size=2)
+        second = RevocationIndexAllocator(block_size=2)
+        indexes = []
+        for _ in range(3):
+            indexes.append(await self.allocate(first))
+            indexes.append(await self.allocate(second))
+        assert indexes == [1, 3, 2, 4, 5, 7]
+
+    async def test_release(self):
+        first = RevocationIndexAllocator(block_size=4)
+        second = RevocationIndexAllocator(block_size=4)
+        assert await self.allocate(first) == 1
+        assert await self.allocate(second) == 5
+        assert await self.allocate(second) == 6
+
+        # unused indexes at the end are returned
+        await second.release(self.profile)
+        info = await self.index_record()
+        assert info["next_index"] == 7
+        assert second.worker_id not in info["reserved"]
+
+        # unused indexes before a later reservation are skipped
+        await first.release(self.profile, REV_REG_ID)
+        info = await self.index_record()
+        assert info == {"next_index": 7, "reserved": {}, "skipped": [[2, 5]]}
+
+        assert await self.allocate(first) == 7
+
+    async def test_release_on_shutdown(self):
+        event_bus = EventBus()
+        self.profile.context.injector.bind_instance(EventBus, event_bus)
+        self.profile.settings["revocation.anoncreds_index_block_size"] = 10
+        allocator = RevocationIndexAllocator.for_profile(self.profile)
+        assert RevocationIndexAllocator.for_profile(self.profile) is allocator
+        assert allocator.block_size == 10
+        assert await self.allocate(allocator) == 1
+
+        await event_bus.notify(self.profile, Event(SHUTDOWN_EVENT_TOPIC, {}))
+        assert await self.index_record() == {
+            "next_index": 2,
+            "reserved": {},
+            "skipped": [],
+        }
+
+    async def test_for_profile_shared_store(self):
+        def wallet_profile(profile_id):
+            return AskarAnoncredsProfile(
+                self.profile.opened, InjectionContext(), profile_id=profile_id
+            )
+
+        # profiles opened for the same wallet share one allocator
+        allocator = RevocationIndexAllocator.for_profile(wallet_profile("tenant1"))
+        assert RevocationIndexAllocator.for_profile(wallet_profile("tenant1")) is (
+            allocator
+        )
+        assert (
+            RevocationIndexAllocator.for_profile(wallet_profile("tenant2"))
+            is not allocator
+        )
+        assert RevocationIndexAllocator.for_profile(self.profile) is not allocator
+
+    async def test_cached_state(self):
+        allocator = RevocationIndexAllocator()
+        registry = test_module.IssuanceRegistry(mock.MagicMock(), b"key")
+        assert allocator.get_registry(REV_REG_ID) is None
+        allocator.set_registry(REV_REG_ID, registry)
+        assert allocator.get_registry(REV_REG_ID) is registry
+
+        status_list = mock.MagicMock()
+        allocator.set_status_list(REV_REG_ID, b"list", status_list)
+        assert allocator.get_status_list(REV_REG_ID, b"list") is status_list
+        assert allocator.get_status_list(REV_REG_ID, b"updated") is None
+
+        for idx in range(test_module.MAX_CACHED_REGISTRIES):
+            allocator.set_registry(f"other-{idx}", registry)
+        assert allocator.get_registry(REV_REG_ID) is None
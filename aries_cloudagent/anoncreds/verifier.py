@@ -11,6 +11,8 @@ from anoncreds import AnoncredsError, Presentation
 from ..core.profile import Profile
 from ..indy.models.xform import indy_proof_req2non_revoc_intervals
 from ..messaging.util import canon, encode
+from ..utils.concurrency import DEFAULT_CONCURRENCY, gather_keyed
+from ..utils.crypto_executor import OP_VERIFY, run_crypto
 from .models.anoncreds_cred_def import GetCredDefResult
 from .registry import AnonCredsRegistry
 
@@ -125,14 +127,21 @@ class AnonCredsVerifier:
         LOGGER.debug(f">>> got non-revoc intervals: {non_revoc_intervals}")
 
         # timestamp for irrevocable credential
+        anoncreds_registry = profile.inject(AnonCredsRegistry)
+
+        async def get_cred_def(cred_def_id: str) -> GetCredDefResult:
+            return await anoncreds_registry.get_credential_definition(
+                profile, cred_def_id
+            )
+
+        cred_def_results = await gather_keyed(
+            get_cred_def, (ident["cred_def_id"] for ident in pres["identifiers"])
+        )
         cred_defs: List[GetCredDefResult] = []
         for index, ident in enumerate(pres["identifiers"]):
             LOGGER.debug(f">>> got (index, ident): ({index},{ident})")
             cred_def_id = ident["cred_def_id"]
-            anoncreds_registry = profile.inject(AnonCredsRegistry)
-            cred_def_result = await anoncreds_registry.get_credential_definition(
-                profile, cred_def_id
-            )
+            cred_def_result = cred_def_results[cred_def_id]
             cred_defs.append(cred_def_result)
             if ident.get("timestamp"):
                 if not cred_def_result.credential_definition.value.revocation:
@@ -377,57 +386,69 @@ class AnonCredsVerifier:
         self,
         identifiers: list,
     ) -> Tuple[dict, dict, dict, dict]:
-        """Return schemas, cred_defs, rev_reg_defs, rev_lists."""
-        schema_ids = []
-        cred_def_ids = []
-
-        schemas = {}
-        cred_defs = {}
-        rev_reg_defs = {}
-        rev_lists = {}
+        """Return schemas, cred_defs, rev_reg_defs, rev_lists.
 
-        for identifier in identifiers:
-            schema_ids.append(identifier["schema_id"])
-            cred_def_ids.append(identifier["cred_def_id"])
+        Distinct objects are fetched concurrently.
+        """
+        anoncreds_registry = self.profile.inject(AnonCredsRegistry)
 
-            anoncreds_registry = self.profile.inject(AnonCredsRegistry)
-            # Build schemas for anoncreds
-            if identifier["schema_id"] not in schemas:
-                schemas[identifier["schema_id"]] = (
-                    await anoncreds_registry.get_schema(
-                        self.profile, identifier["schema_id"]
-                    )
-                ).schema.serialize()
-            if identifier["cred_def_id"] not in cred_defs:
-                cred_defs[identifier["cred_def_id"]] = (
-                    await anoncreds_registry.get_credential_definition(
-                        self.profile, identifier["cred_def_id"]
-                    )
-                ).credential_definition.serialize()
+        async def get_schema(schema_id: str) -> dict:
+            return (
+                await anoncreds_registry.get_schema(self.profile, schema_id)
+            ).schema.serialize()
 
-            if identifier.get("rev_reg_id"):
-                if identifier["rev_reg_id"] not in rev_reg_defs:
-                    rev_reg_defs[identifier["rev_reg_id"]] = (
-                        await anoncreds_registry.get_revocation_registry_definition(
-                            self.profile, identifier["rev_reg_id"]
-                        )
-                    ).revocation_registry.serialize()
+        async def get_cred_def(cred_def_id: str) -> dict:
+            return (
+                await anoncreds_registry.get_credential_definition(
+                    self.profile, cred_def_id
+                )
+            ).credential_definition.serialize()
 
-                if identifier.get("timestamp"):
-                    rev_lists.setdefault(identifier["rev_reg_id"], {})
+        async def get_rev_reg_def(rev_reg_id: str) -> dict:
+            return (
+                await anoncreds_registry.get_revocation_registry_definition(
+                    self.profile, rev_reg_id
+                )
+            ).revocation_registry.serialize()
 
-                    if (
-                        identifier["timestamp"]
-                        not in rev_lists[identifier["rev_reg_id"]]
-                    ):
-                        result = await anoncreds_registry.get_revocation_list(
-                            self.profile,
-                            identifier["rev_reg_id"],
-                            identifier["timestamp"],
-                        )
-                        rev_lists[identifier["rev_reg_id"]][
-                            identifier["timestamp"]
-                        ] = result.revocation_list.serialize()
+        async def get_rev_list(key: Tuple[str, int]) -> dict:
+            rev_reg_id, timestamp = key
+            result = await anoncreds_registry.get_revocation_list(
+                self.profile, rev_reg_id, timestamp
+            )
+            return result.revocation_list.serialize()
+
+        semaphore = asyncio.Semaphore(DEFAULT_CONCURRENCY)
+        rev_idents = [ident for ident in identifiers if ident.get("rev_reg_id")]
+        schemas, cred_defs, rev_reg_defs, lists = await asyncio.gather(
+            gather_keyed(
+                get_schema,
+                (ident["schema_id"] for ident in identifiers),
+                semaphore=semaphore,
+            ),
+            gather_keyed(
+                get_cred_def,
+                (ident["cred_def_id"] for ident in identifiers),
+                semaphore=semaphore,
+            ),
+            gather_keyed(
+                get_rev_reg_def,
+                (ident["rev_reg_id"] for ident in rev_idents),
+                semaphore=semaphore,
+            ),
+            gather_keyed(
+                get_rev_list,
+                (
+                    (ident["rev_reg_id"], ident["timestamp"])
+                    for ident in rev_idents
+                    if ident.get("timestamp")
+                ),
+                semaphore=semaphore,
+            ),
+        )
+        rev_lists = {}
+        for (rev_reg_id, timestamp), rev_list in lists.items():
+            rev_lists.setdefault(rev_reg_id, {})[timestamp] = rev_list
         return (
             schemas,
             cred_defs,
@@ -473,8 +494,9 @@ class AnonCredsVerifier:
 
         try:
             presentation = Presentation.load(pres)
-            verified = await asyncio.get_event_loop().run_in_executor(
-                None,
+            verified = await run_crypto(
+                self.profile,
+                OP_VERIFY,
                 presentation.verify,
                 pres_req,
                 schemas,
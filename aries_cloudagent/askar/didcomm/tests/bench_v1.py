@@ -0,0 +1,65 @@
+"""Compare DIDComm v1 pack/unpack throughput with and without the key cache.
+
+Run with `python -m aries_cloudagent.askar.didcomm.tests.bench_v1`.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Mapping
+
+from aries_askar import Key, KeyAlg, Store
+
+from ....wallet.util import bytes_to_b58
+from ..v1 import KeyCache, pack_message, unpack_message
+
+MESSAGE = b'{"@type": "https://didcomm.org/basicmessage/1.0/message"}'
+
+
+async def run(iterations: int = 1000, recipients: int = 100) -> Mapping[str, float]:
+    """Time authcrypt pack and unpack operations, in operations per second."""
+    store = await Store.provision("sqlite://:memory:", "raw", Store.generate_raw_key())
+    try:
+        sender = Key.generate(KeyAlg.ED25519)
+        recip = Key.generate(KeyAlg.ED25519)
+        recip_vk = bytes_to_b58(recip.get_public_bytes())
+        # a mediator packs for a working set of known verkeys
+        verkeys = [
+            bytes_to_b58(Key.generate(KeyAlg.ED25519).get_public_bytes())
+            for _ in range(recipients)
+        ]
+        async with store.session() as session:
+            await session.insert_key(recip_vk, recip)
+            enc_message = pack_message([recip_vk], sender, MESSAGE)
+
+            results = {}
+            for label, key_cache in (("uncached", None), ("cached", KeyCache())):
+                start = time.perf_counter()
+                for idx in range(iterations):
+                    pack_message(
+                        [verkeys[idx % recipients]], sender, MESSAGE, key_cache
+                    )
+                results[f"pack_{label}"] = iterations / (time.perf_counter() - start)
+
+                start = time.perf_counter()
+                for _ in range(iterations):
+                    await unpack_message(session, enc_message, key_cache)
+                results[f"unpack_{label}"] = iterations / (time.perf_counter() - start)
+        return results
+    finally:
+        await store.close()
+
+
+def main():
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--recipients", type=int, default=100)
+    args = parser.parse_args()
+    results = asyncio.run(run(args.iterations, args.recipients))
+    for name, rate in results.items():
+        print(f"{name:>16}: {rate:10.1f} ops/s")
+
+
+if __name__ == "__main__":
+    main()
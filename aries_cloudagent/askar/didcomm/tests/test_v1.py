@@ -0,0 +1,211 @@
+import json
+
+import pytest
+
+from aries_askar import Key, KeyAlg, Session
+
+from ....config.injection_context import InjectionContext
+from ....wallet.base import WalletError
+from ....wallet.util import bytes_to_b58
+
+from ....tests import mock
+from ...profile import AskarProfile, AskarProfileManager
+from .. import v1 as test_module
+from . import bench_v1
+
+MESSAGE = b"Expecto patronum"
+
+
+async def provision():
+    return await AskarProfileManager().provision(
+        InjectionContext(),
+        {
+            "name": ":memory:",
+            "key": await AskarProfileManager.generate_store_key(),
+            "key_derivation_method": "RAW",  # much faster than using argon-hashed keys
+        },
+    )
+
+
+@pytest.fixture()
+async def session():
+    profile = await provision()
+    async with profile.session() as session:
+        yield session.handle
+    del session
+    await profile.close()
+
+
+def keypair():
+    key = Key.generate(KeyAlg.ED25519)
+    return key, bytes_to_b58(key.get_public_bytes())
+
+
+@pytest.mark.askar
+class TestKeyCache:
+    def test_lru(self):
+        cache = test_module.KeyCache(max_size=2)
+        keys = [Key.generate(KeyAlg.X25519) for _ in range(3)]
+        cache.set("a", keys[0])
+        cache.set("b", keys[1])
+        assert cache.get("a") is keys[0]
+        cache.set("c", keys[2])
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") is keys[0]
+        assert cache.get("c") is keys[2]
+        assert (cache.hits, cache.misses) == (3, 1)
+
+        cache.clear()
+        assert not len(cache)
+
+    def test_get_or_derive(self):
+        cache = test_module.KeyCache()
+        key = Key.generate(KeyAlg.X25519)
+        derived = []
+
+        def derive():
+            derived.append(key)
+            return key
+
+        assert cache.get_or_derive("a", derive) is key
+        assert cache.get_or_derive("a", derive) is key
+        assert len(derived) == 1
+
+    def test_secret_ttl(self):
+        cache = test_module.KeyCache(secret_ttl=60)
+        key = Key.generate(KeyAlg.X25519)
+        cache.set("a", key, 60)
+        cache.set("b", key)
+        with mock.patch.object(
+            test_module, "monotonic", return_value=test_module.monotonic() + 61
+        ):
+            assert cache.get("a") is None
+            assert cache.get("b") is key
+        assert "a" not in cache._keys
+
+    def test_scoped(self):
+        cache = test_module.KeyCache()
+        view1 = cache.scoped("profile1")
+        view2 = cache.scoped("profile2")
+        key = Key.generate(KeyAlg.X25519)
+        view1.set(view1.secret_cache_key("secret", "vk"), key)
+        view1.set(("x25519_public", "vk"), key)
+        assert view2.get(view2.secret_cache_key("secret", "vk")) is None
+        assert view2.get(("x25519_public", "vk")) is key
+        assert view1.get(view1.secret_cache_key("secret", "vk")) is key
+        assert len(cache) == 2
+        assert (cache.hits, cache.misses) == (2, 1)
+
+
+@pytest.mark.askar
+class TestAskarDidCommV1:
+    @pytest.mark.parametrize("authcrypt", [True, False])
+    async def test_round_trip(self, session: Session, authcrypt: bool):
+        key_cache = test_module.KeyCache()
+        recip, recip_vk = keypair()
+        sender, sender_vk = keypair()
+        await session.insert_key(recip_vk, recip)
+        _, other_vk = keypair()
+
+        for _ in range(2):
+            enc_message = test_module.pack_message(
+                [other_vk, recip_vk],
+                sender if authcrypt else None,
+                MESSAGE,
+                key_cache,
+            )
+            assert len(json.loads(enc_message)["protected"]) > 0
+            message, recip_kid, sender_kid = await test_module.unpack_message(
+                session, enc_message, key_cache
+            )
+            assert message == MESSAGE
+            assert recip_kid == recip_vk
+            assert sender_kid == (sender_vk if authcrypt else None)
+
+        # the second pass and unpack are served from the cache
+        assert key_cache.hits > 0
+        assert ("secret", None, recip_vk) in key_cache._keys
+
+    async def test_round_trip_uncached(self, session: Session):
+        recip, recip_vk = keypair()
+        sender, sender_vk = keypair()
+        await session.insert_key(recip_vk, recip)
+
+        enc_message = test_module.pack_message([recip_vk], sender, MESSAGE)
+        assert await test_module.unpack_message(session, enc_message) == (
+            MESSAGE,
+            recip_vk,
+            sender_vk,
+        )
+
+    async def test_profile_isolation(self):
+        recip, recip_vk = keypair()
+        profile1 = await provision()
+        profile2 = await provision()
+        assert profile1.key_cache is not profile2.key_cache
+
+        async with profile1.session() as session1:
+            await session1.handle.insert_key(recip_vk, recip)
+            enc_message = test_module.pack_message(
+                [recip_vk], None, MESSAGE, profile1.key_cache
+            )
+            await test_module.unpack_message(
+                session1.handle, enc_message, profile1.key_cache
+            )
+
+        # a cached key from one profile does not open messages in another
+        async with profile2.session() as session2:
+            with pytest.raises(WalletError):
+                await test_module.unpack_message(
+                    session2.handle, enc_message, profile2.key_cache
+                )
+
+        await profile1.close()
+        await profile2.close()
+
+    async def test_store_scope(self):
+        recip, recip_vk = keypair()
+        base = await provision()
+        await base.store.create_profile("tenant1")
+        await base.store.create_profile("tenant2")
+        tenant1 = AskarProfile(base.opened, InjectionContext(), profile_id="tenant1")
+        tenant2 = AskarProfile(base.opened, InjectionContext(), profile_id="tenant2")
+
+        async with tenant1.session() as session1:
+            await session1.handle.insert_key(recip_vk, recip)
+            enc_message = test_module.pack_message(
+                [recip_vk], None, MESSAGE, tenant1.key_cache
+            )
+            await test_module.unpack_message(
+                session1.handle, enc_message, tenant1.key_cache
+            )
+
+        # the cache outlives the profile instance, which is rebuilt per request
+        tenant1 = AskarProfile(base.opened, InjectionContext(), profile_id="tenant1")
+        async with tenant1.session() as session1:
+            with mock.patch.object(
+                session1.handle, "fetch_key", mock.CoroutineMock()
+            ) as mock_fetch:
+                await test_module.unpack_message(
+                    session1.handle, enc_message, tenant1.key_cache
+                )
+            mock_fetch.assert_not_called()
+
+        # a secret key cached for one profile of the store is not used by another
+        async with tenant2.session() as session2:
+            with pytest.raises(WalletError):
+                await test_module.unpack_message(
+                    session2.handle, enc_message, tenant2.key_cache
+                )
+
+        await base.close()
+
+    async def test_benchmark(self):
+        results = await bench_v1.run(iterations=2, recipients=2)
+        assert set(results) == {
+            "pack_uncached",
+            "unpack_uncached",
+            "pack_cached",
+            "unpack_cached",
+        }
@@ -1,7 +1,9 @@
 """DIDComm v1 envelope handling via Askar backend."""
 
 from collections import OrderedDict
-from typing import Optional, Sequence, Tuple
+from threading import Lock
+from time import monotonic
+from typing import Callable, Hashable, Optional, Sequence, Tuple, Union
 
 from aries_askar import (
     crypto_box,
@@ -17,24 +19,166 @@ from ...wallet.base import WalletError
 from ...wallet.crypto import extract_pack_recipients
 from ...wallet.util import b58_to_bytes, bytes_to_b58
 
+DEFAULT_KEY_CACHE_SIZE = 4096
+DEFAULT_SECRET_KEY_TTL = 60.0
+
+
+class KeyCache:
+    """Bounded LRU cache of the keys used to pack and unpack envelopes.
+
+    One cache is kept per opened store (see `AskarOpenStore.key_cache`), and
+    each profile of the store uses a view scoped to its profile id. Public key
+    conversions are shared by all views, while secret keys are only visible to
+    the view of the profile they were fetched for, and expire after
+    `secret_ttl` seconds.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_KEY_CACHE_SIZE,
+        secret_ttl: float = DEFAULT_SECRET_KEY_TTL,
+    ):
+        """Initialize the cache instance."""
+        self.max_size = max_size
+        self.secret_ttl = secret_ttl
+        self.scope: Optional[str] = None
+        self._stats = {"hits": 0, "misses": 0}
+        self._keys: OrderedDict = OrderedDict()
+        # packing runs in executor threads
+        self._lock = Lock()
+
+    @property
+    def hits(self) -> int:
+        """Accessor for the number of cache hits."""
+        return self._stats["hits"]
+
+    @property
+    def misses(self) -> int:
+        """Accessor for the number of cache misses."""
+        return self._stats["misses"]
+
+    def scoped(self, scope: Optional[str]) -> "KeyCache":
+        """Get a view of the cache for the profile with the given id."""
+        view = object.__new__(KeyCache)
+        view.__dict__.update(self.__dict__)
+        view.scope = scope
+        return view
+
+    def secret_cache_key(self, name: str, verkey: str) -> Hashable:
+        """Get the cache key of a secret key, private to the scope."""
+        return (name, self.scope, verkey)
+
+    def get(self, cache_key: Hashable) -> Optional[Key]:
+        """Fetch a cached key, marking it as recently used."""
+        with self._lock:
+            entry = self._keys.get(cache_key)
+            if entry is not None and entry[1] is not None and entry[1] <= monotonic():
+                del self._keys[cache_key]
+                entry = None
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["hits"] += 1
+            self._keys.move_to_end(cache_key)
+            return entry[0]
+
+    def set(self, cache_key: Hashable, key: Key, ttl: Optional[float] = None):
+        """Add a key to the cache, evicting the least recently used entries."""
+        expires = None if ttl is None else monotonic() + ttl
+        with self._lock:
+            self._keys[cache_key] = (key, expires)
+            self._keys.move_to_end(cache_key)
+            while len(self._keys) > self.max_size:
+                self._keys.popitem(last=False)
+
+    def get_or_derive(
+        self,
+        cache_key: Hashable,
+        derive: Callable[[], Key],
+        ttl: Optional[float] = None,
+    ) -> Key:
+        """Fetch a cached key, deriving and caching it when not present."""
+        key = self.get(cache_key)
+        if key is None:
+            key = derive()
+            self.set(cache_key, key, ttl)
+        return key
+
+    def clear(self):
+        """Remove all cached keys."""
+        with self._lock:
+            self._keys.clear()
+
+    def __len__(self) -> int:
+        """Get the number of cached keys."""
+        return len(self._keys)
+
+
+def _public_x25519(verkey: str, key_cache: Optional[KeyCache]) -> Key:
+    """Convert an Ed25519 verkey to the X25519 public key used for encryption."""
+
+    def derive():
+        return Key.from_public_bytes(KeyAlg.ED25519, b58_to_bytes(verkey)).convert_key(
+            KeyAlg.X25519
+        )
+
+    if key_cache is None:
+        return derive()
+    return key_cache.get_or_derive(("x25519_public", verkey), derive)
+
+
+def _secret_x25519(verkey: str, secret: Key, key_cache: Optional[KeyCache]) -> Key:
+    """Convert an Ed25519 keypair to the X25519 keypair used for encryption."""
+    if key_cache is None:
+        return secret.convert_key(KeyAlg.X25519)
+    return key_cache.get_or_derive(
+        key_cache.secret_cache_key("x25519_secret", verkey),
+        lambda: secret.convert_key(KeyAlg.X25519),
+        key_cache.secret_ttl,
+    )
+
+
+async def fetch_key(
+    session: Session, verkey: str, key_cache: Optional[KeyCache] = None
+) -> Optional[Key]:
+    """Fetch a keypair from the wallet, via the key cache if provided."""
+    if key_cache is not None:
+        key = key_cache.get(key_cache.secret_cache_key("secret", verkey))
+        if key is not None:
+            return key
+    key_entry = await session.fetch_key(verkey)
+    if not key_entry:
+        return None
+    if key_cache is not None:
+        key_cache.set(
+            key_cache.secret_cache_key("secret", verkey),
+            key_entry.key,
+            key_cache.secret_ttl,
+        )
+    return key_entry.key
+
 
 def pack_message(
-    to_verkeys: Sequence[str], from_key: Optional[Key], message: bytes
+    to_verkeys: Sequence[str],
+    from_key: Optional[Key],
+    message: bytes,
+    key_cache: Optional[KeyCache] = None,
 ) -> bytes:
     """Encode a message using the DIDComm v1 'pack' algorithm."""
     wrapper = JweEnvelope(with_protected_recipients=True, with_flatten_recipients=False)
     cek = Key.generate(KeyAlg.C20P)
     # avoid converting to bytes object: this way the only copy is zeroed afterward
     cek_b = key_get_secret_bytes(cek._handle)
-    sender_vk = (
-        bytes_to_b58(from_key.get_public_bytes()).encode("utf-8") if from_key else None
-    )
-    sender_xk = from_key.convert_key(KeyAlg.X25519) if from_key else None
+    if from_key:
+        sender_b58 = bytes_to_b58(from_key.get_public_bytes())
+        sender_vk = sender_b58.encode("utf-8")
+        sender_xk = _secret_x25519(sender_b58, from_key, key_cache)
+    else:
+        sender_vk = None
+        sender_xk = None
 
     for target_vk in to_verkeys:
-        target_xk = Key.from_public_bytes(
-            KeyAlg.ED25519, b58_to_bytes(target_vk)
-        ).convert_key(KeyAlg.X25519)
+        target_xk = _public_x25519(target_vk, key_cache)
         if sender_vk:
             enc_sender = crypto_box.crypto_box_seal(target_xk, sender_vk)
             nonce = crypto_box.random_nonce()
@@ -73,12 +217,19 @@ def pack_message(
     return wrapper.to_json().encode("utf-8")
 
 
-async def unpack_message(session: Session, enc_message: bytes) -> Tuple[str, str, str]:
+async def unpack_message(
+    session: Session,
+    enc_message: Union[bytes, JweEnvelope],
+    key_cache: Optional[KeyCache] = None,
+) -> Tuple[str, str, str]:
     """Decode a message using the DIDComm v1 'unpack' algorithm."""
-    try:
-        wrapper = JweEnvelope.from_json(enc_message)
-    except ValidationError:
-        raise WalletError("Invalid packed message")
+    if isinstance(enc_message, JweEnvelope):
+        wrapper = enc_message
+    else:
+        try:
+            wrapper = JweEnvelope.from_json(enc_message)
+        except ValidationError:
+            raise WalletError("Invalid packed message")
 
     alg = wrapper.protected.get("alg")
     is_authcrypt = alg == "Authcrypt"
@@ -89,10 +240,12 @@ async def unpack_message(session: Session, enc_message: bytes) -> Tuple[str, str
 
     payload_key, sender_vk = None, None
     for recip_vk in recips:
-        recip_key_entry = await session.fetch_key(recip_vk)
-        if recip_key_entry:
+        recip_key = await fetch_key(session, recip_vk, key_cache)
+        if recip_key:
             payload_key, sender_vk = _extract_payload_key(
-                recips[recip_vk], recip_key_entry.key
+                recips[recip_vk],
+                _secret_x25519(recip_vk, recip_key, key_cache),
+                key_cache,
             )
             break
 
@@ -113,20 +266,19 @@ async def unpack_message(session: Session, enc_message: bytes) -> Tuple[str, str
     return message, recip_vk, sender_vk
 
 
-def _extract_payload_key(sender_cek: dict, recip_secret: Key) -> Tuple[bytes, str]:
+def _extract_payload_key(
+    sender_cek: dict, recip_x: Key, key_cache: Optional[KeyCache] = None
+) -> Tuple[bytes, str]:
     """Extract the payload key from pack recipient details.
 
     Returns: A tuple of the CEK and sender verkey
     """
-    recip_x = recip_secret.convert_key(KeyAlg.X25519)
 
     if sender_cek["nonce"] and sender_cek["sender"]:
         sender_vk = crypto_box.crypto_box_seal_open(
             recip_x, sender_cek["sender"]
         ).decode("utf-8")
-        sender_x = Key.from_public_bytes(
-            KeyAlg.ED25519, b58_to_bytes(sender_vk)
-        ).convert_key(KeyAlg.X25519)
+        sender_x = _public_x25519(sender_vk, key_cache)
         cek = crypto_box.crypto_box_open(
             recip_x, sender_x, sender_cek["key"], sender_cek["nonce"]
         )
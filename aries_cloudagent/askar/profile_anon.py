@@ -49,6 +49,7 @@ class AskarAnoncredsProfile(Profile):
         self.opened = opened
         self.ledger_pool: IndyVdrLedgerPool = None
         self.profile_id = profile_id
+        self.key_cache = opened.key_cache.scoped(profile_id)
         self.init_ledger_pool()
         self.bind_providers()
 
@@ -9,6 +9,7 @@ from aries_askar import AskarError, AskarErrorCode, Store
 from ..core.error import ProfileError, ProfileDuplicateError, ProfileNotFoundError
 from ..core.profile import Profile
 from ..utils.env import storage_path
+from .didcomm.v1 import KeyCache
 
 LOGGER = logging.getLogger(__name__)
 
@@ -183,6 +184,7 @@ class AskarOpenStore:
         self.config = config
         self.created = created
         self.store = store
+        self.key_cache = KeyCache()
 
     @property
     def name(self) -> str:
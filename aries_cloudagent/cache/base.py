@@ -56,6 +56,9 @@ class BaseCache(ABC):
     async def flush(self):
         """Remove all items from the cache."""
 
+    async def close(self):
+        """Release any resources held by the cache."""
+
     def acquire(self, key: Text):
         """Acquire a lock on a given cache key."""
         result = CacheKeyLock(self, key)
@@ -1,29 +1,91 @@
 """Basic in-memory cache implementation."""
 
+import heapq
 import time
-from typing import Any, Sequence, Text, Union
+from collections import OrderedDict
+from typing import Any, Optional, Sequence, Text, Union
 
+from ..utils.stats import Collector
 from .base import BaseCache
 
 
 class InMemoryCache(BaseCache):
-    """Basic in-memory cache class."""
+    """Basic in-memory cache class.
 
-    def __init__(self):
-        """Initialize a `InMemoryCache` instance."""
+    Entries are kept in least-recently-used order so that the oldest entry can
+    be evicted in constant time once `max_size` is reached, and expiry times
+    are tracked in a heap so that only expired entries are visited on cleanup.
+    """
+
+    def __init__(self, max_size: Optional[int] = None, collector: Collector = None):
+        """Initialize a `InMemoryCache` instance.
+
+        Args:
+            max_size: the maximum number of entries to retain, or `None`
+                for an unbounded cache
+            collector: an optional stats collector for cache events
+
+        """
         super().__init__()
         # looks like { "key": { "expires": <epoch timestamp>, "value": <val> } }
-        self._cache = {}
+        # ordered from least to most recently used
+        self._cache = OrderedDict()
+        # heap of (expires, key); entries are checked against the cache on pop
+        self._expiry = []
+        self._collector = collector
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the cache counters."""
+        return {
+            "size": len(self._cache),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def _log(self, event: str, duration: float = 0.0):
+        """Report a cache event to the stats collector, if any."""
+        if self._collector:
+            self._collector.log(f"{self.__class__.__name__}.{event}", duration)
 
     def _remove_expired_cache_items(self):
         """Remove all expired items from cache."""
-        for key, val in self._cache.copy().items():  # iterate copy, del from original
-            cache_item_expiry = val["expires"]
-            if cache_item_expiry is None:
-                continue
-            now = time.perf_counter()
-            if now >= cache_item_expiry:
+        now = time.perf_counter()
+        while self._expiry and self._expiry[0][0] <= now:
+            expires, key = heapq.heappop(self._expiry)
+            entry = self._cache.get(key)
+            # skip heap entries for keys which were since replaced or removed
+            if entry and entry["expires"] == expires:
                 del self._cache[key]
+                self.expirations += 1
+                self._log("expire")
+
+    def _compact_expiry(self):
+        """Drop stale heap entries once they outnumber the live ones."""
+        if len(self._expiry) > 2 * len(self._cache) + 64:
+            self._expiry = [
+                (entry["expires"], key)
+                for key, entry in self._cache.items()
+                if entry["expires"] is not None
+            ]
+            heapq.heapify(self._expiry)
+
+    def _evict(self):
+        """Evict least recently used entries until within the size limit."""
+        if self.max_size is None:
+            return
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+            self.evictions += 1
+            self._log("evict")
 
     async def get(self, key: Text):
         """Get an item from the cache.
@@ -35,8 +97,17 @@ class InMemoryCache(BaseCache):
             The record found or `None`
 
         """
+        start = time.perf_counter()
         self._remove_expired_cache_items()
-        return self._cache.get(key)["value"] if self._cache.get(key) else None
+        entry = self._cache.get(key)
+        if entry:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            self._log("hit", time.perf_counter() - start)
+            return entry["value"]
+        self.misses += 1
+        self._log("miss", time.perf_counter() - start)
+        return None
 
     async def set(self, keys: Union[Text, Sequence[Text]], value: Any, ttl: int = None):
         """Add an item to the cache with an optional ttl.
@@ -53,6 +124,11 @@ class InMemoryCache(BaseCache):
         expires_ts = time.perf_counter() + ttl if ttl else None
         for key in [keys] if isinstance(keys, Text) else keys:
             self._cache[key] = {"expires": expires_ts, "value": value}
+            self._cache.move_to_end(key)
+            if expires_ts is not None:
+                heapq.heappush(self._expiry, (expires_ts, key))
+        self._evict()
+        self._compact_expiry()
 
     async def clear(self, key: Text):
         """Remove an item from the cache, if present.
@@ -67,4 +143,5 @@ class InMemoryCache(BaseCache):
     async def flush(self):
         """Remove all items from the cache."""
 
-        self._cache = {}
+        self._cache = OrderedDict()
+        self._expiry = []
@@ -0,0 +1,384 @@
+"""Shared cache implementation backed by a Redis-protocol server."""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, List, Optional, Sequence, Text, Union
+from urllib.parse import unquote, urlparse
+from uuid import uuid4
+
+from .base import BaseCache, CacheError, CacheKeyLock
+
+LOGGER = logging.getLogger(__name__)
+
+
+class RespError(CacheError):
+    """Error reply returned by the cache server."""
+
+
+class RespConnection:
+    """A single connection speaking the Redis serialization protocol (RESP2)."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Initialize the connection."""
+        self._reader = reader
+        self._writer = writer
+
+    @classmethod
+    async def open(cls, host: str, port: int, timeout: float) -> "RespConnection":
+        """Open a new connection to the server."""
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port), timeout
+        )
+        return cls(reader, writer)
+
+    @staticmethod
+    def encode_command(*args: Union[str, bytes, int]) -> bytes:
+        """Encode a command as a RESP array of bulk strings."""
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            if isinstance(arg, str):
+                arg = arg.encode("utf-8")
+            elif isinstance(arg, int):
+                arg = str(arg).encode("ascii")
+            parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        return b"".join(parts)
+
+    async def _read_reply(self) -> Any:
+        """Read and decode a single reply."""
+        line = await self._reader.readuntil(b"\r\n")
+        prefix, body = line[:1], line[1:-2]
+        if prefix == b"+":
+            return body.decode("utf-8")
+        if prefix == b"-":
+            return RespError(body.decode("utf-8"))
+        if prefix == b":":
+            return int(body)
+        if prefix == b"$":
+            length = int(body)
+            if length < 0:
+                return None
+            data = await self._reader.readexactly(length + 2)
+            return data[:-2]
+        if prefix == b"*":
+            length = int(body)
+            if length < 0:
+                return None
+            return [await self._read_reply() for _ in range(length)]
+        raise CacheError(f"Unexpected reply from cache server: {line!r}")
+
+    async def execute(self, *args: Union[str, bytes, int]) -> Any:
+        """Send a command and return the decoded reply."""
+        self._writer.write(self.encode_command(*args))
+        await self._writer.drain()
+        reply = await self._read_reply()
+        if isinstance(reply, RespError):
+            raise reply
+        return reply
+
+    async def close(self):
+        """Close the connection."""
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+
+class RedisCache(BaseCache):
+    """Cache shared between agent processes through a Redis-protocol server.
+
+    Values are serialized as JSON, so the dicts, lists and strings which are
+    cached by the ledger, resolver and connection layers round-trip unchanged.
+    Cache key locks are extended across processes with a lock key held by the
+    process producing the value: other processes wait for the value to appear
+    instead of repeating the same ledger or resolver lookup.
+    """
+
+    DEFAULT_PORT = 6379
+    LOCK_PREFIX = "lock::"
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        prefix: str = "acapy::",
+        pool_size: int = 8,
+        timeout: float = 5.0,
+        lock_ttl: float = 30.0,
+        lock_poll_interval: float = 0.05,
+    ):
+        """Initialize a `RedisCache` instance.
+
+        Args:
+            url: the server address, as redis://[:password@]host[:port][/db]
+            prefix: namespace for all keys written by this cache
+            pool_size: the maximum number of open server connections
+            timeout: seconds to wait on connecting to the server
+            lock_ttl: seconds after which an abandoned key lock lapses
+            lock_poll_interval: seconds between checks while awaiting a key
+                lock held by another process
+
+        """
+        super().__init__()
+        parsed = urlparse(url)
+        if parsed.scheme not in ("redis", "tcp"):
+            raise CacheError(f"Unsupported cache URL scheme: {parsed.scheme}")
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or self.DEFAULT_PORT
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.db = int(parsed.path.strip("/") or 0)
+        self.prefix = prefix
+        self.timeout = timeout
+        self.lock_ttl = lock_ttl
+        self.lock_poll_interval = lock_poll_interval
+        self._pool_size = pool_size
+        self._idle: List[RespConnection] = []
+        self._open_count = 0
+        self._pool_cond: asyncio.Condition = None
+
+    async def _connect(self) -> RespConnection:
+        """Open and prepare a new server connection."""
+        conn = await RespConnection.open(self.host, self.port, self.timeout)
+        try:
+            if self.password:
+                await conn.execute("AUTH", self.password)
+            if self.db:
+                await conn.execute("SELECT", self.db)
+        except Exception:
+            await conn.close()
+            raise
+        return conn
+
+    async def _checkout(self) -> RespConnection:
+        """Take an idle connection from the pool, or open a new one."""
+        if not self._pool_cond:
+            self._pool_cond = asyncio.Condition()
+        async with self._pool_cond:
+            while not self._idle and self._open_count >= self._pool_size:
+                await self._pool_cond.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._open_count += 1
+        try:
+            return await self._connect()
+        except BaseException:
+            async with self._pool_cond:
+                self._open_count -= 1
+                self._pool_cond.notify()
+            raise
+
+    async def _checkin(self, conn: RespConnection, discard: bool = False):
+        """Return a connection to the pool."""
+        async with self._pool_cond:
+            if discard:
+                self._open_count -= 1
+            else:
+                self._idle.append(conn)
+            self._pool_cond.notify()
+        if discard:
+            await conn.close()
+
+    async def execute(self, *args: Union[str, bytes, int]) -> Any:
+        """Run a single command on a pooled connection."""
+        try:
+            conn = await self._checkout()
+        except (OSError, asyncio.TimeoutError) as err:
+            raise CacheError(f"Unable to connect to cache server: {err}") from err
+        try:
+            result = await conn.execute(*args)
+        except RespError:
+            await self._checkin(conn)
+            raise
+        except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError) as err:
+            await self._checkin(conn, discard=True)
+            raise CacheError(f"Error communicating with cache server: {err}") from err
+        except BaseException:
+            await self._checkin(conn, discard=True)
+            raise
+        await self._checkin(conn)
+        return result
+
+    def _key(self, key: Text) -> str:
+        """Get the server-side name for a cache key."""
+        return f"{self.prefix}{key}"
+
+    @staticmethod
+    def serialize(value: Any) -> bytes:
+        """Encode a value for storage."""
+        try:
+            return json.dumps(value, separators=(",", ":")).encode("utf-8")
+        except (TypeError, ValueError) as err:
+            raise CacheError(f"Unable to serialize cache value: {err}") from err
+
+    @staticmethod
+    def deserialize(data: Optional[bytes]) -> Any:
+        """Decode a stored value."""
+        if data is None:
+            return None
+        return json.loads(data)
+
+    async def get(self, key: Text):
+        """Get an item from the cache.
+
+        Args:
+            key: the key to retrieve an item for
+
+        Returns:
+            The record found or `None`
+
+        """
+        return self.deserialize(await self.execute("GET", self._key(key)))
+
+    async def set(
+        self, keys: Union[Text, Sequence[Text]], value: Any, ttl: Optional[int] = None
+    ):
+        """Add an item to the cache with an optional ttl.
+
+        Overwrites existing cache entries.
+
+        Args:
+            keys: the key or keys for which to set an item
+            value: the value to store in the cache
+            ttl: number of seconds that the record should persist
+
+        """
+        data = self.serialize(value)
+        for key in [keys] if isinstance(keys, Text) else keys:
+            if ttl:
+                await self.execute(
+                    "SET", self._key(key), data, "PX", max(int(ttl * 1000), 1)
+                )
+            else:
+                await self.execute("SET", self._key(key), data)
+
+    async def clear(self, key: Text):
+        """Remove an item from the cache, if present.
+
+        Args:
+            key: the key to remove
+
+        """
+        await self.execute("DEL", self._key(key))
+
+    async def flush(self):
+        """Remove all items written under this cache's prefix."""
+        cursor = b"0"
+        while True:
+            cursor, keys = await self.execute(
+                "SCAN", cursor, "MATCH", f"{self.prefix}*", "COUNT", 500
+            )
+            if keys:
+                await self.execute("DEL", *keys)
+            if cursor in (b"0", 0, "0"):
+                break
+
+    async def close(self):
+        """Close all idle server connections."""
+        idle, self._idle = self._idle, []
+        self._open_count -= len(idle)
+        for conn in idle:
+            await conn.close()
+
+    def acquire(self, key: Text):
+        """Acquire a lock on a given cache key, shared between processes."""
+        result = RedisCacheKeyLock(self, key)
+        first = self._key_locks.setdefault(key, result)
+        if first is not result:
+            result.parent = first
+        return result
+
+    async def acquire_remote(self, key: Text) -> Optional[str]:
+        """Try to take the server-side lock for a key.
+
+        Returns:
+            A token identifying the lock holder, or `None` if another process
+            currently holds the lock
+
+        """
+        token = uuid4().hex
+        result = await self.execute(
+            "SET",
+            self._key(self.LOCK_PREFIX + key),
+            token,
+            "NX",
+            "PX",
+            max(int(self.lock_ttl * 1000), 1),
+        )
+        return token if result else None
+
+    async def release_remote(self, key: Text, token: str):
+        """Release the server-side lock for a key if it is still ours."""
+        lock_key = self._key(self.LOCK_PREFIX + key)
+        held = await self.execute("GET", lock_key)
+        if held is not None and held.decode("utf-8") == token:
+            await self.execute("DEL", lock_key)
+
+    def __repr__(self) -> str:
+        """Human readable representation of this instance."""
+        return "<{}(host={}, port={}, db={})>".format(
+            self.__class__.__name__, self.host, self.port, self.db
+        )
+
+
+class RedisCacheKeyLock(CacheKeyLock):
+    """A lock on a cache key which also excludes other agent processes.
+
+    When the value is not cached, the lock holder takes a server-side lock
+    before producing it. Holders of the same key in other processes wait
+    for the value to be published, or for the lock to lapse, instead.
+    """
+
+    cache: RedisCache
+
+    def __init__(self, cache: RedisCache, key: Text):
+        """Initialize the key lock."""
+        super().__init__(cache, key)
+        self._token: str = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await super().__aenter__()
+        if not self.done:
+            await self._wait_remote()
+        return self
+
+    async def _wait_remote(self):
+        """Take the server-side lock, or wait for another process's result."""
+        deadline = time.perf_counter() + self.cache.lock_ttl
+        while True:
+            self._token = await self.cache.acquire_remote(self.key)
+            if self._token:
+                # the value may have been published while we were waiting
+                found = await self.cache.get(self.key)
+                if found is not None:
+                    self._future.set_result(found)
+                return
+            if time.perf_counter() >= deadline:
+                LOGGER.warning(
+                    "Timed out waiting on cache key lock, proceeding: %s", self.key
+                )
+                return
+            await asyncio.sleep(self.cache.lock_poll_interval)
+            found = await self.cache.get(self.key)
+            if found is not None:
+                self._future.set_result(found)
+                return
+
+    async def _release_remote(self):
+        """Release the server-side lock, if held."""
+        if self._token:
+            token, self._token = self._token, None
+            try:
+                await self.cache.release_remote(self.key, token)
+            except CacheError:
+                LOGGER.exception("Error releasing cache key lock: %s", self.key)
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit.
+
+        `None` is returned to any waiters if no value is produced.
+        """
+        await super().__aexit__(exc_type, exc_val, exc_tb)
+        await self._release_remote()
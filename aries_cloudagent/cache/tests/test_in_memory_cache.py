@@ -2,6 +2,7 @@ import pytest
 
 from asyncio import sleep, wait_for
 
+from ...utils.stats import Collector
 from ..base import CacheError
 from ..in_memory import InMemoryCache
 
@@ -166,3 +167,60 @@ class TestBasicCache:
     @pytest.mark.asyncio
     async def test_repr(self, cache):
         assert isinstance(repr(cache), str)
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        cache = InMemoryCache(max_size=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        assert await cache.get("a") == 1  # "b" is now least recently used
+        await cache.set("c", 3)
+        assert await cache.get("b") is None
+        assert await cache.get("a") == 1
+        assert await cache.get("c") == 3
+        assert cache.evictions == 1
+        assert list(cache._cache) == ["a", "c"]
+
+    @pytest.mark.asyncio
+    async def test_expiry_heap_stale_entries(self):
+        cache = InMemoryCache()
+        await cache.set("key", "old", 0.05)
+        await cache.set("key", "new")
+        await sleep(0.05)
+        assert await cache.get("key") == "new"
+        assert cache.expirations == 0
+
+        await cache.set("key", "expiring", 0.05)
+        await sleep(0.05)
+        assert await cache.get("key") is None
+        assert cache.expirations == 1
+        assert not cache._expiry
+
+    @pytest.mark.asyncio
+    async def test_expiry_heap_compaction(self):
+        cache = InMemoryCache()
+        for _ in range(100):
+            await cache.set("key", "value", 60)
+        assert len(cache._cache) == 1
+        assert len(cache._expiry) <= 2 * len(cache._cache) + 64
+
+    @pytest.mark.asyncio
+    async def test_stats(self):
+        collector = Collector()
+        cache = InMemoryCache(max_size=1, collector=collector)
+        await cache.set("a", 1)
+        await cache.get("a")
+        await cache.get("b")
+        await cache.set("b", 2)
+        assert cache.stats == {
+            "size": 1,
+            "max_size": 1,
+            "hits": 1,
+            "misses": 1,
+            "evictions": 1,
+            "expirations": 0,
+        }
+        counts = collector.results["count"]
+        assert counts["InMemoryCache.hit"] == 1
+        assert counts["InMemoryCache.miss"] == 1
+        assert counts["InMemoryCache.evict"] == 1
@@ -0,0 +1,254 @@
+import asyncio
+import fnmatch
+import time
+
+import pytest
+
+from ..base import CacheError
+from ..redis import RedisCache, RespConnection, RespError
+
+
+class StandInServer:
+    """Minimal Redis-protocol server supporting the commands used by the cache."""
+
+    def __init__(self):
+        self.data = {}
+        self.expires = {}
+        self.commands = []
+        self.server = None
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    def _live(self, key):
+        if key in self.expires and self.expires[key] <= time.monotonic():
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+        return self.data.get(key)
+
+    async def read_command(self, reader):
+        line = await reader.readuntil(b"\r\n")
+        count = int(line[1:-2])
+        args = []
+        for _ in range(count):
+            length = int((await reader.readuntil(b"\r\n"))[1:-2])
+            args.append((await reader.readexactly(length + 2))[:-2])
+        return args
+
+    def reply(self, value) -> bytes:
+        if value is None:
+            return b"$-1\r\n"
+        if isinstance(value, bool):
+            return b"+OK\r\n" if value else b"$-1\r\n"
+        if isinstance(value, int):
+            return b":%d\r\n" % value
+        if isinstance(value, bytes):
+            return b"$%d\r\n%s\r\n" % (len(value), value)
+        if isinstance(value, list):
+            return b"*%d\r\n" % len(value) + b"".join(self.reply(v) for v in value)
+        raise ValueError(value)
+
+    def run(self, cmd, *args):
+        if cmd in (b"AUTH", b"SELECT"):
+            return True
+        if cmd == b"GET":
+            return self._live(args[0])
+        if cmd == b"EXISTS":
+            return int(self._live(args[0]) is not None)
+        if cmd == b"SET":
+            key, value, opts = args[0], args[1], [a.upper() for a in args[2:]]
+            if b"NX" in opts and self._live(key) is not None:
+                return False
+            self.data[key] = value
+            self.expires.pop(key, None)
+            if b"PX" in opts:
+                ms = int(args[2 + opts.index(b"PX") + 1])
+                self.expires[key] = time.monotonic() + ms / 1000
+            return True
+        if cmd == b"DEL":
+            count = 0
+            for key in args:
+                if self.data.pop(key, None) is not None:
+                    count += 1
+                self.expires.pop(key, None)
+            return count
+        if cmd == b"SCAN":
+            pattern = args[args.index(b"MATCH") + 1].decode()
+            keys = [
+                k for k in list(self.data) if fnmatch.fnmatchcase(k.decode(), pattern)
+            ]
+            return [b"0", keys]
+        raise ValueError(cmd)
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                args = await self.read_command(reader)
+                self.commands.append(args)
+                try:
+                    writer.write(self.reply(self.run(args[0].upper(), *args[1:])))
+                except ValueError:
+                    writer.write(b"-ERR unknown command\r\n")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.fixture()
+async def server():
+    server = StandInServer()
+    server.port = await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture()
+async def cache(server):
+    cache = RedisCache(f"redis://127.0.0.1:{server.port}", lock_poll_interval=0.01)
+    yield cache
+    await cache.close()
+
+
+class TestRedisCache:
+    def test_url(self):
+        cache = RedisCache("redis://:secret@example.com:1234/2")
+        assert cache.host == "example.com"
+        assert cache.port == 1234
+        assert cache.password == "secret"
+        assert cache.db == 2
+        assert "example.com" in repr(cache)
+
+        cache = RedisCache("redis://example.com")
+        assert cache.port == RedisCache.DEFAULT_PORT
+        assert cache.db == 0
+
+        with pytest.raises(CacheError):
+            RedisCache("http://example.com")
+
+    def test_encode_command(self):
+        assert RespConnection.encode_command("GET", b"k", 1) == (
+            b"*3\r\n$3\r\nGET\r\n$1\r\nk\r\n$1\r\n1\r\n"
+        )
+
+    async def test_get_set_roundtrip(self, cache, server):
+        assert await cache.get("missing") is None
+        value = {"ver": "1.0", "attrNames": ["a", "b"], "seqNo": 10, "x": None}
+        await cache.set("schema::1", value)
+        assert await cache.get("schema::1") == value
+        assert b"acapy::schema::1" in server.data
+
+        await cache.set(["k1", "k2"], "value")
+        assert await cache.get("k1") == "value"
+        assert await cache.get("k2") == "value"
+
+    async def test_set_expires(self, cache):
+        await cache.set("key", {"dictkey": "dval"}, 0.05)
+        assert await cache.get("key") == {"dictkey": "dval"}
+        await asyncio.sleep(0.06)
+        assert await cache.get("key") is None
+
+    async def test_set_unserializable(self, cache):
+        with pytest.raises(CacheError):
+            await cache.set("key", object())
+
+    async def test_clear_flush(self, cache, server):
+        server.data[b"other::key"] = b"1"
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.clear("a")
+        assert await cache.get("a") is None
+        await cache.flush()
+        assert await cache.get("b") is None
+        assert b"other::key" in server.data
+
+    async def test_error_reply(self, cache):
+        with pytest.raises(RespError):
+            await cache.execute("UNKNOWN")
+        # connection remains usable
+        assert await cache.get("key") is None
+
+    async def test_connection_error(self):
+        cache = RedisCache("redis://127.0.0.1:1", timeout=1)
+        with pytest.raises(CacheError):
+            await cache.get("key")
+        assert cache._open_count == 0
+
+    async def test_pool_bounded(self, cache, server):
+        cache._pool_size = 2
+        await asyncio.gather(*[cache.set(f"k{i}", i) for i in range(20)])
+        assert cache._open_count <= 2
+        assert len(cache._idle) == cache._open_count
+
+    async def test_acquire_populated(self, cache):
+        await cache.set("key", "value")
+        async with cache.acquire("key") as entry:
+            assert entry.result == "value"
+        assert "key" not in cache._key_locks
+
+    async def test_acquire_set_result(self, cache, server):
+        async with cache.acquire("key") as entry:
+            assert not entry.done
+            assert b"acapy::lock::key" in server.data
+            await entry.set_result({"a": 1}, 60)
+        assert b"acapy::lock::key" not in server.data
+        assert await cache.get("key") == {"a": 1}
+
+    async def test_acquire_cross_process(self, server):
+        # two caches stand in for two agent processes sharing a server
+        cache1 = RedisCache(f"redis://127.0.0.1:{server.port}", lock_poll_interval=0.01)
+        cache2 = RedisCache(f"redis://127.0.0.1:{server.port}", lock_poll_interval=0.01)
+        produced = []
+
+        async def produce(cache, delay):
+            await asyncio.sleep(delay)
+            async with cache.acquire("key") as entry:
+                if entry.result:
+                    return entry.result
+                produced.append(cache)
+                await asyncio.sleep(0.05)
+                await entry.set_result("value")
+                return entry.result
+
+        results = await asyncio.gather(produce(cache1, 0), produce(cache2, 0.01))
+        assert results == ["value", "value"]
+        assert produced == [cache1]
+        await cache1.close()
+        await cache2.close()
+
+    async def test_acquire_remote_falsy_result(self, cache, server):
+        cache.lock_ttl = 5
+        server.data[b"acapy::lock::key"] = b"other"
+
+        async def publish():
+            await asyncio.sleep(0.03)
+            await cache.set("key", {})
+
+        task = asyncio.ensure_future(publish())
+        start = time.perf_counter()
+        async with cache.acquire("key") as entry:
+            # an empty value published by the other process is a result
+            assert entry.done
+            assert entry.result == {}
+        assert time.perf_counter() - start < 1
+        await task
+
+    async def test_acquire_remote_exception(self, cache, server):
+        with pytest.raises(ValueError):
+            async with cache.acquire("key"):
+                raise ValueError
+        assert b"acapy::lock::key" not in server.data
+
+    async def test_acquire_remote_timeout(self, cache, server):
+        cache.lock_ttl = 0.05
+        server.data[b"acapy::lock::key"] = b"other"
+        async with cache.acquire("key") as entry:
+            assert not entry.done
+        # the lock held by the other process is left alone
+        assert server.data[b"acapy::lock::key"] == b"other"
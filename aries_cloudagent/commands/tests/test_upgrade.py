@@ -1,4 +1,5 @@
 import asyncio
+import json
 
 from aries_cloudagent.tests import mock
 from unittest import IsolatedAsyncioTestCase
@@ -475,6 +476,142 @@ class TestUpgrade(IsolatedAsyncioTestCase):
                 }
             )
 
+    async def test_resave_records(self):
+        async with self.profile.session() as session:
+            for _ in range(5):
+                await ConnRecord().save(session)
+        with mock.patch.object(
+            ConnRecord, "save", autospec=True, side_effect=ConnRecord.save
+        ) as mock_save, mock.patch.object(
+            self.profile, "transaction", wraps=self.profile.transaction
+        ) as mock_transaction:
+            count = await test_module.resave_records(self.profile, ConnRecord, 2)
+        assert count == 5
+        assert mock_transaction.call_count == 3
+        assert all(
+            call_args.kwargs["event"] is False for call_args in mock_save.call_args_list
+        )
+        assert (
+            await test_module.resave_records(
+                self.profile, test_module.IssuerRevRegRecord
+            )
+            == 0
+        )
+
+    async def test_upgrade_resume_from_checkpoint(self):
+        await self.storage.add_record(
+            StorageRecord(
+                test_module.RECORD_TYPE_UPGRADE_CHECKPOINT,
+                json.dumps(
+                    {
+                        "upgrade_to": f"v{__version__}",
+                        "completed": [
+                            "aries_cloudagent.connections.models.conn_record.ConnRecord"
+                        ],
+                    }
+                ),
+            )
+        )
+        self.profile.settings.extend({"upgrade.from_version": "v0.7.2"})
+        with mock.patch.object(
+            test_module.yaml,
+            "safe_load",
+            mock.MagicMock(
+                return_value={
+                    "v0.7.2": {
+                        "resave_records": {
+                            "base_record_path": [
+                                "aries_cloudagent.connections.models.conn_record.ConnRecord",
+                                "aries_cloudagent.revocation.models.issuer_rev_reg_record.IssuerRevRegRecord",
+                            ]
+                        },
+                        "update_existing_records": True,
+                    },
+                }
+            ),
+        ), mock.patch.object(
+            test_module, "resave_records", mock.CoroutineMock(return_value=0)
+        ) as mock_resave:
+            await test_module.upgrade(profile=self.profile)
+        mock_resave.assert_awaited_once_with(
+            self.profile, test_module.IssuerRevRegRecord, test_module.BATCH_SIZE
+        )
+        version_storage_record = await self.storage.find_record(
+            type_filter="acapy_version", tag_query={}
+        )
+        assert version_storage_record.value == f"v{__version__}"
+        with self.assertRaises(test_module.StorageNotFoundError):
+            await self.storage.find_record(
+                type_filter=test_module.RECORD_TYPE_UPGRADE_CHECKPOINT, tag_query={}
+            )
+
+    async def test_upgrade_checkpoint_other_version(self):
+        await self.storage.add_record(
+            StorageRecord(
+                test_module.RECORD_TYPE_UPGRADE_CHECKPOINT,
+                json.dumps({"upgrade_to": "v0.7.4", "completed": ["step"]}),
+            )
+        )
+        checkpoint = await test_module.UpgradeCheckpoint(self.profile, "v0.7.5").load()
+        assert not checkpoint.done("step")
+        await checkpoint.complete("other")
+        checkpoint = await test_module.UpgradeCheckpoint(self.profile, "v0.7.5").load()
+        assert checkpoint.done("other")
+        assert not checkpoint.done("step")
+
+    async def test_upgrade_subwallets_resume(self):
+        async with self.profile.session() as session:
+            wallet_ids = [
+                wallet_record.wallet_id
+                for wallet_record in await WalletRecord.query(session, tag_filter={})
+            ]
+        settings = {"upgrade.workers": 2}
+        upgraded = []
+        failing = {wallet_ids[1]}
+
+        async def upgrade_subwallet(root_profile, wallet_record, settings):
+            if wallet_record.wallet_id in failing:
+                raise UpgradeError("Error during upgrade")
+            upgraded.append(wallet_record.wallet_id)
+
+        async def wallet_records():
+            async with self.profile.session() as session:
+                for wallet_id in wallet_ids:
+                    yield await WalletRecord.retrieve_by_id(session, wallet_id)
+
+        with mock.patch.object(
+            test_module,
+            "_upgrade_subwallet",
+            mock.CoroutineMock(side_effect=upgrade_subwallet),
+        ):
+            with self.assertRaises(UpgradeError):
+                await test_module.upgrade_subwallets(
+                    self.profile, wallet_records(), settings, 2
+                )
+            assert upgraded == [wallet_ids[0]]
+
+            failing.clear()
+            await test_module.upgrade_subwallets(
+                self.profile, wallet_records(), settings, 2
+            )
+        # the sub wallet upgraded by the first run is not upgraded again
+        assert upgraded == wallet_ids
+        assert not await self.storage.find_all_records(
+            test_module.RECORD_TYPE_UPGRADED_WALLET
+        )
+
+    def test_upgrade_progress(self):
+        progress = test_module.UpgradeProgress("test", total=10, interval=0)
+        assert progress.eta is None
+        with mock.patch.object(test_module, "LOGGER", mock.MagicMock()) as mock_logger:
+            progress.advance(5)
+            assert progress.count == 5
+            assert progress.eta is not None
+            assert "5/10 processed" in mock_logger.info.call_args[0][0]
+            progress.finish()
+            assert "test: 5 processed in" in mock_logger.info.call_args[0][0]
+        assert test_module.UpgradeProgress("test").eta is None
+
     async def test_get_upgrade_version_list(self):
         assert len(test_module.get_upgrade_version_list(from_version="v0.7.2")) >= 1
 
@@ -1,12 +1,16 @@
 """Upgrade command for handling breaking changes when updating ACA-PY versions."""
 
 import asyncio
+import hashlib
 import json
 import logging
 import os
+import time
+from datetime import timedelta
 from enum import Enum
 from typing import (
     Any,
+    AsyncIterator,
     Callable,
     List,
     Mapping,
@@ -41,6 +45,10 @@ from . import PROG
 DEFAULT_UPGRADE_CONFIG_FILE_NAME = "default_version_upgrade_config.yml"
 LOGGER = logging.getLogger(__name__)
 BATCH_SIZE = 25
+UPGRADE_WORKERS = 4
+PROGRESS_INTERVAL = 30.0
+RECORD_TYPE_UPGRADE_CHECKPOINT = "acapy_upgrade_checkpoint"
+RECORD_TYPE_UPGRADED_WALLET = "acapy_upgraded_wallet"
 
 
 class ExplicitUpgradeOption(Enum):
@@ -128,6 +136,142 @@ class VersionUpgradeConfig:
             return None
 
 
+class UpgradeProgress:
+    """Log the throughput of an upgrade step, and its remaining time if known."""
+
+    def __init__(
+        self, label: str, total: int = None, interval: float = PROGRESS_INTERVAL
+    ):
+        """Initialize the progress of an upgrade step.
+
+        Args:
+            label: the description of the step
+            total: the number of items to process, if known
+            interval: the minimum number of seconds between progress reports
+
+        """
+        self.label = label
+        self.total = total
+        self.interval = interval
+        self.count = 0
+        self.started = time.perf_counter()
+        self._reported = self.started
+
+    @property
+    def elapsed(self) -> float:
+        """Accessor for the number of seconds since the step started."""
+        return time.perf_counter() - self.started
+
+    @property
+    def rate(self) -> float:
+        """Accessor for the number of items processed per second."""
+        elapsed = self.elapsed
+        return self.count / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Accessor for the estimated number of seconds remaining, if known."""
+        rate = self.rate
+        if self.total is None or not rate:
+            return None
+        return max(self.total - self.count, 0) / rate
+
+    def advance(self, count: int = 1):
+        """Count processed items, reporting progress at most once per interval."""
+        self.count += count
+        now = time.perf_counter()
+        if now - self._reported >= self.interval:
+            self._reported = now
+            self.report()
+
+    def report(self):
+        """Log the progress of the step."""
+        eta = self.eta
+        processed = (
+            f"{self.count}" if self.total is None else f"{self.count}/{self.total}"
+        )
+        remaining = "" if eta is None else f", {_format_duration(eta)} remaining"
+        LOGGER.info(
+            f"{self.label}: {processed} processed, {self.rate:.1f}/s{remaining}"
+        )
+
+    def finish(self):
+        """Log the completion of the step."""
+        LOGGER.info(
+            f"{self.label}: {self.count} processed in "
+            f"{_format_duration(self.elapsed)}, {self.rate:.1f}/s"
+        )
+
+
+def _format_duration(seconds: float) -> str:
+    return str(timedelta(seconds=round(seconds)))
+
+
+class UpgradeCheckpoint:
+    """The completed steps of a profile upgrade.
+
+    The checkpoint is kept in the storage of the profile being upgraded, so
+    that an interrupted upgrade to the same version resumes after the last
+    completed step instead of starting over.
+    """
+
+    def __init__(self, profile: Profile, upgrade_to: str):
+        """Initialize the checkpoint.
+
+        Args:
+            profile: the profile being upgraded
+            upgrade_to: the version the profile is upgraded to
+
+        """
+        self.profile = profile
+        self.upgrade_to = upgrade_to
+        self.completed = set()
+        self._record: Optional[StorageRecord] = None
+
+    async def load(self) -> "UpgradeCheckpoint":
+        """Load the steps completed by a previous upgrade to the same version."""
+        async with self.profile.session() as session:
+            storage = session.inject(BaseStorage)
+            try:
+                self._record = await storage.find_record(
+                    type_filter=RECORD_TYPE_UPGRADE_CHECKPOINT, tag_query={}
+                )
+            except StorageNotFoundError:
+                return self
+        value = json.loads(self._record.value)
+        if value.get("upgrade_to") == self.upgrade_to:
+            self.completed = set(value.get("completed", ()))
+            LOGGER.info(
+                f"Resuming upgrade to {self.upgrade_to}, "
+                f"skipping completed steps: {sorted(self.completed)}"
+            )
+        return self
+
+    def done(self, step: str) -> bool:
+        """Check whether a step has been completed."""
+        return step in self.completed
+
+    async def complete(self, step: str):
+        """Record the completion of a step."""
+        self.completed.add(step)
+        value = json.dumps(
+            {"upgrade_to": self.upgrade_to, "completed": sorted(self.completed)}
+        )
+        async with self.profile.session() as session:
+            storage = session.inject(BaseStorage)
+            if self._record:
+                await storage.update_record(self._record, value, {})
+            else:
+                self._record = StorageRecord(RECORD_TYPE_UPGRADE_CHECKPOINT, value)
+                await storage.add_record(self._record)
+
+    async def clear(self, session: ProfileSession):
+        """Remove the checkpoint once the upgrade is complete."""
+        if self._record:
+            await session.inject(BaseStorage).delete_record(self._record)
+            self._record = None
+
+
 def init_argument_parser(parser: ArgumentParser):
     """Initialize an argument parser with the module's arguments."""
     return arg.load_argument_groups(parser, *arg.group.get_registered(arg.CAT_UPGRADE))
@@ -306,8 +450,11 @@ async def upgrade(
     settings: Optional[Union[Mapping[str, Any], BaseSettings]] = None,
     profile: Optional[Profile] = None,
 ):
-    """Invoke upgradation process for each applicable profile."""
-    profiles_to_upgrade = []
+    """Invoke upgradation process for each applicable profile.
+
+    The base wallet is upgraded first, then the selected sub wallets by a pool
+    of `upgrade.workers` concurrent workers.
+    """
     if settings:
         batch_size = settings.get("upgrade.page_size", BATCH_SIZE)
     else:
@@ -321,42 +468,221 @@ async def upgrade(
         context_builder = DefaultContextBuilder(settings)
         context = await context_builder.build_context()
         root_profile, _ = await wallet_config(context)
-    profiles_to_upgrade.append(root_profile)
-    base_storage_search_inst = root_profile.inject(BaseStorageSearch)
+    wallet_records = None
+    total = None
     if "upgrade.upgrade_all_subwallets" in settings and settings.get(
         "upgrade.upgrade_all_subwallets"
     ):
-        search_session = base_storage_search_inst.search_records(
-            type_filter=WalletRecord.RECORD_TYPE, page_size=batch_size
-        )
-        while search_session._done is False:
-            wallet_storage_records = await search_session.fetch()
-            for wallet_storage_record in wallet_storage_records:
-                wallet_record = WalletRecord.from_storage(
-                    wallet_storage_record.id,
-                    json.loads(wallet_storage_record.value),
-                )
-                wallet_profile = await get_wallet_profile(
-                    base_context=root_profile.context, wallet_record=wallet_record
-                )
-                profiles_to_upgrade.append(wallet_profile)
+        async with root_profile.session() as session:
+            total = await session.inject(BaseStorage).count_records(
+                WalletRecord.RECORD_TYPE
+            )
+        wallet_records = _all_wallet_records(root_profile, batch_size)
         del settings["upgrade.upgrade_all_subwallets"]
     if (
         "upgrade.upgrade_subwallets" in settings
         and len(settings.get("upgrade.upgrade_subwallets")) >= 1
     ):
-        for _wallet_id in settings.get("upgrade.upgrade_subwallets"):
-            async with root_profile.session() as session:
-                wallet_record = await WalletRecord.retrieve_by_id(
-                    session, record_id=_wallet_id
+        wallet_ids = list(settings.get("upgrade.upgrade_subwallets"))
+        total = len(wallet_ids)
+        wallet_records = _wallet_records_by_id(root_profile, wallet_ids)
+        del settings["upgrade.upgrade_subwallets"]
+    await upgrade_per_profile(profile=root_profile, settings=settings)
+    if wallet_records:
+        await upgrade_subwallets(root_profile, wallet_records, settings, total)
+
+
+async def _all_wallet_records(
+    root_profile: Profile, batch_size: int
+) -> AsyncIterator[WalletRecord]:
+    """Stream the wallet records of all sub wallets."""
+    search_session = root_profile.inject(BaseStorageSearch).search_records(
+        type_filter=WalletRecord.RECORD_TYPE, page_size=batch_size
+    )
+    try:
+        while True:
+            wallet_storage_records = await search_session.fetch()
+            if not wallet_storage_records:
+                break
+            for wallet_storage_record in wallet_storage_records:
+                yield WalletRecord.from_storage(
+                    wallet_storage_record.id,
+                    json.loads(wallet_storage_record.value),
                 )
-            wallet_profile = await get_wallet_profile(
-                base_context=root_profile.context, wallet_record=wallet_record
+    finally:
+        await search_session.close()
+
+
+async def _wallet_records_by_id(
+    root_profile: Profile, wallet_ids: Sequence[str]
+) -> AsyncIterator[WalletRecord]:
+    """Retrieve the wallet records of the specified sub wallets."""
+    for wallet_id in wallet_ids:
+        async with root_profile.session() as session:
+            wallet_record = await WalletRecord.retrieve_by_id(
+                session, record_id=wallet_id
             )
-            profiles_to_upgrade.append(wallet_profile)
-        del settings["upgrade.upgrade_subwallets"]
-    for _profile in profiles_to_upgrade:
-        await upgrade_per_profile(profile=_profile, settings=settings)
+        yield wallet_record
+
+
+def _upgrade_run_id(settings: Union[Mapping[str, Any], BaseSettings]) -> str:
+    """Identify the upgrade run by its target version and options."""
+    options = {
+        key: settings.get(key)
+        for key in (
+            "upgrade.config_path",
+            "upgrade.from_version",
+            "upgrade.force_upgrade",
+            "upgrade.named_tags",
+        )
+    }
+    options["upgrade_to"] = f"v{__version__}"
+    return hashlib.sha256(json.dumps(options, sort_keys=True).encode()).hexdigest()
+
+
+async def upgrade_subwallets(
+    root_profile: Profile,
+    wallet_records: AsyncIterator[WalletRecord],
+    settings: Union[Mapping[str, Any], BaseSettings],
+    total: int = None,
+):
+    """Upgrade sub wallets with a bounded pool of workers.
+
+    Each sub wallet profile is opened for its upgrade and closed afterwards.
+    Upgraded sub wallets are marked in the base wallet, so that a run which
+    stops on an error is resumed by running the same upgrade again. The marks
+    are removed once every sub wallet has been upgraded.
+
+    Args:
+        root_profile: the base wallet profile
+        wallet_records: the wallet records of the sub wallets to upgrade
+        settings: the upgrade settings
+        total: the number of sub wallets to upgrade, if known
+
+    """
+    workers = max(int(settings.get("upgrade.workers") or UPGRADE_WORKERS), 1)
+    run_id = _upgrade_run_id(settings)
+    async with root_profile.session() as session:
+        upgraded = {
+            record.value
+            for record in await session.inject(BaseStorage).find_all_records(
+                RECORD_TYPE_UPGRADED_WALLET, {"run_id": run_id}
+            )
+        }
+    if upgraded:
+        LOGGER.info(f"Skipping {len(upgraded)} sub wallets upgraded by a previous run")
+        if total is not None:
+            total = max(total - len(upgraded), 0)
+    progress = UpgradeProgress("Upgrading sub wallets", total)
+    queue = asyncio.Queue(workers)
+    errors = []
+
+    async def worker():
+        while True:
+            wallet_record = await queue.get()
+            if wallet_record is None:
+                return
+            if errors:
+                # stop upgrading after an error, leaving the rest for a new run
+                continue
+            try:
+                await _upgrade_subwallet(root_profile, wallet_record, settings)
+                async with root_profile.session() as session:
+                    await session.inject(BaseStorage).add_record(
+                        StorageRecord(
+                            RECORD_TYPE_UPGRADED_WALLET,
+                            wallet_record.wallet_id,
+                            {"run_id": run_id},
+                        )
+                    )
+            except Exception as err:
+                LOGGER.error(f"Error upgrading sub wallet {wallet_record.wallet_id}")
+                errors.append(err)
+            else:
+                progress.advance()
+
+    tasks = [asyncio.ensure_future(worker()) for _ in range(workers)]
+    try:
+        async for wallet_record in wallet_records:
+            if errors:
+                break
+            if wallet_record.wallet_id not in upgraded:
+                await queue.put(wallet_record)
+    finally:
+        for _ in tasks:
+            await queue.put(None)
+        await asyncio.gather(*tasks)
+    if errors:
+        raise errors[0]
+    progress.finish()
+    async with root_profile.session() as session:
+        await session.inject(BaseStorage).delete_all_records(
+            RECORD_TYPE_UPGRADED_WALLET
+        )
+
+
+async def _upgrade_subwallet(
+    root_profile: Profile,
+    wallet_record: WalletRecord,
+    settings: Union[Mapping[str, Any], BaseSettings],
+):
+    """Open a sub wallet profile, upgrade it and close it."""
+    wallet_profile = await get_wallet_profile(
+        base_context=root_profile.context, wallet_record=wallet_record
+    )
+    try:
+        await upgrade_per_profile(profile=wallet_profile, settings=settings)
+    finally:
+        if wallet_profile is not root_profile:
+            await wallet_profile.close()
+
+
+async def resave_records(
+    profile: Profile, rec_type: RecordType, batch_size: int = BATCH_SIZE
+) -> int:
+    """Re-save all records of a type, one page at a time.
+
+    Each page is saved in its own transaction, without sending events, so that
+    memory use does not grow with the number of records.
+
+    Args:
+        profile: the profile being upgraded
+        rec_type: the record class
+        batch_size: the number of records to save per transaction
+
+    Returns:
+        The number of records re-saved
+
+    """
+    async with profile.session() as session:
+        total = await session.inject(BaseStorage).count_records(rec_type.RECORD_TYPE)
+    progress = UpgradeProgress(f"Re-saving {rec_type.__name__} records", total)
+    search_session = profile.inject(BaseStorageSearch).search_records(
+        type_filter=rec_type.RECORD_TYPE, page_size=batch_size
+    )
+    try:
+        while True:
+            storage_records = await search_session.fetch()
+            if not storage_records:
+                break
+            async with profile.transaction() as txn:
+                for storage_record in storage_records:
+                    record = rec_type.from_storage(
+                        storage_record.id,
+                        json.loads(storage_record.value),
+                    )
+                    await record.save(
+                        txn,
+                        reason="re-saving record during the upgrade process",
+                        event=False,
+                    )
+                await txn.commit()
+            progress.advance(len(storage_records))
+    finally:
+        await search_session.close()
+    if progress.count:
+        progress.finish()
+    return progress.count
 
 
 async def upgrade_per_profile(
@@ -493,7 +819,14 @@ async def upgrade_per_profile(
                 )
         if len(resave_record_path_sets) >= 1 or len(executables_call_set) >= 1:
             to_update_flag = True
-        for record_path in resave_record_path_sets:
+        checkpoint = await UpgradeCheckpoint(profile, upgrade_to_version).load()
+        if settings:
+            batch_size = settings.get("upgrade.page_size", BATCH_SIZE)
+        else:
+            batch_size = BATCH_SIZE
+        for record_path in sorted(resave_record_path_sets):
+            if checkpoint.done(record_path):
+                continue
             try:
                 rec_type = ClassLoader.load_class(record_path)
             except ClassNotFoundError as err:
@@ -502,43 +835,24 @@ async def upgrade_per_profile(
                 raise UpgradeError(
                     f"Only BaseRecord can be resaved, found: {str(rec_type)}"
                 )
-            all_records = []
-            if settings:
-                batch_size = settings.get("upgrade.page_size", BATCH_SIZE)
+            if await resave_records(profile, rec_type, batch_size):
+                LOGGER.info(f"All recs of {str(rec_type)} successfully re-saved")
             else:
-                batch_size = BATCH_SIZE
-            base_storage_search_inst = profile.inject(BaseStorageSearch)
-            search_session = base_storage_search_inst.search_records(
-                type_filter=rec_type.RECORD_TYPE, page_size=batch_size
-            )
-            while search_session._done is False:
-                storage_records = await search_session.fetch()
-                for storage_record in storage_records:
-                    _record = rec_type.from_storage(
-                        storage_record.id,
-                        json.loads(storage_record.value),
-                    )
-                    all_records.append(_record)
-            async with profile.session() as session:
-                for record in all_records:
-                    await record.save(
-                        session,
-                        reason="re-saving record during the upgrade process",
-                    )
-                if len(all_records) == 0:
-                    LOGGER.info(f"No records of {str(rec_type)} found")
-                else:
-                    LOGGER.info(f"All recs of {str(rec_type)} successfully re-saved")
-        for callable_name in executables_call_set:
+                LOGGER.info(f"No records of {str(rec_type)} found")
+            await checkpoint.complete(record_path)
+        for callable_name in sorted(executables_call_set):
+            if checkpoint.done(callable_name):
+                continue
             _callable = version_upgrade_config_inst.get_callable(callable_name)
             if not _callable:
                 raise UpgradeError(f"No function specified for {callable_name}")
             await _callable(profile)
+            await checkpoint.complete(callable_name)
 
         # Update storage version
         if to_update_flag:
-            async with profile.session() as session:
-                storage = session.inject(BaseStorage)
+            async with profile.transaction() as txn:
+                storage = txn.inject(BaseStorage)
                 if not version_storage_record:
                     await storage.add_record(
                         StorageRecord(
@@ -550,6 +864,8 @@ async def upgrade_per_profile(
                     await storage.update_record(
                         version_storage_record, upgrade_to_version, {}
                     )
+                await checkpoint.clear(txn)
+                await txn.commit()
                 LOGGER.info(
                     f"{RECORD_TYPE_ACAPY_VERSION} storage record "
                     f"set to {upgrade_to_version}"
@@ -171,6 +171,30 @@ class AdminGroup(ArgumentGroup):
                 "admin API. If not specified, webhooks are not published by the agent."
             ),
         )
+        parser.add_argument(
+            "--webhook-batch-size",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_WEBHOOK_BATCH_SIZE",
+            help=(
+                "Enable batched webhook delivery: events for each webhook URL are "
+                "buffered and sent as one JSON array of {topic, payload} objects "
+                "to <webhook-url>/topic/batch/ once <count> events are buffered or "
+                "the batch window has passed. Webhooks are sent individually if "
+                "not specified."
+            ),
+        )
+        parser.add_argument(
+            "--webhook-batch-window",
+            type=float,
+            default=1.0,
+            metavar="<seconds>",
+            env_var="ACAPY_WEBHOOK_BATCH_WINDOW",
+            help=(
+                "Maximum time in seconds to buffer an event for batched webhook "
+                "delivery. Default: 1.0"
+            ),
+        )
         parser.add_argument(
             "--admin-client-max-request-size",
             default=1,
@@ -209,6 +233,13 @@ class AdminGroup(ArgumentGroup):
             if hook_url:
                 hook_urls.append(hook_url)
             settings["admin.webhook_urls"] = hook_urls
+            if args.webhook_batch_size:
+                if not args.webhook_batch_window or args.webhook_batch_window <= 0:
+                    raise ArgsParseError(
+                        "Parameter --webhook-batch-window must be greater than 0"
+                    )
+                settings["admin.webhook_batch_size"] = args.webhook_batch_size
+                settings["admin.webhook_batch_window"] = args.webhook_batch_window
 
             settings["admin.admin_client_max_request_size"] = (
                 args.admin_client_max_request_size or 1
@@ -216,6 +247,83 @@ class AdminGroup(ArgumentGroup):
         return settings
 
 
+@group(CAT_START)
+class CacheGroup(ArgumentGroup):
+    """Cache settings."""
+
+    GROUP_NAME = "Cache"
+
+    def add_arguments(self, parser: ArgumentParser):
+        """Add cache-specific command line arguments to the parser."""
+        parser.add_argument(
+            "--cache-backend",
+            type=str,
+            choices=("memory", "redis"),
+            default="memory",
+            env_var="ACAPY_CACHE_BACKEND",
+            help=(
+                "Cache implementation to use. 'memory' keeps a separate cache in "
+                "each agent process, 'redis' shares one cache between agent "
+                "processes through the Redis-protocol server at --cache-url. "
+                "Default: memory."
+            ),
+        )
+        parser.add_argument(
+            "--cache-url",
+            type=str,
+            metavar="<url>",
+            env_var="ACAPY_CACHE_URL",
+            help=(
+                "Address of the shared cache server, as "
+                "redis://[:password@]host[:port][/db]. "
+                "Required when --cache-backend is 'redis'."
+            ),
+        )
+        parser.add_argument(
+            "--cache-max-size",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_CACHE_MAX_SIZE",
+            help=(
+                "Maximum number of entries to keep in the shared in-memory cache. "
+                "The least recently used entries are evicted once the limit is "
+                "reached. Default: unbounded."
+            ),
+        )
+        parser.add_argument(
+            "--connection-cache-ttl",
+            type=BoundedInt(min=0),
+            metavar="<seconds>",
+            env_var="ACAPY_CONNECTION_CACHE_TTL",
+            help=(
+                "Number of seconds to keep active connection records in the "
+                "per-wallet connection cache, avoiding a storage read for each "
+                "message. Only safe when a single agent instance uses the "
+                "wallet: changes made by other instances are not seen until "
+                "the entry expires. Default: 0 (disabled)."
+            ),
+        )
+
+    def get_settings(self, args: Namespace) -> dict:
+        """Extract cache settings."""
+        settings = {}
+        if args.cache_backend:
+            settings["cache.backend"] = args.cache_backend
+        if args.cache_backend == "redis":
+            if not args.cache_url:
+                raise ArgsParseError(
+                    "Parameter --cache-url must be provided when using "
+                    "the redis cache backend"
+                )
+        if args.cache_url:
+            settings["cache.url"] = args.cache_url
+        if args.cache_max_size:
+            settings["cache.max_size"] = args.cache_max_size
+        if args.connection_cache_ttl is not None:
+            settings["cache.connection_ttl"] = args.connection_cache_ttl
+        return settings
+
+
 @group(CAT_START)
 class DebugGroup(ArgumentGroup):
     """Debug settings."""
@@ -654,6 +762,77 @@ class GeneralGroup(ArgumentGroup):
             env_var="ACAPY_UNIVERSAL_RESOLVER_BEARER_TOKEN",
             help="Bearer token if universal resolver instance requires authentication.",
         ),
+        parser.add_argument(
+            "--event-bus-mode",
+            type=str,
+            choices=("sequential", "concurrent", "background"),
+            default="sequential",
+            env_var="ACAPY_EVENT_BUS_MODE",
+            help=(
+                "How event subscribers, such as webhook delivery, are run when an "
+                "event is emitted. 'sequential' runs them one after another, "
+                "'concurrent' runs them together, and 'background' queues events "
+                "so that the emitter does not wait for subscribers unless the "
+                "queue is full. Default: sequential."
+            ),
+        )
+        parser.add_argument(
+            "--event-bus-queue-size",
+            type=BoundedInt(min=1),
+            default=1000,
+            metavar="<count>",
+            env_var="ACAPY_EVENT_BUS_QUEUE_SIZE",
+            help=(
+                "Maximum number of events waiting for dispatch in background "
+                "event bus mode. Default: 1000."
+            ),
+        )
+        parser.add_argument(
+            "--event-bus-workers",
+            type=BoundedInt(min=1),
+            default=1,
+            metavar="<count>",
+            env_var="ACAPY_EVENT_BUS_WORKERS",
+            help=(
+                "Number of tasks dispatching events in background event bus mode. "
+                "With more than one worker, events may reach subscribers out of "
+                "order. Default: 1."
+            ),
+        )
+        parser.add_argument(
+            "--crypto-executor-mode",
+            type=str,
+            choices=("thread", "process"),
+            default="thread",
+            env_var="ACAPY_CRYPTO_EXECUTOR_MODE",
+            help=(
+                "Whether CPU-bound credential operations, such as issuing, proving "
+                "and verifying anoncreds credentials, run in worker threads or in "
+                "worker processes. Each class of operation (issue, prove, verify "
+                "and revocation) has its own pool. Default: thread."
+            ),
+        )
+        parser.add_argument(
+            "--crypto-executor-workers",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_CRYPTO_EXECUTOR_WORKERS",
+            help=(
+                "Number of workers in the pool for each class of credential "
+                "operation. Default: the number of CPUs."
+            ),
+        )
+        parser.add_argument(
+            "--crypto-executor-queue-limit",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_CRYPTO_EXECUTOR_QUEUE_LIMIT",
+            help=(
+                "Number of credential operations of one class waiting for a worker "
+                "at which admin API requests, other than queries, are rejected with "
+                "503 Service Unavailable. Default: no limit."
+            ),
+        )
 
     def get_settings(self, args: Namespace) -> dict:
         """Extract general settings."""
@@ -714,6 +893,19 @@ class GeneralGroup(ArgumentGroup):
         if args.universal_resolver_bearer_token:
             settings["resolver.universal.token"] = args.universal_resolver_bearer_token
 
+        if args.event_bus_mode:
+            settings["event_bus.mode"] = args.event_bus_mode
+        if args.event_bus_queue_size:
+            settings["event_bus.queue_size"] = args.event_bus_queue_size
+        if args.event_bus_workers:
+            settings["event_bus.workers"] = args.event_bus_workers
+        if args.crypto_executor_mode:
+            settings["crypto_executor.mode"] = args.crypto_executor_mode
+        if args.crypto_executor_workers:
+            settings["crypto_executor.workers"] = args.crypto_executor_workers
+        if args.crypto_executor_queue_limit:
+            settings["crypto_executor.queue_limit"] = args.crypto_executor_queue_limit
+
         return settings
 
 
@@ -771,6 +963,18 @@ class RevocationGroup(ArgumentGroup):
                 "for anoncreds credentials. Values are 'accept' or 'reject'."
             ),
         )
+        parser.add_argument(
+            "--anoncreds-revocation-index-block-size",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_ANONCREDS_REVOCATION_INDEX_BLOCK_SIZE",
+            help=(
+                "Specifies the number of credential revocation indexes to reserve "
+                "at a time when issuing anoncreds credentials, which are then "
+                "allocated without updating the wallet. Indexes left unused are "
+                "skipped if the agent stops before releasing them. Default: 1."
+            ),
+        )
 
     def get_settings(self, args: Namespace) -> dict:
         """Extract revocation settings."""
@@ -790,6 +994,10 @@ class RevocationGroup(ArgumentGroup):
             settings["revocation.anoncreds_legacy_support"] = (
                 args.anoncreds_legacy_revocation
             )
+        if args.anoncreds_revocation_index_block_size:
+            settings["revocation.anoncreds_index_block_size"] = (
+                args.anoncreds_revocation_index_block_size
+            )
         return settings
 
 
@@ -1370,6 +1578,75 @@ class TransportGroup(ArgumentGroup):
                 "accumulated messages in message queue. Default value is 4."
             ),
         )
+        parser.add_argument(
+            "--outbound-retry-interval",
+            default=10.0,
+            type=float,
+            metavar="<seconds>",
+            env_var="ACAPY_OUTBOUND_RETRY_INTERVAL",
+            help=(
+                "Set the delay in seconds before the first retry of an undelivered "
+                "outbound message. Default value is 10."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-retry-backoff",
+            default=2.0,
+            type=float,
+            metavar="<factor>",
+            env_var="ACAPY_OUTBOUND_RETRY_BACKOFF",
+            help=(
+                "Multiply the retry delay by <factor> after each failed delivery "
+                "attempt. Use 1 for a constant delay. Default value is 2."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-retry-jitter",
+            default=0.1,
+            type=float,
+            metavar="<fraction>",
+            env_var="ACAPY_OUTBOUND_RETRY_JITTER",
+            help=(
+                "Randomly vary each retry delay by up to this fraction of the "
+                "delay, to spread out retries to the same endpoint. "
+                "Default value is 0.1."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-limit-per-host",
+            default=50,
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_OUTBOUND_LIMIT_PER_HOST",
+            help=(
+                "Set the maximum number of concurrent outbound HTTP connections to "
+                "a single host. Default value is 50."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-circuit-failures",
+            default=5,
+            type=BoundedInt(min=0),
+            metavar="<count>",
+            env_var="ACAPY_OUTBOUND_CIRCUIT_FAILURES",
+            help=(
+                "Suspend outbound HTTP delivery to an endpoint after <count> "
+                "consecutive failures. Messages for a suspended endpoint are "
+                "handled as undelivered without further attempts. Use 0 to disable. "
+                "Default value is 5."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-circuit-reset",
+            default=30.0,
+            type=float,
+            metavar="<seconds>",
+            env_var="ACAPY_OUTBOUND_CIRCUIT_RESET",
+            help=(
+                "Allow a trial delivery to a suspended endpoint after <seconds>. "
+                "Default value is 30."
+            ),
+        )
         parser.add_argument(
             "--ws-heartbeat-interval",
             default=3,
@@ -1378,7 +1655,8 @@ class TransportGroup(ArgumentGroup):
             metavar="<interval>",
             help=(
                 "When using Websocket Inbound Transport, send WS pings every "
-                "<interval> seconds."
+                "<interval> seconds. Also applies to the persistent connections "
+                "of the Websocket Outbound Transport."
             ),
         )
         parser.add_argument(
@@ -1392,6 +1670,29 @@ class TransportGroup(ArgumentGroup):
                 "after <interval> seconds without a heartbeat ping."
             ),
         )
+        parser.add_argument(
+            "--ws-outbound-max-connections",
+            default=4,
+            type=BoundedInt(min=1),
+            env_var="ACAPY_WS_OUTBOUND_MAX_CONNECTIONS",
+            metavar="<count>",
+            help=(
+                "Set the maximum number of persistent Websocket Outbound Transport "
+                "connections to a single endpoint. Messages are queued on an open "
+                "connection until all of them are busy. Default value is 4."
+            ),
+        )
+        parser.add_argument(
+            "--ws-outbound-idle-timeout",
+            default=60.0,
+            type=float,
+            env_var="ACAPY_WS_OUTBOUND_IDLE_TIMEOUT",
+            metavar="<seconds>",
+            help=(
+                "Close a persistent Websocket Outbound Transport connection after "
+                "<seconds> with no messages to send. Default value is 60."
+            ),
+        )
 
     def get_settings(self, args: Namespace):
         """Extract transport settings."""
@@ -1414,10 +1715,44 @@ class TransportGroup(ArgumentGroup):
             settings["transport.max_message_size"] = args.max_message_size
         if args.max_outbound_retry:
             settings["transport.max_outbound_retry"] = args.max_outbound_retry
+        if args.outbound_retry_interval is not None:
+            if args.outbound_retry_interval < 0:
+                raise ArgsParseError("Parameter --outbound-retry-interval must be >= 0")
+            settings["transport.outbound_retry_interval"] = args.outbound_retry_interval
+        if args.outbound_retry_backoff is not None:
+            if args.outbound_retry_backoff < 1:
+                raise ArgsParseError("Parameter --outbound-retry-backoff must be >= 1")
+            settings["transport.outbound_retry_backoff"] = args.outbound_retry_backoff
+        if args.outbound_retry_jitter is not None:
+            if not 0 <= args.outbound_retry_jitter < 1:
+                raise ArgsParseError(
+                    "Parameter --outbound-retry-jitter must be between 0 and 1"
+                )
+            settings["transport.outbound_retry_jitter"] = args.outbound_retry_jitter
+        if args.outbound_limit_per_host:
+            settings["transport.http.limit_per_host"] = args.outbound_limit_per_host
+        if args.outbound_circuit_failures is not None:
+            settings["transport.circuit.failure_threshold"] = (
+                args.outbound_circuit_failures
+            )
+        if args.outbound_circuit_reset is not None:
+            if args.outbound_circuit_reset < 0:
+                raise ArgsParseError("Parameter --outbound-circuit-reset must be >= 0")
+            settings["transport.circuit.reset_timeout"] = args.outbound_circuit_reset
         if args.ws_heartbeat_interval:
             settings["transport.ws.heartbeat_interval"] = args.ws_heartbeat_interval
         if args.ws_timeout_interval:
             settings["transport.ws.timeout_interval"] = args.ws_timeout_interval
+        if args.ws_outbound_max_connections:
+            settings["transport.ws.outbound_max_connections"] = (
+                args.ws_outbound_max_connections
+            )
+        if args.ws_outbound_idle_timeout is not None:
+            if args.ws_outbound_idle_timeout <= 0:
+                raise ArgsParseError("Parameter --ws-outbound-idle-timeout must be > 0")
+            settings["transport.ws.outbound_idle_timeout"] = (
+                args.ws_outbound_idle_timeout
+            )
 
         return settings
 
@@ -1762,8 +2097,11 @@ class MultitenantGroup(ArgumentGroup):
                 "Specify multitenancy configuration in key=value pairs. "
                 'For example: "wallet_type=askar-profile wallet_name=askar-profile-name" '
                 "Possible values: wallet_name, wallet_key, cache_size, "
-                'key_derivation_method. "wallet_name" is only used when '
-                '"wallet_type" is "askar-profile"'
+                'key_derivation_method, wallet_record_ttl. "wallet_name" is only '
+                'used when "wallet_type" is "askar-profile". "wallet_record_ttl" '
+                "is the number of seconds to reuse the wallet record of an auth "
+                "token; changes made by other instances are only seen after it "
+                "expires. Default: 0 (disabled)"
             ),
         )
         parser.add_argument(
@@ -2130,6 +2468,16 @@ class UpgradeGroup(ArgumentGroup):
             ),
         )
 
+        parser.add_argument(
+            "--upgrade-workers",
+            type=str,
+            env_var="ACAPY_UPGRADE_WORKERS",
+            help=(
+                "Specify the number of subwallets to upgrade concurrently. "
+                "Default: 4"
+            ),
+        )
+
     def get_settings(self, args: Namespace) -> dict:
         """Extract ACA-Py upgrade process settings."""
         settings = {}
@@ -2154,4 +2502,9 @@ class UpgradeGroup(ArgumentGroup):
                 settings["upgrade.page_size"] = int(args.upgrade_page_size)
             except ValueError:
                 raise ArgsParseError("Parameter --upgrade-page-size must be an integer")
+        if args.upgrade_workers:
+            try:
+                settings["upgrade.workers"] = int(args.upgrade_workers)
+            except ValueError:
+                raise ArgsParseError("Parameter --upgrade-workers must be an integer")
         return settings
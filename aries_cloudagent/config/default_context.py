@@ -3,6 +3,7 @@
 from ..anoncreds.registry import AnonCredsRegistry
 from ..cache.base import BaseCache
 from ..cache.in_memory import InMemoryCache
+from ..cache.redis import RedisCache
 from ..core.event_bus import EventBus
 from ..core.goal_code_registry import GoalCodeRegistry
 from ..core.plugin_registry import PluginRegistry
@@ -14,8 +15,10 @@ from ..protocols.didcomm_prefix import DIDCommPrefix
 from ..protocols.introduction.v0_1.base_service import BaseIntroductionService
 from ..protocols.introduction.v0_1.demo_service import DemoIntroductionService
 from ..resolver.did_resolver import DIDResolver
+from ..resolver.http import ResolverHttpClient
 from ..tails.base import BaseTailsServer
 from ..transport.wire_format import BaseWireFormat
+from ..utils.crypto_executor import CryptoExecutor
 from ..utils.dependencies import is_indy_sdk_module_installed
 from ..utils.stats import Collector
 from ..wallet.default_verification_key_strategy import (
@@ -37,13 +40,20 @@ class DefaultContextBuilder(ContextBuilder):
         context = InjectionContext(settings=self.settings)
         context.settings.set_default("default_label", "Aries Cloud Agent")
 
+        collector = None
         if context.settings.get("timing.enabled"):
             timing_log = context.settings.get("timing.log_file")
             collector = Collector(log_path=timing_log)
             context.injector.bind_instance(Collector, collector)
 
-        # Shared in-memory cache
-        context.injector.bind_instance(BaseCache, InMemoryCache())
+        # Shared cache
+        if context.settings.get("cache.backend") == "redis":
+            cache = RedisCache(context.settings["cache.url"])
+        else:
+            cache = InMemoryCache(
+                max_size=context.settings.get("cache.max_size"), collector=collector
+            )
+        context.injector.bind_instance(BaseCache, cache)
 
         # Global protocol registry
         context.injector.bind_instance(ProtocolRegistry, ProtocolRegistry())
@@ -52,10 +62,30 @@ class DefaultContextBuilder(ContextBuilder):
         context.injector.bind_instance(GoalCodeRegistry, GoalCodeRegistry())
 
         # Global event bus
-        context.injector.bind_instance(EventBus, EventBus())
+        context.injector.bind_instance(
+            EventBus,
+            EventBus(
+                context.settings.get("event_bus.mode", "sequential"),
+                queue_size=context.settings.get("event_bus.queue_size", 1000),
+                workers=context.settings.get("event_bus.workers", 1),
+                collector=collector,
+            ),
+        )
+
+        # Global worker pools for credential cryptography
+        context.injector.bind_instance(
+            CryptoExecutor,
+            CryptoExecutor(
+                context.settings.get("crypto_executor.mode", "thread"),
+                workers=context.settings.get("crypto_executor.workers"),
+                queue_limit=context.settings.get("crypto_executor.queue_limit"),
+                collector=collector,
+            ),
+        )
 
         # Global did resolver
         context.injector.bind_instance(DIDResolver, DIDResolver([]))
+        context.injector.bind_instance(ResolverHttpClient, ResolverHttpClient())
         context.injector.bind_instance(AnonCredsRegistry, AnonCredsRegistry())
         context.injector.bind_instance(DIDMethods, DIDMethods())
         context.injector.bind_instance(KeyTypes, KeyTypes())
@@ -171,3 +201,6 @@ class DefaultContextBuilder(ContextBuilder):
 
         # Register message protocols
         await plugin_registry.init_context(context)
+
+        # Resolve the registered message types ahead of dispatch
+        context.inject(ProtocolRegistry).build_dispatch_table()
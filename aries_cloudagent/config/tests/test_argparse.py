@@ -53,6 +53,53 @@ class TestArgParse(IsolatedAsyncioTestCase):
         assert settings.get("transport.inbound_configs") == [["http", "0.0.0.0", "80"]]
         assert settings.get("transport.outbound_configs") == ["http"]
         assert result.max_outbound_retry == 5
+        assert settings.get("transport.outbound_retry_interval") == 10
+        assert settings.get("transport.outbound_retry_backoff") == 2
+        assert settings.get("transport.outbound_retry_jitter") == 0.1
+        assert settings.get("transport.http.limit_per_host") == 50
+        assert settings.get("transport.circuit.failure_threshold") == 5
+        assert settings.get("transport.circuit.reset_timeout") == 30
+        assert settings.get("transport.ws.outbound_max_connections") == 4
+        assert settings.get("transport.ws.outbound_idle_timeout") == 60
+
+        base_args = ["-it", "http", "0.0.0.0", "80", "-ot", "http"]
+        result = parser.parse_args(
+            base_args
+            + [
+                "--outbound-retry-interval",
+                "0.5",
+                "--outbound-retry-backoff",
+                "1",
+                "--outbound-retry-jitter",
+                "0",
+                "--outbound-limit-per-host",
+                "10",
+                "--outbound-circuit-failures",
+                "0",
+                "--ws-outbound-max-connections",
+                "1",
+                "--ws-outbound-idle-timeout",
+                "5.5",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("transport.outbound_retry_interval") == 0.5
+        assert settings.get("transport.outbound_retry_backoff") == 1
+        assert settings.get("transport.outbound_retry_jitter") == 0
+        assert settings.get("transport.http.limit_per_host") == 10
+        assert settings.get("transport.circuit.failure_threshold") == 0
+        assert settings.get("transport.ws.outbound_max_connections") == 1
+        assert settings.get("transport.ws.outbound_idle_timeout") == 5.5
+
+        for args in (
+            ["--outbound-retry-interval", "-1"],
+            ["--outbound-retry-backoff", "0.5"],
+            ["--outbound-retry-jitter", "1"],
+            ["--outbound-circuit-reset", "-1"],
+            ["--ws-outbound-idle-timeout", "0"],
+        ):
+            with self.assertRaises(argparse.ArgsParseError):
+                group.get_settings(parser.parse_args(base_args + args))
 
     async def test_get_genesis_transactions_list_with_ledger_selection(self):
         """Test multiple ledger support related argument parsing."""
@@ -209,6 +256,8 @@ class TestArgParse(IsolatedAsyncioTestCase):
                 "test_wallet_id_1",
                 "--upgrade-subwallet",
                 "test_wallet_id_2",
+                "--upgrade-workers",
+                "8",
                 "--force-upgrade",
             ]
         )
@@ -224,6 +273,11 @@ class TestArgParse(IsolatedAsyncioTestCase):
             "test_wallet_id_1",
             "test_wallet_id_2",
         ]
+        assert settings.get("upgrade.workers") == 8
+
+        result = parser.parse_args(["--upgrade-workers", "many"])
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
 
     async def test_outbound_is_required(self):
         """Test that either -ot or -oq are required"""
@@ -633,3 +687,140 @@ class TestArgParse(IsolatedAsyncioTestCase):
         )
         with self.assertRaises(argparse.ArgsParseError):
             group.get_settings(result)
+
+    def test_cache_settings(self):
+        """Test cache flags."""
+        parser = argparse.create_argument_parser()
+        group = argparse.CacheGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args([])
+        settings = group.get_settings(result)
+        assert settings.get("cache.backend") == "memory"
+        assert "cache.max_size" not in settings
+
+        result = parser.parse_args(
+            ["--cache-backend", "redis", "--cache-url", "redis://localhost:6379"]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("cache.backend") == "redis"
+        assert settings.get("cache.url") == "redis://localhost:6379"
+
+        result = parser.parse_args(["--cache-backend", "redis"])
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
+        result = parser.parse_args(["--cache-max-size", "1000"])
+        settings = group.get_settings(result)
+        assert settings.get("cache.max_size") == 1000
+
+        with self.assertRaises(SystemExit):
+            parser.parse_args(["--cache-max-size", "0"])
+
+        settings = group.get_settings(parser.parse_args([]))
+        assert "cache.connection_ttl" not in settings
+        result = parser.parse_args(["--connection-cache-ttl", "0"])
+        settings = group.get_settings(result)
+        assert settings.get("cache.connection_ttl") == 0
+
+    def test_webhook_batch_settings(self):
+        """Test batched webhook flags."""
+        parser = argparse.create_argument_parser()
+        group = argparse.AdminGroup()
+        group.add_arguments(parser)
+        admin_args = ["--admin", "0.0.0.0", "8000", "--admin-insecure-mode"]
+
+        settings = group.get_settings(parser.parse_args(admin_args))
+        assert "admin.webhook_batch_size" not in settings
+
+        result = parser.parse_args(
+            admin_args + ["--webhook-batch-size", "50", "--webhook-batch-window", "0.5"]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("admin.webhook_batch_size") == 50
+        assert settings.get("admin.webhook_batch_window") == 0.5
+
+        result = parser.parse_args(
+            admin_args + ["--webhook-batch-size", "50", "--webhook-batch-window", "0"]
+        )
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
+    def test_event_bus_settings(self):
+        """Test event bus dispatch flags."""
+        parser = argparse.create_argument_parser()
+        group = argparse.GeneralGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(["-e", "http://host"])
+        settings = group.get_settings(result)
+        assert settings.get("event_bus.mode") == "sequential"
+
+        result = parser.parse_args(
+            [
+                "-e",
+                "http://host",
+                "--event-bus-mode",
+                "background",
+                "--event-bus-queue-size",
+                "50",
+                "--event-bus-workers",
+                "4",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("event_bus.mode") == "background"
+        assert settings.get("event_bus.queue_size") == 50
+        assert settings.get("event_bus.workers") == 4
+
+        with self.assertRaises(SystemExit):
+            parser.parse_args(["-e", "http://host", "--event-bus-mode", "other"])
+
+    def test_revocation_index_block_size(self):
+        """Test revocation index block size flag."""
+        parser = argparse.create_argument_parser()
+        group = argparse.RevocationGroup()
+        group.add_arguments(parser)
+
+        settings = group.get_settings(parser.parse_args([]))
+        assert "revocation.anoncreds_index_block_size" not in settings
+
+        result = parser.parse_args(["--anoncreds-revocation-index-block-size", "20"])
+        settings = group.get_settings(result)
+        assert settings.get("revocation.anoncreds_index_block_size") == 20
+
+        with self.assertRaises(SystemExit):
+            parser.parse_args(["--anoncreds-revocation-index-block-size", "0"])
+
+    def test_crypto_executor(self):
+        """Test crypto executor flags."""
+        parser = argparse.create_argument_parser()
+        group = argparse.GeneralGroup()
+        group.add_arguments(parser)
+
+        settings = group.get_settings(parser.parse_args(["--endpoint", "localhost"]))
+        assert settings.get("crypto_executor.mode") == "thread"
+        assert "crypto_executor.workers" not in settings
+        assert "crypto_executor.queue_limit" not in settings
+
+        result = parser.parse_args(
+            [
+                "--endpoint",
+                "localhost",
+                "--crypto-executor-mode",
+                "process",
+                "--crypto-executor-workers",
+                "4",
+                "--crypto-executor-queue-limit",
+                "32",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("crypto_executor.mode") == "process"
+        assert settings.get("crypto_executor.workers") == 4
+        assert settings.get("crypto_executor.queue_limit") == 32
+
+        with self.assertRaises(SystemExit):
+            parser.parse_args(["--crypto-executor-mode", "fork"])
+        with self.assertRaises(SystemExit):
+            parser.parse_args(["--crypto-executor-workers", "0"])
@@ -3,6 +3,7 @@ from tempfile import NamedTemporaryFile
 from unittest import IsolatedAsyncioTestCase
 
 from ...cache.base import BaseCache
+from ...cache.redis import RedisCache
 from ...core.profile import ProfileManager
 from ...core.protocol_registry import ProtocolRegistry
 from ...transport.wire_format import BaseWireFormat
@@ -27,6 +28,15 @@ class TestDefaultContext(IsolatedAsyncioTestCase):
         ):
             assert isinstance(result.inject(cls), cls)
 
+        builder = DefaultContextBuilder(
+            settings={
+                "cache.backend": "redis",
+                "cache.url": "redis://localhost:6379",
+            }
+        )
+        result = await builder.build_context()
+        assert isinstance(result.inject(BaseCache), RedisCache)
+
         builder = DefaultContextBuilder(
             settings={
                 "timing.enabled": True,
@@ -877,10 +877,14 @@ class BaseConnectionManager:
                         receipt.sender_did = cached["sender_did"]
                         receipt.recipient_did_public = cached["recipient_did_public"]
                         receipt.recipient_did = cached["recipient_did"]
-                        async with self._profile.session() as session:
-                            connection = await ConnRecord.retrieve_by_id(
-                                session, cached["id"]
-                            )
+                        try:
+                            async with self._profile.session() as session:
+                                connection = await ConnRecord.retrieve_by_id(
+                                    session, cached["id"]
+                                )
+                        except StorageNotFoundError:
+                            # the connection was deleted: resolve it again below
+                            await cache.clear(cache_key)
                     else:
                         connection = await self.resolve_inbound_connection(receipt)
                         if connection:
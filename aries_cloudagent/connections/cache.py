@@ -0,0 +1,116 @@
+"""Per-wallet read-through cache of connection records."""
+
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Tuple
+from weakref import WeakKeyDictionary, WeakSet
+
+from ..core.event_bus import Event, EventBus
+from ..core.profile import Profile
+
+CONNECTION_EVENT_PATTERN = re.compile("^acapy::record::connections(::.*)?$")
+
+DEFAULT_TTL = 0
+DEFAULT_MAX_SIZE = 10000
+
+
+class ConnRecordCache:
+    """Cache of stored connection record values for a single wallet.
+
+    Only ready (active) connection records are cached: these are the records
+    looked up for every inbound and outbound message, and they only leave the
+    ready states when abandoned or deleted. Entries are dropped when the
+    record is saved or deleted, when a connection record event is received
+    for the wallet, or once the TTL expires.
+
+    The cache is shared by the profile instances opened on the same store and
+    Askar profile, so it survives profiles being rebuilt for each request.
+    Changes made by other agent processes are not seen until the TTL expires,
+    so the cache is disabled by default and only safe to enable when a single
+    instance uses the wallet.
+    """
+
+    _caches: "WeakKeyDictionary[Any, Dict[Optional[str], ConnRecordCache]]" = (
+        WeakKeyDictionary()
+    )
+    _event_buses: "WeakSet[EventBus]" = WeakSet()
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_size: int = DEFAULT_MAX_SIZE):
+        """Initialize the cache instance.
+
+        Args:
+            ttl: the number of seconds to keep each entry
+            max_size: the maximum number of entries to keep
+
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._values: "OrderedDict[str, Tuple[float, Mapping]]" = OrderedDict()
+
+    @staticmethod
+    def _wallet_key(profile: Profile) -> Tuple[Any, Optional[str]]:
+        """Get the opened store, or the profile itself, and the Askar profile id."""
+        return (
+            getattr(profile, "opened", None) or profile,
+            getattr(profile, "profile_id", None),
+        )
+
+    @classmethod
+    def for_profile(cls, profile: Profile) -> Optional["ConnRecordCache"]:
+        """Get the connection record cache for the wallet of a profile, if enabled."""
+        if not isinstance(profile, Profile):
+            return None
+        owner, profile_id = cls._wallet_key(profile)
+        caches = cls._caches.get(owner)
+        cache = caches and caches.get(profile_id)
+        if cache is None:
+            ttl = profile.settings.get("cache.connection_ttl", DEFAULT_TTL)
+            if not ttl:
+                return None
+            cache = cls(ttl)
+            cls._caches.setdefault(owner, {})[profile_id] = cache
+            event_bus = profile.inject_or(EventBus)
+            if event_bus and event_bus not in cls._event_buses:
+                event_bus.subscribe(CONNECTION_EVENT_PATTERN, cls.on_connection_event)
+                cls._event_buses.add(event_bus)
+        return cache
+
+    @classmethod
+    async def on_connection_event(cls, profile: Profile, event: Event):
+        """Drop the cached value for a connection record which was updated."""
+        owner, profile_id = cls._wallet_key(profile)
+        cache = cls._caches.get(owner, {}).get(profile_id)
+        if cache is not None and isinstance(event.payload, dict):
+            cache.invalidate(event.payload.get("connection_id"))
+
+    def get(self, connection_id: str) -> Optional[Mapping]:
+        """Fetch the cached record value for a connection."""
+        entry = self._values.get(connection_id)
+        if not entry:
+            return None
+        expires, value = entry
+        if expires < time.perf_counter():
+            del self._values[connection_id]
+            return None
+        self._values.move_to_end(connection_id)
+        return value
+
+    def set(self, connection_id: str, value: Mapping):
+        """Add the record value for a connection to the cache."""
+        self._values[connection_id] = (time.perf_counter() + self.ttl, value)
+        self._values.move_to_end(connection_id)
+        while len(self._values) > self.max_size:
+            self._values.popitem(last=False)
+
+    def invalidate(self, connection_id: str):
+        """Remove the cached value for a connection, if any."""
+        self._values.pop(connection_id, None)
+
+    def clear(self):
+        """Remove all cached values."""
+        self._values.clear()
+
+    def __len__(self) -> int:
+        """Get the number of cached values."""
+        return len(self._values)
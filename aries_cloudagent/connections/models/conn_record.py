@@ -7,6 +7,7 @@ from typing import Any, Optional, Union
 from marshmallow import fields, validate
 
 from ...core.profile import ProfileSession
+from ..cache import ConnRecordCache
 from ...messaging.models.base_record import BaseRecord, BaseRecordSchema
 from ...messaging.valid import (
     GENERIC_DID_EXAMPLE,
@@ -42,6 +43,7 @@ class ConnRecord(BaseRecord):
         """ConnRecord metadata."""
 
         schema_class = "MaybeStoredConnRecordSchema"
+        fast_serialize = True
 
     class Protocol(Enum):
         """Supported Protocols for Connection."""
@@ -283,6 +285,34 @@ class ConnRecord(BaseRecord):
             )
         }
 
+    @classmethod
+    async def retrieve_by_id(
+        cls,
+        session: ProfileSession,
+        record_id: str,
+        *,
+        for_update=False,
+    ) -> "ConnRecord":
+        """Retrieve a connection record by ID, through the connection record cache.
+
+        Args:
+            session: The profile session to use
+            record_id: The ID of the record to find
+            for_update: Whether to lock the record for update, bypassing the cache
+        """
+        cache = None
+        if not (for_update or session.is_transaction):
+            cache = ConnRecordCache.for_profile(session.profile)
+        if cache is not None:
+            value = cache.get(record_id)
+            if value:
+                return cls.from_storage(record_id, dict(value))
+
+        record = await super().retrieve_by_id(session, record_id, for_update=for_update)
+        if cache is not None and record.is_ready:
+            cache.set(record_id, record.value)
+        return record
+
     @classmethod
     async def retrieve_by_did(
         cls,
@@ -507,6 +537,10 @@ class ConnRecord(BaseRecord):
         """
         await super().post_save(session, *args, **kwargs)
 
+        cache = ConnRecordCache.for_profile(session.profile)
+        if cache is not None:
+            cache.invalidate(self.connection_id)
+
         # clear cache key set by connection manager
         cache_key = f"connection_target::{self.connection_id}"
         await self.clear_cached_key(session, cache_key)
@@ -520,6 +554,10 @@ class ConnRecord(BaseRecord):
         """
         await super().delete_record(session)
 
+        cache = ConnRecordCache.for_profile(session.profile)
+        if cache is not None:
+            cache.invalidate(self.connection_id)
+
         storage = session.inject(BaseStorage)
         # Delete metadata
         if self.connection_id:
@@ -1146,6 +1146,33 @@ class TestBaseConnectionManager(IsolatedAsyncioTestCase):
             conn_rec = await self.manager.find_inbound_connection(receipt)
             assert conn_rec.id == mock_conn.id
 
+    async def test_find_inbound_connection_cached_deleted(self):
+        receipt = MessageReceipt(
+            sender_verkey=self.test_verkey,
+            recipient_verkey=self.test_target_verkey,
+            recipient_did_public=False,
+        )
+
+        mock_conn = mock.MagicMock()
+        mock_conn.connection_id = "dummy"
+
+        with mock.patch.object(
+            BaseConnectionManager,
+            "resolve_inbound_connection",
+            mock.CoroutineMock(return_value=mock_conn),
+        ) as mock_conn_mgr_resolve_conn:
+            await self.manager.find_inbound_connection(receipt)
+
+            # the cached connection no longer exists: resolve it again
+            mock_conn_mgr_resolve_conn.return_value = None
+            with mock.patch.object(
+                ConnRecord,
+                "retrieve_by_id",
+                mock.CoroutineMock(side_effect=StorageNotFoundError()),
+            ):
+                assert not await self.manager.find_inbound_connection(receipt)
+            assert mock_conn_mgr_resolve_conn.call_count == 2
+
     async def test_find_inbound_connection_no_cache(self):
         receipt = MessageReceipt(
             sender_verkey=self.test_verkey,
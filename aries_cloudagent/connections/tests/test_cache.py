@@ -0,0 +1,132 @@
+from unittest import IsolatedAsyncioTestCase
+
+from ...core.event_bus import EventBus
+from ...core.in_memory import InMemoryProfile
+from ...storage.base import BaseStorage
+from ...storage.error import StorageNotFoundError
+from ...tests import mock
+from ..cache import ConnRecordCache
+from ..models.conn_record import ConnRecord
+
+
+class TestConnRecordCache(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.profile = InMemoryProfile.test_profile(
+            {"cache.connection_ttl": 60}, bind={EventBus: EventBus()}
+        )
+        self.cache = ConnRecordCache.for_profile(self.profile)
+
+    async def make_record(self, state=ConnRecord.State.COMPLETED) -> ConnRecord:
+        record = ConnRecord(state=state, their_label="Bob")
+        async with self.profile.session() as session:
+            await record.save(session)
+        return record
+
+    def test_lru_ttl(self):
+        cache = ConnRecordCache(ttl=10, max_size=2)
+        cache.set("a", {"state": "a"})
+        cache.set("b", {"state": "b"})
+        assert cache.get("a") == {"state": "a"}
+        cache.set("c", {"state": "c"})
+        assert len(cache) == 2
+        assert cache.get("b") is None
+
+        with mock.patch("time.perf_counter", return_value=10**9):
+            assert cache.get("a") is None
+        assert len(cache) == 1
+
+        cache.clear()
+        assert not len(cache)
+
+    async def test_for_profile(self):
+        assert ConnRecordCache.for_profile(self.profile) is self.cache
+        assert ConnRecordCache.for_profile(
+            InMemoryProfile.test_profile({"cache.connection_ttl": 60})
+        ) not in (None, self.cache)
+        assert ConnRecordCache.for_profile(mock.MagicMock()) is None
+        # disabled by default
+        assert ConnRecordCache.for_profile(InMemoryProfile.test_profile()) is None
+        assert (
+            ConnRecordCache.for_profile(
+                InMemoryProfile.test_profile({"cache.connection_ttl": 0})
+            )
+            is None
+        )
+
+    async def test_for_profile_shared_store(self):
+        opened = mock.MagicMock()
+        event_bus = EventBus()
+
+        def wallet_profile(profile_id):
+            profile = InMemoryProfile.test_profile(
+                {"cache.connection_ttl": 60}, bind={EventBus: event_bus}
+            )
+            profile.opened = opened
+            profile.profile_id = profile_id
+            return profile
+
+        # profiles rebuilt for the same wallet share one cache
+        cache = ConnRecordCache.for_profile(wallet_profile("tenant1"))
+        assert ConnRecordCache.for_profile(wallet_profile("tenant1")) is cache
+        assert ConnRecordCache.for_profile(wallet_profile("tenant2")) is not cache
+
+        cache.set("conn-id", {"state": "active"})
+        other = wallet_profile("tenant1")
+        await other.notify(
+            "acapy::record::connections::deleted", {"connection_id": "conn-id"}
+        )
+        assert not cache.get("conn-id")
+
+    async def test_retrieve_cached(self):
+        record = await self.make_record()
+        async with self.profile.session() as session:
+            storage = session.inject(BaseStorage)
+            with mock.patch.object(
+                storage, "get_record", wraps=storage.get_record
+            ) as mock_get:
+                first = await ConnRecord.retrieve_by_id(session, record.connection_id)
+                second = await ConnRecord.retrieve_by_id(session, record.connection_id)
+                assert mock_get.call_count == 1
+                await ConnRecord.retrieve_by_id(
+                    session, record.connection_id, for_update=True
+                )
+                assert mock_get.call_count == 2
+        assert first == second == record
+        assert first is not second
+
+    async def test_not_ready_uncached(self):
+        record = await self.make_record(ConnRecord.State.REQUEST)
+        async with self.profile.session() as session:
+            await ConnRecord.retrieve_by_id(session, record.connection_id)
+        assert not self.cache.get(record.connection_id)
+
+    async def test_invalidate_on_save(self):
+        record = await self.make_record()
+        async with self.profile.session() as session:
+            await ConnRecord.retrieve_by_id(session, record.connection_id)
+            assert self.cache.get(record.connection_id)
+            # no state change: no event is emitted
+            record.alias = "Robert"
+            await record.save(session)
+            assert not self.cache.get(record.connection_id)
+            retrieved = await ConnRecord.retrieve_by_id(session, record.connection_id)
+        assert retrieved.alias == "Robert"
+
+    async def test_invalidate_on_delete(self):
+        record = await self.make_record()
+        async with self.profile.session() as session:
+            await ConnRecord.retrieve_by_id(session, record.connection_id)
+            await record.delete_record(session)
+            with self.assertRaises(StorageNotFoundError):
+                await ConnRecord.retrieve_by_id(session, record.connection_id)
+
+    async def test_invalidate_on_event(self):
+        record = await self.make_record()
+        async with self.profile.session() as session:
+            await ConnRecord.retrieve_by_id(session, record.connection_id)
+        assert self.cache.get(record.connection_id)
+        await self.profile.notify(
+            "acapy::record::connections::abandoned",
+            {"connection_id": record.connection_id},
+        )
+        assert not self.cache.get(record.connection_id)
@@ -17,6 +17,7 @@ from qrcode import QRCode
 
 from ..admin.base_server import BaseAdminServer
 from ..admin.server import AdminResponder, AdminServer
+from ..cache.base import BaseCache
 from ..config.default_context import ContextBuilder
 from ..config.injection_context import InjectionContext
 from ..config.ledger import (
@@ -60,21 +61,26 @@ from ..protocols.coordinate_mediation.v1_0.route_manager_provider import (
 )
 from ..protocols.out_of_band.v1_0.manager import OutOfBandManager
 from ..protocols.out_of_band.v1_0.messages.invitation import HSProto, InvitationMessage
+from ..protocols.routing.v1_0.manager import RoutingManager
+from ..protocols.routing.v1_0.route_index import RouteIndex
+from ..resolver.http import ResolverHttpClient
 from ..storage.base import BaseStorage
 from ..storage.error import StorageNotFoundError
 from ..transport.inbound.manager import InboundTransportManager
 from ..transport.inbound.message import InboundMessage
 from ..transport.outbound.base import OutboundDeliveryError
-from ..transport.outbound.manager import OutboundTransportManager, QueuedOutboundMessage
+from ..transport.outbound.manager import OutboundTransportManager
 from ..transport.outbound.message import OutboundMessage
 from ..transport.outbound.status import OutboundSendStatus
 from ..transport.wire_format import BaseWireFormat
+from ..utils.crypto_executor import CryptoExecutor
 from ..utils.stats import Collector
 from ..utils.task_queue import CompletedTask, TaskQueue
 from ..vc.ld_proofs.document_loader import DocumentLoader
 from ..version import RECORD_TYPE_ACAPY_VERSION, __version__
 from ..wallet.did_info import DIDInfo
 from .dispatcher import Dispatcher
+from .event_bus import EventBus
 from .oob_processor import OobMessageProcessor
 from .util import SHUTDOWN_EVENT_TOPIC, STARTUP_EVENT_TOPIC
 
@@ -285,6 +291,14 @@ class Conductor:
 
         context = self.root_profile.context
 
+        # Index the subwallet routes before accepting inbound messages
+        if context.settings.get("multitenant.enabled"):
+            try:
+                loaded = await RoutingManager(self.root_profile).load_route_index()
+                LOGGER.info("Loaded %s routes into the route index", loaded)
+            except Exception:
+                LOGGER.exception("Unable to load the route index")
+
         # Start up transports
         try:
             await self.inbound_transport_manager.start()
@@ -546,8 +560,24 @@ class Conductor:
 
             shutdown.run(self.root_profile.close())
 
+        event_bus = self.context.inject_or(EventBus)
+        if event_bus:
+            shutdown.run(event_bus.close())
+
+        cache = self.context.inject_or(BaseCache)
+        if cache:
+            shutdown.run(cache.close())
+
+        resolver_http_client = self.context.inject_or(ResolverHttpClient)
+        if resolver_http_client:
+            shutdown.run(resolver_http_client.close())
+
         await shutdown.complete(timeout)
 
+        crypto_executor = self.context.inject_or(CryptoExecutor)
+        if crypto_executor:
+            crypto_executor.shutdown(wait=False)
+
     def inbound_message_router(
         self,
         profile: Profile,
@@ -613,18 +643,20 @@ class Conductor:
         """Get the current stats tracked by the conductor."""
         stats = {
             "in_sessions": len(self.inbound_transport_manager.sessions),
-            "out_encode": 0,
-            "out_deliver": 0,
             "task_active": self.dispatcher.task_queue.current_active,
             "task_done": self.dispatcher.task_queue.total_done,
             "task_failed": self.dispatcher.task_queue.total_failed,
             "task_pending": self.dispatcher.task_queue.current_pending,
         }
-        for m in self.outbound_transport_manager.outbound_buffer:
-            if m.state == QueuedOutboundMessage.STATE_ENCODE:
-                stats["out_encode"] += 1
-            if m.state == QueuedOutboundMessage.STATE_DELIVER:
-                stats["out_deliver"] += 1
+        stats.update(self.outbound_transport_manager.get_queue_stats())
+        route_index = RouteIndex.for_profile(self.root_profile)
+        if route_index:
+            stats.update(
+                {
+                    f"route_index_{name}": value
+                    for name, value in route_index.stats().items()
+                }
+            )
         return stats
 
     async def outbound_message_router(
@@ -24,6 +24,7 @@ from ..messaging.request_context import RequestContext
 from ..messaging.responder import BaseResponder, SKIP_ACTIVE_CONN_CHECK_MSG_TYPES
 from ..messaging.util import datetime_now
 from ..protocols.problem_report.v1_0.message import ProblemReport
+from ..protocols.routing.v1_0.relay import relay_forward
 from ..transport.inbound.message import InboundMessage
 from ..transport.outbound.message import OutboundMessage
 from ..transport.outbound.status import OutboundSendStatus
@@ -133,6 +134,10 @@ class Dispatcher:
             The response from the handler
 
         """
+        # forward messages are relayed without a message model round-trip
+        if await relay_forward(profile, inbound_message, send_outbound):
+            return
+
         r_time = get_timer()
 
         error_result = None
@@ -286,16 +291,20 @@ class Dispatcher:
 
         if not message_type:
             raise MessageParseError("Message does not contain '@type' parameter")
-        message_type_rec_version = get_version_from_message_type(message_type)
 
         registry: ProtocolRegistry = self.profile.inject(ProtocolRegistry)
-        try:
-            message_cls = registry.resolve_message_class(message_type)
-        except ProtocolMinorVersionNotSupported as e:
-            raise MessageParseError(f"Problem parsing message type. {e}")
+        entry = registry.get_dispatch_entry(message_type)
+        if entry:
+            message_cls = entry.message_cls
+        else:
+            message_type_rec_version = get_version_from_message_type(message_type)
+            try:
+                message_cls = registry.resolve_message_class(message_type)
+            except ProtocolMinorVersionNotSupported as e:
+                raise MessageParseError(f"Problem parsing message type. {e}")
 
-        if not message_cls:
-            raise MessageParseError(f"Unrecognized message type {message_type}")
+            if not message_cls:
+                raise MessageParseError(f"Unrecognized message type {message_type}")
 
         try:
             instance = message_cls.deserialize(parsed_msg)
@@ -303,6 +312,10 @@ class Dispatcher:
             if "/problem-report" in message_type:
                 raise ProblemReportParseError("Error parsing problem report message")
             raise MessageParseError(f"Error deserializing message: {e}") from e
+        if entry and entry.response_version:
+            return (instance, entry.warning)
+        if entry:
+            message_type_rec_version = get_version_from_message_type(message_type)
         _, warning = await validate_get_response_version(
             profile, message_type_rec_version, message_cls
         )
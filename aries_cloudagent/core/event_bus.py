@@ -19,11 +19,18 @@ from typing import (
 )
 from functools import partial
 
+from ..utils.stats import Collector
+
 if TYPE_CHECKING:  # To avoid circular import error
     from .profile import Profile
 
 LOGGER = logging.getLogger(__name__)
 
+DISPATCH_SEQUENTIAL = "sequential"
+DISPATCH_CONCURRENT = "concurrent"
+DISPATCH_BACKGROUND = "background"
+DISPATCH_MODES = (DISPATCH_SEQUENTIAL, DISPATCH_CONCURRENT, DISPATCH_BACKGROUND)
+
 
 class Event:
     """A simple event object."""
@@ -80,11 +87,62 @@ class EventWithMetadata(Event):
 
 
 class EventBus:
-    """A simple event bus implementation."""
+    """A simple event bus implementation.
 
-    def __init__(self):
-        """Initialize Event Bus."""
+    Subscribers may be dispatched in one of three modes:
+
+    - sequential: each subscriber is awaited in turn by `notify`
+    - concurrent: subscribers are awaited together by `notify`
+    - background: events are handed to worker tasks through a bounded queue,
+      so `notify` only waits when the queue is full
+    """
+
+    MAX_CACHED_TOPICS = 1024
+
+    def __init__(
+        self,
+        dispatch_mode: str = DISPATCH_SEQUENTIAL,
+        *,
+        queue_size: int = 1000,
+        workers: int = 1,
+        collector: Collector = None,
+    ):
+        """Initialize Event Bus.
+
+        Args:
+            dispatch_mode: how subscribers are dispatched
+            queue_size: the maximum number of queued events in background mode
+            workers: the number of worker tasks in background mode
+            collector: an optional collector for per-subscriber timing
+
+        """
+        if dispatch_mode not in DISPATCH_MODES:
+            raise ValueError(f"Unsupported event dispatch mode: {dispatch_mode}")
         self.topic_patterns_to_subscribers: Dict[Pattern, List[Callable]] = {}
+        self.dispatch_mode = dispatch_mode
+        self.queue_size = queue_size
+        self.workers = workers
+        self.collector = collector
+        # matching patterns and subscribers, by topic
+        self._topic_cache: Dict[
+            str, List[Tuple[EventMetadata, Tuple[Callable, ...]]]
+        ] = {}
+        self._queue: asyncio.Queue = None
+        self._worker_tasks: List[asyncio.Task] = []
+
+    def _route(self, topic: str) -> List[Tuple[EventMetadata, Tuple[Callable, ...]]]:
+        """Find the subscribers for a topic, with the match of each pattern."""
+        routes = self._topic_cache.get(topic)
+        if routes is None:
+            routes = []
+            for pattern, subscribers in self.topic_patterns_to_subscribers.items():
+                match = pattern.match(topic)
+                if match:
+                    routes.append((EventMetadata(pattern, match), tuple(subscribers)))
+            if len(self._topic_cache) >= self.MAX_CACHED_TOPICS:
+                self._topic_cache.clear()
+            self._topic_cache[topic] = routes
+        return routes
 
     async def notify(self, profile: "Profile", event: Event):
         """Notify subscribers of event.
@@ -94,33 +152,70 @@ class EventBus:
             event (Event): event to emit
 
         """
-        # TODO don't block notifier until subscribers have all been called?
-        # TODO trigger each processor but don't await?
-        # TODO log errors but otherwise ignore?
-
         LOGGER.debug("Notifying subscribers: %s", event)
 
         partials = []
-        for pattern, subscribers in self.topic_patterns_to_subscribers.items():
-            match = pattern.match(event.topic)
-
-            if not match:
-                continue
-
+        for metadata, subscribers in self._route(event.topic):
             for subscriber in subscribers:
                 partials.append(
                     partial(
+                        self._process,
                         subscriber,
                         profile,
-                        event.with_metadata(EventMetadata(pattern, match)),
+                        event.with_metadata(metadata),
                     )
                 )
+        if not partials:
+            return
+
+        if self.dispatch_mode == DISPATCH_BACKGROUND:
+            self._start_workers()
+            await self._queue.put(partials)
+        elif self.dispatch_mode == DISPATCH_CONCURRENT:
+            await asyncio.gather(*(processor() for processor in partials))
+        else:
+            for processor in partials:
+                await processor()
 
-        for processor in partials:
+    async def _process(self, subscriber: Callable, profile: "Profile", event: Event):
+        """Call a subscriber, logging any error."""
+        try:
+            if self.collector:
+                name = getattr(subscriber, "__qualname__", None) or (
+                    type(subscriber).__qualname__
+                )
+                with self.collector.timer(f"EventBus.subscriber:{name}"):
+                    await subscriber(profile, event)
+            else:
+                await subscriber(profile, event)
+        except Exception:
+            LOGGER.exception("Error occurred while processing event")
+
+    def _start_workers(self):
+        """Start the background dispatch workers if not running."""
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.queue_size)
+        self._worker_tasks = [task for task in self._worker_tasks if not task.done()]
+        while len(self._worker_tasks) < self.workers:
+            self._worker_tasks.append(asyncio.ensure_future(self._worker()))
+
+    async def _worker(self):
+        """Dispatch queued events in the background."""
+        while True:
+            partials = await self._queue.get()
             try:
-                await processor()
-            except Exception:
-                LOGGER.exception("Error occurred while processing event")
+                for processor in partials:
+                    await processor()
+            finally:
+                self._queue.task_done()
+
+    async def close(self):
+        """Finish dispatching queued events and stop the background workers."""
+        if self._queue is not None and self._worker_tasks:
+            await self._queue.join()
+        for task in self._worker_tasks:
+            task.cancel()
+        self._worker_tasks = []
 
     def subscribe(self, pattern: Pattern, processor: Callable):
         """Subscribe to an event.
@@ -134,6 +229,7 @@ class EventBus:
         if pattern not in self.topic_patterns_to_subscribers:
             self.topic_patterns_to_subscribers[pattern] = []
         self.topic_patterns_to_subscribers[pattern].append(processor)
+        self._topic_cache.clear()
 
     def unsubscribe(self, pattern: Pattern, processor: Callable):
         """Unsubscribe from an event.
@@ -154,6 +250,7 @@ class EventBus:
             del self.topic_patterns_to_subscribers[pattern][index]
             if not self.topic_patterns_to_subscribers[pattern]:
                 del self.topic_patterns_to_subscribers[pattern]
+            self._topic_cache.clear()
             LOGGER.debug("Unsubscribed: topic %s, processor %s", pattern, processor)
 
     @contextmanager
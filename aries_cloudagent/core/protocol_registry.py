@@ -2,17 +2,35 @@
 
 import logging
 import re
+from types import MappingProxyType
 
-from typing import Mapping, Sequence
+from typing import Mapping, NamedTuple, Optional, Sequence
 
 from ..config.injection_context import InjectionContext
 from ..utils.classloader import ClassLoader
 
 from .error import ProtocolMinorVersionNotSupported, ProtocolDefinitionValidationError
+from .util import (
+    get_response_version,
+    get_version_from_message_type,
+    load_version_def_from_msg_class,
+)
 
 LOGGER = logging.getLogger(__name__)
 
 
+class MessageTypeEntry(NamedTuple):
+    """A message type resolved for dispatch.
+
+    The response version and warning are None when the version definition of
+    the message class could not be determined ahead of time.
+    """
+
+    message_cls: type
+    response_version: Optional[str]
+    warning: Optional[str]
+
+
 class ProtocolRegistry:
     """Protocol registry for indexing message families."""
 
@@ -21,6 +39,7 @@ class ProtocolRegistry:
         self._controllers = {}
         self._typemap = {}
         self._versionmap = {}
+        self._dispatch_table: Optional[Mapping[str, MessageTypeEntry]] = None
 
     @property
     def protocols(self) -> Sequence[str]:
@@ -156,6 +175,8 @@ class ProtocolRegistry:
 
         """
 
+        self._dispatch_table = None
+
         # Maintain support for versionless protocol modules
         updated_typesets = None
         minor_versions_supported = self._message_type_check_for_minor_verssion(
@@ -190,6 +211,60 @@ class ProtocolRegistry:
         for controlset in controller_sets:
             self._controllers.update(controlset)
 
+    def build_dispatch_table(self) -> Mapping[str, MessageTypeEntry]:
+        """Resolve all registered message types ahead of dispatch.
+
+        Each registered message type, including the generated minor version
+        variants, is mapped to its message class and the version verdict for
+        a received message of that type. Message types whose class cannot be
+        loaded are left out, and are resolved (and fail) when received.
+
+        The table is rebuilt on first use after further message types are
+        registered.
+
+        Returns:
+            A read-only mapping of message types to dispatch entries
+
+        """
+        table = {}
+        for message_type, msg_cls in self._typemap.items():
+            if isinstance(msg_cls, str):
+                try:
+                    msg_cls = ClassLoader.load_class(msg_cls)
+                except Exception:
+                    LOGGER.debug("Unable to load message class for %s", message_type)
+                    continue
+            try:
+                rec_version = get_version_from_message_type(message_type)
+                version_definition = load_version_def_from_msg_class(
+                    msg_cls, int(rec_version.split(".")[0])
+                )
+                response_version, warning = get_response_version(
+                    rec_version, version_definition
+                )
+            except Exception:
+                # checked for each message, as before
+                response_version = warning = None
+            table[message_type] = MessageTypeEntry(msg_cls, response_version, warning)
+        self._dispatch_table = MappingProxyType(table)
+        return self._dispatch_table
+
+    def get_dispatch_entry(self, message_type: str) -> Optional[MessageTypeEntry]:
+        """Look up a registered message type in the dispatch table.
+
+        Args:
+            message_type: Message type to look up
+
+        Returns:
+            The dispatch entry, or None if the message type must be resolved
+            with `resolve_message_class`
+
+        """
+        table = self._dispatch_table
+        if table is None:
+            table = self.build_dispatch_table()
+        return table.get(message_type)
+
     def resolve_message_class(self, message_type: str) -> type:
         """Resolve a message_type to a message class.
 
@@ -203,6 +278,10 @@ class ProtocolRegistry:
             The resolved message class
 
         """
+        if self._dispatch_table is not None:
+            entry = self._dispatch_table.get(message_type)
+            if entry:
+                return entry.message_cls
 
         # Try and retrieve from direct mapping
         msg_cls = self._typemap.get(message_type)
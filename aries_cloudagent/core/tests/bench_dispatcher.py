@@ -0,0 +1,109 @@
+"""Compare message parsing throughput with and without the dispatch table.
+
+Run with `python -m aries_cloudagent.core.tests.bench_dispatcher`.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Mapping
+
+from ...cache.base import BaseCache
+from ...cache.in_memory import InMemoryCache
+from ...core.in_memory import InMemoryProfile
+from ...protocols.basicmessage import definition as basicmessage_definition
+from ...protocols.basicmessage.v1_0.message_types import (
+    BASIC_MESSAGE,
+    MESSAGE_TYPES as BASICMESSAGE_TYPES,
+)
+from ...protocols.didcomm_prefix import DIDCommPrefix
+from ...protocols.out_of_band import definition as oob_definition
+from ...protocols.out_of_band.v1_0.message_types import (
+    MESSAGE_REUSE,
+    MESSAGE_TYPES as OOB_TYPES,
+)
+from ...protocols.trustping import definition as trustping_definition
+from ...protocols.trustping.v1_0.message_types import (
+    MESSAGE_TYPES as TRUSTPING_TYPES,
+    PING,
+)
+from ..dispatcher import Dispatcher
+from ..protocol_registry import ProtocolRegistry
+
+MESSAGES = [
+    {
+        "@type": DIDCommPrefix.qualify_current(PING),
+        "@id": "a7b1ea5c-2d2e-4b86-9c4f-9e6b3c7d3a11",
+        "response_requested": True,
+    },
+    {
+        "@type": DIDCommPrefix.qualify_current(BASIC_MESSAGE),
+        "@id": "4f0fdba4-5a8d-4d39-a0e4-2e0f4f8f7a52",
+        "content": "Hello",
+        "sent_time": "2023-12-01T10:00:00Z",
+    },
+    {
+        "@type": DIDCommPrefix.qualify_current(MESSAGE_REUSE),
+        "@id": "f9c1e9a4-7b22-4d4f-8d0c-6f0a7a0e4c63",
+        "~thread": {
+            "thid": "f9c1e9a4-7b22-4d4f-8d0c-6f0a7a0e4c63",
+            "pthid": "1e513ad4-48c9-444e-9e7e-5b8b45c5e325",
+        },
+    },
+]
+
+
+class ResolvingProtocolRegistry(ProtocolRegistry):
+    """A protocol registry which resolves every message type on receipt."""
+
+    def get_dispatch_entry(self, message_type: str):
+        """Leave all message types to be resolved on receipt."""
+        return None
+
+
+def make_registry(registry_cls: type) -> ProtocolRegistry:
+    """Create a registry with a few of the standard protocols."""
+    registry = registry_cls()
+    for message_types, definition in (
+        (TRUSTPING_TYPES, trustping_definition),
+        (BASICMESSAGE_TYPES, basicmessage_definition),
+        (OOB_TYPES, oob_definition),
+    ):
+        registry.register_message_types(
+            message_types, version_definition=definition.versions[0]
+        )
+    return registry
+
+
+async def run(iterations: int = 5000) -> Mapping[str, float]:
+    """Time message parsing by the dispatcher, in messages per second."""
+    results = {}
+    for label, registry_cls in (
+        ("resolve", ResolvingProtocolRegistry),
+        ("table", ProtocolRegistry),
+    ):
+        registry = make_registry(registry_cls)
+        registry.build_dispatch_table()
+        profile = InMemoryProfile.test_profile(
+            bind={BaseCache: InMemoryCache(), ProtocolRegistry: registry}
+        )
+        dispatcher = Dispatcher(profile)
+        start = time.perf_counter()
+        for idx in range(iterations):
+            await dispatcher.make_message(profile, MESSAGES[idx % len(MESSAGES)])
+        results[label] = iterations / (time.perf_counter() - start)
+    return results
+
+
+def main():
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+    results = asyncio.run(run(args.iterations))
+    for name, rate in results.items():
+        print(f"{name:>10}: {rate:10.1f} messages/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -28,7 +28,6 @@ from ...storage.error import StorageNotFoundError
 from ...transport.inbound.message import InboundMessage
 from ...transport.inbound.receipt import MessageReceipt
 from ...transport.outbound.base import OutboundDeliveryError
-from ...transport.outbound.manager import QueuedOutboundMessage
 from ...transport.outbound.message import OutboundMessage
 from ...transport.outbound.status import OutboundSendStatus
 from ...transport.pack_format import PackWireFormat
@@ -455,10 +454,12 @@ class TestConductor(IsolatedAsyncioTestCase, Config, TestDIDs):
             test_module, "LoggingConfigurator", autospec=True
         ) as mock_logger:
             mock_inbound_mgr.return_value.sessions = ["dummy"]
-            mock_outbound_mgr.return_value.outbound_buffer = [
-                mock.MagicMock(state=QueuedOutboundMessage.STATE_ENCODE),
-                mock.MagicMock(state=QueuedOutboundMessage.STATE_DELIVER),
-            ]
+            mock_outbound_mgr.return_value.get_queue_stats.return_value = {
+                "out_encode": 1,
+                "out_deliver": 2,
+                "out_pending": 0,
+                "out_retry": 3,
+            }
             mock_outbound_mgr.return_value.registered_transports = {
                 "test": mock.MagicMock(schemes=["http"])
             }
@@ -476,8 +477,12 @@ class TestConductor(IsolatedAsyncioTestCase, Config, TestDIDs):
                     "task_done",
                     "task_failed",
                     "task_pending",
+                    "route_index_hits",
+                    "route_index_misses",
                 ]
             )
+            assert stats["out_deliver"] == 2
+            assert stats["out_retry"] == 3
 
     async def test_inbound_message_handler(self):
         builder: ContextBuilder = StubContextBuilder(self.test_settings)
@@ -1253,6 +1258,41 @@ class TestConductor(IsolatedAsyncioTestCase, Config, TestDIDs):
                 test_topic, test_payload, test_endpoint, test_attempts, None
             )
 
+    async def test_start_multitenant_loads_route_index(self):
+        builder: ContextBuilder = StubContextBuilder(
+            {**self.test_settings, "multitenant.enabled": True}
+        )
+        conductor = test_module.Conductor(builder)
+
+        with mock.patch.object(
+            test_module, "InboundTransportManager", autospec=True
+        ) as mock_inbound_mgr, mock.patch.object(
+            test_module, "OutboundTransportManager", autospec=True
+        ) as mock_outbound_mgr, mock.patch.object(
+            test_module, "LoggingConfigurator", autospec=True
+        ), mock.patch.object(
+            test_module,
+            "get_upgrade_version_list",
+            mock.MagicMock(return_value=[]),
+        ), mock.patch.object(
+            test_module.RoutingManager,
+            "load_route_index",
+            mock.CoroutineMock(side_effect=[2, Exception()]),
+        ) as mock_load_route_index:
+            mock_inbound_mgr.return_value.registered_transports = {}
+            mock_outbound_mgr.return_value.registered_transports = {
+                "test": mock.MagicMock(schemes=["http"])
+            }
+            await conductor.setup()
+            await conductor.start()
+            mock_load_route_index.assert_awaited_once()
+            mock_inbound_mgr.return_value.start.assert_awaited_once()
+
+            # the agent starts when the index cannot be loaded
+            await conductor.start()
+            assert mock_inbound_mgr.return_value.start.await_count == 2
+            await conductor.stop()
+
     async def test_shutdown_multitenant_profiles(self):
         builder: ContextBuilder = StubContextBuilder(
             {**self.test_settings, "multitenant.enabled": True}
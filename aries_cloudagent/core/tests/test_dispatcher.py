@@ -1,3 +1,4 @@
+import asyncio
 import json
 
 from unittest import IsolatedAsyncioTestCase
@@ -9,6 +10,7 @@ from marshmallow import EXCLUDE
 from ...cache.base import BaseCache
 from ...cache.in_memory import InMemoryCache
 from ...config.injection_context import InjectionContext
+from ...connections.cache import CONNECTION_EVENT_PATTERN, ConnRecordCache
 from ...core.event_bus import EventBus
 from ...core.in_memory import InMemoryProfile
 from ...core.profile import Profile
@@ -28,6 +30,7 @@ from ...transport.outbound.message import OutboundMessage
 from ...utils.stats import Collector
 
 from .. import dispatcher as test_module
+from . import bench_dispatcher
 
 
 def make_profile() -> Profile:
@@ -336,6 +339,28 @@ class TestDispatcher(IsolatedAsyncioTestCase):
                 ProblemReport.Meta.message_type
             )
 
+    async def test_make_message_dispatch_table(self):
+        profile = make_profile()
+        registry = bench_dispatcher.make_registry(ProtocolRegistry)
+        profile.context.injector.bind_instance(ProtocolRegistry, registry)
+        dispatcher = test_module.Dispatcher(profile)
+        with mock.patch.object(
+            test_module, "validate_get_response_version", mock.CoroutineMock()
+        ) as mock_validate:
+            for payload in bench_dispatcher.MESSAGES:
+                message, warning = await dispatcher.make_message(profile, payload)
+                assert message._id == payload["@id"]
+                assert warning is None
+            mock_validate.assert_not_called()
+
+        # message types which are not registered are still resolved on receipt
+        with self.assertRaises(test_module.MessageParseError):
+            await dispatcher.make_message(profile, {"@type": "proto/1.0/unknown"})
+
+    async def test_dispatcher_benchmark(self):
+        results = await bench_dispatcher.run(iterations=3)
+        assert set(results) == {"resolve", "table"}
+
     async def test_bad_message_dispatch_parse_x(self):
         dispatcher = test_module.Dispatcher(make_profile())
         await dispatcher.setup()
@@ -546,6 +571,34 @@ class TestDispatcher(IsolatedAsyncioTestCase):
             )
             assert check_flag
 
+    async def test_conn_rec_active_state_check_event(self):
+        profile = make_profile()
+        profile.settings.set_value("cache.connection_ttl", 60)
+        context = RequestContext(profile)
+        message = StubAgentMessage()
+        responder = test_module.DispatcherResponder(context, message, None)
+        conn_rec = test_module.ConnRecord(state=test_module.ConnRecord.State.REQUEST)
+        async with profile.session() as session:
+            await conn_rec.save(session)
+
+        with mock.patch.object(
+            test_module.BaseResponder, "CONN_REC_STATE_RECHECK_INTERVAL", 30
+        ):
+            check = asyncio.ensure_future(
+                responder.conn_rec_active_state_check(profile, conn_rec.connection_id)
+            )
+            await asyncio.sleep(0.05)
+            assert not check.done()
+            conn_rec.state = test_module.ConnRecord.State.COMPLETED.rfc160
+            async with profile.session() as session:
+                await conn_rec.save(session)
+            # the state change event wakes the check without waiting to poll
+            assert await asyncio.wait_for(check, 1)
+        # only the connection record cache remains subscribed
+        assert profile.inject(EventBus).topic_patterns_to_subscribers[
+            CONNECTION_EVENT_PATTERN
+        ] == [ConnRecordCache.on_connection_event]
+
     async def test_create_enc_outbound(self):
         profile = make_profile()
         context = RequestContext(profile)
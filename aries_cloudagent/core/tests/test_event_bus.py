@@ -1,11 +1,13 @@
 """Test Event Bus."""
 
+import asyncio
 import pytest
 import re
 
 from unittest import mock
 
 from .. import event_bus as test_module
+from ...utils.stats import Collector
 from ..event_bus import EventBus, Event
 
 # pylint: disable=redefined-outer-name
@@ -205,3 +207,100 @@ async def test_wait_for_event_condition(event_bus: EventBus, profile, event):
         await event_bus.notify(profile, event)
         assert returned_event.done()
         assert await returned_event == event
+
+
+def test_invalid_dispatch_mode():
+    with pytest.raises(ValueError):
+        EventBus("unknown")
+
+
+@pytest.mark.asyncio
+async def test_topic_cache(event_bus: EventBus, profile, event, processor):
+    pattern = re.compile("^any(.*)$")
+    event_bus.subscribe(pattern, processor)
+    with mock.patch.object(event_bus, "_route", wraps=event_bus._route) as mock_route:
+        await event_bus.notify(profile, event)
+        await event_bus.notify(profile, event)
+    assert list(event_bus._topic_cache) == ["anything"]
+    assert processor.event.metadata.match.group(1) == "thing"
+
+    # subscription changes invalidate cached routes
+    other = MockProcessor()
+    event_bus.subscribe(re.compile(".*"), other)
+    assert not event_bus._topic_cache
+    await event_bus.notify(profile, event)
+    assert other.event == event
+    event_bus.unsubscribe(pattern, processor)
+    assert not event_bus._topic_cache
+    assert mock_route.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_topic_cache_bounded(event_bus: EventBus, profile, processor):
+    event_bus.MAX_CACHED_TOPICS = 2
+    event_bus.subscribe(re.compile(".*"), processor)
+    for topic in ("a", "b", "c"):
+        await event_bus.notify(profile, Event(topic))
+    assert list(event_bus._topic_cache) == ["c"]
+
+
+@pytest.mark.asyncio
+async def test_notify_concurrent(profile, event):
+    event_bus = EventBus(test_module.DISPATCH_CONCURRENT)
+    started = []
+    release = asyncio.Event()
+
+    async def slow(profile, event):
+        started.append("slow")
+        await release.wait()
+
+    async def fast(profile, event):
+        started.append("fast")
+        release.set()
+
+    async def bad(profile, event):
+        raise ValueError()
+
+    for processor in (slow, fast, bad):
+        event_bus.subscribe(re.compile(".*"), processor)
+    with mock.patch.object(test_module.LOGGER, "exception") as mock_log_exc:
+        await asyncio.wait_for(event_bus.notify(profile, event), 1)
+    assert started == ["slow", "fast"]
+    mock_log_exc.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_notify_background(profile):
+    event_bus = EventBus(test_module.DISPATCH_BACKGROUND, queue_size=2)
+    release = asyncio.Event()
+    received = []
+
+    async def slow(profile, event):
+        await release.wait()
+        received.append(event.payload)
+
+    event_bus.subscribe(re.compile(".*"), slow)
+
+    # notify returns without waiting for the subscriber
+    for idx in range(3):
+        await asyncio.wait_for(event_bus.notify(profile, Event("topic", idx)), 1)
+    # the queue is full: notify applies backpressure
+    blocked = asyncio.ensure_future(event_bus.notify(profile, Event("topic", 3)))
+    await asyncio.sleep(0.05)
+    assert not blocked.done()
+
+    release.set()
+    await asyncio.wait_for(blocked, 1)
+    await asyncio.wait_for(event_bus.close(), 1)
+    assert received == [0, 1, 2, 3]
+    assert not event_bus._worker_tasks
+
+
+@pytest.mark.asyncio
+async def test_notify_collector(profile, event):
+    collector = Collector()
+    event_bus = EventBus(collector=collector)
+    processor = MockProcessor()
+    event_bus.subscribe(re.compile(".*"), processor)
+    await event_bus.notify(profile, event)
+    assert collector.extract()["count"] == {"EventBus.subscriber:MockProcessor": 1}
@@ -2,9 +2,12 @@ from aries_cloudagent.tests import mock
 from unittest import IsolatedAsyncioTestCase
 
 from ...config.injection_context import InjectionContext
+from ...protocols.out_of_band import definition as oob_definition
+from ...protocols.out_of_band.v1_0.messages.reuse import HandshakeReuse
 from ...utils.classloader import ClassLoader
 
-from ..protocol_registry import ProtocolRegistry
+from ..protocol_registry import MessageTypeEntry, ProtocolRegistry
+from ..util import WARNING_DEGRADED_FEATURES
 
 
 class TestProtocolRegistry(IsolatedAsyncioTestCase):
@@ -296,5 +299,42 @@ class TestProtocolRegistry(IsolatedAsyncioTestCase):
             result = self.registry.resolve_message_class("proto/1.2/bbb")
             assert result is None
 
+    def test_dispatch_table(self):
+        self.registry.register_message_types(
+            {
+                "https://didcomm.org/out-of-band/1.1/handshake-reuse": (
+                    "aries_cloudagent.protocols.out_of_band.v1_0.messages.reuse."
+                    "HandshakeReuse"
+                ),
+                "https://didcomm.org/out-of-band/1.1/no-such-message": (
+                    "aries_cloudagent.protocols.out_of_band.v1_0.messages.NoSuchClass"
+                ),
+            },
+            version_definition=oob_definition.versions[0],
+        )
+        table = self.registry.build_dispatch_table()
+        assert dict(table) == {
+            "https://didcomm.org/out-of-band/1.0/handshake-reuse": MessageTypeEntry(
+                HandshakeReuse, "1.0", WARNING_DEGRADED_FEATURES
+            ),
+            "https://didcomm.org/out-of-band/1.1/handshake-reuse": MessageTypeEntry(
+                HandshakeReuse, "1.1", None
+            ),
+        }
+        with self.assertRaises(TypeError):
+            table["other"] = None
+        assert (
+            self.registry.resolve_message_class(
+                "https://didcomm.org/out-of-band/1.1/handshake-reuse"
+            )
+            is HandshakeReuse
+        )
+
+        # message classes without a version definition are checked on receipt
+        self.registry.register_message_types({"proto/1.0/message": mock.MagicMock})
+        entry = self.registry.get_dispatch_entry("proto/1.0/message")
+        assert entry == MessageTypeEntry(mock.MagicMock, None, None)
+        assert self.registry.get_dispatch_entry("proto/1.0/other") is None
+
     def test_repr(self):
         assert isinstance(repr(self.registry), str)
@@ -39,15 +39,32 @@ async def validate_get_response_version(
     Returns:
         Tuple with response version and any warnings
 
+    """
+    rec_major_version = int(rec_version.split(".")[0])
+    version_definition = await get_version_def_from_msg_class(
+        profile, msg_class, rec_major_version
+    )
+    return get_response_version(rec_version, version_definition)
+
+
+def get_response_version(
+    rec_version: str, version_definition: dict
+) -> Tuple[str, Optional[str]]:
+    """Return a tuple with version to respond with and warnings.
+
+    Args:
+        rec_version: received version from message
+        version_definition: the protocol version definition
+
+    Returns:
+        Tuple with response version and any warnings
+
     """
     resp_version = rec_version
     warning = None
     version_string_tokens = rec_version.split(".")
     rec_major_version = int(version_string_tokens[0])
     rec_minor_version = int(version_string_tokens[1])
-    version_definition = await get_version_def_from_msg_class(
-        profile, msg_class, rec_major_version
-    )
     proto_major_version = int(version_definition["major_version"])
     proto_curr_minor_version = int(version_definition["current_minor_version"])
     proto_min_minor_version = int(version_definition["minimum_minor_version"])
@@ -154,6 +171,17 @@ def _get_default_version_from_version_def(version_definition) -> str:
     return f"{default_major_version}.{default_minor_version}"
 
 
+def load_version_def_from_msg_class(msg_class: type, major_version: int = 1):
+    """Load the version_definition of a protocol from the msg_class module path."""
+    definition_path = _get_path_from_msg_class(msg_class)
+    version_definition = _get_version_def_from_path(definition_path, major_version)
+    if not version_definition:
+        raise ProtocolDefinitionValidationError(
+            f"Unable to load protocol version_definition for {str(msg_class)}"
+        )
+    return version_definition
+
+
 async def get_version_def_from_msg_class(
     profile: Profile, msg_class: type, major_version: int = 1
 ):
@@ -166,12 +194,7 @@ async def get_version_def_from_msg_class(
         )
         if version_definition:
             return version_definition
-    definition_path = _get_path_from_msg_class(msg_class)
-    version_definition = _get_version_def_from_path(definition_path, major_version)
-    if not version_definition:
-        raise ProtocolDefinitionValidationError(
-            f"Unable to load protocol version_definition for {str(msg_class)}"
-        )
+    version_definition = load_version_def_from_msg_class(msg_class, major_version)
     if cache:
         await cache.set(
             f"version_definition::{str(msg_class).lower()}", version_definition
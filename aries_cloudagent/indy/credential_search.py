@@ -0,0 +1,223 @@
+"""Search the wallet for the credentials matching presentation request referents."""
+
+import json
+from typing import (
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from ..utils.concurrency import gather_keyed
+
+
+def _normalize_attr_name(name: str) -> str:
+    return name.replace(" ", "")
+
+
+class UnknownReferentError(ValueError):
+    """A referent to search for is not in the presentation request."""
+
+
+class ReferentSearch(NamedTuple):
+    """A single wallet search for a group of referents sharing restrictions.
+
+    The tag filter matches the credentials for any of the referents, and the
+    attribute value tags which each referent requires select its credentials
+    from the search results. The referent filters match the credentials of
+    each referent alone.
+    """
+
+    tag_filter: dict
+    referents: Mapping[str, Tuple[str, ...]]
+    referent_filters: Mapping[str, dict]
+
+
+def plan_referent_searches(
+    presentation_request: dict,
+    referents: Sequence[str],
+    extra_query: Optional[dict] = None,
+) -> List[ReferentSearch]:
+    """Group presentation request referents into wallet searches.
+
+    Referents with identical restrictions share a search, with the required
+    attribute names of each one checked against the credential tags.
+
+    Args:
+        presentation_request: The indy presentation request
+        referents: The presentation request referents to search for
+        extra_query: An additional wql query to apply to every search
+
+    Returns:
+        The wallet searches to run
+
+    Raises:
+        UnknownReferentError: If a referent is not in the presentation request
+
+    """
+    groups: Dict[str, Tuple[Optional[list], Dict[str, Tuple[str, ...]]]] = {}
+    for reft in referents:
+        names = set()
+        if reft in presentation_request["requested_attributes"]:
+            attr = presentation_request["requested_attributes"][reft]
+            if "name" in attr:
+                names.add(_normalize_attr_name(attr["name"]))
+            elif "names" in attr:
+                names.update(_normalize_attr_name(name) for name in attr["names"])
+            restr = attr.get("restrictions")
+        elif reft in presentation_request["requested_predicates"]:
+            pred = presentation_request["requested_predicates"][reft]
+            if "name" in pred:
+                names.add(_normalize_attr_name(pred["name"]))
+            restr = pred.get("restrictions")
+        else:
+            raise UnknownReferentError(f"Unknown presentation request referent: {reft}")
+
+        group_key = json.dumps(restr or None, sort_keys=True)
+        group = groups.setdefault(group_key, (restr, {}))
+        group[1][reft] = tuple(sorted(f"attr::{name}::value" for name in names))
+
+    def make_filter(exists: List[Tuple[str, ...]], restr: Optional[list]) -> dict:
+        if len(exists) == 1:
+            tag_filter = {"$exist": list(exists[0])}
+        else:
+            tag_filter = {"$or": [{"$exist": list(exist)} for exist in exists]}
+        if restr:
+            # FIXME check if restr is a list or dict? validate WQL format
+            tag_filter = {"$and": [tag_filter] + restr}
+        if extra_query:
+            tag_filter = {"$and": [tag_filter, extra_query]}
+        return tag_filter
+
+    searches = []
+    for restr, group_referents in groups.values():
+        exists = list(dict.fromkeys(group_referents.values()))
+        searches.append(
+            ReferentSearch(
+                make_filter(exists, restr),
+                group_referents,
+                {
+                    reft: make_filter([exist], restr)
+                    for reft, exist in group_referents.items()
+                },
+            )
+        )
+    return searches
+
+
+async def search_credentials_by_referent(
+    scan: Callable[[dict, Optional[int], Optional[int]], AsyncIterator],
+    make_cred_info: Callable[[str, memoryview], dict],
+    presentation_request: dict,
+    referents: Sequence[str],
+    start: int,
+    count: int,
+    extra_query: Optional[dict] = None,
+) -> List[dict]:
+    """Find the credentials matching presentation request referents.
+
+    The searches planned by `plan_referent_searches` run concurrently. Each
+    referent gets the credentials it would by searching for it alone, from
+    `start` up to `count` of them, and each credential is decoded once.
+
+    A search shared by several referents reads at most `start + count` rows per
+    referent. Referents which are still short of `count` credentials once that
+    limit is reached are searched for on their own.
+
+    Args:
+        scan: Start a scan of the credential records for a tag filter, offset and
+            limit
+        make_cred_info: Create the credential info for a credential record id
+            and raw value
+        presentation_request: The indy presentation request
+        referents: The presentation request referents to search for
+        start: Starting index for each referent
+        count: Maximum number of credentials for each referent
+        extra_query: An additional wql query to apply to every search
+
+    Returns:
+        The matching credentials, with the referents they apply to
+
+    """
+    searches = plan_referent_searches(presentation_request, referents, extra_query)
+    cred_infos = {}
+
+    async def scan_referent(tag_filter: dict) -> List[str]:
+        # the search is exact for a single referent: leave paging to the store
+        found = []
+        async for row in scan(tag_filter, start, count):
+            found.append(row.name)
+            if row.name not in cred_infos:
+                cred_infos[row.name] = make_cred_info(row.name, row.raw_value)
+        return found
+
+    async def run_search(index: int) -> Dict[str, List[str]]:
+        search = searches[index]
+        if len(search.referents) == 1:
+            (reft,) = search.referents
+            return {reft: await scan_referent(search.tag_filter)}
+
+        found = {reft: [] for reft in search.referents}
+        skip = {reft: start or 0 for reft in search.referents}
+        pending = set(search.referents) if count is None or count > 0 else set()
+        if not pending:
+            return found
+        # the matches of a referent with few credentials are not to be read
+        # from the whole result set
+        limit = (
+            ((start or 0) + count) * len(search.referents)
+            if count is not None
+            else None
+        )
+        scanned = 0
+        rows = scan(search.tag_filter, None, limit)
+        async for row in rows:
+            scanned += 1
+            tags = row.tags
+            for reft in list(pending):
+                if not all(tag in tags for tag in search.referents[reft]):
+                    continue
+                if skip[reft]:
+                    skip[reft] -= 1
+                    continue
+                found[reft].append(row.name)
+                if row.name not in cred_infos:
+                    cred_infos[row.name] = make_cred_info(row.name, row.raw_value)
+                if count is not None and len(found[reft]) >= count:
+                    pending.discard(reft)
+            if not pending:
+                break
+        if pending and limit is not None and scanned >= limit:
+            found.update(
+                await gather_keyed(
+                    lambda reft: scan_referent(search.referent_filters[reft]),
+                    sorted(pending),
+                )
+            )
+        return found
+
+    found = {}
+    for search_found in (await gather_keyed(run_search, range(len(searches)))).values():
+        found.update(search_found)
+
+    creds = {}
+    for reft in referents:
+        for cred_id in found[reft]:
+            if cred_id in creds:
+                creds[cred_id]["presentation_referents"].add(reft)
+            else:
+                creds[cred_id] = {
+                    "cred_info": cred_infos[cred_id],
+                    "interval": presentation_request.get("non_revoked"),
+                    "presentation_referents": {reft},
+                }
+
+    for cred in creds.values():
+        cred["presentation_referents"] = list(cred["presentation_referents"])
+
+    return list(creds.values())
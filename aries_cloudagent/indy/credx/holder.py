@@ -1,6 +1,5 @@
 """Indy holder implementation."""
 
-import asyncio
 import json
 import logging
 import re
@@ -20,7 +19,12 @@ from indy_credx import (
 
 from ...askar.profile import AskarProfile
 from ...ledger.base import BaseLedger
+from ...utils.crypto_executor import OP_PROVE, OP_REVOCATION, run_crypto
 from ...wallet.error import WalletNotFoundError
+from ..credential_search import (
+    UnknownReferentError,
+    search_credentials_by_referent,
+)
 from ..holder import IndyHolder, IndyHolderError
 
 LOGGER = logging.getLogger(__name__)
@@ -46,6 +50,19 @@ def _normalize_attr_name(name: str) -> str:
     return name.replace(" ", "")
 
 
+def _update_revocation_state(
+    rev_state: dict,
+    rev_reg_def: dict,
+    rev_reg_delta: dict,
+    rev_reg_idx: int,
+    timestamp: int,
+    tails_file_path: str,
+) -> CredentialRevocationState:
+    state = CredentialRevocationState.load(rev_state)
+    state.update(rev_reg_def, rev_reg_delta, rev_reg_idx, timestamp, tails_file_path)
+    return state
+
+
 class IndyCredxHolder(IndyHolder):
     """Indy-credx holder class."""
 
@@ -120,8 +137,9 @@ class IndyCredxHolder(IndyHolder):
             (
                 cred_req,
                 cred_req_metadata,
-            ) = await asyncio.get_event_loop().run_in_executor(
-                None,
+            ) = await run_crypto(
+                self._profile,
+                OP_PROVE,
                 CredentialRequest.create,
                 holder_did,
                 credential_definition,
@@ -173,8 +191,9 @@ class IndyCredxHolder(IndyHolder):
         try:
             secret = await self.get_link_secret()
             cred = Credential.load(credential_data)
-            cred_recvd = await asyncio.get_event_loop().run_in_executor(
-                None,
+            cred_recvd = await run_crypto(
+                self._profile,
+                OP_PROVE,
                 cred.process,
                 credential_request_metadata,
                 secret,
@@ -284,66 +303,35 @@ class IndyCredxHolder(IndyHolder):
             extra_query: wql query dict
 
         """
-        extra_query = extra_query or {}
         if not referents:
             referents = (
                 *presentation_request["requested_attributes"],
                 *presentation_request["requested_predicates"],
             )
 
-        creds = {}
-
-        for reft in referents:
-            names = set()
-            if reft in presentation_request["requested_attributes"]:
-                attr = presentation_request["requested_attributes"][reft]
-                if "name" in attr:
-                    names.add(_normalize_attr_name(attr["name"]))
-                elif "names" in attr:
-                    names.update(_normalize_attr_name(name) for name in attr["names"])
-                # for name in names:
-                #     tag_filter[f"attr::{_normalize_attr_name(name)}::marker"] = "1"
-                restr = attr.get("restrictions")
-            elif reft in presentation_request["requested_predicates"]:
-                pred = presentation_request["requested_predicates"][reft]
-                if "name" in pred:
-                    names.add(_normalize_attr_name(pred["name"]))
-                # tag_filter[f"attr::{_normalize_attr_name(name)}::marker"] = "1"
-                restr = pred.get("restrictions")
-            else:
-                raise IndyHolderError(f"Unknown presentation request referent: {reft}")
-
-            tag_filter = {"$exist": [f"attr::{name}::value" for name in names]}
-            if restr:
-                # FIXME check if restr is a list or dict? validate WQL format
-                tag_filter = {"$and": [tag_filter] + restr}
-            if extra_query:
-                tag_filter = {"$and": [tag_filter, extra_query]}
-
-            rows = self._profile.store.scan(
+        def scan(tag_filter: dict, offset: Optional[int], limit: Optional[int]):
+            return self._profile.store.scan(
                 CATEGORY_CREDENTIAL,
                 tag_filter,
-                start,
-                count,
+                offset,
+                limit,
                 self._profile.settings.get("wallet.askar_profile"),
             )
-            async for row in rows:
-                if row.name in creds:
-                    creds[row.name]["presentation_referents"].add(reft)
-                else:
-                    cred_info = _make_cred_info(
-                        row.name, Credential.load(row.raw_value)
-                    )
-                    creds[row.name] = {
-                        "cred_info": cred_info,
-                        "interval": presentation_request.get("non_revoked"),
-                        "presentation_referents": {reft},
-                    }
 
-        for cred in creds.values():
-            cred["presentation_referents"] = list(cred["presentation_referents"])
-
-        return list(creds.values())
+        try:
+            return await search_credentials_by_referent(
+                scan,
+                lambda cred_id, raw_value: _make_cred_info(
+                    cred_id, Credential.load(raw_value)
+                ),
+                presentation_request,
+                referents,
+                start,
+                count,
+                extra_query,
+            )
+        except UnknownReferentError as err:
+            raise IndyHolderError(str(err)) from err
 
     async def get_credential(self, credential_id: str) -> str:
         """Get a credential stored in the wallet.
@@ -512,15 +500,16 @@ class IndyCredxHolder(IndyHolder):
 
         try:
             secret = await self.get_link_secret()
-            presentation = await asyncio.get_event_loop().run_in_executor(
-                None,
+            presentation = await run_crypto(
+                self._profile,
+                OP_PROVE,
                 Presentation.create,
                 presentation_request,
                 present_creds,
                 self_attest,
                 secret,
-                schemas.values(),
-                credential_definitions.values(),
+                list(schemas.values()),
+                list(credential_definitions.values()),
             )
         except CredxError as err:
             raise IndyHolderError("Error creating presentation") from err
@@ -549,8 +538,9 @@ class IndyCredxHolder(IndyHolder):
         """
 
         try:
-            rev_state = await asyncio.get_event_loop().run_in_executor(
-                None,
+            rev_state = await run_crypto(
+                self._profile,
+                OP_REVOCATION,
                 CredentialRevocationState.create,
                 rev_reg_def,
                 rev_reg_delta,
@@ -561,3 +551,44 @@ class IndyCredxHolder(IndyHolder):
         except CredxError as err:
             raise IndyHolderError("Error creating revocation state") from err
         return rev_state.to_json()
+
+    async def update_revocation_state(
+        self,
+        cred_rev_id: str,
+        rev_reg_def: dict,
+        rev_state: dict,
+        rev_reg_delta: dict,
+        timestamp: int,
+        tails_file_path: str,
+    ) -> str:
+        """Update an existing revocation state for a received credential.
+
+        Only the witness changes recorded in the delta are applied, rather than
+        computing the witness over the full tails file.
+
+        Args:
+            cred_rev_id: credential revocation id in revocation registry
+            rev_reg_def: revocation registry definition
+            rev_state: revocation state to update
+            rev_reg_delta: revocation delta since the timestamp of the state
+            timestamp: delta timestamp
+
+        Returns:
+            the updated revocation state
+
+        """
+        try:
+            rev_state = await run_crypto(
+                self._profile,
+                OP_REVOCATION,
+                _update_revocation_state,
+                rev_state,
+                rev_reg_def,
+                rev_reg_delta,
+                int(cred_rev_id),
+                timestamp,
+                tails_file_path,
+            )
+        except CredxError as err:
+            raise IndyHolderError("Error updating revocation state") from err
+        return rev_state.to_json()
@@ -1,8 +1,7 @@
 """Indy issuer implementation."""
 
-import asyncio
 import logging
-
+from functools import partial
 from typing import Sequence, Tuple
 
 from aries_askar import AskarError
@@ -21,6 +20,7 @@ from indy_credx import (
 )
 
 from ...askar.profile import AskarProfile
+from ...utils.crypto_executor import OP_ISSUE, OP_REVOCATION, run_crypto
 
 from ..issuer import (
     IndyIssuer,
@@ -43,6 +43,25 @@ CATEGORY_REV_REG_DEF_PRIVATE = "revocation_reg_def_private"
 CATEGORY_REV_REG_ISSUER = "revocation_reg_def_issuer"
 
 
+def _update_revocation_registry(
+    rev_reg: RevocationRegistry,
+    cred_def: CredentialDefinition,
+    rev_reg_def: RevocationRegistryDefinition,
+    rev_reg_def_private: RevocationRegistryDefinitionPrivate,
+    revoked: Sequence[int],
+) -> Tuple[RevocationRegistry, RevocationRegistryDelta]:
+    delta = rev_reg.update(
+        cred_def, rev_reg_def, rev_reg_def_private, issued=None, revoked=revoked
+    )
+    return rev_reg, delta
+
+
+def _merge_deltas(fro_delta: str, to_delta: str) -> str:
+    delta = RevocationRegistryDelta.load(fro_delta)
+    delta.update_with(to_delta)
+    return delta.to_json()
+
+
 class IndyCredxIssuer(IndyIssuer):
     """Indy-Credx issuer class."""
 
@@ -137,9 +156,11 @@ class IndyCredxIssuer(IndyIssuer):
                 cred_def,
                 cred_def_private,
                 key_proof,
-            ) = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: CredentialDefinition.create(
+            ) = await run_crypto(
+                self._profile,
+                OP_ISSUE,
+                partial(
+                    CredentialDefinition.create,
                     origin_did,
                     schema,
                     signature_type or DEFAULT_SIGNATURE_TYPE,
@@ -338,8 +359,9 @@ class IndyCredxIssuer(IndyIssuer):
                 credential,
                 _upd_rev_reg,
                 _delta,
-            ) = await asyncio.get_event_loop().run_in_executor(
-                None,
+            ) = await run_crypto(
+                self._profile,
+                OP_ISSUE,
                 Credential.create,
                 cred_def.raw_value,
                 cred_def_private.raw_value,
@@ -478,15 +500,15 @@ class IndyCredxIssuer(IndyIssuer):
                 break
 
             try:
-                delta = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: rev_reg.update(
-                        cred_def,
-                        rev_reg_def,
-                        rev_reg_def_private,
-                        issued=None,
-                        revoked=list(rev_crids),  # revoked
-                    ),
+                rev_reg, delta = await run_crypto(
+                    self._profile,
+                    OP_REVOCATION,
+                    _update_revocation_registry,
+                    rev_reg,
+                    cred_def,
+                    rev_reg_def,
+                    rev_reg_def_private,
+                    list(rev_crids),
                 )
             except CredxError as err:
                 raise IndyIssuerError("Error updating revocation registry") from err
@@ -541,20 +563,12 @@ class IndyCredxIssuer(IndyIssuer):
             Merged delta in JSON format
 
         """
-
-        def update(d1, d2):
-            try:
-                delta = RevocationRegistryDelta.load(d1)
-                delta.update_with(d2)
-                return delta.to_json()
-            except CredxError as err:
-                raise IndyIssuerError(
-                    "Error merging revocation registry deltas"
-                ) from err
-
-        return await asyncio.get_event_loop().run_in_executor(
-            None, update, fro_delta, to_delta
-        )
+        try:
+            return await run_crypto(
+                self._profile, OP_REVOCATION, _merge_deltas, fro_delta, to_delta
+            )
+        except CredxError as err:
+            raise IndyIssuerError("Error merging revocation registry deltas") from err
 
     async def create_and_store_revocation_registry(
         self,
@@ -596,9 +610,11 @@ class IndyCredxIssuer(IndyIssuer):
                 rev_reg_def_private,
                 rev_reg,
                 _rev_reg_delta,
-            ) = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: RevocationRegistryDefinition.create(
+            ) = await run_crypto(
+                self._profile,
+                OP_REVOCATION,
+                partial(
+                    RevocationRegistryDefinition.create,
                     origin_did,
                     cred_def.raw_value,
                     tag,
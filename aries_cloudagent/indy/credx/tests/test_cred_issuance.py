@@ -173,6 +173,39 @@ class TestIndyCredxIssuance(IsolatedAsyncioTestCase):
             }
         ]
 
+        # referents sharing restrictions are found with a single search
+        pres_creds = (
+            await self.holder.get_credentials_for_presentation_request_by_referent(
+                {
+                    **PRES_REQ_NON_REV,
+                    "requested_attributes": {
+                        "name_uuid": {
+                            "name": "name",
+                            "restrictions": [{"cred_def_id": CRED_DEF_ID}],
+                        },
+                        "moniker_uuid": {
+                            "name": "moniker",
+                            "restrictions": [{"cred_def_id": CRED_DEF_ID}],
+                        },
+                        "other_uuid": {
+                            "name": "other",
+                            "restrictions": [{"cred_def_id": CRED_DEF_ID}],
+                        },
+                    },
+                },
+                None,
+                0,
+                10,
+                {},
+            )
+        )
+        assert len(pres_creds) == 1
+        assert pres_creds[0]["cred_info"] == stored_cred
+        assert sorted(pres_creds[0]["presentation_referents"]) == [
+            "moniker_uuid",
+            "name_uuid",
+        ]
+
         pres_json = await self.holder.create_presentation(
             PRES_REQ_NON_REV,
             {
@@ -300,6 +333,26 @@ class TestIndyCredxIssuance(IsolatedAsyncioTestCase):
             rev_state_init = json.loads(rev_state_json)
             rev_delta_init = {"ver": "1.0", "value": rev_state_init["rev_reg"]}
 
+            rev_state_upd_json = await self.holder.update_revocation_state(
+                cred_rev_id,
+                reg_def,
+                rev_state_init,
+                {
+                    "ver": "1.0",
+                    "value": {
+                        "prev_accum": rev_state_init["rev_reg"]["accum"],
+                        "accum": rev_state_init["rev_reg"]["accum"],
+                        "issued": [],
+                        "revoked": [],
+                    },
+                },
+                rev_state_time + 1,
+                tails_path,
+            )
+            rev_state_upd = json.loads(rev_state_upd_json)
+            assert rev_state_upd["timestamp"] == rev_state_time + 1
+            assert rev_state_upd["witness"] == rev_state_init["witness"]
+
             (rev_delta_2_json, skipped_ids) = await self.issuer.revoke_credentials(
                 cd_id, reg_id, tails_path, (1,)
             )
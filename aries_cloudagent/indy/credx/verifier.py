@@ -1,6 +1,5 @@
 """Indy-Credx verifier implementation."""
 
-import asyncio
 import logging
 
 from typing import Tuple
@@ -8,6 +7,7 @@ from typing import Tuple
 from indy_credx import CredxError, Presentation
 
 from ...core.profile import Profile
+from ...utils.crypto_executor import OP_VERIFY, run_crypto
 
 from ..verifier import IndyVerifier, PresVerifyMsg
 
@@ -69,13 +69,14 @@ class IndyCredxVerifier(IndyVerifier):
 
         try:
             presentation = Presentation.load(pres)
-            verified = await asyncio.get_event_loop().run_in_executor(
-                None,
+            verified = await run_crypto(
+                self.profile,
+                OP_VERIFY,
                 presentation.verify,
                 pres_req,
-                schemas.values(),
-                credential_definitions.values(),
-                rev_reg_defs.values(),
+                list(schemas.values()),
+                list(credential_definitions.values()),
+                list(rev_reg_defs.values()),
                 rev_reg_entries,
                 accept_legacy_revocation,
             )
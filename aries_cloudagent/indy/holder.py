@@ -153,3 +153,27 @@ class IndyHolder(ABC, metaclass=ABCMeta):
             the revocation state
 
         """
+
+    @abstractmethod
+    async def update_revocation_state(
+        self,
+        cred_rev_id: str,
+        rev_reg_def: dict,
+        rev_state: dict,
+        rev_reg_delta: dict,
+        timestamp: int,
+        tails_file_path: str,
+    ) -> str:
+        """Update an existing revocation state for a received credential.
+
+        Args:
+            cred_rev_id: credential revocation id in revocation registry
+            rev_reg_def: revocation registry definition
+            rev_state: revocation state to update
+            rev_reg_delta: revocation delta since the timestamp of the state
+            timestamp: delta timestamp
+
+        Returns:
+            the updated revocation state
+
+        """
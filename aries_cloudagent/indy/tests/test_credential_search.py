@@ -0,0 +1,188 @@
+from unittest import IsolatedAsyncioTestCase
+
+import pytest
+
+from .. import credential_search as test_module
+
+CD_ID = "NcYxiDXkpYi6ov5FcYDi1e:3:CL:12:tag"
+PRES_REQ = {
+    "requested_attributes": {
+        "name_uuid": {"name": "name", "restrictions": [{"cred_def_id": CD_ID}]},
+        "degree_uuid": {
+            "names": ["degree", "date"],
+            "restrictions": [{"cred_def_id": CD_ID}],
+        },
+        "email_uuid": {"name": "email"},
+    },
+    "requested_predicates": {
+        "age_uuid": {
+            "name": "age",
+            "p_type": ">=",
+            "p_value": 18,
+            "restrictions": [{"cred_def_id": CD_ID}],
+        },
+    },
+}
+
+
+class MockRow:
+    def __init__(self, name, tags):
+        self.name = name
+        self.tags = tags
+        self.raw_value = name.encode()
+
+
+def tags_match(tags: dict, tag_filter: dict) -> bool:
+    for key, value in tag_filter.items():
+        if key == "$and":
+            if not all(tags_match(tags, sub) for sub in value):
+                return False
+        elif key == "$or":
+            if not any(tags_match(tags, sub) for sub in value):
+                return False
+        elif key == "$exist":
+            if not all(tag in tags for tag in value):
+                return False
+        elif tags.get(key) != value:
+            return False
+    return True
+
+
+def make_rows(count: int):
+    rows = []
+    for idx in range(count):
+        tags = {"cred_def_id": CD_ID if idx % 4 else "other"}
+        for attr in ("name", "degree", "date", "email", "age"):
+            if idx % 3 or attr != "degree":
+                tags[f"attr::{attr}::value"] = str(idx)
+        rows.append(MockRow(f"cred-{idx:02}", tags))
+    return rows
+
+
+class TestCredentialSearch(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.rows = make_rows(24)
+        self.scans = []
+        self.decoded = []
+
+    def scan(self, tag_filter, offset, limit):
+        self.scans.append((tag_filter, offset, limit))
+        rows = [row for row in self.rows if tags_match(row.tags, tag_filter)]
+        rows = rows[offset or 0 :]
+        if limit is not None:
+            rows = rows[:limit]
+
+        async def iterate():
+            for row in rows:
+                yield row
+
+        return iterate()
+
+    def make_cred_info(self, cred_id, raw_value):
+        self.decoded.append(cred_id)
+        return {"referent": cred_id}
+
+    async def search_each(self, referents, start, count):
+        """Search for each referent on its own, as a reference."""
+        results = {}
+        for reft in referents:
+            (search,) = test_module.plan_referent_searches(PRES_REQ, [reft])
+            async for row in self.scan(search.tag_filter, start, count):
+                results.setdefault(row.name, set()).add(reft)
+        return results
+
+    def test_plan(self):
+        searches = test_module.plan_referent_searches(
+            PRES_REQ, list(PRES_REQ["requested_attributes"]) + ["age_uuid"]
+        )
+        assert len(searches) == 2
+        assert searches[0].referents == {
+            "name_uuid": ("attr::name::value",),
+            "degree_uuid": ("attr::date::value", "attr::degree::value"),
+            "age_uuid": ("attr::age::value",),
+        }
+        assert searches[0].tag_filter["$and"][1:] == [{"cred_def_id": CD_ID}]
+        assert len(searches[0].tag_filter["$and"][0]["$or"]) == 3
+        assert searches[0].referent_filters["age_uuid"] == {
+            "$and": [{"$exist": ["attr::age::value"]}, {"cred_def_id": CD_ID}]
+        }
+        assert searches[1] == (
+            {"$exist": ["attr::email::value"]},
+            {"email_uuid": ("attr::email::value",)},
+            {"email_uuid": {"$exist": ["attr::email::value"]}},
+        )
+
+        searches = test_module.plan_referent_searches(
+            PRES_REQ, ["email_uuid"], {"schema_name": "degree"}
+        )
+        assert searches[0].tag_filter == {
+            "$and": [{"$exist": ["attr::email::value"]}, {"schema_name": "degree"}]
+        }
+
+        with pytest.raises(test_module.UnknownReferentError):
+            test_module.plan_referent_searches(PRES_REQ, ["unknown"])
+
+    async def test_search(self):
+        referents = ["name_uuid", "degree_uuid", "email_uuid", "age_uuid"]
+        for start, count in ((0, 10), (2, 3), (0, 100), (5, 0)):
+            self.scans.clear()
+            self.decoded.clear()
+            results = await test_module.search_credentials_by_referent(
+                self.scan,
+                self.make_cred_info,
+                PRES_REQ,
+                referents,
+                start,
+                count,
+            )
+            assert len(self.decoded) == len(set(self.decoded))
+            found = {
+                result["cred_info"]["referent"]: set(result["presentation_referents"])
+                for result in results
+            }
+            expected = await self.search_each(referents, start, count)
+            assert list(found.items()) == list(expected.items())
+            assert all(result["interval"] is None for result in results)
+
+    async def test_search_stops_early(self):
+        results = await test_module.search_credentials_by_referent(
+            self.scan,
+            self.make_cred_info,
+            PRES_REQ,
+            ["name_uuid", "age_uuid"],
+            0,
+            2,
+        )
+        assert [result["cred_info"]["referent"] for result in results] == [
+            "cred-01",
+            "cred-02",
+        ]
+        # a single scan, which is not read past the last credential needed
+        assert len(self.scans) == 1
+        assert self.decoded == ["cred-01", "cred-02"]
+
+    async def test_search_referent_without_matches(self):
+        for row in self.rows:
+            del row.tags["attr::age::value"]
+        referents = ["name_uuid", "age_uuid"]
+        for start, count in ((0, 2), (1, 3)):
+            self.scans.clear()
+            results = await test_module.search_credentials_by_referent(
+                self.scan,
+                self.make_cred_info,
+                PRES_REQ,
+                referents,
+                start,
+                count,
+            )
+            found = {
+                result["cred_info"]["referent"]: set(result["presentation_referents"])
+                for result in results
+            }
+            expected = await self.search_each(referents, start, count)
+            assert list(found.items()) == list(expected.items())
+            # the shared scan is limited, then the referent is searched alone
+            (tag_filter, offset, limit), (referent_filter, *_) = self.scans[:2]
+            assert (offset, limit) == (None, (start + count) * 2)
+            assert referent_filter["$and"][0] == {"$exist": ["attr::age::value"]}
+            assert len(self.scans) == 2 + len(referents)
@@ -14,6 +14,7 @@ from ..ledger.multiple_ledger.ledger_requests_executor import (
 )
 from ..messaging.util import canon, encode
 from ..multitenant.base import BaseMultitenantManager
+from ..utils.concurrency import gather_keyed
 
 from .models.xform import indy_proof_req2non_revoc_intervals
 
@@ -128,15 +129,13 @@ class IndyVerifier(ABC, metaclass=ABCMeta):
         non_revoc_intervals = indy_proof_req2non_revoc_intervals(pres_req)
         LOGGER.debug(f">>> got non-revoc intervals: {non_revoc_intervals}")
         # timestamp for irrevocable credential
-        cred_defs = []
-        for index, ident in enumerate(pres["identifiers"]):
-            LOGGER.debug(f">>> got (index, ident): ({index},{ident})")
-            cred_def_id = ident["cred_def_id"]
-            multitenant_mgr = profile.inject_or(BaseMultitenantManager)
-            if multitenant_mgr:
-                ledger_exec_inst = IndyLedgerRequestsExecutor(profile)
-            else:
-                ledger_exec_inst = profile.inject(IndyLedgerRequestsExecutor)
+        multitenant_mgr = profile.inject_or(BaseMultitenantManager)
+        if multitenant_mgr:
+            ledger_exec_inst = IndyLedgerRequestsExecutor(profile)
+        else:
+            ledger_exec_inst = profile.inject(IndyLedgerRequestsExecutor)
+
+        async def get_cred_def(cred_def_id: str) -> dict:
             ledger = (
                 await ledger_exec_inst.get_ledger_for_identifier(
                     cred_def_id,
@@ -144,7 +143,16 @@ class IndyVerifier(ABC, metaclass=ABCMeta):
                 )
             )[1]
             async with ledger:
-                cred_def = await ledger.get_credential_definition(cred_def_id)
+                return await ledger.get_credential_definition(cred_def_id)
+
+        cred_defs_by_id = await gather_keyed(
+            get_cred_def, (ident["cred_def_id"] for ident in pres["identifiers"])
+        )
+        cred_defs = []
+        for index, ident in enumerate(pres["identifiers"]):
+            LOGGER.debug(f">>> got (index, ident): ({index},{ident})")
+            cred_def_id = ident["cred_def_id"]
+            cred_def = cred_defs_by_id[cred_def_id]
             cred_defs.append(cred_def)
             if ident.get("timestamp"):
                 if not cred_def["value"].get("revocation"):
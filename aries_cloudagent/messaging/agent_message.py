@@ -482,6 +482,8 @@ class AgentMessageSchema(BaseModelSchema):
             ValidationError: If there is a missing field signature
 
         """
+        # schema instances are reused, start from an empty decorator set
+        self._decorators = DecoratorSet()
         processed = self._decorators.extract_decorators(data, self.__class__)
 
         expect_fields = resolve_meta_property(self, "signed_fields") or ()
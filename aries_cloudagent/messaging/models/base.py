@@ -5,10 +5,31 @@ import json
 
 from abc import ABC
 from collections import namedtuple
-from typing import Mapping, Optional, Type, TypeVar, Union, cast, overload
+from typing import (
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 from typing_extensions import Literal
 
-from marshmallow import Schema, post_dump, pre_load, post_load, ValidationError, EXCLUDE
+from marshmallow import (
+    EXCLUDE,
+    Schema,
+    ValidationError,
+    missing,
+    post_dump,
+    post_load,
+    pre_load,
+)
 
 from ...core.error import BaseError
 from ...utils.classloader import ClassLoader
@@ -17,6 +38,18 @@ LOGGER = logging.getLogger(__name__)
 
 SerDe = namedtuple("SerDe", "ser de")
 
+# the number of idle schema instances to keep for each schema class and unknown mode
+SCHEMA_POOL_SIZE = 4
+
+# resolved schema classes, by model class and schema_class
+_schema_classes: Dict[Tuple[type, Any], Type["BaseModelSchema"]] = {}
+# default unknown modes, by schema class
+_schema_unknown: Dict[type, str] = {}
+# fast_serialize metadata, by model class
+_fast_serialize: Dict[type, bool] = {}
+# idle schema instances, by schema class and unknown mode
+_schema_pool: Dict[Tuple[type, str], List["BaseModelSchema"]] = {}
+
 
 def resolve_class(the_cls, relative_cls: Optional[type] = None) -> type:
     """Resolve a class.
@@ -86,6 +119,7 @@ class BaseModel(ABC):
         """BaseModel meta data."""
 
         schema_class = None
+        fast_serialize = False
 
     def __init__(self):
         """Initialize BaseModel.
@@ -109,14 +143,64 @@ class BaseModel(ABC):
             The resolved schema class
 
         """
+        key = (cls, cls.Meta.schema_class)
+        resolved = _schema_classes.get(key)
+        if resolved:
+            return resolved
+
         resolved = resolve_class(cls.Meta.schema_class, cls)
         if issubclass(resolved, BaseModelSchema):
+            _schema_classes[key] = resolved
             return resolved
 
         raise TypeError(
             f"Resolved class is not a subclass of BaseModelSchema: {resolved}"
         )
 
+    @staticmethod
+    def _acquire_schema(
+        schema_cls: Type["BaseModelSchema"], unknown: Optional[str] = None
+    ) -> Tuple["BaseModelSchema", List["BaseModelSchema"]]:
+        """Get an idle schema instance, creating one if needed.
+
+        Schema instances are expensive to create, so they are reused for the
+        same unknown mode. An instance which is in use, for example by a nested
+        load of the same model class, is never handed out twice.
+
+        Returns:
+            The schema instance and the pool to release it to
+
+        """
+        if not unknown:
+            unknown = _schema_unknown.get(schema_cls)
+            if not unknown:
+                unknown = _schema_unknown[schema_cls] = resolve_meta_property(
+                    schema_cls, "unknown", EXCLUDE
+                )
+        pool = _schema_pool.get((schema_cls, unknown))
+        if pool is None:
+            pool = _schema_pool.setdefault((schema_cls, unknown), [])
+        try:
+            return pool.pop(), pool
+        except IndexError:
+            return schema_cls(unknown=unknown), pool
+
+    @classmethod
+    def _fast_serialize(cls) -> bool:
+        """Check whether the model opts into serialization without processors."""
+        fast = _fast_serialize.get(cls)
+        if fast is None:
+            fast = _fast_serialize[cls] = bool(
+                resolve_meta_property(cls, "fast_serialize", False)
+            )
+        return fast
+
+    @staticmethod
+    def _release_schema(schema: "BaseModelSchema", pool: List["BaseModelSchema"]):
+        """Return a schema instance to the pool."""
+        if len(pool) < SCHEMA_POOL_SIZE:
+            pool.append(schema)
+
     @property
     def Schema(self) -> Type["BaseModelSchema"]:
         """Accessor for the model's schema class.
@@ -185,11 +269,7 @@ class BaseModel(ABC):
         if obj is None and none2none:
             return None
 
-        schema_cls = cls._get_schema_class()
-        schema = schema_cls(
-            unknown=unknown or resolve_meta_property(schema_cls, "unknown", EXCLUDE)
-        )
-
+        schema, pool = cls._acquire_schema(cls._get_schema_class(), unknown)
         try:
             return cast(
                 ModelType,
@@ -198,6 +278,8 @@ class BaseModel(ABC):
         except (AttributeError, ValidationError) as err:
             LOGGER.exception(f"{cls.__name__} message validation error:")
             raise BaseModelError(f"{cls.__name__} schema validation failed") from err
+        finally:
+            cls._release_schema(schema, pool)
 
     @overload
     def serialize(
@@ -222,6 +304,10 @@ class BaseModel(ABC):
     ) -> Union[str, dict]:
         """Create a JSON-compatible dict representation of the model instance.
 
+        Models which set `fast_serialize` in their metadata are dumped field by
+        field, without running the schema processors, when their schema only
+        defines the standard processors of `BaseModelSchema`.
+
         Args:
             as_string: Return a string of JSON instead of a dict
 
@@ -229,21 +315,20 @@ class BaseModel(ABC):
             A dict representation of this model, or a JSON string if as_string is True
 
         """
-        schema_cls = self._get_schema_class()
-        schema = schema_cls(
-            unknown=unknown or resolve_meta_property(schema_cls, "unknown", EXCLUDE)
-        )
+        schema, pool = self._acquire_schema(self._get_schema_class(), unknown)
         try:
-            return (
-                schema.dumps(self, separators=(",", ":"))
-                if as_string
-                else schema.dump(self)
-            )
+            if as_string:
+                return schema.dumps(self, separators=(",", ":"))
+            if self._fast_serialize() and schema.fast_dump_fields is not None:
+                return schema.fast_dump(self)
+            return schema.dump(self)
         except (AttributeError, ValidationError) as err:
             LOGGER.exception(f"{self.__class__.__name__} message serialization error:")
             raise BaseModelError(
                 f"{self.__class__.__name__} schema validation failed"
             ) from err
+        finally:
+            self._release_schema(schema, pool)
 
     @classmethod
     def serde(cls, obj: Union["BaseModel", Mapping]) -> Optional[SerDe]:
@@ -335,6 +420,59 @@ class BaseModelSchema(Schema):
                     self.__class__.__name__
                 )
             )
+        self._dump_only_keys = {
+            field_obj.data_key or field_name
+            for field_name, field_obj in self.fields.items()
+            if field_obj.dump_only
+        }
+        self._skip_values = resolve_meta_property(self, "skip_values", [])
+        self._fast_dump_fields: Optional[Sequence[tuple]] = missing
+
+    @property
+    def fast_dump_fields(self) -> Optional[Sequence[tuple]]:
+        """Accessor for the fields to dump without the schema processors.
+
+        Returns:
+            The attribute name, field and output key for each dumped field, or
+            None if the schema defines its own processors
+
+        """
+        if self._fast_dump_fields is missing:
+            standard = {
+                ("pre_load", False): ["skip_dump_only"],
+                ("post_load", False): ["make_model"],
+                ("post_dump", False): ["remove_skipped_values"],
+            }
+            if {key: hooks for key, hooks in self._hooks.items() if hooks} == standard:
+                self._fast_dump_fields = tuple(
+                    (
+                        attr_name,
+                        field_obj,
+                        (
+                            field_obj.data_key
+                            if field_obj.data_key is not None
+                            else attr_name
+                        ),
+                    )
+                    for attr_name, field_obj in self.dump_fields.items()
+                )
+            else:
+                self._fast_dump_fields = None
+        return self._fast_dump_fields
+
+    def fast_dump(self, obj) -> dict:
+        """Serialize an object without running the schema processors.
+
+        The result matches `dump` for schemas with `fast_dump_fields`.
+        """
+        result = {}
+        skip_vals = self._skip_values
+        get_attribute = self.get_attribute
+        for attr_name, field_obj, key in self._fast_dump_fields:
+            value = field_obj.serialize(attr_name, obj, accessor=get_attribute)
+            if value is not missing and value not in skip_vals:
+                result[key] = value
+        return result
 
     @classmethod
     def _get_model_class(cls):
@@ -370,12 +508,7 @@ class BaseModelSchema(Schema):
         if not data:
             return data
 
-        to_remove = {
-            field_obj.data_key or field_name
-            for field_name, field_obj in self.fields.items()
-            if field_obj.dump_only
-        }
-        for field_name in to_remove:
+        for field_name in self._dump_only_keys:
             if field_name in data:
                 del data[field_name]
         return data
@@ -405,5 +538,5 @@ class BaseModelSchema(Schema):
             Returns this modified data
 
         """
-        skip_vals = resolve_meta_property(self, "skip_values", [])
+        skip_vals = self._skip_values
         return {key: value for key, value in data.items() if value not in skip_vals}
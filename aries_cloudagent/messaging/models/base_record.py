@@ -12,7 +12,13 @@ from marshmallow import fields
 from ...cache.base import BaseCache
 from ...config.settings import BaseSettings
 from ...core.profile import ProfileSession
-from ...storage.base import BaseStorage, StorageDuplicateError, StorageNotFoundError
+from ...storage.base import (
+    DEFAULT_PAGE_SIZE,
+    BaseStorage,
+    RecordPage,
+    StorageDuplicateError,
+    StorageNotFoundError,
+)
 from ...storage.record import StorageRecord
 from ..util import datetime_to_str, time_now
 from ..valid import INDY_ISO8601_DATETIME_EXAMPLE, INDY_ISO8601_DATETIME_VALIDATE
@@ -287,6 +293,10 @@ class BaseRecord(BaseModel):
         post_filter_positive: dict = None,
         post_filter_negative: dict = None,
         alt: bool = False,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+        descending: bool = False,
     ) -> Sequence[RecordType]:
         """Query stored records.
 
@@ -297,18 +307,17 @@ class BaseRecord(BaseModel):
             post_filter_negative: Additional value filters to apply matching negatively
             alt: set to match any (positive=True) value or miss all (positive=False)
                 values in post_filter
+            limit: The maximum number of records to return, for a paginated query
+            offset: The number of matching records to skip, for a paginated query
+            order_by: The tag name to order a paginated query by
+            descending: Whether to reverse the order of a paginated query
         """
 
         storage = session.inject(BaseStorage)
-        rows = await storage.find_all_records(
-            cls.RECORD_TYPE,
-            cls.prefix_tag_filter(tag_filter),
-            options={"retrieveTags": False},
-        )
-        result = []
-        for record in rows:
-            vals = json.loads(record.value)
-            if match_post_filter(
+        tag_query = cls.prefix_tag_filter(tag_filter)
+
+        def matches(vals: dict) -> bool:
+            return match_post_filter(
                 vals,
                 post_filter_positive,
                 positive=True,
@@ -318,12 +327,57 @@ class BaseRecord(BaseModel):
                 post_filter_negative,
                 positive=False,
                 alt=alt,
-            ):
-                try:
-                    result.append(cls.from_storage(record.id, vals))
-                except BaseModelError as err:
-                    raise BaseModelError(f"{err}, for record id {record.id}")
-        return result
+            )
+
+        def load(record: StorageRecord, vals: dict) -> RecordType:
+            try:
+                return cls.from_storage(record.id, vals)
+            except BaseModelError as err:
+                raise BaseModelError(f"{err}, for record id {record.id}")
+
+        if limit is None and offset is None and not order_by and not descending:
+            rows = await storage.find_all_records(
+                cls.RECORD_TYPE,
+                tag_query,
+                options={"retrieveTags": False},
+            )
+            result = []
+            for record in rows:
+                vals = json.loads(record.value)
+                if matches(vals):
+                    result.append(load(record, vals))
+            return result
+
+        limit = DEFAULT_PAGE_SIZE if limit is None else limit
+        offset = offset or 0
+        if order_by:
+            tag_map = cls.get_tag_map()
+            if order_by in tag_map:
+                order_by = tag_map[order_by]
+            elif order_by not in tag_map.values():
+                raise BaseModelError(
+                    f"Cannot order {cls.__name__} records by {order_by}: "
+                    f"expected one of {sorted(tag_map)}"
+                )
+
+        if not (post_filter_positive or post_filter_negative):
+            rows = await storage.find_paginated_records(
+                cls.RECORD_TYPE,
+                tag_query,
+                limit=limit,
+                offset=offset,
+                order_by=order_by,
+                descending=descending,
+            )
+            return [load(record, json.loads(record.value)) for record in rows]
+
+        # post filters apply to record values: scan once and page the matches
+        page = RecordPage(limit, offset, order_by, descending)
+        async for record in storage.scan_records(cls.RECORD_TYPE, tag_query):
+            vals = json.loads(record.value)
+            if matches(vals) and not page.add(record, (record, vals)):
+                break
+        return [load(record, vals) for (record, vals) in page.records]
 
     async def save(
         self,
@@ -361,14 +415,21 @@ class BaseRecord(BaseModel):
                 new_record = True
                 self._new_with_id = False
         finally:
-            params = {self.RECORD_TYPE: self.serialize()}
-            if log_params:
-                params.update(log_params)
-            if new_record is None:
-                log_reason = f"FAILED: {log_reason}"
-            self.log_state(
-                log_reason, params, override=log_override, settings=session.settings
-            )
+            # only serialize for the log when it is going to be printed
+            if log_override or (
+                self.LOG_STATE_FLAG and session.settings.get(self.LOG_STATE_FLAG)
+            ):
+                params = {self.RECORD_TYPE: self.serialize()}
+                if log_params:
+                    params.update(log_params)
+                if new_record is None:
+                    log_reason = f"FAILED: {log_reason}"
+                self.log_state(
+                    log_reason,
+                    params,
+                    override=log_override,
+                    settings=session.settings,
+                )
 
         await self.post_save(session, new_record, self._last_state, event)
         self._last_state = self.state
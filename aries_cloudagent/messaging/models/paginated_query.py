@@ -0,0 +1,73 @@
+"""Query string parameters for paginated record listings."""
+
+from typing import NamedTuple, Optional
+
+from aiohttp.web import BaseRequest
+from marshmallow import fields, validate
+
+from .openapi import OpenAPISchema
+
+
+class PaginatedQuerySchema(OpenAPISchema):
+    """Parameters and validators for paginated record list query strings."""
+
+    limit = fields.Int(
+        required=False,
+        validate=validate.Range(min=1),
+        metadata={
+            "description": "Number of results to return; all results if not set",
+            "example": 50,
+        },
+    )
+    offset = fields.Int(
+        required=False,
+        validate=validate.Range(min=0),
+        metadata={"description": "Offset for pagination", "example": 0},
+    )
+    order_by = fields.Str(
+        required=False,
+        metadata={
+            "description": "Record tag to order results by",
+            "example": "state",
+        },
+    )
+    descending = fields.Bool(
+        required=False,
+        metadata={"description": "Order results in descending order"},
+    )
+
+
+class PaginatedQuery(NamedTuple):
+    """Pagination parameters parsed from a request."""
+
+    limit: Optional[int] = None
+    offset: Optional[int] = None
+    order_by: Optional[str] = None
+    descending: bool = False
+
+    @property
+    def paginated(self) -> bool:
+        """Check whether any pagination parameter is set."""
+        return (
+            self.limit is not None
+            or self.offset is not None
+            or bool(self.order_by)
+            or self.descending
+        )
+
+    def as_query_args(self) -> dict:
+        """Get the keyword arguments for `BaseRecord.query`."""
+        return self._asdict()
+
+
+def get_paginated_query(request: BaseRequest) -> PaginatedQuery:
+    """Read the pagination parameters from a (validated) request query string."""
+    query = request.query
+    limit = query.get("limit")
+    offset = query.get("offset")
+    return PaginatedQuery(
+        limit=int(limit) if limit not in (None, "") else None,
+        offset=int(offset) if offset not in (None, "") else None,
+        order_by=query.get("order_by") or None,
+        descending=query.get("descending", "").lower() in ("true", "1"),
+    )
@@ -0,0 +1,118 @@
+"""Compare model serialization throughput with fresh and reused schema instances.
+
+Run with `python -m aries_cloudagent.messaging.models.tests.bench_models`.
+"""
+
+import argparse
+import time
+from typing import Mapping
+
+from marshmallow import EXCLUDE
+
+from ....connections.models.conn_record import ConnRecord
+from ....protocols.issue_credential.v2_0.message_types import (
+    ATTACHMENT_FORMAT,
+    CRED_20_OFFER,
+)
+from ....protocols.issue_credential.v2_0.messages.cred_format import V20CredFormat
+from ....protocols.issue_credential.v2_0.messages.cred_offer import V20CredOffer
+from ....protocols.issue_credential.v2_0.messages.inner.cred_preview import (
+    V20CredAttrSpec,
+    V20CredPreview,
+)
+from ....protocols.issue_credential.v2_0.models.cred_ex_record import V20CredExRecord
+from ...decorators.attach_decorator import AttachDecorator
+from ..base import BaseModel, resolve_meta_property
+
+
+INDY_OFFER = {
+    "schema_id": "LjgpST2rjsoxYegQDRm7EL:2:bc-reg:1.0",
+    "cred_def_id": "LjgpST2rjsoxYegQDRm7EL:3:CL:12:tag1",
+    "key_correctness_proof": {
+        "c": "123467890",
+        "xz_cap": "12345678901234567890",
+        "xr_cap": [["remainder", "1234567890"], ["master_secret", "12345678901234"]],
+    },
+    "nonce": "1234567890",
+}
+
+
+def make_models() -> Mapping[str, BaseModel]:
+    """Create a sample instance of each benchmarked model."""
+    cred_offer = V20CredOffer(
+        comment="Credential offer",
+        credential_preview=V20CredPreview(
+            attributes=V20CredAttrSpec.list_plain(
+                {"name": "Alice Smith", "date": "2018-05-28", "degree": "Maths"}
+            )
+        ),
+        formats=[
+            V20CredFormat(
+                attach_id="indy",
+                format_=ATTACHMENT_FORMAT[CRED_20_OFFER][V20CredFormat.Format.INDY.api],
+            )
+        ],
+        offers_attach=[AttachDecorator.data_base64(INDY_OFFER, ident="indy")],
+    )
+    cred_offer.assign_thread_id("thread-0")
+    return {
+        "ConnRecord": ConnRecord(
+            connection_id="3fa85f64-5717-4562-b3fc-2c963f66afa6",
+            my_did="WgWxqztrNooG92RXvxSTWv",
+            their_did="LjgpST2rjsoxYegQDRm7EL",
+            their_label="Bob",
+            their_role=ConnRecord.Role.REQUESTER.rfc160,
+            invitation_key="8HH5gYEeNc3z7PYXmd54d4x6qAfCNrqQqEB3nS7Zfu7K",
+            accept=ConnRecord.ACCEPT_AUTO,
+            state=ConnRecord.State.COMPLETED.rfc160,
+        ),
+        "V20CredExRecord": V20CredExRecord(
+            cred_ex_id="dummy-0",
+            connection_id="3fa85f64-5717-4562-b3fc-2c963f66afa6",
+            thread_id="thread-0",
+            initiator=V20CredExRecord.INITIATOR_SELF,
+            role=V20CredExRecord.ROLE_ISSUER,
+            state=V20CredExRecord.STATE_OFFER_SENT,
+            cred_offer=cred_offer,
+        ),
+        "V20CredOffer": cred_offer,
+    }
+
+
+def fresh_schema(model: BaseModel):
+    """Create a schema instance for a model, as done for every call before."""
+    schema_cls = model._get_schema_class()
+    return schema_cls(unknown=resolve_meta_property(schema_cls, "unknown", EXCLUDE))
+
+
+def run(iterations: int = 2000) -> Mapping[str, float]:
+    """Time serialization and deserialization, in round trips per second."""
+    results = {}
+    for name, model in make_models().items():
+        serialized = model.serialize()
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fresh_schema(model).dump(model)
+            fresh_schema(model).load(dict(serialized))
+        results[f"{name} fresh"] = iterations / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            model.serialize()
+            model.deserialize(dict(serialized))
+        results[f"{name} reused"] = iterations / (time.perf_counter() - start)
+    return results
+
+
+def main():
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    for name, rate in run(args.iterations).items():
+        print(f"{name:>24}: {rate:10.1f} round trips/s")
+
+
+if __name__ == "__main__":
+    main()
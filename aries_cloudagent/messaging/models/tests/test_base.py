@@ -3,6 +3,8 @@ from unittest import IsolatedAsyncioTestCase
 
 from marshmallow import EXCLUDE, INCLUDE, fields, validates_schema, ValidationError
 
+from .. import base as test_module
+from . import bench_models
 from ..base import BaseModel, BaseModelError, BaseModelSchema
 
 
@@ -69,6 +71,27 @@ class SchemaImplWithoutUnknown(BaseModelSchema):
             raise ValidationError("")
 
 
+class FastModelImpl(BaseModel):
+    class Meta:
+        schema_class = "FastSchemaImpl"
+        fast_serialize = True
+
+    def __init__(self, *, attr=None, count=None, label=None):
+        self.attr = attr
+        self.count = count
+        self.label = label
+
+
+class FastSchemaImpl(BaseModelSchema):
+    class Meta:
+        model_class = FastModelImpl
+
+    attr = fields.String(required=True)
+    count = fields.Integer(required=False)
+    label = fields.String(required=False, data_key="@label")
+    secret = fields.String(required=False, load_only=True)
+
+
 class TestBase(IsolatedAsyncioTestCase):
     def test_model_validate_fails(self):
         model = ModelImpl(attr="string")
@@ -93,6 +116,56 @@ class TestBase(IsolatedAsyncioTestCase):
             with self.assertRaises(BaseModelError):
                 model.serialize()
 
+    def test_schema_reuse(self):
+        ModelImpl.deserialize({"attr": "succeeds"})
+        pool = test_module._schema_pool[(SchemaImpl, EXCLUDE)]
+        (schema,) = pool
+        ModelImpl.deserialize({"attr": "succeeds"})
+        ModelImpl(attr="succeeds").serialize()
+        assert pool == [schema]
+
+        # a schema instance in use is not handed out again
+        first, _ = BaseModel._acquire_schema(SchemaImpl)
+        second, _ = BaseModel._acquire_schema(SchemaImpl)
+        assert first is schema and second is not schema
+        BaseModel._release_schema(first, pool)
+        BaseModel._release_schema(second, pool)
+        assert len(pool) == 2
+
+        with mock.patch.object(test_module, "SCHEMA_POOL_SIZE", 2):
+            third, _ = BaseModel._acquire_schema(SchemaImpl, INCLUDE)
+            assert third.unknown == INCLUDE
+            BaseModel._release_schema(third, pool)
+            assert len(pool) == 2
+
+    def test_fast_serialize(self):
+        schema = FastSchemaImpl()
+        assert schema.fast_dump_fields is not None
+        assert SchemaImpl().fast_dump_fields is None
+        for model in (
+            FastModelImpl(attr="value"),
+            FastModelImpl(attr="value", count=0, label="label"),
+        ):
+            with mock.patch.object(FastSchemaImpl, "dump") as mock_dump:
+                serialized = model.serialize()
+                mock_dump.assert_not_called()
+            assert serialized == schema.dump(model)
+        assert model.serialize(as_string=True) == (
+            '{"attr":"value","count":0,"@label":"label"}'
+        )
+
+    def test_fast_serialize_records(self):
+        for model in bench_models.make_models().values():
+            assert model.serialize() == bench_models.fresh_schema(model).dump(model)
+
+    def test_bench_models(self):
+        results = bench_models.run(iterations=2)
+        assert results.keys() == {
+            f"{name} {label}"
+            for name in ("ConnRecord", "V20CredExRecord", "V20CredOffer")
+            for label in ("fresh", "reused")
+        }
+
     def test_from_json_x(self):
         data = "{}{}"
         with self.assertRaises(BaseModelError):
@@ -254,6 +254,64 @@ class TestBaseRecord(IsolatedAsyncioTestCase):
         )
         assert not result
 
+    async def test_query_paginated(self):
+        session = InMemoryProfile.test_session()
+        records = []
+        for i in range(12):
+            record = ARecordImpl(a=f"{i % 3}", b=f"{i:02d}", code=f"c{11 - i:02d}")
+            await record.save(session)
+            records.append(record)
+
+        result = await ARecordImpl.query(session, limit=5, offset=2)
+        assert [r.b for r in result] == [f"{i:02d}" for i in range(2, 7)]
+
+        result = await ARecordImpl.query(session, limit=3, order_by="code")
+        assert [r.code for r in result] == ["c00", "c01", "c02"]
+
+        result = await ARecordImpl.query(session, offset=10, descending=True)
+        assert [r.b for r in result] == ["01", "00"]
+
+        # post filters apply before the page is selected
+        result = await ARecordImpl.query(
+            session, post_filter_positive={"a": "1"}, limit=2, offset=1
+        )
+        assert [r.b for r in result] == ["04", "07"]
+
+        result = await ARecordImpl.query(
+            session,
+            post_filter_negative={"a": "1"},
+            limit=3,
+            order_by="code",
+            descending=True,
+        )
+        assert [r.code for r in result] == ["c11", "c09", "c08"]
+
+    async def test_query_paginated_single_scan(self):
+        session = InMemoryProfile.test_session()
+        for i in range(5):
+            await ARecordImpl(a="x" if i % 2 else "y", b=f"{i}").save(session)
+        storage = session.inject(BaseStorage)
+
+        with mock.patch.object(
+            storage, "scan_records", wraps=storage.scan_records
+        ) as mock_scan, mock.patch.object(
+            storage, "find_paginated_records", mock.CoroutineMock()
+        ) as mock_paginated:
+            result = await ARecordImpl.query(
+                session, post_filter_positive={"a": "x"}, limit=1, offset=1
+            )
+        assert [r.b for r in result] == ["3"]
+        mock_scan.assert_called_once()
+        mock_paginated.assert_not_called()
+
+    async def test_query_order_by_x(self):
+        session = InMemoryProfile.test_session()
+        await ARecordImpl(a="1", b="1", code="c").save(session)
+        with self.assertRaises(BaseModelError) as ctx:
+            await ARecordImpl.query(session, order_by="created_at")
+        assert "Cannot order ARecordImpl records by created_at" in str(ctx.exception)
+        assert await ARecordImpl.query(session, order_by="code")
+
     @mock.patch("builtins.print")
     def test_log_state(self, mock_print):
         test_param = "test.log"
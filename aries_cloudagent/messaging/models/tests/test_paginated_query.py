@@ -0,0 +1,33 @@
+from unittest import IsolatedAsyncioTestCase
+
+from aries_cloudagent.tests import mock
+
+from ..paginated_query import PaginatedQuery, get_paginated_query
+
+
+class TestPaginatedQuery(IsolatedAsyncioTestCase):
+    def test_get_paginated_query(self):
+        request = mock.MagicMock(query={})
+        query = get_paginated_query(request)
+        assert query == PaginatedQuery()
+        assert not query.paginated
+
+        request = mock.MagicMock(
+            query={
+                "limit": "10",
+                "offset": "20",
+                "order_by": "state",
+                "descending": "true",
+            }
+        )
+        query = get_paginated_query(request)
+        assert query.paginated
+        assert query.as_query_args() == {
+            "limit": 10,
+            "offset": 20,
+            "order_by": "state",
+            "descending": True,
+        }
+
+        request = mock.MagicMock(query={"limit": "", "descending": "false"})
+        assert not get_paginated_query(request).paginated
@@ -10,9 +10,11 @@ from abc import ABC, abstractmethod
 from typing import List, Optional, Sequence, Tuple, Union
 
 from ..cache.base import BaseCache
+from ..connections.cache import CONNECTION_EVENT_PATTERN
 from ..connections.models.conn_record import ConnRecord
 from ..connections.models.connection_target import ConnectionTarget
 from ..core.error import BaseError
+from ..core.event_bus import Event, EventBus
 from ..core.profile import Profile
 from ..transport.outbound.message import OutboundMessage
 from ..transport.outbound.status import OutboundSendStatus
@@ -36,6 +38,10 @@ class ResponderError(BaseError):
 class BaseResponder(ABC):
     """Interface for message handlers to send responses."""
 
+    # seconds between connection state checks while waiting for an active
+    # connection, to pick up changes that did not raise a local event
+    CONN_REC_STATE_RECHECK_INTERVAL = 1.0
+
     def __init__(
         self,
         *,
@@ -147,6 +153,15 @@ class BaseResponder(ABC):
     ) -> bool:
         """Check if the connection record is ready for sending outbound message."""
 
+        state_changed = asyncio.Event()
+
+        async def _on_connection_event(_profile: Profile, event: Event):
+            if (
+                isinstance(event.payload, dict)
+                and event.payload.get("connection_id") == connection_id
+            ):
+                state_changed.set()
+
         async def _wait_for_state() -> Tuple[bool, Optional[str]]:
             while True:
                 async with profile.session() as session:
@@ -154,11 +169,16 @@ class BaseResponder(ABC):
                         session, connection_id
                     )
                     if conn_record.is_ready:
-                        # if ConnRecord.State.get(conn_record.state) in (
-                        #     ConnRecord.State.COMPLETED,
-                        # ):
                         return (True, conn_record.state)
-                    await asyncio.sleep(1)
+                # wake on the next state change for the connection; re-check
+                # periodically for changes made by other agent instances
+                try:
+                    await asyncio.wait_for(
+                        state_changed.wait(), self.CONN_REC_STATE_RECHECK_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                state_changed.clear()
 
         try:
             cache_key = f"conn_rec_state::{connection_id}"
@@ -171,9 +191,18 @@ class BaseResponder(ABC):
                 ConnRecord.State.RESPONSE,
             ):
                 return True
-            check_flag, connection_state = await asyncio.wait_for(
-                _wait_for_state(), timeout
-            )
+            event_bus = profile.inject_or(EventBus)
+            if event_bus:
+                event_bus.subscribe(CONNECTION_EVENT_PATTERN, _on_connection_event)
+            try:
+                check_flag, connection_state = await asyncio.wait_for(
+                    _wait_for_state(), timeout
+                )
+            finally:
+                if event_bus:
+                    event_bus.unsubscribe(
+                        CONNECTION_EVENT_PATTERN, _on_connection_event
+                    )
             if cache and connection_state:
                 await cache.set(cache_key, connection_state)
             return check_flag
@@ -48,6 +48,24 @@ class BasicAgentMessage(AgentMessage):
         message_type = "basic-message"
 
 
+class ThreadedAgentMessage(AgentMessage):
+    """Agent message implementation with a schema"""
+
+    class Meta:
+        """Meta data"""
+
+        schema_class = "ThreadedAgentMessageSchema"
+        message_type = "threaded-message"
+
+
+class ThreadedAgentMessageSchema(AgentMessageSchema):
+    """Utility schema"""
+
+    class Meta:
+        model_class = ThreadedAgentMessage
+        unknown = EXCLUDE
+
+
 class TestAgentMessage(IsolatedAsyncioTestCase):
     """Tests agent message."""
 
@@ -267,3 +285,15 @@ class TestAgentMessageSchema(IsolatedAsyncioTestCase):
         }
         result = SignedAgentMessage.deserialize(serial)
         result.serialize()
+
+    def test_deserialize_decorators_not_shared(self):
+        first = ThreadedAgentMessage.deserialize(
+            {"@type": "threaded-message", "~thread": {"thid": "thread-1"}}
+        )
+        second = ThreadedAgentMessage.deserialize(
+            {"@type": "threaded-message", "~thread": {"thid": "thread-2"}}
+        )
+        third = ThreadedAgentMessage.deserialize({"@type": "threaded-message"})
+        assert first._thread_id == "thread-1"
+        assert second._thread_id == "thread-2"
+        assert not third._thread
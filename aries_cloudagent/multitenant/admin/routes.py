@@ -16,6 +16,10 @@ from ...core.error import BaseError
 from ...core.profile import ProfileManagerProvider
 from ...messaging.models.base import BaseModelError
 from ...messaging.models.openapi import OpenAPISchema
+from ...messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    get_paginated_query,
+)
 from ...messaging.valid import UUID4_EXAMPLE, JSONWebToken
 from ...multitenant.base import BaseMultitenantManager
 from ...storage.error import StorageError, StorageNotFoundError
@@ -335,7 +339,7 @@ class WalletListSchema(OpenAPISchema):
     )
 
 
-class WalletListQueryStringSchema(OpenAPISchema):
+class WalletListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for wallet list request query string."""
 
     wallet_name = fields.Str(
@@ -361,11 +365,16 @@ async def wallets_list(request: web.BaseRequest):
     if wallet_name:
         query["wallet_name"] = wallet_name
 
+    pagination = get_paginated_query(request)
+
     try:
         async with profile.session() as session:
-            records = await WalletRecord.query(session, tag_filter=query)
+            records = await WalletRecord.query(
+                session, tag_filter=query, **pagination.as_query_args()
+            )
         results = [format_wallet_record(record) for record in records]
-        results.sort(key=lambda w: w["created_at"])
+        if not pagination.paginated:
+            results.sort(key=lambda w: w["created_at"])
     except (StorageError, BaseModelError) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
 
@@ -1,9 +1,13 @@
 """Manager for multitenancy."""
 
+import copy
+import hashlib
 import logging
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Iterable, List, Optional, Tuple, cast
+from typing import Iterable, List, Mapping, Optional, Tuple, cast
 
 import jwt
 
@@ -17,7 +21,9 @@ from ..protocols.coordinate_mediation.v1_0.manager import (
 from ..protocols.coordinate_mediation.v1_0.route_manager import RouteManager
 from ..protocols.routing.v1_0.manager import RouteNotFoundError, RoutingManager
 from ..protocols.routing.v1_0.models.route_record import RouteRecord
+from ..protocols.routing.v1_0.route_index import RouteIndex
 from ..storage.base import BaseStorage
+from ..storage.error import StorageNotFoundError
 from ..transport.wire_format import BaseWireFormat
 from ..wallet.base import BaseWallet
 from ..wallet.models.wallet_record import WalletRecord
@@ -25,6 +31,9 @@ from .error import WalletKeyMissingError
 
 LOGGER = logging.getLogger(__name__)
 
+TOKEN_CACHE_SIZE = 10000
+WALLET_RECORD_CACHE_SIZE = 10000
+
 
 class MultitenantManagerError(BaseError):
     """Generic multitenant error."""
@@ -42,6 +51,10 @@ class BaseMultitenantManager(ABC):
         self._profile = profile
         if not profile:
             raise MultitenantManagerError("Missing profile")
+        # verified claims of auth tokens, by token hash
+        self._tokens: "OrderedDict[str, Mapping]" = OrderedDict()
+        # expiry and stored value of the wallet records resolved for auth tokens
+        self._token_wallets: "OrderedDict[str, Tuple[float, Mapping]]" = OrderedDict()
 
     @property
     @abstractmethod
@@ -229,6 +242,7 @@ class BaseMultitenantManager(ABC):
             wallet_record = await WalletRecord.retrieve_by_id(session, wallet_id)
             wallet_record.update_settings(new_settings)
             await wallet_record.save(session)
+        self._token_wallets.pop(wallet_id, None)
 
         return wallet_record
 
@@ -272,6 +286,12 @@ class BaseMultitenantManager(ABC):
 
             await wallet.delete_record(session)
 
+        index = RouteIndex.for_profile(self._profile)
+        if index:
+            index.remove_wallet_routes(wallet.wallet_id)
+        self._forget_tokens(wallet.wallet_id)
+        self._token_wallets.pop(wallet.wallet_id, None)
+
     @abstractmethod
     async def remove_wallet_profile(self, profile: Profile):
         """Remove the wallet profile instance.
@@ -316,13 +336,73 @@ class BaseMultitenantManager(ABC):
         wallet_record.jwt_iat = iat
         async with self._profile.session() as session:
             await wallet_record.save(session)
+        # previously issued tokens are no longer valid
+        self._forget_tokens(wallet_record.wallet_id)
+        self._token_wallets.pop(wallet_record.wallet_id, None)
 
         return token
 
-    def get_wallet_details_from_token(self, token: str) -> Tuple[str, str]:
-        """Get the wallet_id and wallet_key from provided token."""
+    def _decode_token(self, token: str) -> Mapping:
+        """Decode and verify a JWT auth token, reusing the claims of a previous check.
+
+        Tokens with an expiry or not-before time are verified on every use.
+        """
+        token_hash = hashlib.sha256(token.encode()).hexdigest()
+        token_body = self._tokens.get(token_hash)
+        if token_body is not None:
+            self._tokens.move_to_end(token_hash)
+            return token_body
+
         jwt_secret = self._profile.context.settings.get("multitenant.jwt_secret")
         token_body = jwt.decode(token, jwt_secret, algorithms=["HS256"], leeway=1)
+        if not token_body.keys() & {"exp", "nbf"}:
+            self._tokens[token_hash] = token_body
+            while len(self._tokens) > TOKEN_CACHE_SIZE:
+                self._tokens.popitem(last=False)
+        return token_body
+
+    def _forget_tokens(self, wallet_id: str):
+        """Remove the verified tokens of a wallet."""
+        for token_hash in [
+            token_hash
+            for token_hash, token_body in self._tokens.items()
+            if token_body.get("wallet_id") == wallet_id
+        ]:
+            del self._tokens[token_hash]
+
+    async def _get_token_wallet(self, wallet_id: str) -> WalletRecord:
+        """Get the wallet record for an auth token.
+
+        The wallet record is read from storage, unless the opt-in
+        `multitenant.wallet_record_ttl` setting is given. Changes made by this
+        instance are seen immediately, while a token issued for the wallet or
+        a wallet removed by another instance is only seen once the stored value
+        expires.
+        """
+        ttl = self._profile.settings.get("multitenant.wallet_record_ttl")
+        if not ttl:
+            async with self._profile.session() as session:
+                return await WalletRecord.retrieve_by_id(session, wallet_id)
+
+        entry = self._token_wallets.get(wallet_id)
+        if entry and entry[0] >= time.perf_counter():
+            self._token_wallets.move_to_end(wallet_id)
+            return WalletRecord.from_storage(wallet_id, copy.deepcopy(entry[1]))
+
+        async with self._profile.session() as session:
+            wallet = await WalletRecord.retrieve_by_id(session, wallet_id)
+        self._token_wallets[wallet_id] = (
+            time.perf_counter() + float(ttl),
+            copy.deepcopy(wallet.value),
+        )
+        self._token_wallets.move_to_end(wallet_id)
+        while len(self._token_wallets) > WALLET_RECORD_CACHE_SIZE:
+            self._token_wallets.popitem(last=False)
+        return wallet
+
+    def get_wallet_details_from_token(self, token: str) -> Tuple[str, str]:
+        """Get the wallet_id and wallet_key from provided token."""
+        token_body = self._decode_token(token)
         wallet_id = token_body.get("wallet_id")
         wallet_key = token_body.get("wallet_key")
         return wallet_id, wallet_key
@@ -358,17 +438,15 @@ class BaseMultitenantManager(ABC):
             Profile associated with the token
 
         """
-        jwt_secret = self._profile.context.settings.get("multitenant.jwt_secret")
         extra_settings = {}
 
-        token_body = jwt.decode(token, jwt_secret, algorithms=["HS256"], leeway=1)
+        token_body = self._decode_token(token)
 
         wallet_id = token_body.get("wallet_id")
         wallet_key = token_body.get("wallet_key")
         iat = token_body.get("iat")
 
-        async with self._profile.session() as session:
-            wallet = await WalletRecord.retrieve_by_id(session, wallet_id)
+        wallet = await self._get_token_wallet(wallet_id)
 
         if wallet.requires_external_key:
             if not wallet_key:
@@ -386,24 +464,41 @@ class BaseMultitenantManager(ABC):
     async def _get_wallet_by_key(self, recipient_key: str) -> Optional[WalletRecord]:
         """Get the wallet record associated with the recipient key.
 
+        Recipient keys are looked up in the route index first, falling back to
+        the stored routes for keys which are not yet indexed. The wallet record
+        itself is always read from storage.
+
         Args:
             recipient_key: The recipient key
         Returns:
             Wallet record associated with the recipient key
         """
+        index = RouteIndex.for_profile(self._profile)
+        wallet_id = index and index.get_wallet_route(recipient_key)
+        if wallet_id:
+            try:
+                return await self._get_wallet_record(wallet_id)
+            except StorageNotFoundError:
+                # the wallet was removed by another instance
+                index.remove_route(recipient_key)
+
         routing_mgr = RoutingManager(self._profile)
 
         try:
             routing_record = await routing_mgr.get_recipient(recipient_key)
-            async with self._profile.session() as session:
-                wallet = await WalletRecord.retrieve_by_id(
-                    session, routing_record.wallet_id
-                )
+            wallet = await self._get_wallet_record(routing_record.wallet_id)
+            if index and routing_record.wallet_id:
+                index.add_wallet_route(recipient_key, routing_record.wallet_id)
 
             return wallet
         except RouteNotFoundError:
             pass
 
+    async def _get_wallet_record(self, wallet_id: str) -> WalletRecord:
+        """Get a wallet record from storage."""
+        async with self._profile.session() as session:
+            return await WalletRecord.retrieve_by_id(session, wallet_id)
+
     async def get_profile_for_key(
         self, context: InjectionContext, recipient_key: str
     ) -> Optional[Profile]:
@@ -423,7 +518,8 @@ class BaseMultitenantManager(ABC):
         """Get the wallet records associated with the message boy.
 
         Args:
-            message_body: The body of the message
+            message_body: The body of the message, or its envelope as parsed by the
+                wire format
             wire_format: Wire format to use for recipient detection
 
         Returns:
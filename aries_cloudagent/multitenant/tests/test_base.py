@@ -13,7 +13,9 @@ from ...protocols.coordinate_mediation.v1_0.manager import (
     MediationRecord,
 )
 from ...protocols.coordinate_mediation.v1_0.route_manager import RouteManager
+from ...protocols.routing.v1_0.manager import RoutingManager
 from ...protocols.routing.v1_0.models.route_record import RouteRecord
+from ...protocols.routing.v1_0.route_index import RouteIndex
 from ...storage.error import StorageNotFoundError
 from ...storage.in_memory import InMemoryStorage
 from ...wallet.did_info import DIDInfo
@@ -177,6 +179,78 @@ class TestBaseMultitenantManager(IsolatedAsyncioTestCase):
 
         assert isinstance(wallet, WalletRecord)
 
+    async def test_get_wallet_by_key_indexed(self):
+        recipient_key = "test-recipient-key"
+
+        wallet_record = WalletRecord(settings={"wallet.name": "test"})
+        async with self.profile.session() as session:
+            await wallet_record.save(session)
+        await RoutingManager(self.profile).create_route_record(
+            recipient_key=recipient_key, internal_wallet_id=wallet_record.wallet_id
+        )
+        index = RouteIndex.for_profile(self.profile)
+        assert index.get_wallet_route(recipient_key) == wallet_record.wallet_id
+
+        wallet = await self.manager._get_wallet_by_key(recipient_key)
+        assert wallet.wallet_id == wallet_record.wallet_id
+
+        with mock.patch.object(
+            WalletRecord, "retrieve_by_id", wraps=WalletRecord.retrieve_by_id
+        ) as retrieve_by_id, mock.patch.object(
+            RouteRecord, "retrieve_by_recipient_key"
+        ) as retrieve_by_recipient_key:
+            wallet = await self.manager._get_wallet_by_key(recipient_key)
+            retrieve_by_id.assert_called_once()
+            retrieve_by_recipient_key.assert_not_called()
+        assert wallet.wallet_id == wallet_record.wallet_id
+        assert wallet.settings["wallet.name"] == "test"
+
+        # updates are visible to subsequent lookups
+        wallet.settings["wallet.name"] = "changed"
+        await self.manager.update_wallet(
+            wallet_record.wallet_id, {"wallet.webhook_urls": ["http://example"]}
+        )
+        wallet = await self.manager._get_wallet_by_key(recipient_key)
+        assert wallet.settings["wallet.name"] == "test"
+        assert wallet.settings["wallet.webhook_urls"] == ["http://example"]
+
+    async def test_get_wallet_by_key_indexed_wallet_removed(self):
+        recipient_key = "test-recipient-key"
+
+        wallet_record = WalletRecord(settings={})
+        async with self.profile.session() as session:
+            await wallet_record.save(session)
+            await RouteRecord(
+                wallet_id=wallet_record.wallet_id, recipient_key=recipient_key
+            ).save(session)
+        index = RouteIndex.for_profile(self.profile)
+        index.add_wallet_route(recipient_key, "removed-wallet-id")
+
+        wallet = await self.manager._get_wallet_by_key(recipient_key)
+        assert wallet.wallet_id == wallet_record.wallet_id
+        assert index.get_wallet_route(recipient_key) == wallet_record.wallet_id
+
+    async def test_get_wallet_by_key_indexed_wallet_removed_in_storage(self):
+        recipient_key = "test-recipient-key"
+
+        wallet_record = WalletRecord(settings={})
+        async with self.profile.session() as session:
+            await wallet_record.save(session)
+        await RoutingManager(self.profile).create_route_record(
+            recipient_key=recipient_key, internal_wallet_id=wallet_record.wallet_id
+        )
+        index = RouteIndex.for_profile(self.profile)
+        assert await self.manager._get_wallet_by_key(recipient_key)
+
+        # wallet and routes removed by another instance
+        async with self.profile.session() as session:
+            await wallet_record.delete_record(session)
+            await (
+                await RouteRecord.retrieve_by_recipient_key(session, recipient_key)
+            ).delete_record(session)
+        assert await self.manager._get_wallet_by_key(recipient_key) is None
+        assert index.get_wallet_route(recipient_key) is None
+
     async def test_create_wallet_removes_key_only_unmanaged_mode(self):
         with mock.patch.object(
             self.manager, "get_wallet_profile"
@@ -353,6 +427,26 @@ class TestBaseMultitenantManager(IsolatedAsyncioTestCase):
                 RouteRecord.RECORD_TYPE, {"wallet_id": "test"}
             )
 
+    async def test_remove_wallet_removes_indexed_routes(self):
+        index = RouteIndex.for_profile(self.profile)
+        index.add_wallet_route("test-key", "test")
+        index.add_wallet_route("other-key", "other")
+        wallet_record = WalletRecord(
+            wallet_id="test",
+            key_management_mode=WalletRecord.MODE_MANAGED,
+            settings={"wallet.key": "test_key"},
+        )
+        with mock.patch.object(
+            WalletRecord, "retrieve_by_id", mock.CoroutineMock()
+        ) as retrieve_by_id, mock.patch.object(
+            WalletRecord, "delete_record", mock.CoroutineMock()
+        ):
+            retrieve_by_id.return_value = wallet_record
+            await self.manager.remove_wallet("test")
+
+        assert index.get_wallet_route("test-key") is None
+        assert index.get_wallet_route("other-key") == "other"
+
     async def test_create_auth_token_fails_no_wallet_key_but_required(self):
         self.profile.settings["multitenant.jwt_secret"] = "very_secret_jwt"
         wallet_record = WalletRecord(
@@ -642,6 +736,144 @@ class TestBaseMultitenantManager(IsolatedAsyncioTestCase):
 
             assert profile == mock_profile
 
+    async def test_get_profile_for_token_cached(self):
+        self.profile.settings["multitenant.jwt_secret"] = "very_secret_jwt"
+        wallet_record = WalletRecord(
+            key_management_mode=WalletRecord.MODE_MANAGED,
+            settings={"wallet.type": "indy", "wallet.key": "wallet_key"},
+        )
+        async with self.profile.session() as session:
+            await wallet_record.save(session)
+        token = await self.manager.create_auth_token(wallet_record)
+
+        with mock.patch.object(
+            self.manager, "get_wallet_profile"
+        ) as get_wallet_profile, mock.patch.object(
+            test_module.jwt, "decode", wraps=jwt.decode
+        ) as jwt_decode, mock.patch.object(
+            WalletRecord, "retrieve_by_id", wraps=WalletRecord.retrieve_by_id
+        ) as retrieve_by_id:
+            for _ in range(3):
+                await self.manager.get_profile_for_token(self.profile.context, token)
+            assert self.manager.get_wallet_details_from_token(token) == (
+                wallet_record.wallet_id,
+                None,
+            )
+            assert get_wallet_profile.call_count == 3
+            jwt_decode.assert_called_once()
+            assert retrieve_by_id.call_count == 3
+
+            # a token which was re-issued is no longer valid
+            with mock.patch.object(
+                test_module, "datetime", mock.MagicMock()
+            ) as mock_datetime:
+                mock_datetime.now.return_value.timestamp.return_value = (
+                    wallet_record.jwt_iat - 10
+                )
+                new_token = await self.manager.create_auth_token(wallet_record)
+            with self.assertRaises(MultitenantManagerError):
+                await self.manager.get_profile_for_token(self.profile.context, token)
+            await self.manager.get_profile_for_token(self.profile.context, new_token)
+
+            # the token of a removed wallet is no longer valid
+            await self.manager.remove_wallet(wallet_record.wallet_id)
+            with self.assertRaises(StorageNotFoundError):
+                await self.manager.get_profile_for_token(
+                    self.profile.context, new_token
+                )
+
+    async def test_get_profile_for_token_wallet_record_ttl(self):
+        self.profile.settings["multitenant.jwt_secret"] = "very_secret_jwt"
+        self.profile.settings["multitenant.wallet_record_ttl"] = 5
+        wallet_record = WalletRecord(
+            key_management_mode=WalletRecord.MODE_MANAGED,
+            settings={"wallet.type": "indy", "wallet.key": "wallet_key"},
+        )
+        async with self.profile.session() as session:
+            await wallet_record.save(session)
+        token = await self.manager.create_auth_token(wallet_record)
+
+        with mock.patch.object(self.manager, "get_wallet_profile"), mock.patch.object(
+            WalletRecord, "retrieve_by_id", wraps=WalletRecord.retrieve_by_id
+        ) as retrieve_by_id:
+            for _ in range(3):
+                await self.manager.get_profile_for_token(self.profile.context, token)
+            retrieve_by_id.assert_called_once()
+
+            # token re-issued by another instance: seen once the record expires
+            async with self.profile.session() as session:
+                record = await WalletRecord.retrieve_by_id(
+                    session, wallet_record.wallet_id
+                )
+                record.jwt_iat = wallet_record.jwt_iat + 10
+                await record.save(session)
+            await self.manager.get_profile_for_token(self.profile.context, token)
+            with mock.patch.object(
+                test_module.time, "perf_counter", return_value=10**9
+            ):
+                with self.assertRaises(MultitenantManagerError):
+                    await self.manager.get_profile_for_token(
+                        self.profile.context, token
+                    )
+
+            # changes made by this instance are seen immediately
+            new_token = await self.manager.create_auth_token(record)
+            await self.manager.get_profile_for_token(self.profile.context, new_token)
+            await self.manager.update_wallet(
+                record.wallet_id, {"wallet.webhook_urls": ["http://example"]}
+            )
+            retrieve_by_id.reset_mock()
+            await self.manager.get_profile_for_token(self.profile.context, new_token)
+            retrieve_by_id.assert_called_once()
+            await self.manager.remove_wallet(record.wallet_id)
+            with self.assertRaises(StorageNotFoundError):
+                await self.manager.get_profile_for_token(
+                    self.profile.context, new_token
+                )
+
+    async def test_get_profile_for_token_record_changed_in_storage(self):
+        self.profile.settings["multitenant.jwt_secret"] = "very_secret_jwt"
+        wallet_record = WalletRecord(
+            key_management_mode=WalletRecord.MODE_MANAGED,
+            settings={"wallet.type": "indy", "wallet.key": "wallet_key"},
+        )
+        async with self.profile.session() as session:
+            await wallet_record.save(session)
+        token = await self.manager.create_auth_token(wallet_record)
+
+        with mock.patch.object(self.manager, "get_wallet_profile"):
+            await self.manager.get_profile_for_token(self.profile.context, token)
+
+            # token re-issued by another instance
+            async with self.profile.session() as session:
+                record = await WalletRecord.retrieve_by_id(
+                    session, wallet_record.wallet_id
+                )
+                record.jwt_iat = wallet_record.jwt_iat + 10
+                await record.save(session)
+            with self.assertRaises(MultitenantManagerError):
+                await self.manager.get_profile_for_token(self.profile.context, token)
+
+            # wallet removed by another instance
+            async with self.profile.session() as session:
+                await record.delete_record(session)
+            with self.assertRaises(StorageNotFoundError):
+                await self.manager.get_profile_for_token(self.profile.context, token)
+
+    async def test_get_profile_for_token_expiring_not_cached(self):
+        self.profile.settings["multitenant.jwt_secret"] = "very_secret_jwt"
+        token = jwt.encode(
+            {"wallet_id": "test", "exp": 1}, "very_secret_jwt", algorithm="HS256"
+        )
+        for _ in range(2):
+            with self.assertRaises(jwt.ExpiredSignatureError):
+                self.manager.get_wallet_details_from_token(token)
+        token = jwt.encode(
+            {"wallet_id": "test", "exp": 2**40}, "very_secret_jwt", algorithm="HS256"
+        )
+        assert self.manager.get_wallet_details_from_token(token) == ("test", None)
+        assert not self.manager._tokens
+
     async def test_get_wallets_by_message_missing_wire_format_raises(self):
         with self.assertRaises(
             InjectionError,
@@ -102,6 +102,10 @@ class TestConnectionRoutes(IsolatedAsyncioTestCase):
                         "connection_protocol": ConnRecord.Protocol.RFC_0160.aries_protocol,
                     },
                     alt=True,
+                    limit=None,
+                    offset=None,
+                    order_by=None,
+                    descending=False,
                 )
                 mock_response.assert_called_once_with(
                     {
@@ -115,6 +119,34 @@ class TestConnectionRoutes(IsolatedAsyncioTestCase):
                     }  # sorted
                 )
 
+    async def test_connections_list_paginated(self):
+        self.request.query = {"limit": "2", "offset": "1", "order_by": "state"}
+
+        with mock.patch.object(
+            test_module, "ConnRecord", autospec=True
+        ) as mock_conn_rec:
+            conns = [mock.MagicMock(serialize=mock.MagicMock()) for _ in range(2)]
+            for i, conn in enumerate(conns):
+                conn.serialize.return_value = {"state": "active", "created_at": f"{i}"}
+            mock_conn_rec.query = mock.CoroutineMock(return_value=conns[::-1])
+
+            with mock.patch.object(test_module.web, "json_response") as mock_response:
+                await test_module.connections_list(self.request)
+                mock_conn_rec.query.assert_called_once_with(
+                    ANY,
+                    {},
+                    post_filter_positive={},
+                    alt=True,
+                    limit=2,
+                    offset=1,
+                    order_by="state",
+                    descending=False,
+                )
+                # page order is preserved
+                mock_response.assert_called_once_with(
+                    {"results": [c.serialize.return_value for c in conns[::-1]]}
+                )
+
     async def test_connections_list_x(self):
         self.request.query = {
             "their_role": ConnRecord.Role.REQUESTER.rfc160,
@@ -379,7 +411,7 @@ class TestConnectionRoutes(IsolatedAsyncioTestCase):
                 routing_keys=body["routing_keys"],
                 my_endpoint=body["service_endpoint"],
                 metadata=body["metadata"],
-                mediation_id="some-id"
+                mediation_id="some-id",
             )
             mock_response.assert_called_once_with(
                 {
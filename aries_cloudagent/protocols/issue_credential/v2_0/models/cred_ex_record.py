@@ -28,6 +28,7 @@ class V20CredExRecord(BaseExchangeRecord):
         """CredentialExchange metadata."""
 
         schema_class = "V20CredExRecordSchema"
+        fast_serialize = True
 
     RECORD_TYPE = "cred_ex_v20"
     RECORD_ID_NAME = "cred_ex_id"
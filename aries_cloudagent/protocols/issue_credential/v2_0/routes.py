@@ -25,6 +25,10 @@ from ....ledger.error import LedgerError
 from ....messaging.decorators.attach_decorator import AttachDecorator
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    get_paginated_query,
+)
 from ....messaging.valid import (
     INDY_CRED_DEF_ID_EXAMPLE,
     INDY_CRED_DEF_ID_VALIDATE,
@@ -62,7 +66,7 @@ class V20IssueCredentialModuleResponseSchema(OpenAPISchema):
     """Response schema for v2.0 Issue Credential Module."""
 
 
-class V20CredExRecordListQueryStringSchema(OpenAPISchema):
+class V20CredExRecordListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for credential exchange record list query."""
 
     connection_id = fields.Str(
@@ -522,6 +526,7 @@ async def credential_exchange_list(request: web.BaseRequest):
                 session=session,
                 tag_filter=tag_filter,
                 post_filter_positive=post_filter,
+                **get_paginated_query(request).as_query_args(),
             )
 
         results = []
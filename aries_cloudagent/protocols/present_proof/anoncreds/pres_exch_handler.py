@@ -1,5 +1,6 @@
 """Utilities for dif presentation exchange attachment."""
 
+import asyncio
 import json
 import logging
 import time
@@ -14,6 +15,8 @@ from ....anoncreds.revocation import AnonCredsRevocation
 from ....core.error import BaseError
 from ....core.profile import Profile
 from ....indy.models.xform import indy_proof_req2non_revoc_intervals
+from ....revocation.state_cache import CachedRevocationState, RevocationStateCache
+from ....utils.concurrency import DEFAULT_CONCURRENCY, gather_keyed
 from ..v1_0.models.presentation_exchange import V10PresentationExchange
 from ..v2_0.messages.pres_format import V20PresFormat
 from ..v2_0.models.pres_exchange import V20PresExRecord
@@ -104,113 +107,189 @@ class AnonCredsPresExchHandler:
     async def _get_ledger_objects(
         self, credentials: dict
     ) -> Tuple[Dict[str, AnonCredsSchema], Dict[str, CredDef], Dict[str, RevRegDef]]:
-        """Get all schemas, credential definitions, and revocation registries in use."""
-        schemas = {}
-        cred_defs = {}
-        revocation_registries = {}
-
-        for credential in credentials.values():
-            schema_id = credential["schema_id"]
-            anoncreds_registry = self._profile.inject(AnonCredsRegistry)
-            if schema_id not in schemas:
-                schemas[schema_id] = (
-                    await anoncreds_registry.get_schema(self._profile, schema_id)
-                ).schema
-            cred_def_id = credential["cred_def_id"]
-            if cred_def_id not in cred_defs:
-                cred_defs[cred_def_id] = (
-                    await anoncreds_registry.get_credential_definition(
-                        self._profile, cred_def_id
-                    )
-                ).credential_definition
-            if credential.get("rev_reg_id"):
-                revocation_registry_id = credential["rev_reg_id"]
-                if revocation_registry_id not in revocation_registries:
-                    rev_reg = (
-                        await anoncreds_registry.get_revocation_registry_definition(
-                            self._profile, revocation_registry_id
-                        )
-                    ).revocation_registry
-                    revocation_registries[revocation_registry_id] = rev_reg
+        """Get all schemas, credential definitions, and revocation registries in use.
+
+        Distinct objects are fetched concurrently.
+        """
+        anoncreds_registry = self._profile.inject(AnonCredsRegistry)
+
+        async def get_schema(schema_id: str) -> AnonCredsSchema:
+            return (
+                await anoncreds_registry.get_schema(self._profile, schema_id)
+            ).schema
 
+        async def get_cred_def(cred_def_id: str) -> CredDef:
+            return (
+                await anoncreds_registry.get_credential_definition(
+                    self._profile, cred_def_id
+                )
+            ).credential_definition
+
+        async def get_rev_reg_def(rev_reg_id: str) -> RevRegDef:
+            return (
+                await anoncreds_registry.get_revocation_registry_definition(
+                    self._profile, rev_reg_id
+                )
+            ).revocation_registry
+
+        semaphore = asyncio.Semaphore(DEFAULT_CONCURRENCY)
+        schemas, cred_defs, revocation_registries = await asyncio.gather(
+            gather_keyed(
+                get_schema,
+                (cred["schema_id"] for cred in credentials.values()),
+                semaphore=semaphore,
+            ),
+            gather_keyed(
+                get_cred_def,
+                (cred["cred_def_id"] for cred in credentials.values()),
+                semaphore=semaphore,
+            ),
+            gather_keyed(
+                get_rev_reg_def,
+                (
+                    cred["rev_reg_id"]
+                    for cred in credentials.values()
+                    if cred.get("rev_reg_id")
+                ),
+                semaphore=semaphore,
+            ),
+        )
         return schemas, cred_defs, revocation_registries
 
     async def _get_revocation_lists(self, requested_referents: dict, credentials: dict):
         """Get revocation lists.
 
         Get revocation lists with non-revocation interval defined in
-        "non_revoked" of the presentation request or attributes
+        "non_revoked" of the presentation request or attributes. Distinct
+        revocation lists are fetched concurrently.
         """
         epoch_now = int(time.time())
-        rev_lists = {}
+        list_keys = {}  # credential id to (rev reg id, from, to)
+        list_creds = {}  # (rev reg id, from, to) to first credential id
         for precis in requested_referents.values():  # cred_id, non-revoc interval
             credential_id = precis["cred_id"]
-            if not credentials[credential_id].get("rev_reg_id"):
-                continue
-            if "timestamp" in precis:
-                continue
-            rev_reg_id = credentials[credential_id]["rev_reg_id"]
-
-            anoncreds_registry = self._profile.inject(AnonCredsRegistry)
+            rev_reg_id = credentials[credential_id].get("rev_reg_id")
             reft_non_revoc_interval = precis.get("non_revoked")
-            if reft_non_revoc_interval:
+            # often one cred satisfies many requested attrs/preds
+            if (
+                rev_reg_id
+                and reft_non_revoc_interval
+                and credential_id not in list_keys
+            ):
                 key = (
-                    f"{rev_reg_id}_"
-                    f"{reft_non_revoc_interval.get('from', 0)}_"
-                    f"{reft_non_revoc_interval.get('to', epoch_now)}"
+                    rev_reg_id,
+                    reft_non_revoc_interval.get("from", 0),
+                    reft_non_revoc_interval.get("to", epoch_now),
                 )
-                if key not in rev_lists:
-                    result = await anoncreds_registry.get_revocation_list(
-                        self._profile,
-                        rev_reg_id,
-                        reft_non_revoc_interval.get("to", epoch_now),
-                    )
+                list_keys[credential_id] = key
+                list_creds.setdefault(key, credential_id)
 
-                    rev_lists[key] = (
-                        rev_reg_id,
-                        credential_id,
-                        result.revocation_list.serialize(),
-                        result.revocation_list.timestamp,
-                    )
-                for stamp_me in requested_referents.values():
-                    # often one cred satisfies many requested attrs/preds
-                    if stamp_me["cred_id"] == credential_id:
-                        stamp_me["timestamp"] = rev_lists[key][3]
+        anoncreds_registry = self._profile.inject(AnonCredsRegistry)
+
+        async def get_revocation_list(key: Tuple[str, int, int]) -> tuple:
+            rev_reg_id, _, to = key
+            result = await anoncreds_registry.get_revocation_list(
+                self._profile, rev_reg_id, to
+            )
+            return (
+                rev_reg_id,
+                list_creds[key],
+                result.revocation_list.serialize(),
+                result.revocation_list.timestamp,
+            )
+
+        rev_lists = await gather_keyed(get_revocation_list, list_creds)
+        for precis in requested_referents.values():
+            key = list_keys.get(precis["cred_id"])
+            if key:
+                precis["timestamp"] = rev_lists[key][3]
 
         return rev_lists
 
     async def _get_revocation_states(
         self, revocation_registries: dict, credentials: dict, rev_lists: dict
     ):
-        """Get revocation states to prove non-revoked."""
-        revocation_states = {}
-        for (
-            rev_reg_id,
-            credential_id,
-            rev_list,
-            timestamp,
-        ) in rev_lists.values():
-            if rev_reg_id not in revocation_states:
-                revocation_states[rev_reg_id] = {}
-            rev_reg_def = revocation_registries[rev_reg_id]
-            revocation = AnonCredsRevocation(self._profile)
-            tails_local_path = await revocation.get_or_fetch_local_tails_path(
-                rev_reg_def
+        """Get revocation states to prove non-revoked.
+
+        Revocation states are served from the revocation state cache where
+        possible, then updated from an earlier cached state of the credential,
+        and only otherwise created over the full tails file. Each tails file is
+        fetched once, and the revocation states are built concurrently.
+        """
+        state_cache = RevocationStateCache(self._profile)
+
+        async def get_cached_state(key: tuple) -> Optional[CachedRevocationState]:
+            rev_reg_id, credential_id, _, timestamp = rev_lists[key]
+            return await state_cache.get(
+                rev_reg_id, credentials[credential_id]["cred_rev_id"], timestamp
+            )
+
+        cached_states = await gather_keyed(get_cached_state, rev_lists)
+        misses = [key for key, cached in cached_states.items() if not cached]
+
+        revocation = AnonCredsRevocation(self._profile)
+
+        async def get_tails_path(rev_reg_id: str) -> str:
+            return await revocation.get_or_fetch_local_tails_path(
+                revocation_registries[rev_reg_id]
             )
-            try:
-                revocation_states[rev_reg_id][timestamp] = json.loads(
-                    await self.holder.create_revocation_state(
-                        credentials[credential_id]["cred_rev_id"],
-                        rev_reg_def.serialize(),
-                        rev_list,
-                        tails_local_path,
+
+        tails_paths = await gather_keyed(
+            get_tails_path, (rev_lists[key][0] for key in misses)
+        )
+
+        async def build_revocation_state(key: tuple) -> dict:
+            rev_reg_id, credential_id, rev_list, timestamp = rev_lists[key]
+            cred_rev_id = credentials[credential_id]["cred_rev_id"]
+            rev_reg_def = revocation_registries[rev_reg_id].serialize()
+            rev_state = None
+            previous = await state_cache.get_latest(rev_reg_id, cred_rev_id, timestamp)
+            if previous and previous.rev_list:
+                try:
+                    rev_state = json.loads(
+                        await self.holder.update_revocation_state(
+                            cred_rev_id,
+                            rev_reg_def,
+                            previous.rev_state,
+                            previous.rev_list,
+                            rev_list,
+                            tails_paths[rev_reg_id],
+                        )
                     )
-                )
-            except AnonCredsHolderError as e:
-                LOGGER.error(
-                    f"Failed to create revocation state: {e.error_code}, {e.message}"
-                )
-                raise e
+                except AnonCredsHolderError as err:
+                    LOGGER.warning(
+                        "Failed to update cached revocation state for %s, "
+                        "creating it instead: %s",
+                        rev_reg_id,
+                        err,
+                    )
+            if not rev_state:
+                try:
+                    rev_state = json.loads(
+                        await self.holder.create_revocation_state(
+                            cred_rev_id,
+                            rev_reg_def,
+                            rev_list,
+                            tails_paths[rev_reg_id],
+                        )
+                    )
+                except AnonCredsHolderError as e:
+                    LOGGER.error(
+                        f"Failed to create revocation state: {e.error_code}, {e.message}"
+                    )
+                    raise e
+            await state_cache.store(
+                rev_reg_id, cred_rev_id, timestamp, rev_state, rev_list
+            )
+            return rev_state
+
+        built_states = await gather_keyed(build_revocation_state, misses)
+        revocation_states = {}
+        for key, cached in cached_states.items():
+            rev_reg_id, _, _, timestamp = rev_lists[key]
+            revocation_states.setdefault(rev_reg_id, {})[timestamp] = (
+                cached.rev_state if cached else built_states[key]
+            )
         return revocation_states
 
     def _set_timestamps(self, requested_credentials: dict, requested_referents: dict):
@@ -0,0 +1,361 @@
+"""Compiled evaluation of presentation definition constraints.
+
+The constraints of an input descriptor are checked against every candidate
+credential of the holder. The JSON path expressions, patterns and date bounds
+they contain are parsed once here, instead of for each credential and field,
+and the checks a filter applies are selected when it is compiled.
+"""
+
+import logging
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Mapping, Optional, Pattern, Union
+
+import pytz
+from dateutil.parser import ParserError
+from dateutil.parser import parse as dateutil_parser
+from jsonpath_ng import JSONPath, parse
+
+from ....core.error import BaseError
+from .pres_exch import Constraints, DIFField, Filter
+
+LOGGER = logging.getLogger(__name__)
+
+PYTZ_TIMEZONE_PATTERN = re.compile(r"(([a-zA-Z]+)(?:\/)([a-zA-Z]+))")
+DATE_FORMATS = ("date", "date-time")
+
+# JSON paths of the credential properties which are also VC record tags,
+# with the keyword argument of VCHolder.search_credentials for each tag
+TAG_SEARCH_PATHS = {
+    "$.issuer": "issuer_id",
+    "$.issuer.id": "issuer_id",
+    "$.credentialSubject.id": "subject_ids",
+    "$.credentialSubject[*].id": "subject_ids",
+}
+
+
+class DIFPresExchError(BaseError):
+    """Base class for DIF Presentation Exchange related errors."""
+
+
+@lru_cache(maxsize=1024)
+def compile_path(path: str) -> JSONPath:
+    """Parse a JSON path expression, memoized as parsing is slow."""
+    return parse(path)
+
+
+@lru_cache(maxsize=256)
+def compile_pattern(pattern: str) -> Pattern:
+    """Compile a filter pattern."""
+    return re.compile(pattern)
+
+
+def string_to_timezone_aware_datetime(datetime_str: str) -> datetime:
+    """Convert string with PYTZ timezone to datetime for comparison."""
+    if PYTZ_TIMEZONE_PATTERN.search(datetime_str):
+        result = PYTZ_TIMEZONE_PATTERN.search(datetime_str).group(1)
+        datetime_str = datetime_str.replace(result, "")
+        return dateutil_parser(datetime_str).replace(tzinfo=pytz.timezone(result))
+    else:
+        utc = pytz.UTC
+        return dateutil_parser(datetime_str).replace(tzinfo=utc)
+
+
+@lru_cache(maxsize=256)
+def _bound_datetime(datetime_str: str) -> datetime:
+    """Convert a date bound of a filter, memoized as it is shared by all checks."""
+    return string_to_timezone_aware_datetime(datetime_str)
+
+
+def _to_numeric(val: Any) -> Optional[Union[int, float]]:
+    """Convert a value for a numeric comparison, if possible."""
+    if isinstance(val, (float, int)):
+        return val
+    if isinstance(val, str):
+        if val.isdigit():
+            return int(val)
+        try:
+            return float(val)
+        except ValueError:
+            pass
+    LOGGER.error("Invalid type provided for comparision/numeric operation.")
+    return None
+
+
+class CompiledFilter:
+    """A filter with its check selected once, ready to apply to many values."""
+
+    def __init__(self, _filter: Filter):
+        """Initialize the compiled filter.
+
+        Args:
+            _filter: the filter of a constraint field
+
+        """
+        self.filter = _filter
+        self.type_only = bool(_filter._type) and (
+            _filter.pattern is None
+            and _filter.minimum is None
+            and _filter.maximum is None
+            and _filter.min_length is None
+            and _filter.max_length is None
+            and _filter.exclusive_min is None
+            and _filter.exclusive_max is None
+            and _filter.const is None
+            and _filter.enums is None
+        )
+        self._check = self._select_check()
+
+    def check(self, val: Any) -> bool:
+        """Apply the filter to a value."""
+        result = self._check(val)
+        if self.type_only:
+            # a type check is not inverted when it succeeds
+            return result or bool(self.filter._not)
+        return not result if self.filter._not else result
+
+    def _select_check(self) -> Callable[[Any], bool]:
+        """Select the check applied by the filter specification."""
+        _filter = self.filter
+        if _filter._type == "number":
+            return self.type_check if self.type_only else self.numeric_check()
+        if _filter._type == "string":
+            return self.type_check if self.type_only else self.string_check()
+        if _filter._type:
+            return self._never
+        if _filter.const:
+            return self.const_check
+        if _filter.enums:
+            return self.enum_check
+        return self._never
+
+    def numeric_check(self) -> Callable[[Any], bool]:
+        """Select the check for a number type filter."""
+        _filter = self.filter
+        if _filter.exclusive_max:
+            return self.exclusive_maximum_check
+        if _filter.exclusive_min:
+            return self.exclusive_minimum_check
+        if _filter.minimum:
+            return self.minimum_check
+        if _filter.maximum:
+            return self.maximum_check
+        if _filter.const:
+            return self.const_check
+        if _filter.enums:
+            return self.enum_check
+        return self._never
+
+    def string_check(self) -> Callable[[Any], bool]:
+        """Select the check for a string type filter."""
+        _filter = self.filter
+        if _filter.min_length or _filter.max_length:
+            return self.length_check
+        if _filter.pattern:
+            return self.pattern_check
+        if _filter.enums:
+            return self.enum_check
+        if _filter.fmt:
+            if _filter.exclusive_max:
+                return self.exclusive_maximum_check
+            if _filter.exclusive_min:
+                return self.exclusive_minimum_check
+            if _filter.minimum:
+                return self.minimum_check
+            if _filter.maximum:
+                return self.maximum_check
+        if _filter.const:
+            return self.const_check
+        return self._never
+
+    def type_check(self, val: Any) -> bool:
+        """Check the value against the filter type alone."""
+        if self.filter._type == "number":
+            return isinstance(val, (int, float))
+        if self.filter._type == "string" and isinstance(val, str):
+            if self.filter.fmt in DATE_FORMATS:
+                try:
+                    return isinstance(string_to_timezone_aware_datetime(val), datetime)
+                except (ParserError, TypeError):
+                    return False
+            return True
+        return False
+
+    def _range_check(
+        self, val: Any, bound: Any, compare: Callable[[Any, Any], bool]
+    ) -> bool:
+        try:
+            if self.filter.fmt:
+                if self.filter.fmt in DATE_FORMATS:
+                    bound = _bound_datetime(bound)
+                    return compare(string_to_timezone_aware_datetime(str(val)), bound)
+                return False
+            val = _to_numeric(val)
+            return val is not None and compare(val, bound)
+        except (TypeError, ValueError, ParserError):
+            return False
+
+    def exclusive_minimum_check(self, val: Any) -> bool:
+        """Check that the value is greater than the exclusive minimum."""
+        return self._range_check(val, self.filter.exclusive_min, lambda a, b: a > b)
+
+    def exclusive_maximum_check(self, val: Any) -> bool:
+        """Check that the value is less than the exclusive maximum."""
+        return self._range_check(val, self.filter.exclusive_max, lambda a, b: a < b)
+
+    def minimum_check(self, val: Any) -> bool:
+        """Check that the value is greater than or equal to the minimum."""
+        return self._range_check(val, self.filter.minimum, lambda a, b: a >= b)
+
+    def maximum_check(self, val: Any) -> bool:
+        """Check that the value is less than or equal to the maximum."""
+        return self._range_check(val, self.filter.maximum, lambda a, b: a <= b)
+
+    def length_check(self, val: Any) -> bool:
+        """Check the length of the value as a string against the length bounds."""
+        min_length, max_length = self.filter.min_length, self.filter.max_length
+        if not (min_length or max_length):
+            return False
+        given_len = len(str(val))
+        return (not max_length or given_len <= max_length) and (
+            not min_length or given_len >= min_length
+        )
+
+    def pattern_check(self, val: Any) -> bool:
+        """Check that the value as a string matches the pattern."""
+        if self.filter.pattern:
+            return bool(compile_pattern(self.filter.pattern).search(str(val)))
+        return False
+
+    def const_check(self, val: Any) -> bool:
+        """Check that the value is equal to the constant."""
+        return val == self.filter.const
+
+    def enum_check(self, val: Any) -> bool:
+        """Check that the value is one of the enumerated values."""
+        return val in self.filter.enums
+
+    @staticmethod
+    def _never(val: Any) -> bool:
+        return False
+
+    def tag_value(self) -> Optional[str]:
+        """Get the single string value the filter requires, if any."""
+        if self.filter._not:
+            return None
+        if self._check == self.const_check:
+            value = self.filter.const
+        elif self._check == self.enum_check and len(self.filter.enums) == 1:
+            value = self.filter.enums[0]
+        else:
+            return None
+        return value if isinstance(value, str) else None
+
+
+class CompiledField:
+    """A constraint field with its JSON paths and filter compiled."""
+
+    def __init__(self, field: DIFField):
+        """Initialize the compiled field.
+
+        Args:
+            field: the constraint field
+
+        """
+        self.field = field
+        self.id = field.id
+        self.paths = list(field.paths or ())
+        self.filter = CompiledFilter(field._filter) if field._filter else None
+
+    def matches(self, credential_dict: dict) -> bool:
+        """Check whether a credential satisfies the field.
+
+        Raises:
+            DIFPresExchError: If a path of the field refers to the proof
+
+        """
+        for path in self.paths:
+            if "$.proof." in path:
+                raise DIFPresExchError(
+                    "JSON Path expression matching on proof object "
+                    "is not currently supported"
+                )
+            try:
+                match = compile_path(path).find(credential_dict)
+            except KeyError:
+                continue
+            for match_item in match:
+                # No filter in constraint
+                if not self.filter:
+                    return True
+                if self.filter.check(typed_value(match_item.value)):
+                    return True
+        return False
+
+    def tag_search(self) -> Optional[Mapping[str, str]]:
+        """Get the record tag a credential must have to satisfy the field, if any.
+
+        Returns:
+            A mapping of the VCHolder.search_credentials argument to the value
+            required, if every path of the field refers to the same record tag
+            and the filter requires a single value
+
+        """
+        args = {TAG_SEARCH_PATHS.get(path) for path in self.paths}
+        if len(args) != 1 or None in args or not self.filter:
+            return None
+        value = self.filter.tag_value()
+        return {args.pop(): value} if value else None
+
+
+class CompiledConstraints:
+    """The constraints of an input descriptor, compiled for evaluation."""
+
+    def __init__(self, constraints: Constraints):
+        """Initialize the compiled constraints.
+
+        Args:
+            constraints: the input descriptor constraints
+
+        """
+        self.constraints = constraints
+        self.fields = [CompiledField(field) for field in constraints._fields or ()]
+        holder_field_ids = set()
+        for holder in constraints.holders or ():
+            if holder.directive in ("required", "preferred"):
+                holder_field_ids.update(holder.field_ids)
+        self.holder_field_ids = holder_field_ids
+
+    def search_args(self) -> dict:
+        """Get the VC record search arguments which the constraints imply.
+
+        Constraints on the issuer and subject identifiers are applied in the
+        record search, so that credentials which cannot satisfy them are not
+        loaded. The credentials found still need to be evaluated.
+        """
+        args = {}
+        for field in self.fields:
+            for arg, value in (field.tag_search() or {}).items():
+                if arg == "subject_ids":
+                    # one subject is enough to narrow the search
+                    value = [value]
+                args.setdefault(arg, value)
+        return args
+
+
+def typed_value(value: Any) -> Any:
+    """Convert a JSON-LD typed value for comparison, or return the value."""
+    if isinstance(value, dict) and "type" in value and "@value" in value:
+        to_filter_type = value.get("type")
+        to_filter_value = value.get("@value")
+        if "integer" in to_filter_type:
+            to_filter_value = int(to_filter_value)
+        elif "dateTime" in to_filter_type or "date" in to_filter_type:
+            to_filter_value = string_to_timezone_aware_datetime(to_filter_value)
+        elif "boolean" in to_filter_type:
+            to_filter_value = bool(to_filter_value)
+        elif "double" in to_filter_type or "decimal" in to_filter_type:
+            to_filter_value = float(to_filter_value)
+        return to_filter_value
+    return value
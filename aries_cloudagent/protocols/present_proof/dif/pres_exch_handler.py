@@ -8,14 +8,10 @@ merge [return applicable credential list and descriptor_map for presentation_sub
 returns VerifiablePresentation
 """
 
-import pytz
 import re
 import logging
 
 from datetime import datetime
-from dateutil.parser import parse as dateutil_parser
-from dateutil.parser import ParserError
-from jsonpath_ng import parse
 from pyld import jsonld
 from pyld.jsonld import JsonLdProcessor
 from typing import Sequence, Optional, Tuple, Union, Dict, List
@@ -58,20 +54,23 @@ from .pres_exch import (
     InputDescriptorMapping,
     PresentationSubmission,
 )
+from .pres_exch_evaluator import (
+    CompiledConstraints,
+    CompiledField,
+    CompiledFilter,
+    DIFPresExchError,
+    compile_path,
+    string_to_timezone_aware_datetime,
+)
 
 PRESENTATION_SUBMISSION_JSONLD_CONTEXT = (
     "https://identity.foundation/presentation-exchange/submission/v1"
 )
 PRESENTATION_SUBMISSION_JSONLD_TYPE = "PresentationSubmission"
-PYTZ_TIMEZONE_PATTERN = re.compile(r"(([a-zA-Z]+)(?:\/)([a-zA-Z]+))")
 LIST_INDEX_PATTERN = re.compile(r"\[(\W+)\]|\[(\d+)\]")
 LOGGER = logging.getLogger(__name__)
 
 
-class DIFPresExchError(BaseError):
-    """Base class for DIF Presentation Exchange related errors."""
-
-
 class DIFPresExchHandler:
     """Base Presentation Exchange Handler."""
 
@@ -112,6 +111,15 @@ class DIFPresExchHandler:
             self.proof_type = proof_type
         self.is_holder = False
         self.reveal_doc_frame = reveal_doc
+        self._compiled_constraints = {}
+
+    def compile_constraints(self, constraints: Constraints) -> CompiledConstraints:
+        """Compile the constraints of an input descriptor, once per handler."""
+        compiled = self._compiled_constraints.get(id(constraints))
+        if not compiled or compiled.constraints is not constraints:
+            compiled = CompiledConstraints(constraints)
+            self._compiled_constraints[id(constraints)] = compiled
+        return compiled
 
     async def _get_issue_suite(
         self,
@@ -365,6 +373,8 @@ class DIFPresExchHandler:
 
         """
         document_loader = self.profile.inject(DocumentLoader)
+        compiled = self.compile_constraints(constraints)
+        is_holder_field_ids = compiled.holder_field_ids
 
         result = []
         for credential in credentials:
@@ -374,9 +384,8 @@ class DIFPresExchHandler:
                 continue
 
             applicable = False
-            is_holder_field_ids = self.field_ids_for_is_holder(constraints)
-            for field in constraints._fields:
-                applicable = await self.filter_by_field(field, credential)
+            for field in compiled.fields:
+                applicable = field.matches(credential.cred_value)
                 # all fields in the constraint should be satisfied
                 if not applicable:
                     break
@@ -513,14 +522,13 @@ class DIFPresExchHandler:
             unflatten_dict = {}
             for field in constraints._fields:
                 for path in field.paths:
-                    jsonpath = parse(path)
-                    match = jsonpath.find(credential_dict)
+                    match = compile_path(path).find(credential_dict)
                     if len(match) == 0:
                         continue
                     for match_item in match:
                         full_path = str(match_item.full_path)
                         if bool(LIST_INDEX_PATTERN.search(full_path)):
-                            full_path = re.sub(r"\[(\W+)\]|\[(\d+)\]", "[0]", full_path)
+                            full_path = LIST_INDEX_PATTERN.sub("[0]", full_path)
                             full_path = full_path.replace(".[", "[")
                         unflatten_dict[full_path] = {}
                         explicit_key_path = None
@@ -570,56 +578,11 @@ class DIFPresExchHandler:
             bool
 
         """
-        credential_dict = credential.cred_value
-        for path in field.paths:
-            if "$.proof." in path:
-                raise DIFPresExchError(
-                    "JSON Path expression matching on proof object "
-                    "is not currently supported"
-                )
-            try:
-                jsonpath = parse(path)
-                match = jsonpath.find(credential_dict)
-            except KeyError:
-                continue
-            if len(match) == 0:
-                continue
-            for match_item in match:
-                # No filter in constraint
-                if not field._filter:
-                    return True
-                if (
-                    isinstance(match_item.value, dict)
-                    and "type" in match_item.value
-                    and "@value" in match_item.value
-                ):
-                    to_filter_type = match_item.value.get("type")
-                    to_filter_value = match_item.value.get("@value")
-                    if "integer" in to_filter_type:
-                        to_filter_value = int(to_filter_value)
-                    elif "dateTime" in to_filter_type or "date" in to_filter_type:
-                        to_filter_value = self.string_to_timezone_aware_datetime(
-                            to_filter_value
-                        )
-                    elif "boolean" in to_filter_type:
-                        to_filter_value = bool(to_filter_value)
-                    elif "double" in to_filter_type or "decimal" in to_filter_type:
-                        to_filter_value = float(to_filter_value)
-                else:
-                    to_filter_value = match_item.value
-                if self.validate_patch(to_filter_value, field._filter):
-                    return True
-        return False
+        return CompiledField(field).matches(credential.cred_value)
 
     def string_to_timezone_aware_datetime(self, datetime_str: str) -> datetime:
         """Convert string with PYTZ timezone to datetime for comparison."""
-        if PYTZ_TIMEZONE_PATTERN.search(datetime_str):
-            result = PYTZ_TIMEZONE_PATTERN.search(datetime_str).group(1)
-            datetime_str = datetime_str.replace(result, "")
-            return dateutil_parser(datetime_str).replace(tzinfo=pytz.timezone(result))
-        else:
-            utc = pytz.UTC
-            return dateutil_parser(datetime_str).replace(tzinfo=utc)
+        return string_to_timezone_aware_datetime(datetime_str)
 
     def validate_patch(self, to_check: any, _filter: Filter) -> bool:
         """Apply filter on match_value.
@@ -634,39 +597,7 @@ class DIFPresExchHandler:
             bool
 
         """
-        return_val = False
-        if _filter._type:
-            if self.check_filter_only_type_enforced(_filter):
-                if _filter._type == "number":
-                    if isinstance(to_check, (int, float)):
-                        return True
-                elif _filter._type == "string":
-                    if isinstance(to_check, str):
-                        if _filter.fmt == "date" or _filter.fmt == "date-time":
-                            try:
-                                to_compare_date = (
-                                    self.string_to_timezone_aware_datetime(to_check)
-                                )
-                                if isinstance(to_compare_date, datetime):
-                                    return True
-                            except (ParserError, TypeError):
-                                return False
-                        else:
-                            return True
-            else:
-                if _filter._type == "number":
-                    return_val = self.process_numeric_val(to_check, _filter)
-                elif _filter._type == "string":
-                    return_val = self.process_string_val(to_check, _filter)
-        else:
-            if _filter.enums:
-                return_val = self.enum_check(val=to_check, _filter=_filter)
-            if _filter.const:
-                return_val = self.const_check(val=to_check, _filter=_filter)
-
-        if _filter._not:
-            return not return_val
-        return return_val
+        return CompiledFilter(_filter).check(to_check)
 
     def check_filter_only_type_enforced(self, _filter: Filter) -> bool:
         """Check if only type is specified in filter.
@@ -705,20 +636,7 @@ class DIFPresExchHandler:
             bool
 
         """
-        if _filter.exclusive_max:
-            return self.exclusive_maximum_check(val, _filter)
-        elif _filter.exclusive_min:
-            return self.exclusive_minimum_check(val, _filter)
-        elif _filter.minimum:
-            return self.minimum_check(val, _filter)
-        elif _filter.maximum:
-            return self.maximum_check(val, _filter)
-        elif _filter.const:
-            return self.const_check(val, _filter)
-        elif _filter.enums:
-            return self.enum_check(val, _filter)
-        else:
-            return False
+        return CompiledFilter(_filter).numeric_check()(val)
 
     def process_string_val(self, val: any, _filter: Filter) -> bool:
         """Trigger Filter checks.
@@ -733,24 +651,7 @@ class DIFPresExchHandler:
             bool
 
         """
-        if _filter.min_length or _filter.max_length:
-            return self.length_check(val, _filter)
-        elif _filter.pattern:
-            return self.pattern_check(val, _filter)
-        elif _filter.enums:
-            return self.enum_check(val, _filter)
-        elif _filter.exclusive_max and _filter.fmt:
-            return self.exclusive_maximum_check(val, _filter)
-        elif _filter.exclusive_min and _filter.fmt:
-            return self.exclusive_minimum_check(val, _filter)
-        elif _filter.minimum and _filter.fmt:
-            return self.minimum_check(val, _filter)
-        elif _filter.maximum and _filter.fmt:
-            return self.maximum_check(val, _filter)
-        elif _filter.const:
-            return self.const_check(val, _filter)
-        else:
-            return False
+        return CompiledFilter(_filter).string_check()(val)
 
     def exclusive_minimum_check(self, val: any, _filter: Filter) -> bool:
         """Exclusiveminimum check.
@@ -764,23 +665,7 @@ class DIFPresExchHandler:
             bool
 
         """
-        try:
-            if _filter.fmt:
-                if _filter.fmt == "date" or _filter.fmt == "date-time":
-                    to_compare_date = self.string_to_timezone_aware_datetime(
-                        _filter.exclusive_min
-                    )
-                    given_date = self.string_to_timezone_aware_datetime(str(val))
-                    return given_date > to_compare_date
-            else:
-                try:
-                    val = self.is_numeric(val)
-                    return val > _filter.exclusive_min
-                except DIFPresExchError as err:
-                    LOGGER.error(err)
-            return False
-        except (TypeError, ValueError, ParserError):
-            return False
+        return CompiledFilter(_filter).exclusive_minimum_check(val)
 
     def exclusive_maximum_check(self, val: any, _filter: Filter) -> bool:
         """Exclusivemaximum check.
@@ -794,23 +679,7 @@ class DIFPresExchHandler:
             bool
 
         """
-        try:
-            if _filter.fmt:
-                if _filter.fmt == "date" or _filter.fmt == "date-time":
-                    to_compare_date = self.string_to_timezone_aware_datetime(
-                        _filter.exclusive_max
-                    )
-                    given_date = self.string_to_timezone_aware_datetime(str(val))
-                    return given_date < to_compare_date
-            else:
-                try:
-                    val = self.is_numeric(val)
-                    return val < _filter.exclusive_max
-                except DIFPresExchError as err:
-                    LOGGER.error(err)
-            return False
-        except (TypeError, ValueError, ParserError):
-            return False
+        return CompiledFilter(_filter).exclusive_maximum_check(val)
 
     def maximum_check(self, val: any, _filter: Filter) -> bool:
         """Maximum check.
@@ -824,23 +693,7 @@ class DIFPresExchHandler:
             bool
 
         """
-        try:
-            if _filter.fmt:
-                if _filter.fmt == "date" or _filter.fmt == "date-time":
-                    to_compare_date = self.string_to_timezone_aware_datetime(
-                        _filter.maximum
-                    )
-                    given_date = self.string_to_timezone_aware_datetime(str(val))
-                    return given_date <= to_compare_date
-            else:
-                try:
-                    val = self.is_numeric(val)
-                    return val <= _filter.maximum
-                except DIFPresExchError as err:
-                    LOGGER.error(err)
-            return False
-        except (TypeError, ValueError, ParserError):
-            return False
+        return CompiledFilter(_filter).maximum_check(val)
 
     def minimum_check(self, val: any, _filter: Filter) -> bool:
         """Minimum check.
@@ -854,23 +707,7 @@ class DIFPresExchHandler:
             bool
 
         """
-        try:
-            if _filter.fmt:
-                if _filter.fmt == "date" or _filter.fmt == "date-time":
-                    to_compare_date = self.string_to_timezone_aware_datetime(
-                        _filter.minimum
-                    )
-                    given_date = self.string_to_timezone_aware_datetime(str(val))
-                    return given_date >= to_compare_date
-            else:
-                try:
-                    val = self.is_numeric(val)
-                    return val >= _filter.minimum
-                except DIFPresExchError as err:
-                    LOGGER.error(err)
-            return False
-        except (TypeError, ValueError, ParserError):
-            return False
+        return CompiledFilter(_filter).minimum_check(val)
 
     def length_check(self, val: any, _filter: Filter) -> bool:
         """Length check.
@@ -884,17 +721,7 @@ class DIFPresExchHandler:
             bool
 
         """
-        given_len = len(str(val))
-        if _filter.max_length and _filter.min_length:
-            if given_len <= _filter.max_length and given_len >= _filter.min_length:
-                return True
-        elif _filter.max_length and not _filter.min_length:
-            if given_len <= _filter.max_length:
-                return True
-        elif not _filter.max_length and _filter.min_length:
-            if given_len >= _filter.min_length:
-                return True
-        return False
+        return CompiledFilter(_filter).length_check(val)
 
     def pattern_check(self, val: any, _filter: Filter) -> bool:
         """Pattern check.
@@ -908,9 +735,7 @@ class DIFPresExchHandler:
             bool
 
         """
-        if _filter.pattern:
-            return bool(re.search(pattern=_filter.pattern, string=str(val)))
-        return False
+        return CompiledFilter(_filter).pattern_check(val)
 
     def const_check(self, val: any, _filter: Filter) -> bool:
         """Const check.
@@ -924,9 +749,7 @@ class DIFPresExchHandler:
             bool
 
         """
-        if val == _filter.const:
-            return True
-        return False
+        return CompiledFilter(_filter).const_check(val)
 
     def enum_check(self, val: any, _filter: Filter) -> bool:
         """Enum check.
@@ -940,9 +763,7 @@ class DIFPresExchHandler:
             bool
 
         """
-        if val in _filter.enums:
-            return True
-        return False
+        return CompiledFilter(_filter).enum_check(val)
 
     def subject_is_issuer(self, credential: VCRecord) -> bool:
         """subject_is_issuer check.
@@ -1394,7 +1215,7 @@ class DIFPresExchHandler:
             constraint = inp_desc_id_contraint_map.get(desc_map_item_id)
             schema_filter = inp_desc_id_schemas_map.get(desc_map_item_id)
             desc_map_item_path = desc_map_item.get("path")
-            jsonpath = parse(desc_map_item_path)
+            jsonpath = compile_path(desc_map_item_path)
             match = jsonpath.find(pres)
             if len(match) == 0:
                 raise DIFPresExchError(
@@ -1433,7 +1254,7 @@ class DIFPresExchHandler:
         """Return field_paths that are applicable to oneof_filter."""
         applied_field_paths = []
         for path in field_paths:
-            jsonpath = parse(path)
+            jsonpath = compile_path(path)
             match = jsonpath.find(cred_dict)
             if len(match) > 0:
                 applied_field_paths.append(path)
@@ -1558,7 +1379,7 @@ class DIFPresExchHandler:
                 return path
             split_by_index = re.split(r"\[(\d+)\]", to_check, 1)
             if len(split_by_index) > 1:
-                jsonpath = parse(split_by_index[0])
+                jsonpath = compile_path(split_by_index[0])
                 match = jsonpath.find(cred_dict)
                 if len(match) > 0:
                     if isinstance(match[0].value, dict):
@@ -1570,7 +1391,7 @@ class DIFPresExchHandler:
 
     def nested_get(self, input_dict: dict, path: str) -> Union[Dict, List]:
         """Return dict or list from nested dict given list of nested_key."""
-        jsonpath = parse(path)
+        jsonpath = compile_path(path)
         match = jsonpath.find(input_dict)
         if len(match) > 1:
             return_list = []
@@ -0,0 +1,173 @@
+"""Test for the compiled DIF constraint evaluation."""
+
+from unittest import TestCase, mock
+
+from .. import pres_exch_evaluator as test_module
+from ..pres_exch import Constraints, DIFField, Filter
+from ..pres_exch_evaluator import (
+    CompiledConstraints,
+    CompiledField,
+    CompiledFilter,
+    DIFPresExchError,
+    compile_path,
+)
+
+CREDENTIAL = {
+    "issuer": "did:example:issuer",
+    "issuanceDate": "2020-01-01T00:00:00Z",
+    "credentialSubject": {
+        "id": "did:example:subject",
+        "degree": {"type": "BachelorDegree", "name": "Bachelor of Arts"},
+        "age": {"type": "xsd:integer", "@value": "21"},
+    },
+}
+
+
+def field(paths, **filter_args) -> DIFField:
+    return DIFField(paths=paths, _filter=Filter(**filter_args) if filter_args else None)
+
+
+class TestCompiledFilter(TestCase):
+    def test_type_only(self):
+        assert CompiledFilter(Filter(_type="number")).check(1)
+        assert not CompiledFilter(Filter(_type="number")).check("1")
+        assert CompiledFilter(Filter(_type="string")).check("1")
+        date_filter = CompiledFilter(Filter(_type="string", fmt="date"))
+        assert date_filter.check("2020-01-01")
+        assert not date_filter.check("not a date")
+        assert not CompiledFilter(Filter(_type="boolean")).check(True)
+        # a matching type check is not inverted
+        assert CompiledFilter(Filter(_type="number", _not=True)).check(1)
+        assert CompiledFilter(Filter(_type="number", _not=True)).check("1")
+
+    def test_numeric(self):
+        assert CompiledFilter(Filter(_type="number", minimum=2)).check("3")
+        assert not CompiledFilter(Filter(_type="number", minimum=2)).check(1.5)
+        assert CompiledFilter(Filter(_type="number", maximum=2)).check(2)
+        assert CompiledFilter(Filter(_type="number", exclusive_min=2)).check(3)
+        assert not CompiledFilter(Filter(_type="number", exclusive_max=2)).check(2)
+        assert not CompiledFilter(Filter(_type="number", minimum=2)).check("two")
+        assert CompiledFilter(Filter(_type="number", enums=[1, 2])).check(2)
+        assert CompiledFilter(Filter(_type="number", const=2, _not=True)).check(1)
+
+    def test_string(self):
+        assert CompiledFilter(Filter(_type="string", pattern="^ab")).check("abc")
+        assert not CompiledFilter(Filter(_type="string", pattern="^ab")).check("cab")
+        assert CompiledFilter(Filter(_type="string", min_length=2)).check("ab")
+        assert not CompiledFilter(
+            Filter(_type="string", min_length=2, max_length=3)
+        ).check("abcd")
+        assert CompiledFilter(Filter(_type="string", enums=["a", "b"])).check("a")
+        assert CompiledFilter(Filter(_type="string", const="a")).check("a")
+        # a range only applies to formatted strings
+        assert not CompiledFilter(Filter(_type="string", minimum="a")).check("b")
+
+    def test_date_range(self):
+        date_filter = CompiledFilter(
+            Filter(_type="string", fmt="date", minimum="2019-01-01")
+        )
+        with mock.patch.object(
+            test_module,
+            "string_to_timezone_aware_datetime",
+            wraps=test_module.string_to_timezone_aware_datetime,
+        ) as mock_parse:
+            assert date_filter.check("2020-01-01")
+            assert not date_filter.check("2018-01-01")
+            assert not date_filter.check("not a date")
+        # the bound is parsed once, not for every value
+        assert [call[0][0] for call in mock_parse.call_args_list].count(
+            "2019-01-01"
+        ) <= 1
+        assert CompiledFilter(
+            Filter(_type="string", fmt="date-time", exclusive_max="2021-01-01")
+        ).check("2020-12-31T23:59:59Z")
+
+    def test_untyped(self):
+        assert CompiledFilter(Filter(const="a")).check("a")
+        assert CompiledFilter(Filter(enums=["a", "b"])).check("b")
+        assert not CompiledFilter(Filter(enums=["a", "b"])).check("c")
+        assert CompiledFilter(Filter(enums=["a"], _not=True)).check("c")
+        assert not CompiledFilter(Filter()).check("a")
+
+    def test_tag_value(self):
+        assert CompiledFilter(Filter(const="a")).tag_value() == "a"
+        assert CompiledFilter(Filter(enums=["a"])).tag_value() == "a"
+        assert CompiledFilter(Filter(_type="string", const="a")).tag_value() == "a"
+        assert CompiledFilter(Filter(enums=["a", "b"])).tag_value() is None
+        assert CompiledFilter(Filter(const="a", _not=True)).tag_value() is None
+        assert CompiledFilter(Filter(const=1)).tag_value() is None
+        # the pattern is checked in place of the constant
+        assert (
+            CompiledFilter(Filter(_type="string", pattern="a", const="a")).tag_value()
+            is None
+        )
+
+
+class TestCompiledField(TestCase):
+    def test_compile_path_memoized(self):
+        assert compile_path("$.issuer") is compile_path("$.issuer")
+
+    def test_matches(self):
+        assert CompiledField(field(["$.missing", "$.issuer"])).matches(CREDENTIAL)
+        assert not CompiledField(field(["$.missing"])).matches(CREDENTIAL)
+        assert CompiledField(
+            field(["$.credentialSubject.degree.type"], const="BachelorDegree")
+        ).matches(CREDENTIAL)
+        assert CompiledField(
+            field(["$.credentialSubject.age"], _type="number", minimum=18)
+        ).matches(CREDENTIAL)
+        assert not CompiledField(
+            field(["$.credentialSubject.age"], _type="number", minimum=22)
+        ).matches(CREDENTIAL)
+
+    def test_matches_proof_x(self):
+        with self.assertRaises(DIFPresExchError):
+            CompiledField(field(["$.proof.type"])).matches(CREDENTIAL)
+
+    def test_tag_search(self):
+        assert CompiledField(
+            field(["$.issuer", "$.issuer.id"], const="did:example:issuer")
+        ).tag_search() == {"issuer_id": "did:example:issuer"}
+        assert CompiledField(
+            field(["$.credentialSubject.id"], enums=["did:example:subject"])
+        ).tag_search() == {"subject_ids": "did:example:subject"}
+        assert (
+            CompiledField(
+                field(["$.issuer", "$.vc.issuer"], const="did:example:issuer")
+            ).tag_search()
+            is None
+        )
+        assert CompiledField(field(["$.issuer"])).tag_search() is None
+        assert CompiledField(field(["$.issuer"], _type="string")).tag_search() is None
+
+
+class TestCompiledConstraints(TestCase):
+    def test_search_args(self):
+        constraints = Constraints(
+            _fields=[
+                field(["$.issuer", "$.issuer.id"], const="did:example:issuer"),
+                field(["$.credentialSubject.id"], const="did:example:subject"),
+                field(["$.credentialSubject.id"], const="did:example:other"),
+                field(["$.credentialSubject.name"], const="Alice"),
+            ]
+        )
+        assert CompiledConstraints(constraints).search_args() == {
+            "issuer_id": "did:example:issuer",
+            "subject_ids": ["did:example:subject"],
+        }
+        assert CompiledConstraints(Constraints()).search_args() == {}
+
+    def test_holder_field_ids(self):
+        subject_id = "3fa85f64-5717-4562-b3fc-2c963f66afa6"
+        other_id = "4fa85f64-5717-4562-b3fc-2c963f66afa7"
+        constraints = Constraints.deserialize(
+            {
+                "fields": [{"id": subject_id, "path": ["$.credentialSubject.id"]}],
+                "is_holder": [
+                    {"directive": "required", "field_id": [subject_id]},
+                    {"directive": "preferred", "field_id": [other_id]},
+                ],
+            }
+        )
+        compiled = CompiledConstraints(constraints)
+        assert compiled.holder_field_ids == {subject_id, other_id}
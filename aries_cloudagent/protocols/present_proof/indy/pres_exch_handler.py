@@ -1,21 +1,29 @@
 """Utilities for dif presentation exchange attachment."""
 
+import asyncio
 import json
 import logging
 import time
-from typing import Optional, Tuple, Union
+from typing import Mapping, Optional, Tuple, Union
 
 from ....core.error import BaseError
 from ....core.profile import Profile
 from ....indy.holder import IndyHolder, IndyHolderError
+from ....ledger.base import BaseLedger
+from ....ledger.error import LedgerError
 from ....indy.models.xform import indy_proof_req2non_revoc_intervals
 from ....ledger.multiple_ledger.ledger_requests_executor import (
+    GET_CRED_DEF,
+    GET_REVOC_REG_DEF,
     GET_REVOC_REG_DELTA,
+    GET_REVOC_REG_ENTRY,
     GET_SCHEMA,
     IndyLedgerRequestsExecutor,
 )
 from ....multitenant.base import BaseMultitenantManager
 from ....revocation.models.revocation_registry import RevocationRegistry
+from ....revocation.state_cache import RevocationStateCache
+from ....utils.concurrency import DEFAULT_CONCURRENCY, gather_keyed
 from ..v1_0.models.presentation_exchange import V10PresentationExchange
 from ..v2_0.messages.pres_format import V20PresFormat
 from ..v2_0.models.pres_exchange import V20PresExRecord
@@ -87,114 +95,78 @@ class IndyPresExchHandler:
                         f"Removed superfluous timestamp from requested_credentials {r} "
                         f"{reft} for non-revocable credential {req_item['cred_id']}"
                     )
-        # Get all schemas, credential definitions, and revocation registries in use
-        schemas = {}
-        cred_defs = {}
-        revocation_registries = {}
-
-        for credential in credentials.values():
-            schema_id = credential["schema_id"]
-            multitenant_mgr = self._profile.inject_or(BaseMultitenantManager)
-            if multitenant_mgr:
-                ledger_exec_inst = IndyLedgerRequestsExecutor(self._profile)
-            else:
-                ledger_exec_inst = self._profile.inject(IndyLedgerRequestsExecutor)
-            ledger = (
-                await ledger_exec_inst.get_ledger_for_identifier(
-                    schema_id,
-                    txn_record_type=GET_SCHEMA,
-                )
-            )[1]
-            async with ledger:
-                if schema_id not in schemas:
-                    schemas[schema_id] = await ledger.get_schema(schema_id)
-                cred_def_id = credential["cred_def_id"]
-                if cred_def_id not in cred_defs:
-                    cred_defs[cred_def_id] = await ledger.get_credential_definition(
-                        cred_def_id
-                    )
-                if credential.get("rev_reg_id"):
-                    revocation_registry_id = credential["rev_reg_id"]
-                    if revocation_registry_id not in revocation_registries:
-                        revocation_registries[revocation_registry_id] = (
-                            RevocationRegistry.from_definition(
-                                await ledger.get_revoc_reg_def(revocation_registry_id),
-                                True,
-                            )
-                        )
-        # Get delta with non-revocation interval defined in "non_revoked"
-        # of the presentation request or attributes
+        # Collect the ledger artifacts and revocation deltas in use, fetching the
+        # distinct ones concurrently
         epoch_now = int(time.time())
-        revoc_reg_deltas = {}
+        delta_keys = {}  # credential id to (rev reg id, from, to)
+        delta_creds = {}  # (rev reg id, from, to) to first credential id
         for precis in requested_referents.values():  # cred_id, non-revoc interval
             credential_id = precis["cred_id"]
-            if not credentials[credential_id].get("rev_reg_id"):
-                continue
-            if "timestamp" in precis:
-                continue
-            rev_reg_id = credentials[credential_id]["rev_reg_id"]
-            multitenant_mgr = self._profile.inject_or(BaseMultitenantManager)
-            if multitenant_mgr:
-                ledger_exec_inst = IndyLedgerRequestsExecutor(self._profile)
-            else:
-                ledger_exec_inst = self._profile.inject(IndyLedgerRequestsExecutor)
-            ledger = (
-                await ledger_exec_inst.get_ledger_for_identifier(
+            rev_reg_id = credentials[credential_id].get("rev_reg_id")
+            reft_non_revoc_interval = precis.get("non_revoked")
+            # often one cred satisfies many requested attrs/preds
+            if (
+                rev_reg_id
+                and reft_non_revoc_interval
+                and credential_id not in delta_keys
+            ):
+                delta_key = (
                     rev_reg_id,
-                    txn_record_type=GET_REVOC_REG_DELTA,
+                    reft_non_revoc_interval.get("from", 0),
+                    reft_non_revoc_interval.get("to", epoch_now),
                 )
-            )[1]
-            async with ledger:
-                reft_non_revoc_interval = precis.get("non_revoked")
-                if reft_non_revoc_interval:
-                    key = (
-                        f"{rev_reg_id}_"
-                        f"{reft_non_revoc_interval.get('from', 0)}_"
-                        f"{reft_non_revoc_interval.get('to', epoch_now)}"
-                    )
-                    if key not in revoc_reg_deltas:
-                        (delta, delta_timestamp) = await ledger.get_revoc_reg_delta(
-                            rev_reg_id,
-                            reft_non_revoc_interval.get("from", 0),
-                            reft_non_revoc_interval.get("to", epoch_now),
-                        )
-                        revoc_reg_deltas[key] = (
-                            rev_reg_id,
-                            credential_id,
-                            delta,
-                            delta_timestamp,
-                        )
-                    for stamp_me in requested_referents.values():
-                        # often one cred satisfies many requested attrs/preds
-                        if stamp_me["cred_id"] == credential_id:
-                            stamp_me["timestamp"] = revoc_reg_deltas[key][3]
+                delta_keys[credential_id] = delta_key
+                delta_creds.setdefault(delta_key, credential_id)
+        semaphore = asyncio.Semaphore(DEFAULT_CONCURRENCY)
+        schemas, cred_defs, revocation_registries, revoc_reg_deltas = (
+            await asyncio.gather(
+                gather_keyed(
+                    self._get_schema,
+                    (cred["schema_id"] for cred in credentials.values()),
+                    semaphore=semaphore,
+                ),
+                gather_keyed(
+                    self._get_cred_def,
+                    (cred["cred_def_id"] for cred in credentials.values()),
+                    semaphore=semaphore,
+                ),
+                gather_keyed(
+                    self._get_revocation_registry,
+                    (
+                        cred["rev_reg_id"]
+                        for cred in credentials.values()
+                        if cred.get("rev_reg_id")
+                    ),
+                    semaphore=semaphore,
+                ),
+                gather_keyed(
+                    self._get_revoc_reg_delta,
+                    delta_creds,
+                    semaphore=semaphore,
+                ),
+            )
+        )
+        for precis in requested_referents.values():
+            delta_key = delta_keys.get(precis["cred_id"])
+            if delta_key:
+                precis["timestamp"] = revoc_reg_deltas[delta_key][1]
+
         # Get revocation states to prove non-revoked
         revocation_states = {}
-        for (
-            rev_reg_id,
-            credential_id,
-            delta,
-            delta_timestamp,
-        ) in revoc_reg_deltas.values():
-            if rev_reg_id not in revocation_states:
-                revocation_states[rev_reg_id] = {}
-            rev_reg = revocation_registries[rev_reg_id]
-            tails_local_path = await rev_reg.get_or_fetch_local_tails_path()
-            try:
-                revocation_states[rev_reg_id][delta_timestamp] = json.loads(
-                    await holder.create_revocation_state(
-                        credentials[credential_id]["cred_rev_id"],
-                        rev_reg.reg_def,
-                        delta,
-                        delta_timestamp,
-                        tails_local_path,
-                    )
-                )
-            except IndyHolderError as e:
-                LOGGER.error(
-                    f"Failed to create revocation state: {e.error_code}, {e.message}"
-                )
-                raise e
+        for delta_key, revocation_state in (
+            await self._get_revocation_states(
+                holder,
+                revocation_registries,
+                revoc_reg_deltas,
+                {
+                    delta_key: credentials[credential_id]["cred_rev_id"]
+                    for delta_key, credential_id in delta_creds.items()
+                },
+            )
+        ).items():
+            revocation_states.setdefault(delta_key[0], {})[
+                revoc_reg_deltas[delta_key][1]
+            ] = revocation_state
         for referent, precis in requested_referents.items():
             if "timestamp" not in precis:
                 continue
@@ -216,69 +188,187 @@ class IndyPresExchHandler:
         indy_proof = json.loads(indy_proof_json)
         return indy_proof
 
-    async def process_pres_identifiers(
+    async def _get_revocation_states(
         self,
-        identifiers: list,
-    ) -> Tuple[dict, dict, dict, dict]:
-        """Return schemas, cred_defs, rev_reg_defs, rev_reg_entries."""
-        schema_ids = []
-        cred_def_ids = []
+        holder: IndyHolder,
+        revocation_registries: Mapping[str, RevocationRegistry],
+        revoc_reg_deltas: Mapping[tuple, tuple],
+        cred_rev_ids: Mapping[tuple, str],
+    ) -> dict:
+        """Get the revocation states for a set of revocation registry deltas.
 
-        schemas = {}
-        cred_defs = {}
-        rev_reg_defs = {}
-        rev_reg_entries = {}
+        Revocation states are served from the revocation state cache where
+        possible, then updated from an earlier cached state of the credential,
+        and only otherwise created over the full tails file.
 
-        for identifier in identifiers:
-            schema_ids.append(identifier["schema_id"])
-            cred_def_ids.append(identifier["cred_def_id"])
-            multitenant_mgr = self._profile.inject_or(BaseMultitenantManager)
-            if multitenant_mgr:
-                ledger_exec_inst = IndyLedgerRequestsExecutor(self._profile)
-            else:
-                ledger_exec_inst = self._profile.inject(IndyLedgerRequestsExecutor)
-            ledger = (
-                await ledger_exec_inst.get_ledger_for_identifier(
-                    identifier["schema_id"],
-                    txn_record_type=GET_SCHEMA,
-                )
-            )[1]
-            async with ledger:
-                # Build schemas for anoncreds
-                if identifier["schema_id"] not in schemas:
-                    schemas[identifier["schema_id"]] = await ledger.get_schema(
-                        identifier["schema_id"]
-                    )
+        Args:
+            holder: The holder to create the revocation states
+            revocation_registries: The revocation registries by id
+            revoc_reg_deltas: The (delta, timestamp) by (rev reg id, from, to)
+            cred_rev_ids: The credential revocation id by (rev reg id, from, to)
+
+        Returns:
+            The revocation states by (rev reg id, from, to)
+
+        """
+        state_cache = RevocationStateCache(self._profile)
+
+        async def get_cached_state(delta_key: tuple) -> Optional[dict]:
+            return await state_cache.get(
+                delta_key[0], cred_rev_ids[delta_key], revoc_reg_deltas[delta_key][1]
+            )
 
-                if identifier["cred_def_id"] not in cred_defs:
-                    cred_defs[identifier["cred_def_id"]] = (
-                        await ledger.get_credential_definition(
-                            identifier["cred_def_id"]
+        cached_states = await gather_keyed(get_cached_state, cred_rev_ids)
+        misses = [key for key, cached in cached_states.items() if not cached]
+
+        # fetch each tails file once
+        async def get_tails_path(rev_reg_id: str) -> str:
+            return await revocation_registries[
+                rev_reg_id
+            ].get_or_fetch_local_tails_path()
+
+        tails_paths = await gather_keyed(
+            get_tails_path, (delta_key[0] for delta_key in misses)
+        )
+
+        async def build_revocation_state(delta_key: tuple) -> dict:
+            rev_reg_id = delta_key[0]
+            cred_rev_id = cred_rev_ids[delta_key]
+            rev_reg_def = revocation_registries[rev_reg_id].reg_def
+            delta, delta_timestamp = revoc_reg_deltas[delta_key]
+            rev_state = None
+            previous = await state_cache.get_latest(
+                rev_reg_id, cred_rev_id, delta_timestamp
+            )
+            if previous:
+                try:
+                    update_delta, _ = await self._get_revoc_reg_delta(
+                        (rev_reg_id, previous.timestamp, delta_timestamp)
+                    )
+                    rev_state = json.loads(
+                        await holder.update_revocation_state(
+                            cred_rev_id,
+                            rev_reg_def,
+                            previous.rev_state,
+                            update_delta,
+                            delta_timestamp,
+                            tails_paths[rev_reg_id],
                         )
                     )
-
-                if identifier.get("rev_reg_id"):
-                    if identifier["rev_reg_id"] not in rev_reg_defs:
-                        rev_reg_defs[identifier["rev_reg_id"]] = (
-                            await ledger.get_revoc_reg_def(identifier["rev_reg_id"])
+                except (IndyHolderError, LedgerError) as err:
+                    LOGGER.warning(
+                        "Failed to update cached revocation state for %s, "
+                        "creating it instead: %s",
+                        rev_reg_id,
+                        err,
+                    )
+            if not rev_state:
+                try:
+                    rev_state = json.loads(
+                        await holder.create_revocation_state(
+                            cred_rev_id,
+                            rev_reg_def,
+                            delta,
+                            delta_timestamp,
+                            tails_paths[rev_reg_id],
                         )
+                    )
+                except IndyHolderError as e:
+                    LOGGER.error(
+                        f"Failed to create revocation state: {e.error_code}, {e.message}"
+                    )
+                    raise e
+            await state_cache.store(rev_reg_id, cred_rev_id, delta_timestamp, rev_state)
+            return rev_state
+
+        built_states = await gather_keyed(build_revocation_state, misses)
+        return {
+            delta_key: cached.rev_state if cached else built_states[delta_key]
+            for delta_key, cached in cached_states.items()
+        }
+
+    async def _get_ledger(self, identifier: str, txn_record_type: int) -> BaseLedger:
+        """Get the ledger to use for an identifier."""
+        multitenant_mgr = self._profile.inject_or(BaseMultitenantManager)
+        if multitenant_mgr:
+            ledger_exec_inst = IndyLedgerRequestsExecutor(self._profile)
+        else:
+            ledger_exec_inst = self._profile.inject(IndyLedgerRequestsExecutor)
+        return (
+            await ledger_exec_inst.get_ledger_for_identifier(
+                identifier,
+                txn_record_type=txn_record_type,
+            )
+        )[1]
+
+    async def _get_schema(self, schema_id: str) -> dict:
+        ledger = await self._get_ledger(schema_id, GET_SCHEMA)
+        async with ledger:
+            return await ledger.get_schema(schema_id)
+
+    async def _get_cred_def(self, cred_def_id: str) -> dict:
+        ledger = await self._get_ledger(cred_def_id, GET_CRED_DEF)
+        async with ledger:
+            return await ledger.get_credential_definition(cred_def_id)
+
+    async def _get_rev_reg_def(self, rev_reg_id: str) -> dict:
+        ledger = await self._get_ledger(rev_reg_id, GET_REVOC_REG_DEF)
+        async with ledger:
+            return await ledger.get_revoc_reg_def(rev_reg_id)
+
+    async def _get_revocation_registry(self, rev_reg_id: str) -> RevocationRegistry:
+        return RevocationRegistry.from_definition(
+            await self._get_rev_reg_def(rev_reg_id), True
+        )
+
+    async def _get_revoc_reg_delta(self, delta_key: Tuple[str, int, int]) -> tuple:
+        rev_reg_id, fro, to = delta_key
+        ledger = await self._get_ledger(rev_reg_id, GET_REVOC_REG_DELTA)
+        async with ledger:
+            return await ledger.get_revoc_reg_delta(rev_reg_id, fro, to)
 
-                    if identifier.get("timestamp"):
-                        rev_reg_entries.setdefault(identifier["rev_reg_id"], {})
+    async def _get_revoc_reg_entry(self, entry_key: Tuple[str, int]) -> dict:
+        rev_reg_id, timestamp = entry_key
+        ledger = await self._get_ledger(rev_reg_id, GET_REVOC_REG_ENTRY)
+        async with ledger:
+            return (await ledger.get_revoc_reg_entry(rev_reg_id, timestamp))[0]
 
-                        if (
-                            identifier["timestamp"]
-                            not in rev_reg_entries[identifier["rev_reg_id"]]
-                        ):
-                            (
-                                found_rev_reg_entry,
-                                _found_timestamp,
-                            ) = await ledger.get_revoc_reg_entry(
-                                identifier["rev_reg_id"], identifier["timestamp"]
-                            )
-                            rev_reg_entries[identifier["rev_reg_id"]][
-                                identifier["timestamp"]
-                            ] = found_rev_reg_entry
+    async def process_pres_identifiers(
+        self,
+        identifiers: list,
+    ) -> Tuple[dict, dict, dict, dict]:
+        """Return schemas, cred_defs, rev_reg_defs, rev_reg_entries."""
+        semaphore = asyncio.Semaphore(DEFAULT_CONCURRENCY)
+        rev_idents = [ident for ident in identifiers if ident.get("rev_reg_id")]
+        schemas, cred_defs, rev_reg_defs, entries = await asyncio.gather(
+            gather_keyed(
+                self._get_schema,
+                (ident["schema_id"] for ident in identifiers),
+                semaphore=semaphore,
+            ),
+            gather_keyed(
+                self._get_cred_def,
+                (ident["cred_def_id"] for ident in identifiers),
+                semaphore=semaphore,
+            ),
+            gather_keyed(
+                self._get_rev_reg_def,
+                (ident["rev_reg_id"] for ident in rev_idents),
+                semaphore=semaphore,
+            ),
+            gather_keyed(
+                self._get_revoc_reg_entry,
+                (
+                    (ident["rev_reg_id"], ident["timestamp"])
+                    for ident in rev_idents
+                    if ident.get("timestamp")
+                ),
+                semaphore=semaphore,
+            ),
+        )
+        rev_reg_entries = {}
+        for (rev_reg_id, timestamp), entry in entries.items():
+            rev_reg_entries.setdefault(rev_reg_id, {})[timestamp] = entry
         return (
             schemas,
             cred_defs,
@@ -0,0 +1,218 @@
+import json
+from time import time
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import call
+
+from aries_cloudagent.tests import mock
+
+from .....core.in_memory import InMemoryProfile
+from .....indy.holder import IndyHolder
+from .....ledger.base import BaseLedger
+from .....ledger.multiple_ledger.ledger_requests_executor import (
+    IndyLedgerRequestsExecutor,
+)
+from .....revocation.models.revocation_registry import RevocationRegistry
+from ...v1_0.models.presentation_exchange import V10PresentationExchange
+from ..pres_exch_handler import IndyPresExchHandler
+
+NOW = int(time())
+ISSUER_DID = "NcYxiDXkpYi6ov5FcYDi1e"
+S_ID = f"{ISSUER_DID}:2:vidya:1.0"
+CD_ID = f"{ISSUER_DID}:3:CL:{S_ID}:tag1"
+RR_ID = f"{ISSUER_DID}:4:{CD_ID}:CL_ACCUM:0"
+S_ID_2 = f"{ISSUER_DID}:2:arcade:1.0"
+CD_ID_2 = f"{ISSUER_DID}:3:CL:{S_ID_2}:tag1"
+REV_REG_DEF = {
+    "ver": "1.0",
+    "id": RR_ID,
+    "revocDefType": "CL_ACCUM",
+    "tag": "0",
+    "credDefId": CD_ID,
+    "value": {
+        "issuanceType": "ISSUANCE_BY_DEFAULT",
+        "maxCredNum": 1000,
+        "publicKeys": {"accumKey": {"z": "1 ..."}},
+        "tailsHash": "3MLjUFQz9x9n5u9rFu8Ba9C5bo4HNFjkPNc54jZPSNaZ",
+        "tailsLocation": "http://sample.ca/path",
+    },
+}
+CREDENTIALS = {
+    "cred-0": {
+        "schema_id": S_ID,
+        "cred_def_id": CD_ID,
+        "rev_reg_id": RR_ID,
+        "cred_rev_id": "1",
+    },
+    "cred-1": {"schema_id": S_ID_2, "cred_def_id": CD_ID_2},
+}
+
+
+class TestIndyPresExchHandler(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.profile = InMemoryProfile.test_profile()
+        injector = self.profile.context.injector
+
+        self.ledger = mock.MagicMock(BaseLedger, autospec=True)
+        self.ledger.get_schema = mock.CoroutineMock(
+            side_effect=lambda schema_id: {"id": schema_id}
+        )
+        self.ledger.get_credential_definition = mock.CoroutineMock(
+            side_effect=lambda cred_def_id: {"id": cred_def_id}
+        )
+        self.ledger.get_revoc_reg_def = mock.CoroutineMock(return_value=REV_REG_DEF)
+        self.ledger.get_revoc_reg_delta = mock.CoroutineMock(
+            return_value=({"value": {"accum": "21 ..."}}, NOW)
+        )
+        self.ledger.get_revoc_reg_entry = mock.CoroutineMock(
+            return_value=({"value": {"accum": "21 ..."}}, NOW)
+        )
+        injector.bind_instance(
+            IndyLedgerRequestsExecutor,
+            mock.MagicMock(
+                get_ledger_for_identifier=mock.CoroutineMock(
+                    return_value=(None, self.ledger)
+                )
+            ),
+        )
+
+        self.holder = mock.MagicMock(IndyHolder, autospec=True)
+        self.holder.get_credential = mock.CoroutineMock(
+            side_effect=lambda cred_id: json.dumps(CREDENTIALS[cred_id])
+        )
+        self.holder.create_revocation_state = mock.CoroutineMock(
+            return_value=json.dumps({"timestamp": NOW})
+        )
+        self.holder.update_revocation_state = mock.CoroutineMock(
+            return_value=json.dumps({"timestamp": NOW + 10})
+        )
+        self.holder.create_presentation = mock.CoroutineMock(return_value="{}")
+        injector.bind_instance(IndyHolder, self.holder)
+
+    def make_pres_ex_record(self) -> V10PresentationExchange:
+        return V10PresentationExchange(
+            presentation_request={
+                "name": "proof-request",
+                "version": "1.0",
+                "nonce": "12345",
+                "requested_attributes": {
+                    "0_player_uuid": {"name": "player", "non_revoked": {"to": NOW}},
+                    "0_score_uuid": {"name": "score", "non_revoked": {"to": NOW}},
+                    "1_game_uuid": {"name": "game"},
+                },
+                "requested_predicates": {},
+            }
+        )
+
+    def make_requested_credentials(self) -> dict:
+        return {
+            "requested_attributes": {
+                "0_player_uuid": {"cred_id": "cred-0", "revealed": True},
+                "0_score_uuid": {"cred_id": "cred-0", "revealed": True},
+                "1_game_uuid": {"cred_id": "cred-1", "revealed": True},
+            },
+            "requested_predicates": {},
+        }
+
+    async def test_return_presentation(self):
+        with mock.patch.object(
+            RevocationRegistry,
+            "get_or_fetch_local_tails_path",
+            mock.CoroutineMock(return_value="/tmp/tails"),
+        ) as mock_tails:
+            await IndyPresExchHandler(self.profile).return_presentation(
+                self.make_pres_ex_record(), self.make_requested_credentials()
+            )
+
+        assert self.ledger.get_schema.await_count == 2
+        assert self.ledger.get_credential_definition.await_count == 2
+        self.ledger.get_revoc_reg_def.assert_awaited_once_with(RR_ID)
+        self.ledger.get_revoc_reg_delta.assert_awaited_once_with(RR_ID, 0, NOW)
+        mock_tails.assert_awaited_once()
+        self.holder.create_revocation_state.assert_awaited_once()
+
+        (
+            _,
+            requested,
+            schemas,
+            cred_defs,
+            revocation_states,
+        ) = self.holder.create_presentation.call_args[0]
+        assert schemas == {S_ID: {"id": S_ID}, S_ID_2: {"id": S_ID_2}}
+        assert cred_defs == {CD_ID: {"id": CD_ID}, CD_ID_2: {"id": CD_ID_2}}
+        assert revocation_states == {RR_ID: {NOW: {"timestamp": NOW}}}
+        attrs = requested["requested_attributes"]
+        assert attrs["0_player_uuid"]["timestamp"] == NOW
+        assert attrs["0_score_uuid"]["timestamp"] == NOW
+        assert "timestamp" not in attrs["1_game_uuid"]
+
+    async def test_return_presentation_cached_revocation_state(self):
+        handler = IndyPresExchHandler(self.profile)
+        with mock.patch.object(
+            RevocationRegistry,
+            "get_or_fetch_local_tails_path",
+            mock.CoroutineMock(return_value="/tmp/tails"),
+        ) as mock_tails:
+            await handler.return_presentation(
+                self.make_pres_ex_record(), self.make_requested_credentials()
+            )
+            self.holder.create_revocation_state.assert_awaited_once()
+
+            # same registry state: served from the cache
+            await handler.return_presentation(
+                self.make_pres_ex_record(), self.make_requested_credentials()
+            )
+            self.holder.create_revocation_state.assert_awaited_once()
+            mock_tails.assert_awaited_once()
+            revocation_states = self.holder.create_presentation.call_args[0][4]
+            assert revocation_states == {RR_ID: {NOW: {"timestamp": NOW}}}
+
+            # newer registry state: updated from the cached state
+            self.ledger.get_revoc_reg_delta.return_value = (
+                {"value": {"accum": "22 ..."}},
+                NOW + 10,
+            )
+            self.ledger.get_revoc_reg_delta.reset_mock()
+            await handler.return_presentation(
+                self.make_pres_ex_record(), self.make_requested_credentials()
+            )
+            self.holder.create_revocation_state.assert_awaited_once()
+            self.ledger.get_revoc_reg_delta.assert_has_awaits(
+                [call(RR_ID, 0, NOW), call(RR_ID, NOW, NOW + 10)]
+            )
+            self.holder.update_revocation_state.assert_awaited_once_with(
+                "1",
+                REV_REG_DEF,
+                {"timestamp": NOW},
+                {"value": {"accum": "22 ..."}},
+                NOW + 10,
+                "/tmp/tails",
+            )
+            revocation_states = self.holder.create_presentation.call_args[0][4]
+            assert revocation_states == {RR_ID: {NOW + 10: {"timestamp": NOW + 10}}}
+
+    async def test_process_pres_identifiers(self):
+        identifiers = [
+            {"schema_id": S_ID, "cred_def_id": CD_ID, "rev_reg_id": RR_ID},
+            {
+                "schema_id": S_ID,
+                "cred_def_id": CD_ID,
+                "rev_reg_id": RR_ID,
+                "timestamp": NOW,
+            },
+            {"schema_id": S_ID_2, "cred_def_id": CD_ID_2},
+        ]
+        (
+            schemas,
+            cred_defs,
+            rev_reg_defs,
+            rev_reg_entries,
+        ) = await IndyPresExchHandler(self.profile).process_pres_identifiers(
+            identifiers
+        )
+        assert schemas.keys() == {S_ID, S_ID_2}
+        assert cred_defs.keys() == {CD_ID, CD_ID_2}
+        assert rev_reg_defs == {RR_ID: REV_REG_DEF}
+        assert rev_reg_entries == {RR_ID: {NOW: {"value": {"accum": "21 ..."}}}}
+        assert self.ledger.get_schema.await_count == 2
+        self.ledger.get_revoc_reg_def.assert_awaited_once_with(RR_ID)
+        self.ledger.get_revoc_reg_entry.assert_awaited_once_with(RR_ID, NOW)
@@ -22,6 +22,7 @@ from ......vc.vc_ld.models.options import LDProofVCOptions
 from ......vc.vc_ld.models.presentation import VerifiablePresentation
 from .....problem_report.v1_0.message import ProblemReport
 from ....dif.pres_exch import PresentationDefinition, SchemaInputDescriptor
+from ....dif.pres_exch_evaluator import CompiledConstraints
 from ....dif.pres_exch_handler import DIFPresExchError, DIFPresExchHandler
 from ....dif.pres_proposal_schema import DIFProofProposalSchema
 from ....dif.pres_request_schema import DIFPresSpecSchema, DIFProofRequestSchema
@@ -292,12 +293,18 @@ class DIFPresFormatHandler(V20PresFormatHandler):
                             "BbsBlsSignature2020, Ed25519Signature2018 and "
                             "Ed25519Signature2020 signature types are supported"
                         )
+                # narrow the search by the issuer and subject constraints
+                search_args = CompiledConstraints(
+                    input_descriptor.constraint
+                ).search_args()
                 if one_of_uri_groups:
                     records = []
                     cred_group_record_ids = set()
                     for uri_group in one_of_uri_groups:
                         search = holder.search_credentials(
-                            proof_types=proof_type, pd_uri_list=uri_group
+                            proof_types=proof_type,
+                            pd_uri_list=uri_group,
+                            **search_args,
                         )
                         max_results = 1000
                         cred_group = await search.fetch(max_results)
@@ -311,7 +318,7 @@ class DIFPresFormatHandler(V20PresFormatHandler):
                         records = records + cred_group_vcrecord_list
                 else:
                     search = holder.search_credentials(
-                        proof_types=proof_type, pd_uri_list=uri_list
+                        proof_types=proof_type, pd_uri_list=uri_list, **search_args
                     )
                     # Defaults to page_size but would like to include all
                     # For now, setting to 1000
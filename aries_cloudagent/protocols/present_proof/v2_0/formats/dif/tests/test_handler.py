@@ -592,6 +592,60 @@ class TestDIFFormatHandler(IsolatedAsyncioTestCase):
             )
             assert output[1].data.json_ == DIF_PRES
 
+    async def test_create_pres_search_args(self):
+        dif_pres_req = deepcopy(DIF_PRES_REQUEST_B)
+        dif_pres_req["presentation_definition"]["input_descriptors"][0]["constraints"][
+            "fields"
+        ].append(
+            {
+                "path": ["$.issuer.id", "$.issuer"],
+                "filter": {"const": "did:example:489398593"},
+            }
+        )
+        dif_pres_request = V20PresRequest(
+            formats=[
+                V20PresFormat(
+                    attach_id="dif",
+                    format_=ATTACHMENT_FORMAT[PRES_20_REQUEST][
+                        V20PresFormat.Format.DIF.api
+                    ],
+                )
+            ],
+            request_presentations_attach=[
+                AttachDecorator.data_json(dif_pres_req, ident="dif")
+            ],
+        )
+        record = V20PresExRecord(
+            pres_ex_id="pxid",
+            thread_id="thid",
+            connection_id="conn_id",
+            initiator="init",
+            role="role",
+            state="state",
+            pres_request=dif_pres_request,
+            verified="false",
+            auto_present=True,
+            error_msg="error",
+        )
+        mock_holder = mock.MagicMock(
+            search_credentials=mock.MagicMock(
+                return_value=mock.MagicMock(fetch=mock.CoroutineMock(return_value=[]))
+            )
+        )
+        self.context.injector.bind_instance(VCHolder, mock_holder)
+
+        with mock.patch.object(
+            DIFPresExchHandler,
+            "create_vp",
+            mock.CoroutineMock(return_value=DIF_PRES),
+        ):
+            await self.handler.create_pres(record, {})
+        # the issuer constraint is applied in the record search
+        assert (
+            mock_holder.search_credentials.call_args.kwargs["issuer_id"]
+            == "did:example:489398593"
+        )
+
     async def test_create_pres_pd_schema_uri(self):
         dif_pres_req = deepcopy(DIF_PRES_REQUEST_B)
         dif_pres_req["presentation_definition"]["input_descriptors"][0]["schema"][0][
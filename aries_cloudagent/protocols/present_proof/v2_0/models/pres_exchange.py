@@ -26,6 +26,7 @@ class V20PresExRecord(BaseExchangeRecord):
         """V20PresExRecord metadata."""
 
         schema_class = "V20PresExRecordSchema"
+        fast_serialize = True
 
     RECORD_TYPE = "pres_ex_v20"
     RECORD_ID_NAME = "pres_ex_id"
@@ -26,6 +26,10 @@ from ....ledger.error import LedgerError
 from ....messaging.decorators.attach_decorator import AttachDecorator
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    get_paginated_query,
+)
 from ....messaging.valid import (
     INDY_EXTRA_WQL_EXAMPLE,
     INDY_EXTRA_WQL_VALIDATE,
@@ -48,6 +52,7 @@ from ....vc.ld_proofs import (
 )
 from ....wallet.error import WalletNotFoundError
 from ..dif.pres_exch import ClaimFormat, InputDescriptors, SchemaInputDescriptor
+from ..dif.pres_exch_evaluator import CompiledConstraints
 from ..dif.pres_proposal_schema import DIFProofProposalSchema
 from ..dif.pres_request_schema import DIFPresSpecSchema, DIFProofRequestSchema
 from . import problem_report_for_record, report_problem
@@ -70,7 +75,7 @@ class V20PresentProofModuleResponseSchema(OpenAPISchema):
     """Response schema for Present Proof Module."""
 
 
-class V20PresExRecordListQueryStringSchema(OpenAPISchema):
+class V20PresExRecordListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for presentation exchange list query."""
 
     connection_id = fields.Str(
@@ -453,6 +458,7 @@ async def present_proof_list(request: web.BaseRequest):
                 session=session,
                 tag_filter=tag_filter,
                 post_filter_positive=post_filter,
+                **get_paginated_query(request).as_query_args(),
             )
         results = [record.serialize() for record in records]
     except (StorageError, BaseModelError) as err:
@@ -723,12 +729,18 @@ async def present_proof_credentials_list(request: web.BaseRequest):
                                 "Ed25519Signature2020 signature types are supported"
                             )
                         )
+                # narrow the search by the issuer and subject constraints
+                search_args = CompiledConstraints(
+                    input_descriptor.constraint
+                ).search_args()
                 if one_of_uri_groups:
                     records = []
                     cred_group_record_ids = set()
                     for uri_group in one_of_uri_groups:
                         search = dif_holder.search_credentials(
-                            proof_types=proof_type, pd_uri_list=uri_group
+                            proof_types=proof_type,
+                            pd_uri_list=uri_group,
+                            **search_args,
                         )
                         cred_group = await search.fetch(count)
                         (
@@ -743,6 +755,7 @@ async def present_proof_credentials_list(request: web.BaseRequest):
                     search = dif_holder.search_credentials(
                         proof_types=proof_type,
                         pd_uri_list=uri_list,
+                        **search_args,
                     )
                     records = await search.fetch(count)
                 # Avoiding addition of duplicate records
@@ -6,12 +6,14 @@ from typing import Sequence
 
 from ....core.error import BaseError
 from ....core.profile import Profile
+from ....storage.base import BaseStorage
 from ....storage.error import (
     StorageDuplicateError,
     StorageNotFoundError,
 )
 
 from .models.route_record import RouteRecord
+from .route_index import RouteIndex
 
 
 LOGGER = logging.getLogger(__name__)
@@ -117,10 +119,43 @@ class RoutingManager:
 
         return results
 
+    async def load_route_index(self) -> int:
+        """Load the stored server routes into the route index of the profile.
+
+        At most `max_routes` routes of each kind are loaded. Routes which are
+        not loaded are still resolved from storage on first use.
+
+        Returns:
+            The number of routes added to the index
+
+        """
+        index = RouteIndex.for_profile(self._profile)
+        if not index:
+            return 0
+        async with self._profile.session() as session:
+            storage = session.inject(BaseStorage)
+            records = await storage.find_paginated_records(
+                RouteRecord.RECORD_TYPE,
+                {"role": RouteRecord.ROLE_SERVER},
+                limit=index.max_routes,
+            )
+        for record in records:
+            recipient_key = record.tags.get("recipient_key")
+            if not recipient_key:
+                continue
+            if record.tags.get("connection_id"):
+                index.add_route(recipient_key, record.tags["connection_id"])
+            elif record.tags.get("wallet_id"):
+                index.add_wallet_route(recipient_key, record.tags["wallet_id"])
+        return len(records)
+
     async def delete_route_record(self, route: RouteRecord):
         """Remove an existing route record."""
         async with self._profile.session() as session:
             await route.delete_record(session)
+        index = RouteIndex.for_profile(self._profile)
+        if index:
+            index.remove_route(route.recipient_key)
 
     async def create_route_record(
         self,
@@ -153,5 +188,10 @@ class RoutingManager:
         )
         async with self._profile.session() as session:
             await route.save(session, reason="Created new route")
+        index = RouteIndex.for_profile(self._profile)
+        if index and client_connection_id:
+            index.add_route(recipient_key, client_connection_id)
+        elif index:
+            index.add_wallet_route(recipient_key, internal_wallet_id)
         LOGGER.info(">>> CREATED routing record for verkey: " + recipient_key)
         return route
@@ -0,0 +1,150 @@
+"""Relay forward messages without a message model round-trip."""
+
+import json
+import logging
+from typing import Coroutine, Optional, Sequence, Tuple
+
+from ....connections.base_manager import BaseConnectionManager
+from ....connections.models.conn_record import ConnRecord
+from ....connections.models.connection_target import ConnectionTarget
+from ....core.profile import Profile
+from ....core.protocol_registry import ProtocolRegistry
+from ....storage.error import StorageNotFoundError
+from ....transport.inbound.message import InboundMessage
+from ....transport.outbound.message import OutboundMessage
+from ...didcomm_prefix import DIDCommPrefix
+from .manager import RoutingManager, RoutingManagerError
+from .message_types import FORWARD
+from .messages.forward import Forward
+from .route_index import RouteIndex
+
+LOGGER = logging.getLogger(__name__)
+
+FORWARD_TYPES = frozenset(pfx.qualify(FORWARD) for pfx in DIDCommPrefix)
+FORWARD_RECEIVED_EVENT = "acapy::forward::received"
+
+
+async def resolve_forward_targets(
+    profile: Profile, recip_verkey: str
+) -> Tuple[Optional[str], Sequence[ConnectionTarget]]:
+    """Resolve the connection and connection targets for a forward recipient key.
+
+    Lookups are served from the route index of the profile, falling back to
+    storage for recipient keys and connections which are not yet indexed, and
+    for an indexed route to a connection which no longer exists.
+
+    Args:
+        profile: The profile which received the forward message
+        recip_verkey: The verkey ("to") of the forward message
+
+    Returns:
+        A tuple of the connection ID and connection targets. The connection ID is
+        None when the route is not associated with a connection.
+
+    Raises:
+        RoutingManagerError: If no route exists for the recipient key
+
+    """
+    index = RouteIndex.for_profile(profile)
+    connection_id = index and index.get_route(recip_verkey)
+    if connection_id:
+        try:
+            return connection_id, await _get_targets(profile, index, connection_id)
+        except StorageNotFoundError:
+            # the route was removed by another instance
+            index.remove_route(recip_verkey)
+
+    route = await RoutingManager(profile).get_recipient(recip_verkey)
+    connection_id = route.connection_id
+    if not connection_id:
+        return None, ()
+    if index:
+        index.add_route(recip_verkey, connection_id)
+    return connection_id, await _get_targets(profile, index, connection_id)
+
+
+async def _get_targets(
+    profile: Profile, index: Optional[RouteIndex], connection_id: str
+) -> Sequence[ConnectionTarget]:
+    targets = index and index.get_targets(connection_id)
+    if not targets:
+        async with profile.session() as session:
+            connection = await ConnRecord.retrieve_by_id(session, connection_id)
+        targets = await BaseConnectionManager(profile).get_connection_targets(
+            connection=connection
+        )
+        if index and connection.state == ConnRecord.State.COMPLETED.rfc160:
+            index.add_targets(connection_id, targets)
+    return targets
+
+
+async def relay_forward(
+    profile: Profile,
+    inbound_message: InboundMessage,
+    send_outbound: Coroutine,
+) -> bool:
+    """Relay an inbound forward message directly to the mediation client.
+
+    The forward message is handled from the parsed payload, without creating
+    a message instance, request context or responder. Messages which are not
+    plain forward messages handled by the standard `Forward` class are left
+    to the dispatcher.
+
+    Args:
+        profile: The profile which received the message
+        inbound_message: The inbound message instance
+        send_outbound: Async function to send outbound messages
+
+    Returns:
+        True if the message was handled
+
+    """
+    payload = inbound_message.payload
+    if not isinstance(payload, dict):
+        return False
+    message_type = payload.get("@type")
+    if message_type not in FORWARD_TYPES:
+        return False
+    recip_verkey = payload.get("to")
+    packed = payload.get("msg")
+    if (
+        not isinstance(recip_verkey, str)
+        or not isinstance(packed, dict)
+        or not inbound_message.receipt.recipient_verkey
+    ):
+        return False
+    registry = profile.inject_or(ProtocolRegistry)
+    if not registry or registry.resolve_message_class(message_type) is not Forward:
+        return False
+
+    try:
+        connection_id, targets = await resolve_forward_targets(profile, recip_verkey)
+    except RoutingManagerError:
+        LOGGER.exception("Error resolving recipient for forwarded message")
+        return True
+    if not connection_id:
+        return False
+
+    LOGGER.debug("Forwarding message to connection: %s", connection_id)
+    send_status = await send_outbound(
+        profile,
+        OutboundMessage(
+            connection_id=connection_id,
+            payload=None,
+            enc_payload=json.dumps(packed).encode("ascii"),
+            target_list=targets,
+            reply_to_verkey=targets[0].recipient_keys[0],
+        ),
+        inbound_message,
+    )
+
+    # emit event that a forward message is received (may trigger webhook event)
+    await profile.notify(
+        FORWARD_RECEIVED_EVENT,
+        {
+            "connection_id": connection_id,
+            "status": send_status.value,
+            "recipient_key": recip_verkey,
+        },
+    )
+    return True
@@ -0,0 +1,193 @@
+"""In-memory index of mediated recipient keys."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+from weakref import WeakKeyDictionary, WeakSet
+
+from ....connections.cache import CONNECTION_EVENT_PATTERN
+from ....connections.models.connection_target import ConnectionTarget
+from ....core.event_bus import Event, EventBus
+from ....core.profile import Profile
+
+DEFAULT_MAX_ROUTES = 100000
+DEFAULT_MAX_TARGETS = 10000
+DEFAULT_ROUTE_TTL = 300
+DEFAULT_TARGET_TTL = 300
+
+
+class RouteIndex:
+    """Index forward recipient keys and connection targets for a single wallet.
+
+    Recipient keys map to the connection of the mediation client, or to the
+    subwallet for multitenant relay. The index is populated on first lookup (or
+    loaded at startup) and kept up to date as routes are created and removed on
+    this instance, so steady-state forwarding needs no storage access. Routes
+    expire after their TTL, so that changes made by other instances are picked
+    up from storage. Connection targets are dropped on any connection record
+    event or once their TTL expires.
+
+    Profiles opened for the same wallet, such as the profiles created for an
+    Askar profile subwallet, share one index.
+    """
+
+    _indexes: "WeakKeyDictionary[Any, Dict[Optional[str], RouteIndex]]" = (
+        WeakKeyDictionary()
+    )
+    _event_buses: "WeakSet[EventBus]" = WeakSet()
+
+    def __init__(
+        self,
+        max_routes: int = DEFAULT_MAX_ROUTES,
+        max_targets: int = DEFAULT_MAX_TARGETS,
+        target_ttl: float = DEFAULT_TARGET_TTL,
+        route_ttl: float = DEFAULT_ROUTE_TTL,
+    ):
+        """Initialize the route index instance.
+
+        Args:
+            max_routes: the maximum number of recipient keys to keep
+            max_targets: the maximum number of connections to keep targets for
+            target_ttl: the number of seconds to keep connection targets
+            route_ttl: the number of seconds to keep recipient keys
+
+        """
+        self.max_routes = max_routes
+        self.max_targets = max_targets
+        self.target_ttl = target_ttl
+        self.route_ttl = route_ttl
+        self._routes: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._targets: "OrderedDict[str, Tuple[float, Sequence[ConnectionTarget]]]" = (
+            OrderedDict()
+        )
+        self._wallet_routes: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _wallet_key(profile: Profile) -> Tuple[Any, Optional[str]]:
+        """Get the opened store, or the profile itself, and the Askar profile id."""
+        return (
+            getattr(profile, "opened", None) or profile,
+            getattr(profile, "profile_id", None),
+        )
+
+    @classmethod
+    def for_profile(cls, profile: Profile) -> Optional["RouteIndex"]:
+        """Get the route index for the wallet of a profile."""
+        if not isinstance(profile, Profile):
+            return None
+        owner, profile_id = cls._wallet_key(profile)
+        indexes = cls._indexes.get(owner)
+        index = indexes and indexes.get(profile_id)
+        if index is None:
+            index = cls()
+            cls._indexes.setdefault(owner, {})[profile_id] = index
+            event_bus = profile.inject_or(EventBus)
+            if event_bus and event_bus not in cls._event_buses:
+                event_bus.subscribe(CONNECTION_EVENT_PATTERN, cls.on_connection_event)
+                cls._event_buses.add(event_bus)
+        return index
+
+    @classmethod
+    async def on_connection_event(cls, profile: Profile, event: Event):
+        """Drop the connection targets for a connection which was updated."""
+        owner, profile_id = cls._wallet_key(profile)
+        index = cls._indexes.get(owner, {}).get(profile_id)
+        if index is not None and isinstance(event.payload, dict):
+            index.remove_targets(event.payload.get("connection_id"))
+
+    def get_route(self, recipient_key: str) -> Optional[str]:
+        """Get the connection ID for a recipient key, if indexed."""
+        return self._lookup(self._routes, recipient_key)
+
+    def add_route(self, recipient_key: str, connection_id: str):
+        """Add a recipient key to the index."""
+        self._insert(self._routes, recipient_key, connection_id)
+
+    def get_wallet_route(self, recipient_key: str) -> Optional[str]:
+        """Get the subwallet ID for a recipient key, if indexed."""
+        return self._lookup(self._wallet_routes, recipient_key)
+
+    def add_wallet_route(self, recipient_key: str, wallet_id: str):
+        """Add a subwallet recipient key to the index."""
+        self._insert(self._wallet_routes, recipient_key, wallet_id)
+
+    def remove_route(self, recipient_key: str):
+        """Remove a recipient key from the index."""
+        self._routes.pop(recipient_key, None)
+        self._wallet_routes.pop(recipient_key, None)
+
+    def remove_wallet_routes(self, wallet_id: str):
+        """Remove all recipient keys of a subwallet from the index."""
+        for recipient_key in [
+            key for key, (_, value) in self._wallet_routes.items() if value == wallet_id
+        ]:
+            del self._wallet_routes[recipient_key]
+
+    def _lookup(
+        self, routes: "OrderedDict[str, Tuple[float, str]]", recipient_key: str
+    ) -> Optional[str]:
+        entry = routes.get(recipient_key)
+        if entry and entry[0] < time.perf_counter():
+            del routes[recipient_key]
+            entry = None
+        if entry:
+            routes.move_to_end(recipient_key)
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    def _insert(
+        self,
+        routes: "OrderedDict[str, Tuple[float, str]]",
+        recipient_key: str,
+        value: str,
+    ):
+        routes[recipient_key] = (time.perf_counter() + self.route_ttl, value)
+        routes.move_to_end(recipient_key)
+        while len(routes) > self.max_routes:
+            routes.popitem(last=False)
+
+    def get_targets(self, connection_id: str) -> Optional[Sequence[ConnectionTarget]]:
+        """Get the indexed connection targets for a connection."""
+        entry = self._targets.get(connection_id)
+        if not entry:
+            return None
+        expires, targets = entry
+        if expires < time.perf_counter():
+            del self._targets[connection_id]
+            return None
+        self._targets.move_to_end(connection_id)
+        return targets
+
+    def add_targets(self, connection_id: str, targets: Sequence[ConnectionTarget]):
+        """Add the connection targets for a connection to the index."""
+        self._targets[connection_id] = (
+            time.perf_counter() + self.target_ttl,
+            tuple(targets),
+        )
+        self._targets.move_to_end(connection_id)
+        while len(self._targets) > self.max_targets:
+            self._targets.popitem(last=False)
+
+    def remove_targets(self, connection_id: str):
+        """Remove the connection targets for a connection, if any."""
+        self._targets.pop(connection_id, None)
+
+    def stats(self) -> Mapping[str, int]:
+        """Get the size of the index and the lookup hit and miss counts."""
+        return {
+            "routes": len(self._routes),
+            "wallet_routes": len(self._wallet_routes),
+            "targets": len(self._targets),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def clear(self):
+        """Remove all indexed values."""
+        self._routes.clear()
+        self._targets.clear()
+        self._wallet_routes.clear()
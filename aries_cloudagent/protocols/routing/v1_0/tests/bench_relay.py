@@ -0,0 +1,128 @@
+"""Compare forward message throughput through the dispatcher and the relay path.
+
+Run with `python -m aries_cloudagent.protocols.routing.v1_0.tests.bench_relay`.
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from typing import Mapping
+
+from ....coordinate_mediation.v1_0.route_manager import RouteManager
+from ....didcomm_prefix import DIDCommPrefix
+from .....cache.base import BaseCache
+from .....cache.in_memory import InMemoryCache
+from .....connections.models.conn_record import ConnRecord
+from .....connections.models.connection_target import ConnectionTarget
+from .....core.dispatcher import Dispatcher
+from .....core.event_bus import EventBus
+from .....core.in_memory import InMemoryProfile
+from .....core.protocol_registry import ProtocolRegistry
+from .....tests import mock
+from .....transport.inbound.message import InboundMessage
+from .....transport.inbound.receipt import MessageReceipt
+from .....transport.outbound.status import OutboundSendStatus
+from ..manager import RoutingManager
+from ..message_types import FORWARD
+from ..messages.forward import Forward, ForwardSchema
+
+MEDIATOR_VERKEY = "3Dn1SJNPaCXcvvJvSbsFWP2xaCjMom3can8CQNhWrTRx"
+CLIENT_VERKEY = "9WCgWKUaAJj3VWxxtzvvMQN3AoFxoBtBDo9ntwJnVVCC"
+ENC_MESSAGE = {
+    "protected": "eyJlbmMiOiJ4Y2hhY2hhMjBwb2x5MTMwNV9pZXRmIiwidHlwIjoiSldNLzEuMCJ9",
+    "iv": "MnDrl6BDiJ7BZeCX",
+    "ciphertext": "c2FtcGxlIGNpcGhlcnRleHQgZm9yIGEgZm9yd2FyZGVkIG1lc3NhZ2U" * 8,
+    "tag": "QMJ3nQyBK8Kp0AvLUDlZ2A==",
+}
+
+
+class DispatchedForward(Forward):
+    """A forward message class which is not eligible for the relay path."""
+
+    class Meta(Forward.Meta):
+        """DispatchedForward metadata."""
+
+        schema_class = ForwardSchema
+
+
+async def setup_profile(routes: int) -> InMemoryProfile:
+    """Create a mediator profile with a client connection and its routes."""
+    profile = InMemoryProfile.test_profile(
+        bind={
+            BaseCache: InMemoryCache(),
+            EventBus: EventBus(),
+            ProtocolRegistry: ProtocolRegistry(),
+            RouteManager: mock.MagicMock(),
+        }
+    )
+    conn_record = ConnRecord(state=ConnRecord.State.COMPLETED)
+    async with profile.session() as session:
+        await conn_record.save(session)
+    # as cached by the connection manager once the connection completes
+    await profile.inject(BaseCache).set(
+        f"connection_target::{conn_record.connection_id}",
+        [
+            ConnectionTarget(
+                endpoint="http://client.example", recipient_keys=[CLIENT_VERKEY]
+            ).serialize()
+        ],
+    )
+    routing_mgr = RoutingManager(profile)
+    for idx in range(routes):
+        await routing_mgr.create_route_record(conn_record.connection_id, f"key-{idx}")
+    return profile
+
+
+async def run(iterations: int = 1000, routes: int = 100) -> Mapping[str, float]:
+    """Time forward message handling, in forwards per second."""
+    sent = []
+
+    async def send_outbound(profile, outbound, inbound=None):
+        sent.append(outbound)
+        return OutboundSendStatus.QUEUED_FOR_DELIVERY
+
+    results = {}
+    for label, message_cls in (("dispatch", DispatchedForward), ("relay", Forward)):
+        profile = await setup_profile(routes)
+        profile.inject(ProtocolRegistry).register_message_types(
+            {pfx.qualify(FORWARD): message_cls for pfx in DIDCommPrefix}
+        )
+        dispatcher = Dispatcher(profile)
+        await dispatcher.setup()
+        messages = [
+            InboundMessage(
+                {
+                    "@type": DIDCommPrefix.qualify_current(FORWARD),
+                    "@id": f"forward-{idx}",
+                    "to": f"key-{idx % routes}",
+                    "msg": ENC_MESSAGE,
+                },
+                MessageReceipt(recipient_verkey=MEDIATOR_VERKEY),
+            )
+            for idx in range(iterations)
+        ]
+        sent.clear()
+        start = time.perf_counter()
+        for message in messages:
+            await dispatcher.handle_message(profile, message, send_outbound)
+        results[label] = iterations / (time.perf_counter() - start)
+        assert len(sent) == iterations
+    return results
+
+
+def main():
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--routes", type=int, default=100)
+    args = parser.parse_args()
+    # the dispatcher warns for each forward from an unknown sender
+    logging.disable(logging.WARNING)
+    results = asyncio.run(run(args.iterations, args.routes))
+    for name, rate in results.items():
+        print(f"{name:>10}: {rate:10.1f} forwards/s")
+
+
+if __name__ == "__main__":
+    main()
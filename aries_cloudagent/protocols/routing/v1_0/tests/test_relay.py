@@ -0,0 +1,242 @@
+from unittest import IsolatedAsyncioTestCase
+
+from ....coordinate_mediation.v1_0.route_manager import RouteManager
+from ....didcomm_prefix import DIDCommPrefix
+from .....connections.models.conn_record import ConnRecord
+from .....connections.models.connection_target import ConnectionTarget
+from .....core.event_bus import EventBus
+from .....core.in_memory import InMemoryProfile
+from .....core.protocol_registry import ProtocolRegistry
+from .....tests import mock
+from .....transport.inbound.message import InboundMessage
+from .....transport.inbound.receipt import MessageReceipt
+from .....transport.outbound.status import OutboundSendStatus
+from .. import manager as manager_module
+from ..manager import RoutingManager
+from ..message_types import FORWARD
+from ..models.route_record import RouteRecord
+from ..route_index import RouteIndex
+from .. import relay as test_module
+from . import bench_relay
+
+TEST_VERKEY = "3Dn1SJNPaCXcvvJvSbsFWP2xaCjMom3can8CQNhWrTRx"
+TEST_ROUTE_VERKEY = "9WCgWKUaAJj3VWxxtzvvMQN3AoFxoBtBDo9ntwJnVVCC"
+ENC_MESSAGE = {"protected": "abc", "iv": "def", "ciphertext": "ghi", "tag": "jkl"}
+
+
+class TestRouteIndex(IsolatedAsyncioTestCase):
+    def test_routes_lru(self):
+        index = RouteIndex(max_routes=2)
+        index.add_route("a", "conn-a")
+        index.add_route("b", "conn-b")
+        assert index.get_route("a") == "conn-a"
+        index.add_route("c", "conn-c")
+        assert index.get_route("b") is None
+        index.remove_route("a")
+        assert index.get_route("a") is None
+        assert index.get_route("c") == "conn-c"
+
+    def test_wallet_routes_stats(self):
+        index = RouteIndex(max_routes=2)
+        index.add_route("a", "conn-a")
+        index.add_wallet_route("b", "wallet-1")
+        index.add_wallet_route("c", "wallet-1")
+        index.add_wallet_route("d", "wallet-2")
+        assert index.get_wallet_route("b") is None
+        assert index.get_wallet_route("c") == "wallet-1"
+        assert index.get_route("c") is None
+        index.remove_wallet_routes("wallet-1")
+        assert index.get_wallet_route("c") is None
+        assert index.get_wallet_route("d") == "wallet-2"
+        index.remove_route("d")
+        assert index.stats() == {
+            "routes": 1,
+            "wallet_routes": 0,
+            "targets": 0,
+            "hits": 2,
+            "misses": 3,
+        }
+
+    def test_targets_ttl(self):
+        index = RouteIndex(max_targets=1, target_ttl=10)
+        targets = [ConnectionTarget(recipient_keys=[TEST_VERKEY])]
+        index.add_targets("conn-a", targets)
+        assert index.get_targets("conn-a") == tuple(targets)
+        index.add_targets("conn-b", targets)
+        assert index.get_targets("conn-a") is None
+        with mock.patch("time.perf_counter", return_value=10**9):
+            assert index.get_targets("conn-b") is None
+
+        index.add_targets("conn-a", targets)
+        index.clear()
+        assert index.get_targets("conn-a") is None
+
+    def test_routes_ttl(self):
+        index = RouteIndex(route_ttl=10)
+        index.add_route("a", "conn-a")
+        index.add_wallet_route("b", "wallet-1")
+        assert index.get_route("a") == "conn-a"
+        assert index.get_wallet_route("b") == "wallet-1"
+        with mock.patch("time.perf_counter", return_value=10**9):
+            assert index.get_route("a") is None
+            assert index.get_wallet_route("b") is None
+        assert index.stats()["routes"] == 0
+        assert index.stats()["wallet_routes"] == 0
+
+    def test_for_profile_shared_store(self):
+        opened = mock.MagicMock()
+
+        def wallet_profile(profile_id):
+            profile = InMemoryProfile.test_profile()
+            profile.opened = opened
+            profile.profile_id = profile_id
+            return profile
+
+        # profiles opened for the same wallet share one index
+        index = RouteIndex.for_profile(wallet_profile("tenant1"))
+        assert RouteIndex.for_profile(wallet_profile("tenant1")) is index
+        assert RouteIndex.for_profile(wallet_profile("tenant2")) is not index
+
+
+class TestRelayForward(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.profile = InMemoryProfile.test_profile(
+            bind={
+                EventBus: EventBus(),
+                ProtocolRegistry: ProtocolRegistry(),
+                RouteManager: mock.MagicMock(),
+            }
+        )
+        self.profile.inject(ProtocolRegistry).register_message_types(
+            {
+                pfx.qualify(FORWARD): f"{test_module.__package__}.messages.forward."
+                "Forward"
+                for pfx in DIDCommPrefix
+            }
+        )
+        self.conn_record = ConnRecord(state=ConnRecord.State.COMPLETED)
+        async with self.profile.session() as session:
+            await self.conn_record.save(session)
+        self.targets = [
+            ConnectionTarget(endpoint="http://client", recipient_keys=["client-key"])
+        ]
+        self.routing_mgr = RoutingManager(self.profile)
+        await self.routing_mgr.create_route_record(
+            self.conn_record.connection_id, TEST_ROUTE_VERKEY
+        )
+        self.send_outbound = mock.CoroutineMock(
+            return_value=OutboundSendStatus.QUEUED_FOR_DELIVERY
+        )
+
+    def make_inbound(self, **payload) -> InboundMessage:
+        payload = {
+            "@type": DIDCommPrefix.qualify_current(FORWARD),
+            "@id": "forward-id",
+            "to": TEST_ROUTE_VERKEY,
+            "msg": ENC_MESSAGE,
+            **payload,
+        }
+        return InboundMessage(payload, MessageReceipt(recipient_verkey=TEST_VERKEY))
+
+    async def relay(self, inbound: InboundMessage) -> bool:
+        return await test_module.relay_forward(
+            self.profile, inbound, self.send_outbound
+        )
+
+    async def test_relay(self):
+        inbound = self.make_inbound()
+        with mock.patch.object(
+            test_module.BaseConnectionManager,
+            "get_connection_targets",
+            mock.CoroutineMock(return_value=self.targets),
+        ) as mock_get_targets, mock.patch.object(
+            self.profile, "notify", mock.CoroutineMock()
+        ) as mock_notify, mock.patch.object(
+            test_module.RoutingManager, "get_recipient", mock.CoroutineMock()
+        ) as mock_get_recipient:
+            assert await self.relay(inbound)
+            assert await self.relay(inbound)
+            # served from the route index
+            mock_get_recipient.assert_not_called()
+            mock_get_targets.assert_called_once()
+
+        profile, outbound, receipt_inbound = self.send_outbound.call_args.args
+        assert profile is self.profile
+        assert receipt_inbound is inbound
+        assert outbound.connection_id == self.conn_record.connection_id
+        assert outbound.enc_payload == test_module.json.dumps(ENC_MESSAGE).encode()
+        assert list(outbound.target_list) == self.targets
+        assert outbound.reply_to_verkey == "client-key"
+        mock_notify.assert_called_with(
+            test_module.FORWARD_RECEIVED_EVENT,
+            {
+                "connection_id": self.conn_record.connection_id,
+                "status": "queued_for_delivery",
+                "recipient_key": TEST_ROUTE_VERKEY,
+            },
+        )
+
+    async def test_relay_index_updates(self):
+        index = RouteIndex.for_profile(self.profile)
+        assert index.get_route(TEST_ROUTE_VERKEY) == self.conn_record.connection_id
+        index.add_targets(self.conn_record.connection_id, self.targets)
+
+        # connection record events drop the connection targets
+        self.conn_record.state = ConnRecord.State.ABANDONED.rfc160
+        async with self.profile.session() as session:
+            await self.conn_record.save(session)
+        assert index.get_targets(self.conn_record.connection_id) is None
+
+        (route,) = await self.routing_mgr.get_routes()
+        await self.routing_mgr.delete_route_record(route)
+        assert index.get_route(TEST_ROUTE_VERKEY) is None
+        with mock.patch.object(manager_module, "RECIP_ROUTE_RETRY", 0):
+            # handled: no route exists for the recipient key
+            assert await self.relay(self.make_inbound())
+        self.send_outbound.assert_not_called()
+
+    async def test_relay_route_changed_in_storage(self):
+        index = RouteIndex.for_profile(self.profile)
+        new_conn = ConnRecord(state=ConnRecord.State.COMPLETED)
+        async with self.profile.session() as session:
+            await new_conn.save(session)
+            # route moved to another connection by another instance
+            (route,) = await RouteRecord.query(session)
+            route.connection_id = new_conn.connection_id
+            await route.save(session)
+            await self.conn_record.delete_record(session)
+        assert index.get_route(TEST_ROUTE_VERKEY) == self.conn_record.connection_id
+
+        with mock.patch.object(
+            test_module.BaseConnectionManager,
+            "get_connection_targets",
+            mock.CoroutineMock(return_value=self.targets),
+        ):
+            assert await self.relay(self.make_inbound())
+        outbound = self.send_outbound.call_args.args[1]
+        assert outbound.connection_id == new_conn.connection_id
+        assert index.get_route(TEST_ROUTE_VERKEY) == new_conn.connection_id
+
+    async def test_relay_not_eligible(self):
+        assert not await self.relay(InboundMessage(b"packed", MessageReceipt()))
+        assert not await self.relay(self.make_inbound(**{"@type": "other"}))
+        assert not await self.relay(self.make_inbound(msg="packed"))
+        assert not await self.relay(
+            InboundMessage(self.make_inbound().payload, MessageReceipt())
+        )
+        self.profile.inject(ProtocolRegistry).register_message_types(
+            {DIDCommPrefix.qualify_current(FORWARD): (bench_relay.DispatchedForward)}
+        )
+        assert not await self.relay(self.make_inbound())
+        self.send_outbound.assert_not_called()
+
+    async def test_relay_wallet_route(self):
+        await self.routing_mgr.create_route_record(
+            internal_wallet_id="wallet-id", recipient_key="wallet-key"
+        )
+        assert not await self.relay(self.make_inbound(to="wallet-key"))
+        self.send_outbound.assert_not_called()
+
+    async def test_benchmark(self):
+        results = await bench_relay.run(iterations=2, routes=2)
+        assert set(results) == {"dispatch", "relay"}
@@ -12,6 +12,7 @@ from .....transport.inbound.receipt import MessageReceipt
 
 from ..manager import RoutingManager, RoutingManagerError, RouteNotFoundError
 from ..models.route_record import RouteRecord, RouteRecordSchema
+from ..route_index import RouteIndex
 
 TEST_CONN_ID = "conn-id"
 TEST_VERKEY = "3Dn1SJNPaCXcvvJvSbsFWP2xaCjMom3can8CQNhWrTRx"
@@ -42,6 +43,23 @@ class TestRoutingManager(IsolatedAsyncioTestCase):
         assert results[0].connection_id == TEST_CONN_ID
         assert results[0].recipient_key == TEST_ROUTE_VERKEY
 
+    async def test_load_route_index(self):
+        await self.manager.create_route_record(TEST_CONN_ID, TEST_ROUTE_VERKEY)
+        await self.manager.create_route_record(
+            internal_wallet_id="wallet-id", recipient_key=TEST_VERKEY
+        )
+        async with self.profile.session() as session:
+            await RouteRecord(
+                role=RouteRecord.ROLE_CLIENT, recipient_key="client-key"
+            ).save(session)
+        index = RouteIndex.for_profile(self.profile)
+        index.clear()
+
+        assert await self.manager.load_route_index() == 2
+        assert index.get_route(TEST_ROUTE_VERKEY) == TEST_CONN_ID
+        assert index.get_wallet_route(TEST_VERKEY) == "wallet-id"
+        assert index.get_route("client-key") is None
+
     async def test_route_record_schema_validate(self):
         route_rec_schema = RouteRecordSchema()
         with self.assertRaises(ValidationError):
@@ -1,9 +1,12 @@
 """Base Class for DID Resolvers."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from enum import Enum
+import logging
 import re
-from typing import NamedTuple, Optional, Pattern, Sequence, Text, Union
+import time
+from typing import NamedTuple, Optional, Pattern, Sequence, Set, Text, Tuple, Union
 import warnings
 
 from pydid import DID
@@ -13,6 +16,8 @@ from ..config.injection_context import InjectionContext
 from ..core.error import BaseError
 from ..core.profile import Profile
 
+LOGGER = logging.getLogger(__name__)
+
 
 class ResolverError(BaseError):
     """Base class for resolver exceptions."""
@@ -71,6 +76,8 @@ class BaseDIDResolver(ABC):
     """Base Class for DID Resolvers."""
 
     DEFAULT_TTL = 3600
+    NEGATIVE_TTL = 60
+    STALE_TTL = 3600
 
     def __init__(self, type_: Optional[ResolverType] = None):
         """Initialize BaseDIDResolver.
@@ -79,6 +86,12 @@ class BaseDIDResolver(ABC):
             type_ (Type): Type of resolver, native or non-native
         """
         self.type = type_ or ResolverType.NON_NATIVE
+        self._refreshing: Set[str] = set()
+
+    @classmethod
+    def now(cls) -> float:
+        """Fetch the current time, used for the freshness of cached documents."""
+        return time.time()
 
     @abstractmethod
     async def setup(self, context: InjectionContext):
@@ -142,7 +155,9 @@ class BaseDIDResolver(ABC):
     ) -> dict:
         """Resolve a DID using this resolver.
 
-        Handles caching of results.
+        Handles caching of results. A cached document past its lifetime is
+        returned while a fresh copy is resolved in the background, and a DID
+        which was not found is not looked up again for a short time.
         """
         if isinstance(did, DID):
             did = str(did)
@@ -153,18 +168,97 @@ class BaseDIDResolver(ABC):
                 f"{self.__class__.__name__} does not support DID method for: {did}"
             )
 
-        cache_key = f"resolver::{type(self).__name__}::{did}"
         cache = profile.inject_or(BaseCache)
-        if cache:
-            async with cache.acquire(cache_key) as entry:
-                if entry.result:
-                    return entry.result
+        if not cache:
+            return await self._resolve(profile, did, service_accept)
+
+        # the key is versioned with the format of the entries, which may be
+        # shared through the cache with agents running an older release
+        cache_key = f"resolver:v2::{type(self).__name__}::{did}"
+        async with cache.acquire(cache_key) as entry:
+            cached = entry.result
+            if isinstance(cached, dict) and (
+                "document" in cached or "not_found" in cached
+            ):
+                if "fresh_until" in cached and cached["fresh_until"] <= self.now():
+                    self._refresh(profile, cache, cache_key, did, service_accept)
+            else:
+                cached, ttl = await self._fetch_entry(profile, did, service_accept)
+                if ttl and entry.done:
+                    # replace an entry which was not recognized
+                    await cache.set(cache_key, cached, ttl)
+                elif ttl:
+                    await entry.set_result(cached, ttl)
+
+        if "not_found" in cached:
+            raise DIDNotFound(cached["not_found"])
+        return cached["document"]
+
+    async def _fetch_entry(
+        self,
+        profile: Profile,
+        did: str,
+        service_accept: Optional[Sequence[Text]] = None,
+    ) -> Tuple[dict, int]:
+        """Resolve a DID into a cache entry, returned with the entry lifetime.
+
+        A document is fresh for the lifetime given by the resolver, and is kept
+        for `STALE_TTL` seconds longer to be served while it is refreshed. A DID
+        which is not found is remembered for `NEGATIVE_TTL` seconds.
+        """
+        try:
+            document, ttl = await self._resolve_cacheable(profile, did, service_accept)
+        except DIDNotFound as err:
+            return {"not_found": str(err)}, self.NEGATIVE_TTL
+        if ttl is None:
+            ttl = self.DEFAULT_TTL
+        if ttl <= 0:
+            return {"document": document}, 0
+        return {"document": document, "fresh_until": self.now() + ttl}, (
+            ttl + self.STALE_TTL
+        )
+
+    def _refresh(
+        self,
+        profile: Profile,
+        cache: BaseCache,
+        cache_key: str,
+        did: str,
+        service_accept: Optional[Sequence[Text]] = None,
+    ):
+        """Refresh a stale cache entry in the background."""
+        if cache_key in self._refreshing:
+            return
+        self._refreshing.add(cache_key)
+
+        async def refresh():
+            try:
+                cached, ttl = await self._fetch_entry(profile, did, service_accept)
+                if ttl:
+                    await cache.set(cache_key, cached, ttl)
                 else:
-                    result = await self._resolve(profile, did, service_accept)
-                    await entry.set_result(result, ttl=self.DEFAULT_TTL)
-                    return result
+                    await cache.clear(cache_key)
+            except Exception:
+                # the stale document is kept until it expires
+                LOGGER.warning("Failed to refresh DID %s", did, exc_info=True)
+            finally:
+                self._refreshing.discard(cache_key)
+
+        asyncio.ensure_future(refresh())
 
-        return await self._resolve(profile, did, service_accept)
+    async def _resolve_cacheable(
+        self,
+        profile: Profile,
+        did: str,
+        service_accept: Optional[Sequence[Text]] = None,
+    ) -> Tuple[dict, Optional[int]]:
+        """Resolve a DID, along with the number of seconds it may be cached.
+
+        Override to take the lifetime from the source of the document, such as
+        HTTP cache headers. A lifetime of `None` uses `DEFAULT_TTL`, and 0
+        prevents caching.
+        """
+        return await self._resolve(profile, did, service_accept), None
 
     @abstractmethod
     async def _resolve(
@@ -11,6 +11,7 @@ from ....core.in_memory import InMemoryProfile
 
 from .. import universal as test_module
 from ...base import DIDNotFound, ResolverError
+from ...http import ResolverHttpClient
 from ..universal import UniversalResolver
 
 
@@ -31,9 +32,10 @@ def profile():
 class MockResponse:
     """Mock http response."""
 
-    def __init__(self, status: int, body: Union[str, Dict]):
+    def __init__(self, status: int, body: Union[str, Dict], headers: dict = None):
         self.status = status
         self.body = body
+        self.headers = headers or {}
 
     async def json(self):
         return self.body
@@ -49,34 +51,24 @@ class MockResponse:
         """For use as async context."""
 
 
-class MockClientSession:
-    """Mock client session."""
+class MockHttpClient:
+    """Mock resolver http client."""
 
     def __init__(self, response: MockResponse = None):
         self.response = response
+        self.requests = []
 
-    def __call__(self, headers):
-        return self
-
-    async def __aenter__(self):
-        """For use as async context."""
-        return self
-
-    async def __aexit__(self, err_type, err_value, err_exc):
-        """For use as async context."""
-
-    def get(self, endpoint):
+    def get(self, url, *, headers=None):
         """Return response."""
+        self.requests.append((url, headers))
         return self.response
 
 
 @pytest.fixture
-def mock_client_session():
-    temp = test_module.aiohttp.ClientSession
-    session = MockClientSession()
-    test_module.aiohttp.ClientSession = session
-    yield session
-    test_module.aiohttp.ClientSession = temp
+def mock_client_session(profile):
+    client = MockHttpClient()
+    profile.context.injector.bind_instance(ResolverHttpClient, client)
+    yield client
 
 
 @pytest.mark.asyncio
@@ -92,6 +84,23 @@ async def test_resolve(profile, resolver, mock_client_session):
     )
     doc = await resolver.resolve(profile, "did:sov:WRfXPg8dantKVubE3HX8pw")
     assert doc.get("id") == "did:example:123"
+    assert mock_client_session.requests == [
+        ("https://example.com/identifiers/did:sov:WRfXPg8dantKVubE3HX8pw", {})
+    ]
+
+
+@pytest.mark.asyncio
+async def test_resolve_cache_headers(profile, resolver, mock_client_session):
+    mock_client_session.response = MockResponse(
+        200,
+        {"didDocument": {"id": "did:example:123"}},
+        headers={"Cache-Control": "max-age=120"},
+    )
+    doc, ttl = await resolver._resolve_cacheable(
+        profile, "did:sov:WRfXPg8dantKVubE3HX8pw"
+    )
+    assert doc == {"id": "did:example:123"}
+    assert ttl == 120
 
 
 @pytest.mark.asyncio
@@ -111,12 +120,14 @@ async def test_resolve_unexpected_status(profile, resolver, mock_client_session)
 
 
 @pytest.mark.asyncio
-async def test_fetch_resolver_props(mock_client_session: MockClientSession):
+async def test_fetch_resolver_props(profile, mock_client_session: MockHttpClient):
     mock_client_session.response = MockResponse(200, {"test": "json"})
-    assert await UniversalResolver()._fetch_resolver_props() == {"test": "json"}
+    assert await UniversalResolver()._fetch_resolver_props(profile.context) == {
+        "test": "json"
+    }
     mock_client_session.response = MockResponse(404, "Not found")
     with pytest.raises(ResolverError):
-        await UniversalResolver()._fetch_resolver_props()
+        await UniversalResolver()._fetch_resolver_props(profile.context)
 
 
 @pytest.mark.asyncio
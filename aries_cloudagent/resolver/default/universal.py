@@ -2,13 +2,12 @@
 
 import logging
 import re
-from typing import Iterable, Optional, Pattern, Sequence, Union, Text
-
-import aiohttp
+from typing import Iterable, Optional, Pattern, Sequence, Tuple, Union, Text
 
 from ...config.injection_context import InjectionContext
 from ...core.profile import Profile
 from ..base import BaseDIDResolver, DIDNotFound, ResolverError, ResolverType
+from ..http import cache_ttl, http_get
 
 LOGGER = logging.getLogger(__name__)
 DEFAULT_ENDPOINT = "https://dev.uniresolver.io/1.0"
@@ -63,7 +62,7 @@ class UniversalResolver(BaseDIDResolver):
         # configure supported methods
         supported = context.settings.get("resolver.universal.supported")
         if supported is None:
-            supported_did_regex = await self._get_supported_did_regex()
+            supported_did_regex = await self._get_supported_did_regex(context)
         else:
             supported_did_regex = _compile_supported_did_regex(supported)
 
@@ -79,39 +78,55 @@ class UniversalResolver(BaseDIDResolver):
 
     async def _resolve(
         self,
-        _profile: Profile,
+        profile: Profile,
         did: str,
         service_accept: Optional[Sequence[Text]] = None,
     ) -> dict:
         """Resolve DID through remote universal resolver."""
+        document, _ = await self._resolve_cacheable(profile, did, service_accept)
+        return document
 
-        async with aiohttp.ClientSession(headers=self.__default_headers) as session:
-            async with session.get(f"{self._endpoint}/identifiers/{did}") as resp:
-                if resp.status == 200:
-                    doc = await resp.json()
-                    did_doc = doc["didDocument"]
-                    LOGGER.info("Retrieved doc: %s", did_doc)
-                    return did_doc
-                if resp.status == 404:
-                    raise DIDNotFound(f"{did} not found by {self.__class__.__name__}")
-
-                text = await resp.text()
-                raise ResolverError(
-                    f"Unexpected status from universal resolver ({resp.status}): {text}"
-                )
-
-    async def _fetch_resolver_props(self) -> dict:
+    async def _resolve_cacheable(
+        self,
+        profile: Profile,
+        did: str,
+        service_accept: Optional[Sequence[Text]] = None,
+    ) -> Tuple[dict, Optional[int]]:
+        """Resolve DID through remote universal resolver, with the cache lifetime."""
+
+        async with http_get(
+            profile,
+            f"{self._endpoint}/identifiers/{did}",
+            headers=self.__default_headers,
+        ) as resp:
+            if resp.status == 200:
+                doc = await resp.json()
+                did_doc = doc["didDocument"]
+                LOGGER.info("Retrieved doc: %s", did_doc)
+                return did_doc, cache_ttl(resp.headers)
+            if resp.status == 404:
+                raise DIDNotFound(f"{did} not found by {self.__class__.__name__}")
+
+            text = await resp.text()
+            raise ResolverError(
+                f"Unexpected status from universal resolver ({resp.status}): {text}"
+            )
+
+    async def _fetch_resolver_props(self, context: InjectionContext = None) -> dict:
         """Retrieve universal resolver properties."""
-        async with aiohttp.ClientSession(headers=self.__default_headers) as session:
-            async with session.get(f"{self._endpoint}/properties/") as resp:
-                if 200 <= resp.status < 400:
-                    return await resp.json()
-                raise ResolverError(
-                    "Failed to retrieve resolver properties: " + await resp.text()
-                )
-
-    async def _get_supported_did_regex(self) -> Pattern:
-        props = await self._fetch_resolver_props()
+        async with http_get(
+            context, f"{self._endpoint}/properties/", headers=self.__default_headers
+        ) as resp:
+            if 200 <= resp.status < 400:
+                return await resp.json()
+            raise ResolverError(
+                "Failed to retrieve resolver properties: " + await resp.text()
+            )
+
+    async def _get_supported_did_regex(
+        self, context: InjectionContext = None
+    ) -> Pattern:
+        props = await self._fetch_resolver_props(context)
         return _compile_supported_did_regex(
             driver["http"]["pattern"] for driver in props.values()
         )
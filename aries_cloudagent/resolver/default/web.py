@@ -2,9 +2,7 @@
 
 import urllib.parse
 
-from typing import Optional, Pattern, Sequence, Text
-
-import aiohttp
+from typing import Optional, Pattern, Sequence, Text, Tuple
 
 from pydid import DID, DIDDocument
 
@@ -18,6 +16,7 @@ from ..base import (
     ResolverError,
     ResolverType,
 )
+from ..http import cache_ttl, http_get
 
 
 class WebDIDResolver(BaseDIDResolver):
@@ -63,21 +62,28 @@ class WebDIDResolver(BaseDIDResolver):
         service_accept: Optional[Sequence[Text]] = None,
     ) -> dict:
         """Resolve did:web DIDs."""
+        document, _ = await self._resolve_cacheable(profile, did, service_accept)
+        return document
+
+    async def _resolve_cacheable(
+        self,
+        profile: Profile,
+        did: str,
+        service_accept: Optional[Sequence[Text]] = None,
+    ) -> Tuple[dict, Optional[int]]:
+        """Resolve did:web DIDs, cached as directed by the response headers."""
 
         url = self.__transform_to_url(did)
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    try:
-                        # Validate DIDDoc with pyDID
-                        did_doc = DIDDocument.from_json(await response.text())
-                        return did_doc.serialize()
-                    except Exception as err:
-                        raise ResolverError(
-                            "Response was incorrectly formatted"
-                        ) from err
-                if response.status == 404:
-                    raise DIDNotFound(f"No document found for {did}")
-                raise ResolverError(
-                    "Could not find doc for {}: {}".format(did, await response.text())
-                )
+        async with http_get(profile, url) as response:
+            if response.status == 200:
+                try:
+                    # Validate DIDDoc with pyDID
+                    did_doc = DIDDocument.from_json(await response.text())
+                    return did_doc.serialize(), cache_ttl(response.headers)
+                except Exception as err:
+                    raise ResolverError("Response was incorrectly formatted") from err
+            if response.status == 404:
+                raise DIDNotFound(f"No document found for {did}")
+            raise ResolverError(
+                "Could not find doc for {}: {}".format(did, await response.text())
+            )
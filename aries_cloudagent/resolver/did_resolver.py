@@ -8,13 +8,14 @@ import asyncio
 from datetime import datetime, timezone
 from itertools import chain
 import logging
-from typing import List, Optional, Sequence, Text, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Sequence, Text, Tuple, Union
 
 from pydid import DID, DIDError, DIDUrl, Resource, VerificationMethod
 import pydid
 from pydid.doc.doc import BaseDIDDocument, IDNotFoundError
 
 from ..core.profile import Profile
+from ..utils.concurrency import gather_keyed
 from .base import (
     BaseDIDResolver,
     DIDMethodNotSupported,
@@ -31,6 +32,7 @@ class DIDResolver:
     """did resolver singleton."""
 
     DEFAULT_TIMEOUT = 30
+    BATCH_LIMIT = 16
 
     def __init__(self, resolvers: Optional[List[BaseDIDResolver]] = None):
         """Create DID Resolver."""
@@ -51,12 +53,17 @@ class DIDResolver:
         """Retrieve doc and return with resolver.
 
         This private method enables the public resolve and resolve_with_metadata
-        methods to share the same logic.
+        methods to share the same logic. The timeout applies to the resolution
+        as a whole, not to each resolver tried.
         """
         if isinstance(did, DID):
             did = str(did)
         else:
             DID.validate(did)
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + (
+            timeout if timeout is not None else self.DEFAULT_TIMEOUT
+        )
         for resolver in await self._match_did_to_resolver(profile, did):
             try:
                 LOGGER.debug("Resolving DID %s with %s", did, resolver)
@@ -66,7 +73,7 @@ class DIDResolver:
                         did,
                         service_accept,
                     ),
-                    timeout if timeout is not None else self.DEFAULT_TIMEOUT,
+                    max(deadline - loop.time(), 0),
                 )
                 LOGGER.debug("Resolved DID %s with %s: %s", did, resolver, document)
                 return resolver, document
@@ -87,6 +94,43 @@ class DIDResolver:
         _, doc = await self._resolve(profile, did, service_accept, timeout=timeout)
         return doc
 
+    async def resolve_many(
+        self,
+        profile: Profile,
+        dids: Iterable[Union[str, DID]],
+        service_accept: Optional[Sequence[Text]] = None,
+        *,
+        timeout: Optional[int] = None,
+        limit: int = None,
+    ) -> Dict[str, Union[dict, ResolverError]]:
+        """Resolve a batch of DIDs concurrently.
+
+        Args:
+            profile: the profile to resolve with
+            dids: the DIDs to resolve, duplicates are resolved once
+            service_accept: the accepted service types
+            timeout: the timeout for each DID, in seconds
+            limit: the maximum number of DIDs being resolved at once
+
+        Returns:
+            A dictionary of the DID documents, in the order the DIDs were given.
+            A DID which could not be resolved, or not within the timeout, maps to
+            the resolver error instead.
+
+        """
+
+        async def fetch(did: str) -> Union[dict, ResolverError]:
+            try:
+                return await self.resolve(profile, did, service_accept, timeout=timeout)
+            except ResolverError as err:
+                return err
+            except asyncio.TimeoutError:
+                return ResolverError(f"Timed out resolving DID {did}")
+
+        return await gather_keyed(
+            fetch, (str(did) for did in dids), limit=limit or self.BATCH_LIMIT
+        )
+
     async def resolve_with_metadata(
         self, profile: Profile, did: Union[str, DID], *, timeout: Optional[int] = None
     ) -> ResolutionResult:
@@ -0,0 +1,151 @@
+"""Pooled HTTP client shared by the DID resolvers."""
+
+import time
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Mapping, Optional, Union
+
+from aiohttp import (
+    ClientResponse,
+    ClientSession,
+    ClientTimeout,
+    DummyCookieJar,
+    TCPConnector,
+)
+
+from ..config.injection_context import InjectionContext
+from ..core.profile import Profile
+
+
+class ResolverHttpClient:
+    """HTTP client with a connection pool shared by the DID resolvers.
+
+    Connections and DNS lookups are kept between resolutions instead of being
+    made again for every DID. The client session is created on first use, and
+    again after the client has been closed.
+    """
+
+    LIMIT = 100
+    LIMIT_PER_HOST = 8
+    DNS_CACHE_TTL = 300
+    TIMEOUT = 30.0
+
+    def __init__(
+        self,
+        *,
+        limit: int = None,
+        limit_per_host: int = None,
+        timeout: float = None,
+    ):
+        """Initialize the client instance.
+
+        Args:
+            limit: the maximum number of open connections
+            limit_per_host: the maximum number of open connections per host
+            timeout: the total timeout of a request, in seconds
+
+        """
+        self.limit = limit or self.LIMIT
+        self.limit_per_host = limit_per_host or self.LIMIT_PER_HOST
+        self.timeout = timeout or self.TIMEOUT
+        self._session: ClientSession = None
+
+    @property
+    def session(self) -> ClientSession:
+        """Accessor for the pooled client session."""
+        if not self._session or self._session.closed:
+            self._session = ClientSession(
+                connector=TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    ttl_dns_cache=self.DNS_CACHE_TTL,
+                ),
+                cookie_jar=DummyCookieJar(),
+                timeout=ClientTimeout(total=self.timeout),
+                trust_env=True,
+            )
+        return self._session
+
+    def get(self, url: str, *, headers: dict = None):
+        """Send a GET request, for use as an async context manager."""
+        return self.session.get(url, headers=headers)
+
+    async def close(self):
+        """Close the client session and its connections."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+@asynccontextmanager
+async def http_get(
+    injector: Optional[Union[Profile, InjectionContext]],
+    url: str,
+    *,
+    headers: dict = None,
+) -> AsyncIterator[ClientResponse]:
+    """Send a GET request for a resolver.
+
+    The shared `ResolverHttpClient` is used when one is bound, otherwise a
+    client session is opened for the single request.
+
+    Args:
+        injector: the profile or context providing the shared client
+        url: the address to fetch
+        headers: an optional dict of headers to send
+
+    """
+    client = injector and injector.inject_or(ResolverHttpClient)
+    if client:
+        async with client.get(url, headers=headers) as response:
+            yield response
+    else:
+        async with ClientSession() as session:
+            async with session.get(url, headers=headers) as response:
+                yield response
+
+
+def cache_ttl(headers: Mapping[str, str], now: float = None) -> Optional[int]:
+    """Get the number of seconds a response may be cached, from its headers.
+
+    `Cache-Control` directives take precedence over `Expires`, as in HTTP
+    caches. `no-store` and `no-cache` prevent caching.
+
+    Args:
+        headers: the response headers
+        now: the current time, as a UNIX timestamp
+
+    Returns:
+        The lifetime of the response in seconds, or `None` if not given
+
+    """
+    directives = {}
+    for directive in headers.get("Cache-Control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip().strip('"')
+
+    if "no-store" in directives or "no-cache" in directives:
+        return 0
+    for name in ("s-maxage", "max-age"):
+        if name in directives:
+            try:
+                max_age = int(directives[name])
+            except ValueError:
+                return 0
+            try:
+                age = int(headers.get("Age", 0))
+            except ValueError:
+                age = 0
+            return max(max_age - age, 0)
+
+    expires = headers.get("Expires")
+    if expires:
+        try:
+            expires_at = parsedate_to_datetime(expires).timestamp()
+        except (TypeError, ValueError):
+            # an invalid date means the response has already expired
+            return 0
+        return max(int(expires_at - (time.time() if now is None else now)), 0)
+
+    return None
@@ -1,12 +1,22 @@
 """Test Base DID Resolver methods."""
 
+import asyncio
 import pytest
 import re
 
 from unittest import mock
 from pydid import DIDDocument
 
-from ..base import BaseDIDResolver, DIDMethodNotSupported, ResolverType
+from ...cache.base import BaseCache
+from ...cache.in_memory import InMemoryCache
+from ...core.in_memory import InMemoryProfile
+from ..base import (
+    BaseDIDResolver,
+    DIDMethodNotSupported,
+    DIDNotFound,
+    ResolverError,
+    ResolverType,
+)
 
 
 class ExampleDIDResolver(BaseDIDResolver):
@@ -81,3 +91,120 @@ async def test_supported_methods():
         assert await TestDIDResolver().supports(
             profile, "did:example:WgWxqztrNooG92RXvxSTWv"
         )
+
+
+class CachedDIDResolver(ExampleDIDResolver):
+    """Test DID Resolver counting resolutions."""
+
+    def __init__(self, ttl=None):
+        super().__init__()
+        self.ttl = ttl
+        self.not_found = False
+        self.calls = 0
+
+    async def _resolve_cacheable(self, profile, did, accept):
+        self.calls += 1
+        if self.not_found:
+            raise DIDNotFound(f"{did} not found")
+        return {"id": did, "version": self.calls}, self.ttl
+
+
+@pytest.fixture
+def cached_profile():
+    yield InMemoryProfile.test_profile(bind={BaseCache: InMemoryCache()})
+
+
+@pytest.mark.asyncio
+async def test_resolve_cached(cached_profile):
+    resolver = CachedDIDResolver()
+    did = "did:example:123"
+    assert await resolver.resolve(cached_profile, did) == {"id": did, "version": 1}
+    assert await resolver.resolve(cached_profile, did) == {"id": did, "version": 1}
+    assert resolver.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_resolve_not_cached(cached_profile):
+    resolver = CachedDIDResolver(ttl=0)
+    did = "did:example:123"
+    await resolver.resolve(cached_profile, did)
+    assert await resolver.resolve(cached_profile, did) == {"id": did, "version": 2}
+
+
+@pytest.mark.asyncio
+async def test_resolve_negative_cached(cached_profile):
+    resolver = CachedDIDResolver()
+    resolver.not_found = True
+    did = "did:example:123"
+    for _ in range(2):
+        with pytest.raises(DIDNotFound) as err:
+            await resolver.resolve(cached_profile, did)
+        assert "not found" in str(err.value)
+    assert resolver.calls == 1
+
+    cache = cached_profile.inject(BaseCache)
+    cache_key = f"resolver:v2::CachedDIDResolver::{did}"
+    with mock.patch.object(cache, "set", wraps=cache.set) as mock_set:
+        await cache.clear(cache_key)
+        with pytest.raises(DIDNotFound):
+            await resolver.resolve(cached_profile, did)
+    mock_set.assert_called_once_with(cache_key, mock.ANY, resolver.NEGATIVE_TTL)
+
+
+@pytest.mark.asyncio
+async def test_resolve_unrecognized_entry(cached_profile):
+    resolver = CachedDIDResolver()
+    did = "did:example:123"
+    cache = cached_profile.inject(BaseCache)
+    cache_key = f"resolver:v2::CachedDIDResolver::{did}"
+    for value in ({"id": did}, "document"):
+        await cache.set(cache_key, value)
+        assert (await resolver.resolve(cached_profile, did))["id"] == did
+    assert resolver.calls == 2
+    assert await cache.get(cache_key) == {
+        "document": {"id": did, "version": 2},
+        "fresh_until": mock.ANY,
+    }
+
+
+@pytest.mark.asyncio
+async def test_resolve_stale_while_revalidate(cached_profile):
+    resolver = CachedDIDResolver(ttl=60)
+    did = "did:example:123"
+    now = resolver.now()
+    assert (await resolver.resolve(cached_profile, did))["version"] == 1
+
+    with mock.patch.object(CachedDIDResolver, "now", return_value=now + 30):
+        assert (await resolver.resolve(cached_profile, did))["version"] == 1
+        await asyncio.sleep(0)
+    assert resolver.calls == 1
+
+    with mock.patch.object(CachedDIDResolver, "now", return_value=now + 90):
+        # the stale document is returned while it is refreshed
+        assert (await resolver.resolve(cached_profile, did))["version"] == 1
+        assert (await resolver.resolve(cached_profile, did))["version"] == 1
+        while resolver._refreshing:
+            await asyncio.sleep(0.01)
+        assert resolver.calls == 2
+        assert (await resolver.resolve(cached_profile, did))["version"] == 2
+
+
+@pytest.mark.asyncio
+async def test_resolve_refresh_x(cached_profile):
+    resolver = CachedDIDResolver(ttl=60)
+    did = "did:example:123"
+    now = resolver.now()
+    await resolver.resolve(cached_profile, did)
+
+    with mock.patch.object(CachedDIDResolver, "now", return_value=now + 90):
+        with mock.patch.object(
+            resolver, "_resolve_cacheable", side_effect=ResolverError("failed")
+        ):
+            assert (await resolver.resolve(cached_profile, did))["version"] == 1
+            while resolver._refreshing:
+                await asyncio.sleep(0.01)
+        # the stale document is kept, and refreshed again on the next use
+        assert (await resolver.resolve(cached_profile, did))["version"] == 1
+        while resolver._refreshing:
+            await asyncio.sleep(0.01)
+        assert (await resolver.resolve(cached_profile, did))["version"] == 2
@@ -1,5 +1,6 @@
 """Test did resolver registry."""
 
+import asyncio
 from typing import Pattern
 
 import re
@@ -209,3 +210,46 @@ async def test_resolve_did_x_not_found(profile):
     resolver = DIDResolver([cowsay_resolver_not_found])
     with pytest.raises(DIDNotFound):
         await resolver.resolve(profile, py_did)
+
+
+@pytest.mark.asyncio
+async def test_resolve_many(resolver, profile):
+    results = await resolver.resolve_many(
+        profile,
+        [TEST_DID0, DID(TEST_DID1), TEST_DID0, "did:cowsay:EiDahaOGH"],
+    )
+    assert list(results) == [TEST_DID0, TEST_DID1, "did:cowsay:EiDahaOGH"]
+    assert isinstance(results[TEST_DID0], dict)
+    assert isinstance(results[TEST_DID1], dict)
+    assert isinstance(results["did:cowsay:EiDahaOGH"], DIDMethodNotSupported)
+
+
+@pytest.mark.asyncio
+async def test_resolve_many_timeout(profile):
+    class SlowResolver(MockResolver):
+        async def _resolve(self, profile, did, accept):
+            await asyncio.sleep(1)
+
+    resolver = DIDResolver([SlowResolver(["slow"]), MockResolver(["fast"], DOC)])
+    results = await resolver.resolve_many(
+        profile, ["did:slow:123", "did:fast:123"], timeout=0.01
+    )
+    assert isinstance(results["did:slow:123"], ResolverError)
+    assert results["did:fast:123"] == DOC
+
+
+@pytest.mark.asyncio
+async def test_resolve_shared_timeout(profile):
+    calls = []
+
+    class SlowResolver(MockResolver):
+        async def _resolve(self, profile, did, accept):
+            calls.append(self)
+            await asyncio.sleep(0.05)
+            raise DIDNotFound()
+
+    resolver = DIDResolver([SlowResolver(["slow"]), SlowResolver(["slow"])])
+    with pytest.raises(asyncio.TimeoutError):
+        await resolver.resolve(profile, "did:slow:123", timeout=0.08)
+    # the second resolver only has the time left by the first
+    assert len(calls) == 2
@@ -0,0 +1,79 @@
+"""Test the pooled resolver HTTP client."""
+
+from email.utils import formatdate
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from ...core.in_memory import InMemoryProfile
+from ..http import ResolverHttpClient, cache_ttl, http_get
+
+
+def test_cache_ttl():
+    assert cache_ttl({}) is None
+    assert cache_ttl({"Cache-Control": "public, max-age=300"}) == 300
+    assert cache_ttl({"Cache-Control": "max-age=300", "Age": "100"}) == 200
+    assert cache_ttl({"Cache-Control": "max-age=300", "Age": "400"}) == 0
+    assert cache_ttl({"Cache-Control": "max-age=300, s-maxage=60"}) == 60
+    assert cache_ttl({"Cache-Control": 'max-age="30"'}) == 30
+    assert cache_ttl({"Cache-Control": "max-age=soon"}) == 0
+    assert cache_ttl({"Cache-Control": "no-store, max-age=300"}) == 0
+    assert cache_ttl({"Cache-Control": "No-Cache"}) == 0
+
+
+def test_cache_ttl_expires():
+    now = 1700000000
+    expires = formatdate(now + 120, usegmt=True)
+    assert cache_ttl({"Expires": expires}, now=now) == 120
+    assert cache_ttl({"Expires": expires}, now=now + 200) == 0
+    assert cache_ttl({"Expires": "0"}, now=now) == 0
+    # Cache-Control takes precedence
+    assert cache_ttl({"Expires": expires, "Cache-Control": "max-age=10"}) == 10
+
+
+@pytest.fixture
+async def server():
+    async def handle(request):
+        return web.json_response(
+            {"path": request.path, "auth": request.headers.get("Authorization")},
+            headers={"Cache-Control": "max-age=60"},
+        )
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handle)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_client_pooled(server):
+    client = ResolverHttpClient(limit_per_host=2)
+    profile = InMemoryProfile.test_profile(bind={ResolverHttpClient: client})
+    for path in ("/one", "/two"):
+        async with http_get(
+            profile, str(server.make_url(path)), headers={"Authorization": "token"}
+        ) as response:
+            assert await response.json() == {"path": path, "auth": "token"}
+            assert cache_ttl(response.headers) == 60
+    session = client.session
+    assert session.connector.limit_per_host == 2
+    # connections are kept for the next request
+    assert session.connector._conns
+
+    await client.close()
+    assert session.closed
+    assert client.session is not session
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_http_get_unpooled(server):
+    async with http_get(None, str(server.make_url("/one"))) as response:
+        assert (await response.json())["path"] == "/one"
+    async with http_get(
+        InMemoryProfile.test_profile(), str(server.make_url("/two"))
+    ) as response:
+        assert (await response.json())["path"] == "/two"
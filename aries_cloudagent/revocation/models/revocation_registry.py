@@ -1,21 +1,16 @@
 """Classes for managing a revocation registry."""
 
-import http
 import logging
-import os
 import re
 
 from os.path import join
 from pathlib import Path
 
-from requests import Session
-from requests.exceptions import RequestException
-
 from ...indy.util import indy_client_dir
+from ...tails.error import TailsFetchError
+from ...tails.fetcher import fetch_tails
 
 from ..error import RevocationError
-import hashlib
-import base58
 
 LOGGER = logging.getLogger(__name__)
 
@@ -165,41 +160,14 @@ class RevocationRegistry:
             self.registry_id,
         )
 
-        tails_file_path = Path(self.get_receiving_tails_local_path())
-        tails_file_dir = tails_file_path.parent
-        if not tails_file_dir.exists():
-            tails_file_dir.mkdir(parents=True)
-
-        buffer_size = 65536  # should be multiple of 32 bytes for sha256
-        file_hasher = hashlib.sha256()
-        with open(tails_file_path, "wb", buffer_size) as tails_file:
-            with Session() as req_session:
-                try:
-                    resp = req_session.get(self._tails_public_uri, stream=True)
-                    # Should this directly raise an Error?
-                    if resp.status_code != http.HTTPStatus.OK:
-                        LOGGER.warning(
-                            f"Unexpected status code for tails file: {resp.status_code}"
-                        )
-                    for buf in resp.iter_content(chunk_size=buffer_size):
-                        tails_file.write(buf)
-                        file_hasher.update(buf)
-                except RequestException as rx:
-                    raise RevocationError(f"Error retrieving tails file: {rx}")
-
-        download_tails_hash = base58.b58encode(file_hasher.digest()).decode("utf-8")
-        if download_tails_hash != self.tails_hash:
-            try:
-                os.remove(tails_file_path)
-                tails_file_dir.rmdir()
-            except OSError as err:
-                LOGGER.warning(f"Could not delete invalid tails file: {err}")
-
-            raise RevocationError(
-                "The hash of the downloaded tails file does not match."
+        try:
+            self.tails_local_path = await fetch_tails(
+                self._tails_public_uri,
+                self.tails_hash,
+                self.get_receiving_tails_local_path(),
             )
-
-        self.tails_local_path = str(tails_file_path)
+        except TailsFetchError as err:
+            raise RevocationError(err.roll_up) from err
         return self.tails_local_path
 
     async def get_or_fetch_local_tails_path(self):
@@ -4,9 +4,8 @@ from copy import deepcopy
 from pathlib import Path
 from shutil import rmtree
 
-import base58
-
 from ....indy.util import indy_client_dir
+from ....tails.error import TailsFetchError
 
 from ...error import RevocationError
 
@@ -102,61 +101,25 @@ class TestRevocationRegistry(IsolatedAsyncioTestCase):
         rr_def_public["value"]["tailsLocation"] = "http://sample.ca:8088/path"
         rev_reg = RevocationRegistry.from_definition(rr_def_public, public_def=True)
 
-        more_magic = mock.MagicMock()
-        with mock.patch.object(test_module, "Session", autospec=True) as mock_session:
-            mock_session.return_value.__enter__ = mock.MagicMock(
-                return_value=more_magic
-            )
-            more_magic.get = mock.MagicMock(
-                side_effect=test_module.RequestException("Not this time")
-            )
-
-            with self.assertRaises(RevocationError) as x_retrieve:
-                await rev_reg.retrieve_tails()
-                assert x_retrieve.message.contains("Error retrieving tails file")
-
-            rmtree(TAILS_DIR, ignore_errors=True)
-
-        more_magic = mock.MagicMock()
-        with mock.patch.object(test_module, "Session", autospec=True) as mock_session:
-            mock_session.return_value.__enter__ = mock.MagicMock(
-                return_value=more_magic
-            )
-            more_magic.get = mock.MagicMock(
-                return_value=mock.MagicMock(
-                    iter_content=mock.MagicMock(side_effect=[(b"abcd1234",), (b"",)])
-                )
-            )
-
+        with mock.patch.object(
+            test_module, "fetch_tails", mock.AsyncMock()
+        ) as mock_fetch:
+            mock_fetch.side_effect = TailsFetchError("Not this time")
             with self.assertRaises(RevocationError) as x_retrieve:
                 await rev_reg.retrieve_tails()
-                assert x_retrieve.message.contains(
-                    "The hash of the downloaded tails file does not match."
-                )
+            assert "Not this time" in x_retrieve.exception.message
 
-            rmtree(TAILS_DIR, ignore_errors=True)
-
-        more_magic = mock.MagicMock()
-        with mock.patch.object(
-            test_module, "Session", autospec=True
-        ) as mock_session, mock.patch.object(
-            base58, "b58encode", mock.MagicMock()
-        ) as mock_b58enc, mock.patch.object(
-            Path, "is_file", autospec=True
-        ) as mock_is_file:
-            mock_session.return_value.__enter__ = mock.MagicMock(
-                return_value=more_magic
+            mock_fetch.side_effect = None
+            mock_fetch.return_value = rev_reg.get_receiving_tails_local_path()
+            assert (
+                await rev_reg.get_or_fetch_local_tails_path()
+                == rev_reg.get_receiving_tails_local_path()
             )
-            more_magic.get = mock.MagicMock(
-                return_value=mock.MagicMock(
-                    iter_content=mock.MagicMock(side_effect=[(b"abcd1234",), (b"",)])
-                )
-            )
-            mock_is_file.return_value = False
-
-            mock_b58enc.return_value = mock.MagicMock(
-                decode=mock.MagicMock(return_value=TAILS_HASH)
+            assert rev_reg.tails_local_path == rev_reg.get_receiving_tails_local_path()
+            mock_fetch.assert_called_with(
+                "http://sample.ca:8088/path",
+                TAILS_HASH,
+                rev_reg.get_receiving_tails_local_path(),
             )
-            await rev_reg.get_or_fetch_local_tails_path()
 
             rmtree(TAILS_DIR, ignore_errors=True)
@@ -0,0 +1,120 @@
+"""Wallet-persisted cache of holder revocation states."""
+
+import json
+from typing import NamedTuple, Optional
+
+from ..core.profile import Profile
+from ..storage.base import BaseStorage
+from ..storage.error import StorageDuplicateError, StorageNotFoundError
+from ..storage.record import StorageRecord
+
+RECORD_TYPE_REVOCATION_STATE = "revocation_state"
+MAX_STATES_PER_CREDENTIAL = 4
+
+
+class CachedRevocationState(NamedTuple):
+    """A revocation state held in the cache.
+
+    The revocation list is the one the state was created from, where the
+    registry type needs it to update the state.
+    """
+
+    timestamp: int
+    rev_state: dict
+    rev_list: Optional[dict] = None
+
+
+class RevocationStateCache:
+    """Cache holder revocation states in the wallet.
+
+    Revocation states are keyed by revocation registry, credential revocation id
+    and the timestamp of the registry state they prove non-revocation against,
+    and kept across restarts. The most recent states of a credential serve as a
+    base for updating the witness incrementally to a newer registry state.
+    """
+
+    def __init__(self, profile: Profile):
+        """Initialize the revocation state cache for a profile."""
+        self._profile = profile
+
+    @staticmethod
+    def _record_id(rev_reg_id: str, cred_rev_id: str, timestamp: int) -> str:
+        return (
+            f"{RECORD_TYPE_REVOCATION_STATE}::{rev_reg_id}::{cred_rev_id}::{timestamp}"
+        )
+
+    @staticmethod
+    def _from_record(record: StorageRecord) -> CachedRevocationState:
+        value = json.loads(record.value)
+        return CachedRevocationState(
+            int(record.tags["timestamp"]), value["rev_state"], value.get("rev_list")
+        )
+
+    async def get(
+        self, rev_reg_id: str, cred_rev_id: str, timestamp: int
+    ) -> Optional[CachedRevocationState]:
+        """Get the cached revocation state for a registry state, if any."""
+        async with self._profile.session() as session:
+            try:
+                record = await session.inject(BaseStorage).get_record(
+                    RECORD_TYPE_REVOCATION_STATE,
+                    self._record_id(rev_reg_id, str(cred_rev_id), timestamp),
+                )
+            except StorageNotFoundError:
+                return None
+        return self._from_record(record)
+
+    async def get_latest(
+        self, rev_reg_id: str, cred_rev_id: str, before: int
+    ) -> Optional[CachedRevocationState]:
+        """Get the most recent cached revocation state prior to a timestamp."""
+        async with self._profile.session() as session:
+            records = await session.inject(BaseStorage).find_all_records(
+                RECORD_TYPE_REVOCATION_STATE,
+                {"rev_reg_id": rev_reg_id, "cred_rev_id": str(cred_rev_id)},
+            )
+        records = [rec for rec in records if int(rec.tags["timestamp"]) < before]
+        if not records:
+            return None
+        return self._from_record(
+            max(records, key=lambda rec: int(rec.tags["timestamp"]))
+        )
+
+    async def store(
+        self,
+        rev_reg_id: str,
+        cred_rev_id: str,
+        timestamp: int,
+        rev_state: dict,
+        rev_list: dict = None,
+    ):
+        """Store a revocation state, dropping the oldest ones for the credential."""
+        cred_rev_id = str(cred_rev_id)
+        value = {"rev_state": rev_state}
+        if rev_list is not None:
+            value["rev_list"] = rev_list
+        record = StorageRecord(
+            RECORD_TYPE_REVOCATION_STATE,
+            json.dumps(value),
+            {
+                "rev_reg_id": rev_reg_id,
+                "cred_rev_id": cred_rev_id,
+                "timestamp": str(timestamp),
+            },
+            self._record_id(rev_reg_id, cred_rev_id, timestamp),
+        )
+        async with self._profile.transaction() as txn:
+            storage = txn.inject(BaseStorage)
+            try:
+                await storage.add_record(record)
+            except StorageDuplicateError:
+                # stored concurrently by another presentation
+                return
+            records = await storage.find_all_records(
+                RECORD_TYPE_REVOCATION_STATE,
+                {"rev_reg_id": rev_reg_id, "cred_rev_id": cred_rev_id},
+            )
+            records.sort(key=lambda rec: int(rec.tags["timestamp"]), reverse=True)
+            for stale in records[MAX_STATES_PER_CREDENTIAL:]:
+                await storage.delete_record(stale)
+            await txn.commit()
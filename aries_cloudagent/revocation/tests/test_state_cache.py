@@ -0,0 +1,46 @@
+from unittest import IsolatedAsyncioTestCase
+
+from ...core.in_memory import InMemoryProfile
+from .. import state_cache as test_module
+from ..state_cache import RevocationStateCache
+
+REV_REG_ID = "NcYxiDXkpYi6ov5FcYDi1e:4:NcYxiDXkpYi6ov5FcYDi1e:3:CL:12:tag:CL_ACCUM:0"
+
+
+class TestRevocationStateCache(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.profile = InMemoryProfile.test_profile()
+        self.cache = RevocationStateCache(self.profile)
+
+    async def test_store_get(self):
+        assert await self.cache.get(REV_REG_ID, "1", 100) is None
+        assert await self.cache.get_latest(REV_REG_ID, "1", 100) is None
+
+        await self.cache.store(REV_REG_ID, "1", 100, {"timestamp": 100})
+        await self.cache.store(
+            REV_REG_ID, 1, 200, {"timestamp": 200}, rev_list={"timestamp": 200}
+        )
+        await self.cache.store(REV_REG_ID, "2", 150, {"timestamp": 150})
+        # stored concurrently
+        await self.cache.store(REV_REG_ID, "1", 100, {"timestamp": 100})
+
+        cached = await self.cache.get(REV_REG_ID, "1", 100)
+        assert cached == (100, {"timestamp": 100}, None)
+        assert await self.cache.get(REV_REG_ID, "1", 150) is None
+        assert await self.cache.get(REV_REG_ID, "1", 200) == (
+            200,
+            {"timestamp": 200},
+            {"timestamp": 200},
+        )
+
+        assert await self.cache.get_latest(REV_REG_ID, "1", 100) is None
+        assert (await self.cache.get_latest(REV_REG_ID, 1, 199)).timestamp == 100
+        assert (await self.cache.get_latest(REV_REG_ID, "1", 300)).timestamp == 200
+
+    async def test_store_prune(self):
+        count = test_module.MAX_STATES_PER_CREDENTIAL + 2
+        for timestamp in range(count):
+            await self.cache.store(REV_REG_ID, "1", timestamp, {})
+        for timestamp in range(count):
+            cached = await self.cache.get(REV_REG_ID, "1", timestamp)
+            assert (cached is not None) == (timestamp >= 2)
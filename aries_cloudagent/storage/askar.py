@@ -1,6 +1,6 @@
 """Aries-Askar implementation of BaseStorage interface."""
 
-from typing import Mapping, Sequence
+from typing import AsyncIterator, Mapping, Optional, Sequence
 
 from aries_askar import AskarError, AskarErrorCode, Session
 
@@ -11,6 +11,7 @@ from .base import (
     BaseStorage,
     BaseStorageSearch,
     BaseStorageSearchSession,
+    RecordPage,
     validate_record,
 )
 from .error import (
@@ -191,6 +192,93 @@ class AskarStorage(BaseStorage):
             )
         return results
 
+    async def scan_records(
+        self, type_filter: str, tag_query: Mapping = None
+    ) -> AsyncIterator[StorageRecord]:
+        """Stream the records matching a type filter and tag query from the store.
+
+        Args:
+            type_filter: Filter string
+            tag_query: Tags to query
+
+        """
+        try:
+            async for row in self._session.profile.store.scan(
+                type_filter,
+                tag_query,
+                profile=self._session.profile.profile_id,
+            ):
+                yield StorageRecord(
+                    type=row.category,
+                    id=row.name,
+                    value=None if row.value is None else row.value.decode("utf-8"),
+                    tags=row.tags,
+                )
+        except AskarError as err:
+            raise StorageSearchError("Error when fetching search results") from err
+
+    async def find_paginated_records(
+        self,
+        type_filter: str,
+        tag_query: Mapping = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+    ) -> Sequence[StorageRecord]:
+        """Retrieve a page of records matching a type filter and tag query.
+
+        Records in storage order are paged by the store itself. Ordering by a tag
+        value, or in reverse, streams the matching records while retaining at
+        most `offset + limit` of them.
+
+        Args:
+            type_filter: Filter string
+            tag_query: Tags to query
+            limit: The maximum number of records to return
+            offset: The number of records to skip
+            order_by: The name of a tag to order the records by
+            descending: Whether to return the records in reverse order
+
+        """
+        page = RecordPage(limit, offset, order_by, descending)
+        scan_args = {}
+        if not page.ordered:
+            # the store applies the offset and limit itself
+            page = RecordPage(limit)
+            scan_args = {"offset": offset, "limit": limit}
+        try:
+            async for row in self._session.profile.store.scan(
+                type_filter,
+                tag_query,
+                profile=self._session.profile.profile_id,
+                **scan_args,
+            ):
+                page.add(
+                    StorageRecord(
+                        type=row.category,
+                        id=row.name,
+                        value=None if row.value is None else row.value.decode("utf-8"),
+                        tags=row.tags,
+                    )
+                )
+        except AskarError as err:
+            raise StorageSearchError("Error when fetching search results") from err
+        return page.records
+
+    async def count_records(self, type_filter: str, tag_query: Mapping = None) -> int:
+        """Count the records matching a type filter and tag query.
+
+        Args:
+            type_filter: Filter string
+            tag_query: Tags to query
+
+        """
+        try:
+            return await self._session.handle.count(type_filter, tag_query)
+        except AskarError as err:
+            raise StorageError("Error when counting storage records") from err
+
     async def delete_all_records(
         self,
         type_filter: str,
@@ -1,7 +1,8 @@
 """Abstract base classes for non-secrets storage."""
 
+import heapq
 from abc import ABC, abstractmethod
-from typing import Mapping, Sequence
+from typing import AsyncIterator, Iterable, List, Mapping, Optional, Sequence
 
 from .error import StorageError, StorageDuplicateError, StorageNotFoundError
 from .record import StorageRecord
@@ -22,6 +23,116 @@ def validate_record(record: StorageRecord, *, delete=False):
         raise StorageError("Record must have a non-empty value")
 
 
+class _Reversed:
+    """Sort key wrapper inverting the natural order."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key):
+        """Wrap the sort key."""
+        self.key = key
+
+    def __lt__(self, other: "_Reversed") -> bool:
+        """Compare in reverse."""
+        return other.key < self.key
+
+
+class RecordPage:
+    """Select one page from a stream of records.
+
+    At most `offset + limit` records are held at any time, so a page can be
+    selected from an arbitrarily large result set in bounded memory. Records
+    keep the order in which they are added unless `order_by` names a tag to
+    sort on; records without the tag sort after those having it.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        offset: int = 0,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+    ):
+        """Initialize the `RecordPage` instance.
+
+        Args:
+            limit: The maximum number of records in the page
+            offset: The number of leading records to skip
+            order_by: The name of the tag to order records by
+            descending: Whether to reverse the sort order
+
+        """
+        self.limit = limit
+        self.offset = offset
+        self.order_by = order_by
+        self.descending = descending
+        self._end = offset + limit
+        self._heap = []
+        self._rows = []
+        self._seq = 0
+
+    @property
+    def ordered(self) -> bool:
+        """Check whether records are reordered, requiring the full stream."""
+        return bool(self.order_by or self.descending)
+
+    def add(self, record: StorageRecord, item=None) -> bool:
+        """Offer a record for the page.
+
+        Args:
+            record: The storage record, used to determine the sort order
+            item: The value to return for this record, if not the record itself
+
+        Returns:
+            False once no further record can affect the page
+
+        """
+        seq = self._seq
+        self._seq += 1
+        item = record if item is None else item
+        if not self.ordered:
+            if self.offset <= seq < self._end:
+                self._rows.append(item)
+            return seq + 1 < self._end
+        if self.order_by:
+            tag = (record.tags or {}).get(self.order_by)
+            key = (tag is None, tag or "", seq)
+            if self.descending:
+                key = (tag is not None, tag or "", seq)
+        else:
+            key = (seq,)
+        # keep the `end` first records in a heap topped by the last of them
+        entry = (key if self.descending else _Reversed(key), item)
+        if len(self._heap) < self._end:
+            heapq.heappush(self._heap, entry)
+        elif self._end:
+            heapq.heappushpop(self._heap, entry)
+        return True
+
+    def extend(self, records: Iterable[StorageRecord]) -> bool:
+        """Offer a sequence of records for the page."""
+        for record in records:
+            if not self.add(record):
+                return False
+        return True
+
+    @property
+    def complete(self) -> bool:
+        """Check whether no further record can affect the page."""
+        return not self.ordered and self._seq >= self._end
+
+    @property
+    def records(self) -> List:
+        """Accessor for the selected records, in page order."""
+        if not self.ordered:
+            return list(self._rows)
+        if self.descending:
+            rows = sorted(self._heap, reverse=True)
+        else:
+            rows = sorted(self._heap, key=lambda entry: entry[0].key)
+        return [item for (_, item) in rows[self.offset :]]
+
+
 class BaseStorage(ABC):
     """Abstract stored records interface."""
 
@@ -98,6 +209,58 @@ class BaseStorage(ABC):
     ):
         """Retrieve all records matching a particular type filter and tag query."""
 
+    async def scan_records(
+        self, type_filter: str, tag_query: Mapping = None
+    ) -> AsyncIterator[StorageRecord]:
+        """Iterate over the records matching a type filter and tag query.
+
+        Backends able to stream results from the store override this, so that
+        the matching records are not all loaded at once.
+
+        Args:
+            type_filter: Filter string
+            tag_query: Tags to query
+
+        """
+        for record in await self.find_all_records(type_filter, tag_query):
+            yield record
+
+    async def find_paginated_records(
+        self,
+        type_filter: str,
+        tag_query: Mapping = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+    ) -> Sequence[StorageRecord]:
+        """Retrieve a page of records matching a type filter and tag query.
+
+        Records are returned in storage order unless ordered by a tag value.
+
+        Args:
+            type_filter: Filter string
+            tag_query: Tags to query
+            limit: The maximum number of records to return
+            offset: The number of records to skip
+            order_by: The name of a tag to order the records by
+            descending: Whether to return the records in reverse order
+
+        """
+        page = RecordPage(limit, offset, order_by, descending)
+        page.extend(await self.find_all_records(type_filter, tag_query))
+        return page.records
+
+    async def count_records(self, type_filter: str, tag_query: Mapping = None) -> int:
+        """Count the records matching a type filter and tag query.
+
+        Args:
+            type_filter: Filter string
+            tag_query: Tags to query
+
+        """
+        return len(await self.find_all_records(type_filter, tag_query))
+
     @abstractmethod
     async def delete_all_records(
         self,
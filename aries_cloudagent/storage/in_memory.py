@@ -1,6 +1,6 @@
 """Basic in-memory storage implementation (non-wallet)."""
 
-from typing import Mapping, Sequence
+from typing import Mapping, Optional, Sequence
 
 from ..core.in_memory import InMemoryProfile
 
@@ -9,6 +9,7 @@ from .base import (
     BaseStorage,
     BaseStorageSearch,
     BaseStorageSearchSession,
+    RecordPage,
     validate_record,
 )
 from .error import (
@@ -115,6 +116,41 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
                 results.append(record)
         return results
 
+    async def count_records(self, type_filter: str, tag_query: Mapping = None) -> int:
+        """Count the records matching a type filter and tag query."""
+        return sum(
+            1
+            for record in self.profile.records.values()
+            if record.type == type_filter and tag_query_match(record.tags, tag_query)
+        )
+
+    async def find_paginated_records(
+        self,
+        type_filter: str,
+        tag_query: Mapping = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+    ) -> Sequence[StorageRecord]:
+        """Retrieve a page of records matching a type filter and tag query.
+
+        Args:
+            type_filter: Filter string
+            tag_query: Tags to query
+            limit: The maximum number of records to return
+            offset: The number of records to skip
+            order_by: The name of a tag to order the records by
+            descending: Whether to return the records in reverse order
+
+        """
+        page = RecordPage(limit, offset, order_by, descending)
+        for record in self.profile.records.values():
+            if record.type == type_filter and tag_query_match(record.tags, tag_query):
+                if not page.add(record):
+                    break
+        return page.records
+
     async def delete_all_records(
         self,
         type_filter: str,
@@ -133,6 +133,75 @@ class TestInMemoryStorage:
         assert found.value == record.value
         assert found.tags == record.tags
 
+    @pytest.mark.asyncio
+    async def test_find_paginated_records(self, store, record_factory):
+        records = [record_factory({"idx": f"{i:02d}"}) for i in range(10)]
+        for record in records:
+            await store.add_record(record)
+        # storage order is backend specific
+        ids = [row.id for row in await store.find_paginated_records("TYPE", limit=100)]
+        assert sorted(ids) == sorted(record.id for record in records)
+
+        rows = await store.find_paginated_records("TYPE", {}, limit=3, offset=2)
+        assert [row.id for row in rows] == ids[2:5]
+
+        rows = await store.find_paginated_records("TYPE", {}, limit=5, offset=8)
+        assert [row.id for row in rows] == ids[8:]
+
+        rows = await store.find_paginated_records(
+            "TYPE", {}, limit=3, offset=1, descending=True
+        )
+        assert [row.id for row in rows] == ids[::-1][1:4]
+
+        rows = await store.find_paginated_records(
+            "TYPE", {"idx": {"$in": ["01", "03", "05"]}}, limit=10
+        )
+        assert [row.id for row in rows] == [
+            row_id for row_id in ids if row_id in {r.id for r in records[1:6:2]}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_find_paginated_records_order_by(self, store, record_factory):
+        records = [record_factory({"name": name}) for name in ("c", "a", "d", "b", "a")]
+        records.append(record_factory())
+        for record in records:
+            await store.add_record(record)
+
+        rows = await store.find_paginated_records("TYPE", limit=10, order_by="name")
+        assert [row.tags.get("name") for row in rows] == [
+            "a",
+            "a",
+            "b",
+            "c",
+            "d",
+            None,
+        ]
+        assert {rows[0].id, rows[1].id} == {records[1].id, records[4].id}
+
+        rows = await store.find_paginated_records(
+            "TYPE", limit=2, offset=1, order_by="name", descending=True
+        )
+        assert [row.tags.get("name") for row in rows] == ["c", "b"]
+
+    @pytest.mark.asyncio
+    async def test_scan_records(self, store, record_factory):
+        records = [record_factory({"tag": tag}) for tag in ("one", "two", "two")]
+        for record in records:
+            await store.add_record(record)
+        ids = [row.id async for row in store.scan_records("TYPE")]
+        assert sorted(ids) == sorted(record.id for record in records)
+        ids = [row.id async for row in store.scan_records("TYPE", {"tag": "one"})]
+        assert ids == [records[0].id]
+
+    @pytest.mark.asyncio
+    async def test_count_records(self, store, record_factory):
+        assert await store.count_records("TYPE") == 0
+        for tag in ("one", "two", "two"):
+            await store.add_record(record_factory({"tag": tag}))
+        assert await store.count_records("TYPE") == 3
+        assert await store.count_records("TYPE", {"tag": "two"}) == 2
+        assert await store.count_records("OTHER") == 0
+
     @pytest.mark.asyncio
     async def test_delete_all(self, store, record_factory):
         record = record_factory({"tag": "one"})
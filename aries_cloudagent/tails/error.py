@@ -5,3 +5,7 @@ from ..core.error import BaseError
 
 class TailsServerNotConfiguredError(BaseError):
     """Error indicating the tails server plugin hasn't been configured."""
+
+
+class TailsFetchError(BaseError):
+    """Error raised when a tails file cannot be retrieved."""
@@ -0,0 +1,164 @@
+"""Asynchronous tails file retrieval."""
+
+import asyncio
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Dict
+
+import base58
+from aiohttp import ClientError, ClientSession, ClientTimeout
+
+from ..utils.repeat import RepeatSequence
+from .error import TailsFetchError
+
+LOGGER = logging.getLogger(__name__)
+
+CHUNK_SIZE = 65536  # should be multiple of 32 bytes for sha256
+
+# downloads in progress, by local tails file path
+_PENDING: Dict[str, asyncio.Future] = {}
+
+
+def tails_file_hash(data_hasher: "hashlib._Hash") -> str:
+    """Encode a tails file sha256 digest as it appears in a revocation registry."""
+    return base58.b58encode(data_hasher.digest()).decode("utf-8")
+
+
+def _hash_partial_file(path: Path) -> "hashlib._Hash":
+    """Hash the content downloaded so far."""
+    hasher = hashlib.sha256()
+    with open(path, "rb") as partial:
+        for chunk in iter(lambda: partial.read(CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher
+
+
+async def _download(
+    session: ClientSession,
+    url: str,
+    partial_path: Path,
+    request_timeout: float,
+) -> "hashlib._Hash":
+    """Stream the tails file to the partial path, resuming from any prior content.
+
+    Returns:
+        The hasher, updated with the full content of the partial file
+
+    """
+    offset = partial_path.stat().st_size if partial_path.is_file() else 0
+    if offset:
+        hasher = await asyncio.get_event_loop().run_in_executor(
+            None, _hash_partial_file, partial_path
+        )
+        headers = {"Range": f"bytes={offset}-"}
+    else:
+        hasher = hashlib.sha256()
+        headers = {}
+
+    timeout = ClientTimeout(total=None, sock_connect=request_timeout)
+    async with session.get(url, headers=headers, timeout=timeout) as response:
+        if response.status == 416 and offset:
+            # nothing left to fetch: the partial file holds the full content
+            return hasher
+        if response.status not in (200, 206):
+            raise TailsFetchError(
+                f"Unexpected status code for tails file: {response.status}"
+            )
+        mode = "ab"
+        if response.status == 200 and offset:
+            # the server ignored the range request: start over
+            LOGGER.debug("Range request not honored, restarting tails download")
+            hasher = hashlib.sha256()
+            mode = "wb"
+        with open(partial_path, mode, CHUNK_SIZE) as tails_file:
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                tails_file.write(chunk)
+                hasher.update(chunk)
+    return hasher
+
+
+async def _fetch(
+    url: str,
+    tails_hash: str,
+    path: Path,
+    max_attempts: int,
+    interval: float,
+    backoff: float,
+    request_timeout: float,
+) -> str:
+    """Download, verify and move a tails file into place."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = path.with_name(path.name + ".part")
+
+    async with ClientSession(trust_env=True) as session:
+        async for attempt in RepeatSequence(max_attempts, interval, backoff):
+            try:
+                hasher = await _download(session, url, partial_path, request_timeout)
+                break
+            except (ClientError, asyncio.TimeoutError, TailsFetchError) as err:
+                LOGGER.warning("Error retrieving tails file from %s: %s", url, err)
+                if attempt.final:
+                    raise TailsFetchError(
+                        f"Error retrieving tails file: {err}"
+                    ) from err
+
+    if tails_file_hash(hasher) != tails_hash:
+        try:
+            os.remove(partial_path)
+        except OSError as err:
+            LOGGER.warning(f"Could not delete invalid tails file: {err}")
+        raise TailsFetchError("The hash of the downloaded tails file does not match.")
+
+    os.replace(partial_path, path)
+    return str(path)
+
+
+async def fetch_tails(
+    url: str,
+    tails_hash: str,
+    path: str,
+    *,
+    max_attempts: int = 5,
+    interval: float = 1.0,
+    backoff: float = 0.25,
+    request_timeout: float = 10.0,
+) -> str:
+    """Retrieve a tails file without blocking the event loop.
+
+    The file is streamed to a partial file next to `path` while being hashed,
+    and moved into place once its hash is verified. An interrupted download is
+    resumed with an HTTP range request on the next attempt. Concurrent calls
+    for the same path share a single download.
+
+    Args:
+        url: the public URI of the tails file
+        tails_hash: the expected (base58-encoded sha256) tails file hash
+        path: the local path to store the tails file
+        max_attempts: the maximum number of download attempts
+        interval: the interval between attempts, in seconds
+        backoff: the backoff interval, in seconds
+        request_timeout: the connection timeout, in seconds
+
+    Returns:
+        The local path of the tails file
+
+    """
+    pending = _PENDING.get(path)
+    if not pending:
+        pending = asyncio.ensure_future(
+            _fetch(
+                url,
+                tails_hash,
+                Path(path),
+                max_attempts,
+                interval,
+                backoff,
+                request_timeout,
+            )
+        )
+        _PENDING[path] = pending
+        pending.add_done_callback(lambda _: _PENDING.pop(path, None))
+    # a cancelled caller must not cancel the download shared with other callers
+    return await asyncio.shield(pending)
@@ -0,0 +1,139 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+
+import base58
+from aiohttp import web
+from aiohttp.test_utils import AioHTTPTestCase
+
+from ..error import TailsFetchError
+from ..fetcher import fetch_tails
+
+TAILS_CONTENT = bytes(range(256)) * 1024
+TAILS_HASH = base58.b58encode(hashlib.sha256(TAILS_CONTENT).digest()).decode()
+
+
+class TestFetchTails(AioHTTPTestCase):
+    async def setUpAsync(self):
+        self.calls = 0
+        self.ranges = []
+        self.fail_calls = 0
+        self.tails_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tails_dir.name, "reg", TAILS_HASH)
+        await super().setUpAsync()
+
+    async def tearDownAsync(self):
+        self.tails_dir.cleanup()
+        await super().tearDownAsync()
+
+    async def get_application(self):
+        app = web.Application()
+        app.add_routes(
+            [
+                web.get("/tails", self.tails_route),
+                web.get("/no-range", self.no_range_route),
+                web.get("/interrupted", self.interrupted_route),
+                web.get("/fail", self.fail_route),
+            ]
+        )
+        return app
+
+    async def tails_route(self, request):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        header = request.headers.get("Range")
+        self.ranges.append(header)
+        if header:
+            start = int(header[len("bytes=") :].rstrip("-"))
+            if start >= len(TAILS_CONTENT):
+                raise web.HTTPRequestRangeNotSatisfiable()
+            return web.Response(body=TAILS_CONTENT[start:], status=206)
+        return web.Response(body=TAILS_CONTENT)
+
+    async def no_range_route(self, request):
+        self.calls += 1
+        return web.Response(body=TAILS_CONTENT)
+
+    async def interrupted_route(self, request):
+        self.calls += 1
+        header = request.headers.get("Range")
+        self.ranges.append(header)
+        if header:
+            start = int(header[len("bytes=") :].rstrip("-"))
+            return web.Response(body=TAILS_CONTENT[start:], status=206)
+        response = web.StreamResponse()
+        response.content_length = len(TAILS_CONTENT)
+        await response.prepare(request)
+        await response.write(TAILS_CONTENT[:1000])
+        # drop the connection before the declared length is sent
+        request.transport.close()
+        return response
+
+    async def fail_route(self, request):
+        self.fail_calls += 1
+        raise web.HTTPNotFound()
+
+    async def fetch(self, route: str, tails_hash: str = TAILS_HASH, **kwargs):
+        return await fetch_tails(
+            self.client.make_url(route),
+            tails_hash,
+            self.path,
+            interval=0,
+            **kwargs,
+        )
+
+    def write_partial(self, content: bytes):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path + ".part", "wb") as partial:
+            partial.write(content)
+
+    async def test_fetch(self):
+        assert await self.fetch("/tails") == self.path
+        with open(self.path, "rb") as tails_file:
+            assert tails_file.read() == TAILS_CONTENT
+        assert not os.path.exists(self.path + ".part")
+        assert self.ranges == [None]
+
+    async def test_fetch_single_flight(self):
+        results = await asyncio.gather(*[self.fetch("/tails") for _ in range(5)])
+        assert results == [self.path] * 5
+        assert self.calls == 1
+
+    async def test_fetch_resume_interrupted(self):
+        assert await self.fetch("/interrupted") == self.path
+        assert self.calls == 2
+        assert self.ranges == [None, "bytes=1000-"]
+        with open(self.path, "rb") as tails_file:
+            assert tails_file.read() == TAILS_CONTENT
+
+    async def test_fetch_resume_partial(self):
+        self.write_partial(TAILS_CONTENT[:5000])
+        assert await self.fetch("/tails") == self.path
+        assert self.ranges == ["bytes=5000-"]
+        with open(self.path, "rb") as tails_file:
+            assert tails_file.read() == TAILS_CONTENT
+
+    async def test_fetch_partial_complete(self):
+        self.write_partial(TAILS_CONTENT)
+        assert await self.fetch("/tails") == self.path
+        assert self.ranges == [f"bytes={len(TAILS_CONTENT)}-"]
+
+    async def test_fetch_range_not_honored(self):
+        self.write_partial(b"stale content")
+        assert await self.fetch("/no-range") == self.path
+        with open(self.path, "rb") as tails_file:
+            assert tails_file.read() == TAILS_CONTENT
+
+    async def test_fetch_hash_mismatch(self):
+        with self.assertRaises(TailsFetchError) as context:
+            await self.fetch("/tails", tails_hash="not-the-hash")
+        assert "does not match" in context.exception.message
+        assert not os.path.exists(self.path)
+        assert not os.path.exists(self.path + ".part")
+
+    async def test_fetch_fail(self):
+        with self.assertRaises(TailsFetchError):
+            await self.fetch("/fail", max_attempts=2)
+        assert self.fail_calls == 2
+        assert not os.path.exists(self.path)
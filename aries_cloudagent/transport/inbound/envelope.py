@@ -0,0 +1,69 @@
+"""Inbound wire message envelope, parsed once and shared by the inbound pipeline."""
+
+import json
+from functools import cached_property
+from typing import List, Union
+
+from ...utils.jwe import IDENT_PROTECTED, JweEnvelope, decode_protected
+from ..error import WireFormatParseError
+
+
+class InboundEnvelope:
+    """A received wire message.
+
+    The JSON body is parsed once, on first use, and the protected headers and
+    the JWE structure of a packed message are decoded only when needed. Relay
+    routing, unpacking and the message receipt all work from the same instance.
+    """
+
+    def __init__(self, raw: Union[str, bytes]):
+        """Initialize the envelope for a raw wire message."""
+        self.raw = raw
+
+    @cached_property
+    def message(self) -> dict:
+        """Accessor for the parsed JSON body of the message.
+
+        Raises:
+            WireFormatParseError: If the body is empty or not a JSON object
+
+        """
+        if not self.raw:
+            raise WireFormatParseError("Message body is empty")
+        try:
+            message = json.loads(self.raw)
+        except ValueError:
+            raise WireFormatParseError("Message JSON parsing failed")
+        if not isinstance(message, dict):
+            raise WireFormatParseError("Message JSON result is not an object")
+        return message
+
+    @property
+    def is_packed(self) -> bool:
+        """Check whether the message is packed, as detected by the absence of @type."""
+        return "@type" not in self.message
+
+    @cached_property
+    def protected(self) -> dict:
+        """Accessor for the decoded protected headers of a packed message."""
+        return decode_protected(self.message[IDENT_PROTECTED])
+
+    @cached_property
+    def recipient_keys(self) -> List[str]:
+        """Accessor for the recipient key identifiers of a packed message."""
+        return [
+            recipient["header"]["kid"] for recipient in self.protected["recipients"]
+        ]
+
+    @cached_property
+    def jwe(self) -> JweEnvelope:
+        """Accessor for the JWE structure of a packed message.
+
+        Raises:
+            ValidationError: If the message is not a valid JWE
+
+        """
+        protected_b64 = self.message.get(IDENT_PROTECTED)
+        return JweEnvelope.deserialize(
+            self.message, self.protected if isinstance(protected_b64, str) else None
+        )
@@ -13,6 +13,7 @@ from ..error import WireFormatError
 from ..outbound.message import OutboundMessage
 from ..wire_format import BaseWireFormat
 
+from .envelope import InboundEnvelope
 from .message import InboundMessage
 from .receipt import MessageReceipt
 
@@ -157,7 +158,9 @@ class InboundSession:
         """Check if a response is currently buffered."""
         return bool(self.response_buffer)
 
-    async def handle_relay_context(self, payload_enc: Union[str, bytes]):
+    async def handle_relay_context(
+        self, payload_enc: Union[str, bytes, InboundEnvelope]
+    ):
         """Update the session profile based on the recipients of an incoming message."""
         multitenant_mgr = self.profile.context.inject(BaseMultitenantManager)
 
@@ -200,7 +203,9 @@ class InboundSession:
         if mode == MessageReceipt.REPLY_MODE_THREAD:
             self.add_reply_thread_ids(receipt.thread_id)
 
-    async def parse_inbound(self, payload_enc: Union[str, bytes]) -> InboundMessage:
+    async def parse_inbound(
+        self, payload_enc: Union[str, bytes, InboundEnvelope]
+    ) -> InboundMessage:
         """Convert a message payload and to an inbound message."""
         session = await self.profile.session()
         payload, receipt = await self.wire_format.parse_message(session, payload_enc)
@@ -213,11 +218,17 @@ class InboundSession:
 
     async def receive(self, payload_enc: Union[str, bytes]) -> InboundMessage:
         """Receive a new message payload and dispatch the message."""
+        # relay routing and parsing share the envelope, parsed at most once
+        payload = (
+            self.wire_format.parse_envelope(payload_enc)
+            if self.wire_format
+            else payload_enc
+        )
         if self._check_relay_context:
-            await self.handle_relay_context(payload_enc)
+            await self.handle_relay_context(payload)
             self._check_relay_context = False
 
-        message = await self.parse_inbound(payload_enc)
+        message = await self.parse_inbound(payload)
         self.receive_inbound(message)
         return message
 
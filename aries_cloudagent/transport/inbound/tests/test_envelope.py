@@ -0,0 +1,72 @@
+import json
+from unittest import TestCase, mock
+
+from marshmallow import ValidationError
+
+from ....utils.jwe import b64url
+from ...error import WireFormatParseError
+from .. import envelope as test_module
+from ..envelope import InboundEnvelope
+
+PROTECTED = {
+    "enc": "xchacha20poly1305_ietf",
+    "typ": "JWM/1.0",
+    "alg": "Anoncrypt",
+    "recipients": [
+        {"encrypted_key": b64url(b"key 1"), "header": {"kid": "verkey1"}},
+        {"encrypted_key": b64url(b"key 2"), "header": {"kid": "verkey2"}},
+    ],
+}
+PACKED = json.dumps(
+    {
+        "protected": b64url(json.dumps(PROTECTED)),
+        "iv": b64url(b"iv"),
+        "ciphertext": b64url(b"ciphertext"),
+        "tag": b64url(b"tag"),
+    }
+)
+
+
+class TestInboundEnvelope(TestCase):
+    def test_packed(self):
+        envelope = InboundEnvelope(PACKED)
+        assert envelope.raw is PACKED
+        assert envelope.is_packed
+        assert envelope.protected == PROTECTED
+        assert envelope.recipient_keys == ["verkey1", "verkey2"]
+
+        jwe = envelope.jwe
+        assert jwe.protected["alg"] == "Anoncrypt"
+        assert list(jwe.recipient_key_ids) == ["verkey1", "verkey2"]
+        assert jwe.ciphertext == b"ciphertext"
+        # the shared protected headers are left intact
+        assert "recipients" in envelope.protected
+
+    def test_parse_once(self):
+        envelope = InboundEnvelope(PACKED)
+        with mock.patch.object(
+            test_module.json, "loads", wraps=json.loads
+        ) as mock_loads:
+            envelope.recipient_keys
+            envelope.jwe
+            assert envelope.is_packed
+        # the body and the protected headers
+        assert mock_loads.call_count == 2
+
+    def test_plain(self):
+        envelope = InboundEnvelope(b'{"@type": "test", "@id": "1"}')
+        assert not envelope.is_packed
+        assert envelope.message == {"@type": "test", "@id": "1"}
+        with self.assertRaises(KeyError):
+            envelope.recipient_keys
+        with self.assertRaises(ValidationError):
+            envelope.jwe
+
+    def test_invalid(self):
+        for raw in (None, "", "1", "[]", "{..."):
+            with self.assertRaises(WireFormatParseError):
+                InboundEnvelope(raw).message
+
+        envelope = InboundEnvelope(json.dumps({"protected": b64url("[]")}))
+        with self.assertRaises(ValidationError):
+            envelope.protected
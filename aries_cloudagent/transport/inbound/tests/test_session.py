@@ -146,6 +146,36 @@ class TestInboundSession(IsolatedAsyncioTestCase):
             receive.assert_called_once_with(encode.return_value)
             assert result is encode.return_value
 
+    async def test_receive_envelope(self):
+        self.multitenant_mgr = mock.MagicMock(MultitenantManager, autospec=True)
+        self.multitenant_mgr.get_wallets_by_message = mock.CoroutineMock(
+            side_effect=ValueError("no such wallet")
+        )
+        self.profile.context.injector.bind_instance(
+            BaseMultitenantManager, self.multitenant_mgr
+        )
+        self.profile.context.update_settings({"multitenant.enabled": True})
+        test_wire_format = mock.MagicMock()
+
+        sess = InboundSession(
+            profile=self.profile,
+            inbound_handler=None,
+            session_id=None,
+            wire_format=test_wire_format,
+        )
+        test_msg = mock.MagicMock()
+
+        with mock.patch.object(
+            sess, "parse_inbound", mock.CoroutineMock()
+        ) as encode, mock.patch.object(sess, "receive_inbound", mock.MagicMock()):
+            await sess.receive(test_msg)
+            envelope = test_wire_format.parse_envelope.return_value
+            test_wire_format.parse_envelope.assert_called_once_with(test_msg)
+            self.multitenant_mgr.get_wallets_by_message.assert_awaited_once_with(
+                envelope, test_wire_format
+            )
+            encode.assert_awaited_once_with(envelope)
+
     async def test_receive_no_wallet_found(self):
         self.multitenant_mgr = mock.MagicMock(MultitenantManager, autospec=True)
         self.multitenant_mgr.get_wallets_by_message = mock.CoroutineMock(
@@ -37,6 +37,7 @@ class QueuedOutboundMessage:
         self.payload: Union[str, bytes] = None
         self.retries = None
         self.retry_at: float = None
+        self.failed_attempts = 0
         self.state = self.STATE_NEW
         self.target = target
         self.task: asyncio.Task = None
@@ -124,3 +125,7 @@ class OutboundTransportRegistrationError(OutboundTransportError):
 
 class OutboundDeliveryError(OutboundTransportError):
     """Base exception when a message cannot be delivered via an outbound transport."""
+
+
+class OutboundCircuitOpenError(OutboundDeliveryError):
+    """Delivery skipped because the endpoint has repeatedly failed."""
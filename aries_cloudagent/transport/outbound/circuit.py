@@ -0,0 +1,87 @@
+"""Circuit breaker for outbound delivery."""
+
+import time
+from typing import Dict, Optional
+
+from yarl import URL
+
+
+def endpoint_origin(endpoint: str) -> str:
+    """Get the origin (scheme, host and port) of an endpoint URL."""
+    try:
+        return str(URL(endpoint).origin())
+    except ValueError:
+        return endpoint
+
+
+class Circuit:
+    """The delivery state of a single endpoint origin."""
+
+    def __init__(self):
+        """Initialize the circuit instance."""
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_at: Optional[float] = None
+
+
+class CircuitBreaker:
+    """Suspend delivery to endpoints after repeated consecutive failures.
+
+    A circuit opens once an endpoint origin has failed `failure_threshold`
+    times in a row, and delivery attempts are rejected while it is open. After
+    `reset_timeout` seconds a single trial attempt is allowed through: the
+    circuit closes when it succeeds and reopens when it fails.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """Initialize the circuit breaker instance.
+
+        Args:
+            failure_threshold: the number of consecutive failures which opens a
+                circuit, or 0 to disable the circuit breaker
+            reset_timeout: the number of seconds before a trial attempt is allowed
+
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._circuits: Dict[str, Circuit] = {}
+
+    @classmethod
+    def now(cls) -> float:
+        """Fetch a standard timer value."""
+        return time.perf_counter()
+
+    def is_open(self, origin: str) -> bool:
+        """Check whether delivery to an endpoint origin is suspended."""
+        circuit = self._circuits.get(origin)
+        return bool(circuit and circuit.opened_at is not None)
+
+    def allow(self, origin: str) -> bool:
+        """Check whether a delivery attempt to an endpoint origin may proceed."""
+        circuit = self._circuits.get(origin)
+        if not circuit or circuit.opened_at is None:
+            return True
+        now = self.now()
+        if now - circuit.opened_at < self.reset_timeout:
+            return False
+        if circuit.trial_at is not None and now - circuit.trial_at < self.reset_timeout:
+            # a trial attempt is already in progress
+            return False
+        circuit.trial_at = now
+        return True
+
+    def record_success(self, origin: str):
+        """Record a successful delivery, closing the circuit."""
+        self._circuits.pop(origin, None)
+
+    def record_failure(self, origin: str):
+        """Record a failed delivery, opening the circuit past the threshold."""
+        if not self.failure_threshold:
+            return
+        circuit = self._circuits.get(origin)
+        if not circuit:
+            circuit = self._circuits[origin] = Circuit()
+        circuit.failures += 1
+        circuit.trial_at = None
+        if circuit.failures >= self.failure_threshold:
+            circuit.opened_at = self.now()
@@ -1,16 +1,22 @@
 """Http outbound transport."""
 
+import asyncio
 import logging
 from typing import Union
 
-from aiohttp import ClientSession, DummyCookieJar, TCPConnector
+from aiohttp import ClientError, ClientSession, DummyCookieJar, TCPConnector
 
 from ...core.profile import Profile
 
 from ..stats import StatsTracer
 from ..wire_format import DIDCOMM_V0_MIME_TYPE, DIDCOMM_V1_MIME_TYPE
 
-from .base import BaseOutboundTransport, OutboundTransportError
+from .base import (
+    BaseOutboundTransport,
+    OutboundCircuitOpenError,
+    OutboundTransportError,
+)
+from .circuit import CircuitBreaker, endpoint_origin
 
 
 class HttpTransport(BaseOutboundTransport):
@@ -19,32 +25,65 @@ class HttpTransport(BaseOutboundTransport):
     schemes = ("http", "https")
     is_external = False
 
+    LIMIT = 200
+    LIMIT_PER_HOST = 50
+    WEBHOOK_LIMIT = 100
+    CIRCUIT_FAILURE_THRESHOLD = 5
+    CIRCUIT_RESET_TIMEOUT = 30.0
+
     def __init__(self, **kwargs) -> None:
         """Initialize an `HttpTransport` instance."""
         super().__init__(**kwargs)
         self.client_session: ClientSession = None
         self.connector: TCPConnector = None
+        self.webhook_session: ClientSession = None
+        self.webhook_connector: TCPConnector = None
+        self.circuit_breaker: CircuitBreaker = None
         self.logger = logging.getLogger(__name__)
 
-    async def start(self):
-        """Start the transport."""
-        self.connector = TCPConnector(limit=200, limit_per_host=50)
+    def _create_session(self, connector: TCPConnector, stats_prefix: str):
+        """Create a client session using a connection pool."""
         session_args = {
             "cookie_jar": DummyCookieJar(),
-            "connector": self.connector,
+            "connector": connector,
             "trust_env": True,
         }
         if self.collector:
             session_args["trace_configs"] = [
-                StatsTracer(self.collector, "outbound-http:")
+                StatsTracer(self.collector, stats_prefix, endpoint_stats=True)
             ]
-        self.client_session = ClientSession(**session_args)
+        return ClientSession(**session_args)
+
+    async def start(self):
+        """Start the transport."""
+        settings = self.root_profile.settings if self.root_profile else {}
+        limit_per_host = settings.get(
+            "transport.http.limit_per_host", self.LIMIT_PER_HOST
+        )
+        # webhooks use a separate pool so that a slow controller
+        # does not hold up delivery to other agents
+        self.connector = TCPConnector(limit=self.LIMIT, limit_per_host=limit_per_host)
+        self.client_session = self._create_session(self.connector, "outbound-http:")
+        self.webhook_connector = TCPConnector(
+            limit=self.WEBHOOK_LIMIT, limit_per_host=limit_per_host
+        )
+        self.webhook_session = self._create_session(
+            self.webhook_connector, "outbound-webhook:"
+        )
+        self.circuit_breaker = CircuitBreaker(
+            settings.get(
+                "transport.circuit.failure_threshold", self.CIRCUIT_FAILURE_THRESHOLD
+            ),
+            settings.get("transport.circuit.reset_timeout", self.CIRCUIT_RESET_TIMEOUT),
+        )
         return self
 
     async def stop(self):
         """Stop the transport."""
         await self.client_session.close()
         self.client_session = None
+        await self.webhook_session.close()
+        self.webhook_session = None
 
     async def handle_message(
         self,
@@ -74,16 +113,31 @@ class HttpTransport(BaseOutboundTransport):
                 headers["Content-Type"] = DIDCOMM_V0_MIME_TYPE
         else:
             headers["Content-Type"] = "application/json"
+        origin = endpoint_origin(endpoint)
+        if not self.circuit_breaker.allow(origin):
+            raise OutboundCircuitOpenError(
+                f"Delivery to {origin} suspended after repeated failures"
+            )
+        # webhooks are the only messages queued without a profile
+        session = self.client_session if profile else self.webhook_session
         self.logger.debug(
             "Posting to %s; Data: %s; Headers: %s", endpoint, payload, headers
         )
-        async with self.client_session.post(
-            endpoint, data=payload, headers=headers
-        ) as response:
-            if response.status < 200 or response.status > 299:
-                raise OutboundTransportError(
-                    (
-                        f"Unexpected response status {response.status}, "
-                        f"caused by: {response.reason}"
+        try:
+            async with session.post(
+                endpoint, data=payload, headers=headers
+            ) as response:
+                if response.status >= 500:
+                    self.circuit_breaker.record_failure(origin)
+                else:
+                    self.circuit_breaker.record_success(origin)
+                if response.status < 200 or response.status > 299:
+                    raise OutboundTransportError(
+                        (
+                            f"Unexpected response status {response.status}, "
+                            f"caused by: {response.reason}"
+                        )
                     )
-                )
+        except (ClientError, asyncio.TimeoutError):
+            self.circuit_breaker.record_failure(origin)
+            raise
@@ -1,10 +1,14 @@
 """Outbound transport manager."""
 
 import asyncio
+import heapq
+import itertools
 import json
 import logging
+import random
 import time
 
+from collections import deque
 from typing import Callable, Type
 from urllib.parse import urlparse
 
@@ -20,6 +24,7 @@ from ..wire_format import BaseWireFormat
 
 from .base import (
     BaseOutboundTransport,
+    OutboundCircuitOpenError,
     OutboundDeliveryError,
     OutboundTransportRegistrationError,
     QueuedOutboundMessage,
@@ -34,6 +39,9 @@ class OutboundTransportManager:
     """Outbound transport manager class."""
 
     MAX_RETRY_COUNT = 4
+    RETRY_INTERVAL = 10.0
+    RETRY_BACKOFF = 2.0
+    RETRY_JITTER = 0.1
 
     def __init__(self, profile: Profile, handle_not_delivered: Callable = None):
         """Initialize a `OutboundTransportManager` instance.
@@ -46,9 +54,18 @@ class OutboundTransportManager:
         self.root_profile = profile
         self.loop = asyncio.get_event_loop()
         self.handle_not_delivered = handle_not_delivered
-        self.outbound_buffer = []
         self.outbound_event = asyncio.Event()
+        # messages awaiting encoding
         self.outbound_new = []
+        # encoded messages awaiting delivery
+        self.outbound_ready = deque()
+        # heap of (retry_at, sequence, message) for failed deliveries
+        self.outbound_retry = []
+        self.outbound_encoding = set()
+        self.outbound_delivering = set()
+        # completed messages awaiting error reporting
+        self.outbound_failed = deque()
+        self._retry_seq = itertools.count()
         self.registered_schemes = {}
         self.registered_transports = {}
         self.running_transports = {}
@@ -58,6 +75,16 @@ class OutboundTransportManager:
             self.MAX_RETRY_COUNT = self.root_profile.settings[
                 "transport.max_outbound_retry"
             ]
+        settings = self.root_profile.settings
+        self.retry_interval = settings.get(
+            "transport.outbound_retry_interval", self.RETRY_INTERVAL
+        )
+        self.retry_backoff = settings.get(
+            "transport.outbound_retry_backoff", self.RETRY_BACKOFF
+        )
+        self.retry_jitter = settings.get(
+            "transport.outbound_retry_jitter", self.RETRY_JITTER
+        )
 
     async def setup(self):
         """Perform setup operations."""
@@ -316,7 +343,7 @@ class OutboundTransportManager:
         """
         if self._process_task and not self._process_task.done():
             self.outbound_event.set()
-        elif self.outbound_new or self.outbound_buffer:
+        elif self.queued_count:
             self._process_task = self.loop.create_task(self._process_loop())
             self._process_task.add_done_callback(lambda task: self._process_done(task))
         return self._process_task
@@ -331,6 +358,36 @@ class OutboundTransportManager:
         if self._process_task and self._process_task.done():
             self._process_task = None
 
+    @property
+    def queued_count(self) -> int:
+        """Get the number of messages which have not completed processing."""
+        return (
+            len(self.outbound_new)
+            + len(self.outbound_ready)
+            + len(self.outbound_retry)
+            + len(self.outbound_encoding)
+            + len(self.outbound_delivering)
+            + len(self.outbound_failed)
+        )
+
+    def get_queue_stats(self) -> dict:
+        """Get the number of queued messages in each processing state."""
+        return {
+            "out_encode": len(self.outbound_encoding),
+            "out_deliver": len(self.outbound_delivering),
+            "out_pending": len(self.outbound_new) + len(self.outbound_ready),
+            "out_retry": len(self.outbound_retry),
+        }
+
+    def retry_delay(self, queued: QueuedOutboundMessage) -> float:
+        """Calculate the delay before the next delivery attempt of a message."""
+        delay = self.retry_interval * pow(
+            self.retry_backoff, max(queued.failed_attempts - 1, 0)
+        )
+        if self.retry_jitter:
+            delay *= 1 + random.uniform(-self.retry_jitter, self.retry_jitter)
+        return delay
+
     async def _process_loop(self):
         """Continually kick off encoding and delivery on outbound messages."""
         # Note: this method should not call async methods apart from
@@ -338,53 +395,23 @@ class OutboundTransportManager:
 
         while True:
             self.outbound_event.clear()
-            loop_time = get_timer()
-            upd_buffer = []
-            retry_count = 0
-
-            for queued in self.outbound_buffer:
-                if queued.state == QueuedOutboundMessage.STATE_DONE:
-                    if queued.error:
-                        LOGGER.exception(
-                            "Outbound message could not be delivered to %s",
-                            queued.endpoint,
-                            exc_info=queued.error,
-                        )
-                        if self.handle_not_delivered and queued.message:
-                            self.handle_not_delivered(queued.profile, queued.message)
-                    continue  # remove from buffer
-
-                deliver = False
-
-                if queued.state == QueuedOutboundMessage.STATE_PENDING:
-                    deliver = True
-                elif queued.state == QueuedOutboundMessage.STATE_RETRY:
-                    if queued.retry_at < loop_time:
-                        queued.retry_at = None
-                        deliver = True
-                    else:
-                        retry_count += 1
-
-                if deliver:
-                    queued.state = QueuedOutboundMessage.STATE_DELIVER
-                    p_time = trace_event(
-                        self.root_profile.settings,
-                        queued.message if queued.message else queued.payload,
-                        outcome="OutboundTransportManager.DELIVER.START."
-                        + queued.endpoint,
-                    )
-                    self.deliver_queued_message(queued)
-                    trace_event(
-                        self.root_profile.settings,
-                        queued.message if queued.message else queued.payload,
-                        outcome="OutboundTransportManager.DELIVER.END."
-                        + queued.endpoint,
-                        perf_counter=p_time,
-                    )
 
-                upd_buffer.append(queued)
+            while self.outbound_failed:
+                queued = self.outbound_failed.popleft()
+                LOGGER.exception(
+                    "Outbound message could not be delivered to %s",
+                    queued.endpoint,
+                    exc_info=queued.error,
+                )
+                if self.handle_not_delivered and queued.message:
+                    self.handle_not_delivered(queued.profile, queued.message)
+
+            loop_time = get_timer()
+            while self.outbound_retry and self.outbound_retry[0][0] <= loop_time:
+                queued = heapq.heappop(self.outbound_retry)[2]
+                queued.retry_at = None
+                self.outbound_ready.append(queued)
 
-            new_pending = 0
             new_messages = self.outbound_new
             self.outbound_new = []
 
@@ -393,9 +420,10 @@ class OutboundTransportManager:
                     if queued.message and queued.message.enc_payload:
                         queued.payload = queued.message.enc_payload
                         queued.state = QueuedOutboundMessage.STATE_PENDING
-                        new_pending += 1
+                        self.outbound_ready.append(queued)
                     else:
                         queued.state = QueuedOutboundMessage.STATE_ENCODE
+                        self.outbound_encoding.add(queued)
                         p_time = trace_event(
                             self.root_profile.settings,
                             queued.message if queued.message else queued.payload,
@@ -409,19 +437,36 @@ class OutboundTransportManager:
                             perf_counter=p_time,
                         )
                 else:
-                    new_pending += 1
-
-                upd_buffer.append(queued)
+                    self.outbound_ready.append(queued)
+
+            while self.outbound_ready:
+                queued = self.outbound_ready.popleft()
+                queued.state = QueuedOutboundMessage.STATE_DELIVER
+                self.outbound_delivering.add(queued)
+                p_time = trace_event(
+                    self.root_profile.settings,
+                    queued.message if queued.message else queued.payload,
+                    outcome="OutboundTransportManager.DELIVER.START." + queued.endpoint,
+                )
+                self.deliver_queued_message(queued)
+                trace_event(
+                    self.root_profile.settings,
+                    queued.message if queued.message else queued.payload,
+                    outcome="OutboundTransportManager.DELIVER.END." + queued.endpoint,
+                    perf_counter=p_time,
+                )
 
-            self.outbound_buffer = upd_buffer
-            if self.outbound_buffer:
-                if (not new_pending) and (not retry_count):
-                    await self.outbound_event.wait()
-                elif retry_count:
-                    # only retries - yield here so we don't hog resources
-                    await asyncio.sleep(0.05)
-            else:
+            if not self.queued_count:
                 break
+            if self.outbound_retry:
+                # wake up when the next retry is due, or on any queue update
+                timeout = self.outbound_retry[0][0] - get_timer()
+                try:
+                    await asyncio.wait_for(self.outbound_event.wait(), max(timeout, 0))
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                await self.outbound_event.wait()
 
     def encode_queued_message(self, queued: QueuedOutboundMessage) -> asyncio.Task:
         """Kick off encoding of a queued message."""
@@ -451,11 +496,14 @@ class OutboundTransportManager:
 
     def finished_encode(self, queued: QueuedOutboundMessage, completed: CompletedTask):
         """Handle completion of queued message encoding."""
+        self.outbound_encoding.discard(queued)
         if completed.exc_info:
             queued.error = completed.exc_info
             queued.state = QueuedOutboundMessage.STATE_DONE
+            self.outbound_failed.append(queued)
         else:
             queued.state = QueuedOutboundMessage.STATE_PENDING
+            self.outbound_ready.append(queued)
         queued.task = None
         self.process_queued()
 
@@ -476,10 +524,23 @@ class OutboundTransportManager:
 
     def finished_deliver(self, queued: QueuedOutboundMessage, completed: CompletedTask):
         """Handle completion of queued message delivery."""
+        self.outbound_delivering.discard(queued)
         if completed.exc_info:
             queued.error = completed.exc_info
-
-            if queued.retries:
+            queued.failed_attempts += 1
+
+            if isinstance(completed.exc_info, tuple) and isinstance(
+                completed.exc_info[1], OutboundCircuitOpenError
+            ):
+                # the endpoint is failing: report as undelivered without retrying
+                LOGGER.warning(
+                    ">>> Outbound message to %s NOT delivered: %s",
+                    queued.endpoint,
+                    completed.exc_info[1],
+                )
+                queued.state = QueuedOutboundMessage.STATE_DONE
+                self.outbound_failed.append(queued)
+            elif queued.retries:
                 if LOGGER.isEnabledFor(logging.DEBUG):
                     LOGGER.error(
                         (
@@ -502,13 +563,18 @@ class OutboundTransportManager:
                     )
                 queued.retries -= 1
                 queued.state = QueuedOutboundMessage.STATE_RETRY
-                queued.retry_at = time.perf_counter() + 10
+                queued.retry_at = time.perf_counter() + self.retry_delay(queued)
+                heapq.heappush(
+                    self.outbound_retry,
+                    (queued.retry_at, next(self._retry_seq), queued),
+                )
             else:
                 LOGGER.exception(
                     ">>> Outbound message failed to deliver, NOT Re-queued.",
                     exc_info=queued.error,
                 )
                 queued.state = QueuedOutboundMessage.STATE_DONE
+                self.outbound_failed.append(queued)
         else:
             queued.error = None
             queued.state = QueuedOutboundMessage.STATE_DONE
@@ -0,0 +1,50 @@
+from unittest import TestCase, mock
+
+from ..circuit import CircuitBreaker, endpoint_origin
+
+
+class TestCircuitBreaker(TestCase):
+    def test_endpoint_origin(self):
+        assert endpoint_origin("https://example.com:8443/path?q=1") == (
+            "https://example.com:8443"
+        )
+        assert endpoint_origin("http://example.com/topic/x/") == "http://example.com"
+
+    def test_open_close(self):
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+        origin = "http://example.com"
+        with mock.patch.object(CircuitBreaker, "now", return_value=100.0):
+            for _ in range(2):
+                breaker.record_failure(origin)
+            assert breaker.allow(origin)
+            breaker.record_failure(origin)
+            assert breaker.is_open(origin)
+            assert not breaker.allow(origin)
+            assert breaker.allow("http://other.example.com")
+
+        with mock.patch.object(CircuitBreaker, "now", return_value=111.0):
+            # a single trial attempt is allowed after the reset timeout
+            assert breaker.allow(origin)
+            assert not breaker.allow(origin)
+            breaker.record_failure(origin)
+            assert not breaker.allow(origin)
+
+        with mock.patch.object(CircuitBreaker, "now", return_value=122.0):
+            assert breaker.allow(origin)
+            breaker.record_success(origin)
+            assert not breaker.is_open(origin)
+            assert breaker.allow(origin)
+
+    def test_success_resets_failures(self):
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure("a")
+        breaker.record_success("a")
+        breaker.record_failure("a")
+        assert not breaker.is_open("a")
+
+    def test_disabled(self):
+        breaker = CircuitBreaker(failure_threshold=0)
+        for _ in range(10):
+            breaker.record_failure("a")
+        assert breaker.allow("a")
+        assert not breaker.is_open("a")
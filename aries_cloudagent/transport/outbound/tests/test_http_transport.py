@@ -2,7 +2,7 @@ import asyncio
 import pytest
 
 from aiohttp.test_utils import AioHTTPTestCase
-from aiohttp import web
+from aiohttp import ClientError, web
 from aries_cloudagent.tests import mock
 
 from ....core.in_memory import InMemoryProfile
@@ -10,7 +10,7 @@ from ....utils.stats import Collector
 
 from ...wire_format import JsonWireFormat
 
-from ..base import OutboundTransportError
+from ..base import OutboundCircuitOpenError, OutboundTransportError
 from ..http import HttpTransport
 
 
@@ -116,8 +116,56 @@ class TestHttpTransport(AioHTTPTestCase):
             "outbound-http:dns_resolve": 1,
             "outbound-http:connect": 1,
             "outbound-http:POST": 1,
+            f"outbound-http:POST:http://localhost:{self.server.port}": 1,
         }
 
+    async def test_stats_failed(self):
+        transport = HttpTransport()
+        transport.collector = Collector()
+        async with transport:
+            with pytest.raises(ClientError):
+                await transport.handle_message(
+                    self.profile, b"{}", "http://localhost:1/"
+                )
+
+        results = transport.collector.extract()
+        assert results["count"]["outbound-http:failed"] == 1
+        assert results["count"]["outbound-http:failed:http://localhost:1"] == 1
+
+    async def test_webhook_pool(self):
+        server_addr = f"http://localhost:{self.server.port}"
+        transport = HttpTransport()
+        transport.collector = Collector()
+        async with transport:
+            await transport.handle_message(None, "{}", server_addr)
+
+        assert self.message_results == [{}]
+        results = transport.collector.extract()
+        assert results["count"]["outbound-webhook:POST"] == 1
+        assert "outbound-http:POST" not in results["count"]
+
+    async def test_circuit_breaker(self):
+        self.profile.settings["transport.circuit.failure_threshold"] = 2
+        self.profile.settings["transport.circuit.reset_timeout"] = 60
+        transport = HttpTransport(root_profile=self.profile)
+        async with transport:
+            for _ in range(2):
+                with pytest.raises(ClientError):
+                    await transport.handle_message(
+                        self.profile, b"{}", "http://localhost:1/"
+                    )
+
+            with pytest.raises(OutboundCircuitOpenError):
+                await transport.handle_message(
+                    self.profile, b"{}", "http://localhost:1/other"
+                )
+
+            # other endpoints are unaffected
+            await transport.handle_message(
+                self.profile, b"{}", f"http://localhost:{self.server.port}"
+            )
+        assert self.message_results == [{}]
+
     async def test_transport_coverage(self):
         transport = HttpTransport()
         assert transport.wire_format is None
@@ -130,7 +178,7 @@ class TestHttpTransport(AioHTTPTestCase):
             await transport.handle_message(None, None, None)
 
         with mock.patch.object(
-            transport, "client_session", mock.MagicMock()
+            transport, "webhook_session", mock.MagicMock()
         ) as mock_session:
             mock_response = mock.MagicMock(status=404)
             mock_session.post = mock.MagicMock(
@@ -1,3 +1,4 @@
+import asyncio
 import json
 
 from aries_cloudagent.tests import mock
@@ -179,7 +180,7 @@ class TestOutboundTransportManager(IsolatedAsyncioTestCase):
             mgr._process_done(mock_task)
 
     async def test_process_finished_x(self):
-        mock_queued = mock.MagicMock(retries=1)
+        mock_queued = mock.MagicMock(retries=1, failed_attempts=0)
         mock_task = mock.MagicMock(
             exc_info=(KeyError, KeyError("nope"), None),
         )
@@ -202,7 +203,7 @@ class TestOutboundTransportManager(IsolatedAsyncioTestCase):
         profile = InMemoryProfile.test_profile()
         mock_handle_not_delivered = mock.MagicMock()
         mgr = OutboundTransportManager(profile, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        mgr.outbound_retry.append((mock_queued.retry_at, 0, mock_queued))
 
         with mock.patch.object(
             test_module, "trace_event", mock.MagicMock()
@@ -211,6 +212,7 @@ class TestOutboundTransportManager(IsolatedAsyncioTestCase):
             with self.assertRaises(KeyError):  # cover retry logic and bail
                 await mgr._process_loop()
             assert mock_queued.retry_at is None
+            assert not mgr.outbound_retry
 
     async def test_process_loop_retry_later(self):
         mock_queued = mock.MagicMock(
@@ -221,15 +223,80 @@ class TestOutboundTransportManager(IsolatedAsyncioTestCase):
         profile = InMemoryProfile.test_profile()
         mock_handle_not_delivered = mock.MagicMock()
         mgr = OutboundTransportManager(profile, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        mgr.outbound_retry.append((mock_queued.retry_at, 0, mock_queued))
 
         with mock.patch.object(
-            test_module.asyncio, "sleep", mock.CoroutineMock()
-        ) as mock_sleep_x:
-            mock_sleep_x.side_effect = KeyError()
+            test_module.asyncio, "wait_for", mock.CoroutineMock()
+        ) as mock_wait_for:
+            mock_wait_for.side_effect = KeyError()
             with self.assertRaises(KeyError):  # cover retry logic and bail
                 await mgr._process_loop()
             assert mock_queued.retry_at is not None
+            # the loop sleeps until the retry is due rather than polling
+            assert 3500 < mock_wait_for.call_args[0][1] <= 3600
+            mock_wait_for.call_args[0][0].close()
+
+    async def test_process_loop_retry_timer(self):
+        profile = InMemoryProfile.test_profile(
+            {
+                "transport.outbound_retry_interval": 0.01,
+                "transport.outbound_retry_jitter": 0,
+            }
+        )
+        mgr = OutboundTransportManager(profile)
+        transport_cls = mock.MagicMock(schemes=["http"])
+        transport_cls.return_value = mock.MagicMock(
+            schemes=["http"],
+            is_external=False,
+            start=mock.CoroutineMock(),
+            handle_message=mock.CoroutineMock(
+                side_effect=[KeyError(), KeyError(), None]
+            ),
+        )
+        await mgr.start_transport(mgr.register_class(transport_cls, "transport_cls"))
+
+        queued = QueuedOutboundMessage(None, None, None, "transport_cls")
+        queued.endpoint = "http://localhost"
+        queued.payload = "{}"
+        queued.state = QueuedOutboundMessage.STATE_PENDING
+        queued.retries = 4
+        mgr.outbound_new.append(queued)
+        mgr.process_queued()
+        assert mgr.get_queue_stats()["out_pending"] == 1
+
+        await asyncio.wait_for(mgr.flush(), 5)
+        assert transport_cls.return_value.handle_message.await_count == 3
+        assert queued.state == QueuedOutboundMessage.STATE_DONE
+        assert queued.failed_attempts == 2
+        assert queued.error is None
+        assert not mgr.queued_count
+        assert mgr.get_queue_stats() == {
+            "out_encode": 0,
+            "out_deliver": 0,
+            "out_pending": 0,
+            "out_retry": 0,
+        }
+
+    def test_retry_delay(self):
+        profile = InMemoryProfile.test_profile(
+            {
+                "transport.outbound_retry_interval": 5,
+                "transport.outbound_retry_backoff": 3,
+                "transport.outbound_retry_jitter": 0,
+            }
+        )
+        mgr = OutboundTransportManager(profile)
+        queued = QueuedOutboundMessage(None, None, None, None)
+        delays = []
+        for attempts in range(1, 4):
+            queued.failed_attempts = attempts
+            delays.append(mgr.retry_delay(queued))
+        assert delays == [5, 15, 45]
+
+        mgr.retry_jitter = 0.1
+        queued.failed_attempts = 1
+        for _ in range(20):
+            assert 4.5 <= mgr.retry_delay(queued) <= 5.5
 
     async def test_process_loop_new(self):
         profile = InMemoryProfile.test_profile()
@@ -288,18 +355,24 @@ class TestOutboundTransportManager(IsolatedAsyncioTestCase):
         profile = InMemoryProfile.test_profile()
         mock_handle_not_delivered = mock.MagicMock()
         mgr = OutboundTransportManager(profile, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        mgr.outbound_failed.append(mock_queued)
 
         await mgr._process_loop()
+        mock_handle_not_delivered.assert_called_once_with(
+            mock_queued.profile, mock_queued.message
+        )
+        assert not mgr.outbound_failed
 
     async def test_finished_deliver_x_log_debug(self):
-        mock_queued = mock.MagicMock(state=QueuedOutboundMessage.STATE_DONE, retries=1)
+        mock_queued = mock.MagicMock(
+            state=QueuedOutboundMessage.STATE_DONE, retries=1, failed_attempts=0
+        )
         mock_completed_x = mock.MagicMock(exc_info=KeyError("an error occurred"))
 
         profile = InMemoryProfile.test_profile()
         mock_handle_not_delivered = mock.MagicMock()
         mgr = OutboundTransportManager(profile, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        mgr.outbound_delivering.add(mock_queued)
         with mock.patch.object(
             test_module.LOGGER, "exception", mock.MagicMock()
         ) as mock_logger_exception, mock.patch.object(
@@ -311,6 +384,34 @@ class TestOutboundTransportManager(IsolatedAsyncioTestCase):
         ) as mock_process:
             mock_logger_enabled.return_value = True  # cover debug logging
             mgr.finished_deliver(mock_queued, mock_completed_x)
+            assert not mgr.outbound_delivering
+            assert mgr.outbound_retry[0][2] is mock_queued
+
+    async def test_finished_deliver_circuit_open(self):
+        mock_queued = mock.MagicMock(retries=3, failed_attempts=0)
+        mock_completed_x = mock.MagicMock(
+            exc_info=(
+                test_module.OutboundCircuitOpenError,
+                test_module.OutboundCircuitOpenError("suspended"),
+                None,
+            )
+        )
+
+        profile = InMemoryProfile.test_profile()
+        mock_handle_not_delivered = mock.MagicMock()
+        mgr = OutboundTransportManager(profile, mock_handle_not_delivered)
+        mgr.outbound_delivering.add(mock_queued)
+        with mock.patch.object(mgr, "process_queued", mock.MagicMock()):
+            mgr.finished_deliver(mock_queued, mock_completed_x)
+        assert mock_queued.state == QueuedOutboundMessage.STATE_DONE
+        assert mock_queued.retries == 3
+        assert not mgr.outbound_retry
+        assert list(mgr.outbound_failed) == [mock_queued]
+
+        await mgr._process_loop()
+        mock_handle_not_delivered.assert_called_once_with(
+            mock_queued.profile, mock_queued.message
+        )
 
     async def test_should_encode_outbound_message(self):
         base_wire_format = BaseWireFormat()
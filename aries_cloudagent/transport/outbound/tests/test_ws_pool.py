@@ -0,0 +1,141 @@
+import asyncio
+import json
+
+from aiohttp import ClientSession, DummyCookieJar, WSMsgType, web
+from aiohttp.test_utils import AioHTTPTestCase
+
+from ....tests import mock
+from ..ws_pool import WsConnectionPool
+
+
+class TestWsConnectionPool(AioHTTPTestCase):
+    async def setUpAsync(self):
+        self.message_results = []
+        self.sockets = []
+        self.reply = None
+        await super().setUpAsync()
+        self.client_session = ClientSession(cookie_jar=DummyCookieJar())
+
+    async def tearDownAsync(self):
+        await self.client_session.close()
+        await super().tearDownAsync()
+
+    async def receive_message(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.sockets.append(ws)
+
+        async for msg in ws:
+            if msg.type in (WSMsgType.TEXT, WSMsgType.BINARY):
+                data = json.loads(msg.data)
+                self.message_results.append(data)
+                if self.reply and "request" in data:
+                    await ws.send_str(self.reply)
+
+        return ws
+
+    async def get_application(self):
+        app = web.Application()
+        app.add_routes([web.get("/", self.receive_message)])
+        return app
+
+    @property
+    def endpoint(self) -> str:
+        return f"ws://localhost:{self.server.port}"
+
+    async def wait_for_messages(self, count: int):
+        while len(self.message_results) < count:
+            await asyncio.sleep(0.01)
+
+    async def test_reuse_connection(self):
+        pool = WsConnectionPool(self.client_session)
+        await pool.send(self.endpoint, '{"a": 1}')
+        await pool.send(self.endpoint, b'{"a": 2}')
+        await self.wait_for_messages(2)
+        assert self.message_results == [{"a": 1}, {"a": 2}]
+        assert len(self.sockets) == 1
+        assert len(pool.connections(self.endpoint)) == 1
+        await pool.close()
+        assert not pool.connections(self.endpoint)
+
+    async def test_pipeline_max_connections(self):
+        pool = WsConnectionPool(self.client_session, max_connections=2)
+        await asyncio.wait_for(
+            asyncio.gather(
+                *(pool.send(self.endpoint, json.dumps({"n": n})) for n in range(10))
+            ),
+            5.0,
+        )
+        await self.wait_for_messages(10)
+        assert sorted(msg["n"] for msg in self.message_results) == list(range(10))
+        assert len(self.sockets) == 2
+        await pool.close()
+
+    async def test_reconnect(self):
+        pool = WsConnectionPool(self.client_session)
+        await pool.send(self.endpoint, "{}")
+        await self.wait_for_messages(1)
+        await self.sockets[0].close()
+        while pool.connections(self.endpoint):
+            await asyncio.sleep(0.01)
+
+        await pool.send(self.endpoint, "{}")
+        await self.wait_for_messages(2)
+        assert len(self.sockets) == 2
+        await pool.close()
+
+    async def test_connect_failure(self):
+        pool = WsConnectionPool(self.client_session, max_attempts=2, backoff=0.01)
+        with mock.patch.object(
+            pool, "backoff", wraps=pool.backoff
+        ) as mock_backoff, self.assertRaises(Exception):
+            await pool.send(f"{self.endpoint}/missing", "{}")
+        mock_backoff.assert_called_once_with(1)
+        assert not pool.connections(f"{self.endpoint}/missing")
+        await pool.close()
+
+    async def test_backoff(self):
+        pool = WsConnectionPool(self.client_session, backoff=1.0)
+        assert [pool.backoff(attempt) for attempt in (1, 2, 3)] == [1.0, 2.0, 4.0]
+        assert pool.backoff(10) == WsConnectionPool.BACKOFF_MAX
+
+    async def test_evict_idle(self):
+        pool = WsConnectionPool(self.client_session, idle_timeout=30.0)
+        await pool.send(self.endpoint, "{}")
+        conn = pool.connections(self.endpoint)[0]
+
+        with mock.patch.object(
+            WsConnectionPool, "now", return_value=conn.last_used + 10.0
+        ):
+            await pool.evict_idle()
+        assert pool.connections(self.endpoint) == [conn]
+
+        with mock.patch.object(
+            WsConnectionPool, "now", return_value=conn.last_used + 30.0
+        ):
+            await pool.evict_idle()
+        assert not pool.connections(self.endpoint)
+        assert conn.closed
+        await pool.close()
+
+    async def test_receive_returned_message(self):
+        self.reply = '{"reply": true}'
+        session = mock.MagicMock(
+            closed=False,
+            receive=mock.CoroutineMock(),
+            wait_response=mock.CoroutineMock(side_effect=['"response"', None]),
+        )
+        create_session = mock.CoroutineMock(return_value=session)
+        pool = WsConnectionPool(self.client_session, create_session=create_session)
+
+        await pool.send(self.endpoint, '{"request": true}')
+        while not session.receive.called:
+            await asyncio.sleep(0.01)
+        session.receive.assert_called_once_with(self.reply)
+        create_session.assert_called_once_with(client_info={"host": self.endpoint})
+
+        # the direct response is sent back over the socket
+        await self.wait_for_messages(2)
+        assert self.message_results[1] == "response"
+        await pool.close()
+        session.close.assert_called_once()
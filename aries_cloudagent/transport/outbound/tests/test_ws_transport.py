@@ -5,7 +5,10 @@ from aiohttp.test_utils import AioHTTPTestCase
 from aiohttp import web, WSMsgType
 
 from ....core.in_memory import InMemoryProfile
+from ....tests import mock
+from ....transport.inbound.manager import InboundTransportManager
 
+from ..base import OutboundTransportError
 from ..ws import WsTransport
 
 
@@ -52,3 +55,30 @@ class TestWsTransport(AioHTTPTestCase):
             send_message(transport, b"{}", endpoint=server_addr), 5.0
         )
         assert self.message_results == [{}]
+
+    async def test_handle_message_persistent(self):
+        server_addr = f"ws://localhost:{self.server.port}"
+        inbound_manager = mock.MagicMock(
+            InboundTransportManager, create_session=mock.CoroutineMock()
+        )
+        self.profile.context.injector.bind_instance(
+            InboundTransportManager, inbound_manager
+        )
+        self.profile.settings["transport.ws.outbound_max_connections"] = 1
+
+        transport = WsTransport(root_profile=self.profile)
+        async with transport:
+            assert transport.pool.max_connections == 1
+            assert transport.pool.create_session
+            for payload in ("{}", b"{}"):
+                await asyncio.wait_for(
+                    transport.handle_message(self.profile, payload, server_addr), 5.0
+                )
+            assert len(transport.pool.connections(server_addr)) == 1
+
+            with self.assertRaises(OutboundTransportError):
+                await transport.handle_message(self.profile, "{}", None)
+
+        while len(self.message_results) < 2:
+            await asyncio.sleep(0.01)
+        assert self.message_results == [{}, {}]
@@ -1,13 +1,16 @@
 """Websockets outbound transport."""
 
 import logging
+from functools import partial
 from typing import Union
 
 from aiohttp import ClientSession, DummyCookieJar
 
 from ...core.profile import Profile
 
-from .base import BaseOutboundTransport
+from ..inbound.manager import InboundTransportManager
+from .base import BaseOutboundTransport, OutboundTransportError
+from .ws_pool import WsConnectionPool
 
 
 class WsTransport(BaseOutboundTransport):
@@ -19,15 +22,37 @@ class WsTransport(BaseOutboundTransport):
     def __init__(self, **kwargs) -> None:
         """Initialize an `WsTransport` instance."""
         super().__init__(**kwargs)
+        self.client_session: ClientSession = None
+        self.pool: WsConnectionPool = None
         self.logger = logging.getLogger(__name__)
 
     async def start(self):
         """Start the outbound transport."""
+        settings = self.root_profile.settings if self.root_profile else {}
+        inbound_manager = (
+            self.root_profile.inject_or(InboundTransportManager)
+            if self.root_profile
+            else None
+        )
         self.client_session = ClientSession(cookie_jar=DummyCookieJar(), trust_env=True)
+        self.pool = WsConnectionPool(
+            self.client_session,
+            max_connections=settings.get("transport.ws.outbound_max_connections"),
+            idle_timeout=settings.get("transport.ws.outbound_idle_timeout"),
+            heartbeat=settings.get("transport.ws.heartbeat_interval"),
+            # messages returned over the socket are processed as inbound messages
+            create_session=(
+                partial(inbound_manager.create_session, "ws", can_respond=True)
+                if inbound_manager
+                else None
+            ),
+        )
         return self
 
     async def stop(self):
         """Stop the outbound transport."""
+        await self.pool.close()
+        self.pool = None
         await self.client_session.close()
         self.client_session = None
 
@@ -47,9 +72,6 @@ class WsTransport(BaseOutboundTransport):
             endpoint: URI endpoint for delivery
             metadata: Additional metadata associated with the payload
         """
-        # aiohttp should automatically handle websocket sessions
-        async with self.client_session.ws_connect(endpoint, headers=metadata) as ws:
-            if isinstance(payload, bytes):
-                await ws.send_bytes(payload)
-            else:
-                await ws.send_str(payload)
+        if not endpoint:
+            raise OutboundTransportError("No endpoint provided")
+        await self.pool.send(endpoint, payload, metadata)
@@ -0,0 +1,334 @@
+"""Persistent outbound websocket connections."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+from aiohttp import ClientError, ClientSession, ClientWebSocketResponse, WSMsgType
+
+from ...messaging.error import MessageParseError
+from ..error import WireFormatParseError
+from ..inbound.session import InboundSession
+
+LOGGER = logging.getLogger(__name__)
+
+PoolKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class PooledWsConnection:
+    """A websocket connection to an endpoint, shared by outbound messages.
+
+    Queued messages are written to the socket in order without waiting for
+    each other. The socket is opened on demand, and reopened with increasing
+    delays when it cannot be reached or is lost with messages still queued.
+    Messages received on the socket are handed to an inbound session, so that
+    the endpoint can return messages over the same connection.
+    """
+
+    def __init__(self, pool: "WsConnectionPool", endpoint: str, headers: dict = None):
+        """Initialize the connection instance.
+
+        Args:
+            pool: the pool holding the connection
+            endpoint: the websocket endpoint
+            headers: the headers to send when opening the socket
+
+        """
+        self.pool = pool
+        self.endpoint = endpoint
+        self.headers = headers
+        self.ws: ClientWebSocketResponse = None
+        self.closed = False
+        self.last_used = pool.now()
+        self._queue: Deque[Tuple[Union[str, bytes], asyncio.Future]] = deque()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task = None
+        self._receive_task: asyncio.Task = None
+
+    @property
+    def pending(self) -> int:
+        """Accessor for the number of messages waiting to be sent."""
+        return len(self._queue)
+
+    @property
+    def connected(self) -> bool:
+        """Check whether the socket is currently open."""
+        return bool(self.ws and not self.ws.closed)
+
+    def idle_time(self, now: float) -> Optional[float]:
+        """Get the time the connection has spent with no messages to send."""
+        return None if self._queue else now - self.last_used
+
+    def send(self, payload: Union[str, bytes]) -> asyncio.Future:
+        """Queue a message, returning a future resolved once it is written."""
+        if self.closed:
+            raise ConnectionError(f"Connection to {self.endpoint} is closed")
+        future = asyncio.get_event_loop().create_future()
+        self._queue.append((payload, future))
+        self.last_used = self.pool.now()
+        self._wakeup.set()
+        if not self._task:
+            self._task = asyncio.ensure_future(self._run())
+        return future
+
+    async def _run(self):
+        attempts = 0
+        try:
+            while not self.closed:
+                if not self.connected:
+                    if not self._queue:
+                        # nothing to reconnect for
+                        break
+                    try:
+                        await self._connect()
+                        attempts = 0
+                    except (ClientError, asyncio.TimeoutError, OSError) as err:
+                        attempts += 1
+                        if attempts >= self.pool.max_attempts:
+                            LOGGER.warning(
+                                "Unable to open websocket to %s: %s", self.endpoint, err
+                            )
+                            self._fail_queued(err)
+                            break
+                        await asyncio.sleep(self.pool.backoff(attempts))
+                    continue
+
+                if not self._queue:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+
+                payload, future = self._queue[0]
+                if future.done():
+                    self._queue.popleft()
+                    continue
+                try:
+                    if isinstance(payload, bytes):
+                        await self.ws.send_bytes(payload)
+                    else:
+                        await self.ws.send_str(payload)
+                except (ClientError, ConnectionError) as err:
+                    # the message is sent again on a new socket
+                    LOGGER.debug("Websocket to %s lost: %s", self.endpoint, err)
+                    await self.ws.close()
+                    continue
+                self._queue.popleft()
+                self.last_used = self.pool.now()
+                if not future.done():
+                    future.set_result(None)
+        finally:
+            self.closed = True
+            self._fail_queued(ConnectionError(f"Connection to {self.endpoint} closed"))
+            await self._disconnect()
+            self.pool.discard(self)
+
+    async def _connect(self):
+        self.ws = await self.pool.client_session.ws_connect(
+            self.endpoint,
+            headers=self.headers,
+            heartbeat=self.pool.heartbeat,
+            autoping=True,
+        )
+        self._receive_task = asyncio.ensure_future(self._receive(self.ws))
+
+    async def _disconnect(self):
+        if self.ws and not self.ws.closed:
+            await self.ws.close()
+        if self._receive_task and not self._receive_task.done():
+            self._receive_task.cancel()
+        self._receive_task = None
+
+    def _fail_queued(self, err: Exception):
+        while self._queue:
+            _payload, future = self._queue.popleft()
+            if not future.done():
+                future.set_exception(err)
+
+    async def _receive(self, ws: ClientWebSocketResponse):
+        session: InboundSession = None
+        respond: asyncio.Task = None
+        try:
+            async for msg in ws:
+                if msg.type in (WSMsgType.TEXT, WSMsgType.BINARY):
+                    if not session:
+                        session = await self.pool.open_session(self.endpoint)
+                        if session:
+                            respond = asyncio.ensure_future(self._respond(session))
+                    if not session:
+                        LOGGER.warning(
+                            "Discarding message received on websocket to %s",
+                            self.endpoint,
+                        )
+                        continue
+                    try:
+                        await session.receive(msg.data)
+                    except (MessageParseError, WireFormatParseError):
+                        LOGGER.warning(
+                            "Unable to parse message received on websocket to %s",
+                            self.endpoint,
+                        )
+                elif msg.type == WSMsgType.ERROR:
+                    LOGGER.error(
+                        "Websocket to %s closed with exception: %s",
+                        self.endpoint,
+                        ws.exception(),
+                    )
+        finally:
+            if respond:
+                respond.cancel()
+            if session:
+                session.close()
+            # let the sender notice the closed socket
+            self._wakeup.set()
+
+    async def _respond(self, session: InboundSession):
+        while not session.closed:
+            response = await session.wait_response()
+            if response is None:
+                break
+            try:
+                await self.send(response)
+            except ConnectionError:
+                break
+            session.clear_response()
+
+    async def close(self):
+        """Close the connection, failing any queued messages."""
+        self.closed = True
+        self._wakeup.set()
+        if self._task:
+            await asyncio.wait([self._task])
+        else:
+            await self._disconnect()
+            self.pool.discard(self)
+
+
+class WsConnectionPool:
+    """Pool of persistent outbound websocket connections, keyed by endpoint.
+
+    A message is queued on the least busy connection to its endpoint. Another
+    connection is opened only when every existing one has messages waiting,
+    up to `max_connections` per endpoint. Connections with nothing to send for
+    `idle_timeout` seconds are closed.
+    """
+
+    MAX_CONNECTIONS = 4
+    IDLE_TIMEOUT = 60.0
+    MAX_ATTEMPTS = 3
+    BACKOFF = 0.5
+    BACKOFF_MAX = 10.0
+
+    def __init__(
+        self,
+        client_session: ClientSession,
+        *,
+        max_connections: int = None,
+        idle_timeout: float = None,
+        heartbeat: float = None,
+        max_attempts: int = None,
+        backoff: float = None,
+        create_session: Callable[..., Awaitable[InboundSession]] = None,
+    ):
+        """Initialize the connection pool instance.
+
+        Args:
+            client_session: the client session used to open sockets
+            max_connections: the maximum number of connections per endpoint
+            idle_timeout: the number of seconds before an idle connection closes
+            heartbeat: the interval in seconds between pings on open sockets
+            max_attempts: the number of attempts to open a socket before failing
+                the queued messages
+            backoff: the delay in seconds before the first reconnection attempt,
+                doubling with each further attempt
+            create_session: create an inbound session for received messages
+
+        """
+        self.client_session = client_session
+        self.max_connections = max_connections or self.MAX_CONNECTIONS
+        self.idle_timeout = self.IDLE_TIMEOUT if idle_timeout is None else idle_timeout
+        self.heartbeat = heartbeat
+        self.max_attempts = max_attempts or self.MAX_ATTEMPTS
+        self.backoff_delay = self.BACKOFF if backoff is None else backoff
+        self.create_session = create_session
+        self._connections: Dict[PoolKey, List[PooledWsConnection]] = {}
+        self._evict_task: asyncio.Task = None
+
+    @classmethod
+    def now(cls) -> float:
+        """Fetch a standard timer value."""
+        return time.perf_counter()
+
+    @staticmethod
+    def pool_key(endpoint: str, headers: dict = None) -> PoolKey:
+        """Get the key of the connections for an endpoint and headers."""
+        return endpoint, tuple(sorted((headers or {}).items()))
+
+    def backoff(self, attempts: int) -> float:
+        """Get the delay before reconnecting after a number of failed attempts."""
+        return min(self.backoff_delay * 2 ** (attempts - 1), self.BACKOFF_MAX)
+
+    def connections(
+        self, endpoint: str, headers: dict = None
+    ) -> List[PooledWsConnection]:
+        """Get the open connections for an endpoint."""
+        return list(self._connections.get(self.pool_key(endpoint, headers), ()))
+
+    def acquire(self, endpoint: str, headers: dict = None) -> PooledWsConnection:
+        """Select the connection for the next message to an endpoint."""
+        conns = self._connections.setdefault(self.pool_key(endpoint, headers), [])
+        open_conns = [conn for conn in conns if not conn.closed]
+        conn = min(open_conns, key=lambda conn: conn.pending, default=None)
+        if not conn or (conn.pending and len(open_conns) < self.max_connections):
+            conn = PooledWsConnection(self, endpoint, headers)
+            conns.append(conn)
+        if not self._evict_task and self.idle_timeout:
+            self._evict_task = asyncio.ensure_future(self._evict_loop())
+        return conn
+
+    def discard(self, conn: PooledWsConnection):
+        """Remove a closed connection from the pool."""
+        key = self.pool_key(conn.endpoint, conn.headers)
+        conns = self._connections.get(key)
+        if conns and conn in conns:
+            conns.remove(conn)
+            if not conns:
+                del self._connections[key]
+
+    async def send(
+        self, endpoint: str, payload: Union[str, bytes], headers: dict = None
+    ):
+        """Send a message to an endpoint over a pooled connection."""
+        await self.acquire(endpoint, headers).send(payload)
+
+    async def open_session(self, endpoint: str) -> Optional[InboundSession]:
+        """Open an inbound session for messages received from an endpoint."""
+        if not self.create_session:
+            return None
+        return await self.create_session(client_info={"host": endpoint})
+
+    async def evict_idle(self):
+        """Close the connections which have been idle for too long."""
+        now = self.now()
+        for conns in list(self._connections.values()):
+            for conn in list(conns):
+                idle = conn.idle_time(now)
+                if idle is not None and idle >= self.idle_timeout:
+                    LOGGER.debug("Closing idle websocket to %s", conn.endpoint)
+                    await conn.close()
+
+    async def _evict_loop(self):
+        while True:
+            await asyncio.sleep(self.idle_timeout / 2)
+            await self.evict_idle()
+
+    async def close(self):
+        """Close every connection in the pool."""
+        if self._evict_task:
+            self._evict_task.cancel()
+            self._evict_task = None
+        for conns in list(self._connections.values()):
+            for conn in list(conns):
+                await conn.close()
+        self._connections = {}
@@ -4,6 +4,8 @@ import json
 import logging
 from typing import List, Sequence, Tuple, Union
 
+from marshmallow import ValidationError
+
 from ..core.profile import ProfileSession
 
 from ..protocols.routing.v1_0.messages.forward import Forward
@@ -12,9 +14,9 @@ from ..messaging.util import time_now
 from ..utils.task_queue import TaskQueue
 from ..wallet.base import BaseWallet
 from ..wallet.error import WalletError
-from ..wallet.util import b64_to_str
 
 from .error import WireFormatParseError, WireFormatEncodeError, RecipientKeysError
+from .inbound.envelope import InboundEnvelope
 from .inbound.receipt import MessageReceipt
 from .wire_format import BaseWireFormat
 
@@ -29,16 +31,28 @@ class PackWireFormat(BaseWireFormat):
         super().__init__()
         self.task_queue: TaskQueue = None
 
+    def parse_envelope(self, message_body: Union[str, bytes]) -> InboundEnvelope:
+        """Prepare an incoming message to be shared by the inbound processing steps.
+
+        Args:
+            message_body: The body of the message
+
+        Returns:
+            The envelope for the message, parsed on first use
+
+        """
+        return InboundEnvelope(message_body)
+
     async def parse_message(
         self,
         session: ProfileSession,
-        message_body: Union[str, bytes],
+        message_body: Union[str, bytes, InboundEnvelope],
     ) -> Tuple[dict, MessageReceipt]:
         """Deserialize an incoming message and further populate the request context.
 
         Args:
             session: The profile session for providing wallet access
-            message_body: The body of the message
+            message_body: The body of the message, or its envelope
 
         Returns:
             A tuple of the parsed message and a message receipt instance
@@ -48,28 +62,20 @@ class PackWireFormat(BaseWireFormat):
             WireFormatParseError: If a wallet is required but can't be located
 
         """
-
+        envelope = (
+            message_body
+            if isinstance(message_body, InboundEnvelope)
+            else InboundEnvelope(message_body)
+        )
         receipt = MessageReceipt()
         receipt.in_time = time_now()
-        receipt.raw_message = message_body
-
-        message_dict = None
-        message_json = message_body
+        receipt.raw_message = envelope.raw
 
-        if not message_json:
-            raise WireFormatParseError("Message body is empty")
+        message_dict = envelope.message
 
-        try:
-            message_dict = json.loads(message_json)
-        except ValueError:
-            raise WireFormatParseError("Message JSON parsing failed")
-        if not isinstance(message_dict, dict):
-            raise WireFormatParseError("Message JSON result is not an object")
-
-        # packed messages are detected by the absence of @type
-        if "@type" not in message_dict:
+        if envelope.is_packed:
             try:
-                unpack = self.unpack(session, message_body, receipt)
+                unpack = self.unpack(session, envelope, receipt)
                 message_json = await (
                     self.task_queue and self.task_queue.run(unpack) or unpack
                 )
@@ -103,7 +109,7 @@ class PackWireFormat(BaseWireFormat):
     async def unpack(
         self,
         session: ProfileSession,
-        message_body: Union[str, bytes],
+        message_body: Union[str, bytes, InboundEnvelope],
         receipt: MessageReceipt,
     ):
         """Look up the wallet instance and perform the message unpack."""
@@ -111,6 +117,13 @@ class PackWireFormat(BaseWireFormat):
         if not wallet:
             raise WireFormatParseError("Wallet not defined in profile session")
 
+        if isinstance(message_body, InboundEnvelope):
+            # the wallet works from the already parsed JWE
+            try:
+                message_body = message_body.jwe
+            except ValidationError as e:
+                raise WireFormatParseError("Message unpack failed") from e
+
         try:
             unpacked = await wallet.unpack_message(message_body)
             (
@@ -192,11 +205,13 @@ class PackWireFormat(BaseWireFormat):
                     raise WireFormatEncodeError("Forward message pack failed") from e
         return message
 
-    def get_recipient_keys(self, message_body: Union[str, bytes]) -> List[str]:
+    def get_recipient_keys(
+        self, message_body: Union[str, bytes, InboundEnvelope]
+    ) -> List[str]:
         """Get all recipient keys from a wire message.
 
         Args:
-            message_body: The body of the message
+            message_body: The body of the message, or its envelope
 
         Returns:
             List of recipient keys from the message body
@@ -205,13 +220,13 @@ class PackWireFormat(BaseWireFormat):
             RecipientKeysError: If the recipient keys could not be extracted
 
         """
-
+        envelope = (
+            message_body
+            if isinstance(message_body, InboundEnvelope)
+            else InboundEnvelope(message_body)
+        )
         try:
-            message_dict = json.loads(message_body)
-            protected = json.loads(b64_to_str(message_dict["protected"], urlsafe=True))
-            recipients = protected["recipients"]
-
-            recipient_keys = [recipient["header"]["kid"] for recipient in recipients]
+            recipient_keys = envelope.recipient_keys
         except Exception as e:
             raise RecipientKeysError(
                 "Error trying to extract recipient keys from JWE", e
@@ -2,17 +2,26 @@
 
 import aiohttp
 
-from ..utils.stats import Collector
+from ..utils.stats import Collector, Timer
 
 
 class StatsTracer(aiohttp.TraceConfig):
     """Attach hooks to client session events and report statistics."""
 
-    def __init__(self, collector: Collector, prefix: str):
-        """Initialize the `StatsTracer` instance."""
+    def __init__(self, collector: Collector, prefix: str, endpoint_stats: bool = False):
+        """Initialize the `StatsTracer` instance.
+
+        Args:
+            collector: the stats collector
+            prefix: the prefix for the reported stat names
+            endpoint_stats: also report request latency and failures per
+                endpoint origin
+
+        """
         super().__init__()
         self.collector = collector
         self.prefix = prefix
+        self.endpoint_stats = endpoint_stats
         self.on_request_start.append(self.request_start)
         self.on_connection_queued_start.append(self.connection_queued_start)
         self.on_connection_queued_end.append(self.connection_queued_end)
@@ -24,10 +33,12 @@ class StatsTracer(aiohttp.TraceConfig):
         self.on_connection_reuseconn.append(self.connection_ready)
         self.on_connection_create_end.append(self.connection_ready)
         self.on_request_end.append(self.request_end)
+        self.on_request_exception.append(self.request_exception)
 
     async def request_start(self, session, context, params):
         """Handle the start of a request."""
         context.method, context.url = params.method, params.url
+        context.request_start = Timer.now()
 
     async def connection_queued_start(self, session, context, params):
         """Handle the start of a queued connection."""
@@ -55,8 +66,18 @@ class StatsTracer(aiohttp.TraceConfig):
             context.socket_timer.stop()
         except AttributeError:
             pass
-        context.fetch_timer = self.collector.timer(self.prefix + context.method).start()
+        groups = [self.prefix + context.method]
+        if self.endpoint_stats:
+            groups.append(f"{self.prefix}{context.method}:{context.url.origin()}")
+        context.fetch_timer = self.collector.timer(*groups).start()
 
     async def request_end(self, session, context, params):
         """Handle the end of request."""
         context.fetch_timer.stop()
+
+    async def request_exception(self, session, context, params):
+        """Handle a failed request."""
+        duration = Timer.now() - context.request_start
+        self.collector.log(self.prefix + "failed", duration)
+        if self.endpoint_stats:
+            self.collector.log(f"{self.prefix}failed:{context.url.origin()}", duration)
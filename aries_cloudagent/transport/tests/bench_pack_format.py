@@ -0,0 +1,75 @@
+"""Measure the CPU time spent on each inbound packed message.
+
+Run with `python -m aries_cloudagent.transport.tests.bench_pack_format`.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Mapping
+
+from ...core.in_memory import InMemoryProfile
+from ...wallet.base import BaseWallet
+from ...wallet.did_method import SOV, DIDMethods
+from ...wallet.key_type import ED25519
+from ..pack_format import PackWireFormat
+
+MESSAGE = json.dumps(
+    {
+        "@type": "https://didcomm.org/basicmessage/1.0/message",
+        "@id": "8ac36e4a-6bd7-4d71-8e11-5b2b4b7cbd5a",
+        "~transport": {"return_route": "all"},
+        "content": "Hello",
+    }
+)
+
+
+async def run(iterations: int = 1000, recipients=(1, 5, 20)) -> Mapping[str, float]:
+    """Time relay routing and parsing, in microseconds of CPU per message.
+
+    Each message is processed as by a multitenant agent: the recipient keys are
+    extracted for relay routing, then the message is unpacked and parsed. The
+    "separate" figures pass the raw message to each step, while the "shared"
+    figures parse it once into an envelope.
+    """
+    profile = InMemoryProfile.test_profile(bind={DIDMethods: DIDMethods()})
+    wire_format = PackWireFormat()
+    results = {}
+    async with profile.session() as session:
+        wallet = session.inject(BaseWallet)
+        sender = await wallet.create_local_did(method=SOV, key_type=ED25519)
+        for count in recipients:
+            verkeys = [
+                (await wallet.create_local_did(method=SOV, key_type=ED25519)).verkey
+                for _ in range(count)
+            ]
+            packed = await wallet.pack_message(MESSAGE, verkeys, sender.verkey)
+
+            for label, prepare in (
+                ("separate", lambda raw: raw),
+                ("shared", wire_format.parse_envelope),
+            ):
+                start = time.process_time()
+                for _ in range(iterations):
+                    payload = prepare(packed)
+                    wire_format.get_recipient_keys(payload)
+                    await wire_format.parse_message(session, payload)
+                elapsed = time.process_time() - start
+                results[f"{label}_{count}"] = elapsed / iterations * 1e6
+    return results
+
+
+def main():
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--recipients", type=int, nargs="+", default=[1, 5, 20])
+    args = parser.parse_args()
+    results = asyncio.run(run(args.iterations, args.recipients))
+    for name, usec in results.items():
+        print(f"{name:>12}: {usec:10.1f} us/msg")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ from aries_cloudagent.tests import mock
 from ...core.in_memory import InMemoryProfile
 from ...protocols.didcomm_prefix import DIDCommPrefix
 from ...protocols.routing.v1_0.message_types import FORWARD
+from ...utils.jwe import JweEnvelope
 from ...wallet.base import BaseWallet
 from ...wallet.did_method import SOV, DIDMethods
 from ...wallet.error import WalletError
@@ -170,6 +171,42 @@ class TestPackWireFormat(IsolatedAsyncioTestCase):
             == plain_json
         )
 
+    async def test_parse_envelope(self):
+        local_did = await self.wallet.create_local_did(
+            method=SOV, key_type=ED25519, seed=self.test_seed
+        )
+        serializer = PackWireFormat()
+        packed_json = await serializer.encode_message(
+            self.session,
+            json.dumps(self.test_message),
+            (local_did.verkey,),
+            (),
+            local_did.verkey,
+        )
+
+        # relay routing and unpacking share the parsed envelope
+        envelope = serializer.parse_envelope(packed_json)
+        assert serializer.get_recipient_keys(envelope) == [local_did.verkey]
+        with mock.patch.object(
+            self.wallet, "unpack_message", wraps=self.wallet.unpack_message
+        ) as mock_unpack, mock.patch.object(
+            self.session, "inject_or", return_value=self.wallet
+        ):
+            message_dict, delivery = await serializer.parse_message(
+                self.session, envelope
+            )
+        assert mock_unpack.call_args.args == (envelope.jwe,)
+        assert isinstance(envelope.jwe, JweEnvelope)
+        assert message_dict == self.test_message
+        assert delivery.sender_verkey == local_did.verkey
+        assert delivery.recipient_verkey == local_did.verkey
+
+        # an invalid JWE falls back to the plain message
+        envelope = serializer.parse_envelope(json.dumps({"protected": "e30"}))
+        message_dict, delivery = await serializer.parse_message(self.session, envelope)
+        assert message_dict == {"protected": "e30"}
+        assert delivery.raw_message is envelope.raw
+
     async def test_forward(self):
         local_did = await self.wallet.create_local_did(
             method=SOV, key_type=ED25519, seed=self.test_seed
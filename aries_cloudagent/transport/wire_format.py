@@ -1,6 +1,5 @@
 """Abstract wire format classes."""
 
-import json
 import logging
 
 from abc import abstractmethod
@@ -9,8 +8,8 @@ from typing import List, Sequence, Tuple, Union
 from ..core.profile import ProfileSession
 from ..messaging.util import time_now
 
+from .inbound.envelope import InboundEnvelope
 from .inbound.receipt import MessageReceipt
-from .error import WireFormatParseError
 
 LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +23,23 @@ class BaseWireFormat:
     def __init__(self):
         """Initialize the base wire format instance."""
 
+    def parse_envelope(
+        self, message_body: Union[str, bytes]
+    ) -> Union[str, bytes, InboundEnvelope]:
+        """Prepare an incoming message to be shared by the inbound processing steps.
+
+        The result is passed in place of the message body to `parse_message`
+        and `get_recipient_keys`. By default the message body is used as is.
+
+        Args:
+            message_body: The body of the message
+
+        Returns:
+            The message body, or an envelope parsed once for all the steps
+
+        """
+        return message_body
+
     @abstractmethod
     async def parse_message(
         self,
@@ -89,17 +105,29 @@ class BaseWireFormat:
 class JsonWireFormat(BaseWireFormat):
     """Unencrypted wire format."""
 
+    def parse_envelope(self, message_body: Union[str, bytes]) -> InboundEnvelope:
+        """Prepare an incoming message to be shared by the inbound processing steps.
+
+        Args:
+            message_body: The body of the message
+
+        Returns:
+            The envelope for the message, parsed on first use
+
+        """
+        return InboundEnvelope(message_body)
+
     @abstractmethod
     async def parse_message(
         self,
         session: ProfileSession,
-        message_body: Union[str, bytes],
+        message_body: Union[str, bytes, InboundEnvelope],
     ) -> Tuple[dict, MessageReceipt]:
         """Deserialize an incoming message and further populate the request context.
 
         Args:
             session: The profile session for providing wallet access
-            message_body: The body of the message
+            message_body: The body of the message, or its envelope
 
         Returns:
             A tuple of the parsed message and a message receipt instance
@@ -108,22 +136,16 @@ class JsonWireFormat(BaseWireFormat):
             WireFormatParseError: If the JSON parsing failed
 
         """
+        envelope = (
+            message_body
+            if isinstance(message_body, InboundEnvelope)
+            else InboundEnvelope(message_body)
+        )
         receipt = MessageReceipt()
         receipt.in_time = time_now()
-        receipt.raw_message = message_body
-
-        message_dict = None
-        message_json = message_body
+        receipt.raw_message = envelope.raw
 
-        if not message_json:
-            raise WireFormatParseError("Message body is empty")
-
-        try:
-            message_dict = json.loads(message_json)
-        except ValueError:
-            raise WireFormatParseError("Message JSON parsing failed")
-        if not isinstance(message_dict, dict):
-            raise WireFormatParseError("Message JSON result is not an object")
+        message_dict = envelope.message
 
         # parse thread ID
         thread_dec = message_dict.get("~thread")
@@ -168,11 +190,13 @@ class JsonWireFormat(BaseWireFormat):
         """
         return message_json
 
-    def get_recipient_keys(self, message_body: Union[str, bytes]) -> List[str]:
+    def get_recipient_keys(
+        self, message_body: Union[str, bytes, InboundEnvelope]
+    ) -> List[str]:
         """Get all recipient keys from a wire message.
 
         Args:
-            message_body: The body of the message
+            message_body: The body of the message, or its envelope
 
         Returns:
             List of recipient keys from the message body
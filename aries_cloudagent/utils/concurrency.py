@@ -0,0 +1,54 @@
+"""Utilities for running bounded sets of concurrent operations."""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, Iterable, Optional, TypeVar
+
+DEFAULT_CONCURRENCY = 8
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+async def gather_keyed(
+    fetch: Callable[[K], Awaitable[V]],
+    keys: Iterable[K],
+    *,
+    limit: int = DEFAULT_CONCURRENCY,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> Dict[K, V]:
+    """Run an async operation for each distinct key, with bounded concurrency.
+
+    Args:
+        fetch: The coroutine function to call for each key
+        keys: The keys to fetch, duplicates are fetched once
+        limit: The maximum number of operations in progress at once
+        semaphore: A semaphore to share the limit with other operations, in place
+            of `limit`
+
+    Returns:
+        A dictionary of the results, in the order the keys were given
+
+    Raises:
+        The first exception raised by an operation, after cancelling the rest
+
+    """
+    keys = list(dict.fromkeys(keys))
+    if not keys:
+        return {}
+    if len(keys) == 1 and not semaphore:
+        return {keys[0]: await fetch(keys[0])}
+
+    semaphore = semaphore or asyncio.Semaphore(limit)
+
+    async def bounded(key: K) -> V:
+        async with semaphore:
+            return await fetch(key)
+
+    tasks = [asyncio.ensure_future(bounded(key)) for key in keys]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+    return dict(zip(keys, results))
@@ -0,0 +1,256 @@
+"""Dedicated executor pools for CPU-bound credential cryptography."""
+
+import asyncio
+import copyreg
+import importlib
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Mapping,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from .stats import Collector
+
+if TYPE_CHECKING:  # To avoid circular import error
+    from ..core.profile import Profile
+
+LOGGER = logging.getLogger(__name__)
+
+OP_ISSUE = "issue"
+OP_PROVE = "prove"
+OP_VERIFY = "verify"
+OP_REVOCATION = "revocation"
+OPERATIONS = (OP_ISSUE, OP_PROVE, OP_VERIFY, OP_REVOCATION)
+
+MODE_THREAD = "thread"
+MODE_PROCESS = "process"
+MODES = (MODE_THREAD, MODE_PROCESS)
+
+# library object base classes, by module, which are passed to worker processes
+PICKLED_OBJECT_TYPES = (
+    ("anoncreds.bindings", "AnoncredsObject"),
+    ("indy_credx.bindings", "IndyObject"),
+)
+
+# library error classes, by module, which are raised back from worker processes
+PICKLED_ERROR_TYPES = (
+    ("anoncreds.error", "AnoncredsError"),
+    ("indy_credx.error", "CredxError"),
+)
+
+T = TypeVar("T")
+
+
+def _reduce_library_object(obj):
+    return type(obj).load, (bytes(obj.to_json_buffer()),)
+
+
+def _load_library_error(cls, code, message, extra):
+    return cls(code, message, extra)
+
+
+def _reduce_library_error(err):
+    message = err.args[0] if err.args else ""
+    return _load_library_error, (type(err), err.code, message, err.extra)
+
+
+def register_object_pickling():
+    """Allow the credential library objects to be passed to worker processes.
+
+    Objects allocated by the anoncreds and indy-credx libraries are handles to
+    native memory. They are pickled as their JSON representation and loaded
+    again on the other side. The library errors take the error code as an
+    extra constructor argument, and are pickled with their code, message and
+    extra details.
+    """
+    for module_name, error_name in PICKLED_ERROR_TYPES:
+        try:
+            error_cls = getattr(importlib.import_module(module_name), error_name)
+        except ImportError:
+            continue
+        copyreg.pickle(error_cls, _reduce_library_error)
+    for module_name, base_name in PICKLED_OBJECT_TYPES:
+        try:
+            base = getattr(importlib.import_module(module_name), base_name)
+        except ImportError:
+            continue
+        pending = list(base.__subclasses__())
+        while pending:
+            cls = pending.pop()
+            pending.extend(cls.__subclasses__())
+            if hasattr(cls, "load"):
+                copyreg.pickle(cls, _reduce_library_object)
+
+
+def _portable(value):
+    """Copy buffers which cannot be pickled, such as stored record values."""
+    return bytes(value) if isinstance(value, memoryview) else value
+
+
+class CryptoExecutor:
+    """Run CPU-bound credential operations on dedicated worker pools.
+
+    Each class of operation (issue, prove, verify and revocation) has its own
+    pool, so that a burst of one cannot starve the others or unrelated blocking
+    work. In process mode the pools are worker processes, avoiding contention
+    on the GIL, and the operation and its arguments must be picklable: library
+    objects are passed as JSON, but lambdas and closures are not supported.
+
+    Operations beyond the number of workers wait in a queue. The queue depth,
+    time spent waiting and time spent running are recorded by the collector,
+    if any, and the executor reports itself saturated once a queue reaches the
+    configured limit.
+    """
+
+    def __init__(
+        self,
+        mode: str = MODE_THREAD,
+        *,
+        workers: Union[int, Mapping[str, int]] = None,
+        queue_limit: int = None,
+        collector: Collector = None,
+    ):
+        """Initialize the executor.
+
+        Args:
+            mode: run operations in worker threads or worker processes
+            workers: the number of workers for each operation class, or a
+                mapping of operation class to number of workers
+            queue_limit: the number of waiting operations of any one class at
+                which the executor is saturated
+            collector: an optional collector for queue and timing statistics
+
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unsupported crypto executor mode: {mode}")
+        if not isinstance(workers, Mapping):
+            workers = {op: workers for op in OPERATIONS}
+        default_workers = os.cpu_count() or 1
+        self.mode = mode
+        self.workers = {op: workers.get(op) or default_workers for op in OPERATIONS}
+        self.queue_limit = queue_limit
+        self.collector = collector
+        self._pools: Dict[str, Executor] = {}
+        self._slots: Dict[str, asyncio.Semaphore] = {}
+        self._waiting = {op: 0 for op in OPERATIONS}
+
+    def _pool(self, operation: str) -> Executor:
+        pool = self._pools.get(operation)
+        if not pool:
+            if self.mode == MODE_PROCESS:
+                register_object_pickling()
+                pool = ProcessPoolExecutor(
+                    self.workers[operation],
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=register_object_pickling,
+                )
+            else:
+                pool = ThreadPoolExecutor(
+                    self.workers[operation], thread_name_prefix=f"crypto-{operation}"
+                )
+            self._pools[operation] = pool
+        return pool
+
+    def queue_depth(self, operation: Optional[str] = None) -> int:
+        """Get the number of operations waiting for a worker.
+
+        Args:
+            operation: the operation class, or None for all of them
+
+        """
+        if operation:
+            return self._waiting[operation]
+        return sum(self._waiting.values())
+
+    @property
+    def saturated(self) -> bool:
+        """Check whether any operation class has reached the queue limit."""
+        return bool(self.queue_limit) and any(
+            waiting >= self.queue_limit for waiting in self._waiting.values()
+        )
+
+    async def run(self, operation: str, fn: Callable[..., T], *args: Any) -> T:
+        """Run an operation on the pool for its class.
+
+        Args:
+            operation: the operation class
+            fn: the function to call
+            args: the arguments to pass to the function
+
+        Returns:
+            The result of the function
+
+        """
+        if operation not in self._waiting:
+            raise ValueError(f"Unknown crypto operation class: {operation}")
+        slots = self._slots.get(operation)
+        if not slots:
+            slots = self._slots[operation] = asyncio.Semaphore(self.workers[operation])
+        if self.mode == MODE_PROCESS:
+            args = tuple(_portable(arg) for arg in args)
+
+        collector = (
+            self.collector if self.collector and self.collector.enabled else None
+        )
+        if collector:
+            collector.record(
+                f"CryptoExecutor.queue_depth:{operation}", self._waiting[operation]
+            )
+        self._waiting[operation] += 1
+        try:
+            if collector:
+                with collector.timer(f"CryptoExecutor.wait:{operation}"):
+                    await slots.acquire()
+            else:
+                await slots.acquire()
+        finally:
+            self._waiting[operation] -= 1
+
+        try:
+            loop = asyncio.get_event_loop()
+            call = partial(fn, *args)
+            pool = self._pool(operation)
+            try:
+                if collector:
+                    with collector.timer(f"CryptoExecutor.run:{operation}"):
+                        return await loop.run_in_executor(pool, call)
+                return await loop.run_in_executor(pool, call)
+            except BrokenProcessPool:
+                # a worker died: the pool is replaced for the next operation
+                if self._pools.get(operation) is pool:
+                    del self._pools[operation]
+                    pool.shutdown(wait=False, cancel_futures=True)
+                raise
+        finally:
+            slots.release()
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker pools."""
+        pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+async def run_crypto(
+    profile: Optional["Profile"], operation: str, fn: Callable[..., T], *args: Any
+) -> T:
+    """Run a CPU-bound credential operation for a profile.
+
+    The operation runs on the crypto executor of the profile, falling back to
+    the default executor of the event loop when none is configured.
+    """
+    executor = profile.inject_or(CryptoExecutor) if profile else None
+    if executor:
+        return await executor.run(operation, fn, *args)
+    return await asyncio.get_event_loop().run_in_executor(None, partial(fn, *args))
@@ -3,7 +3,7 @@
 import binascii
 import json
 from collections import OrderedDict
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 from marshmallow import Schema, ValidationError, fields
 
@@ -30,6 +30,19 @@ def from_b64url(value: str) -> bytes:
         raise ValidationError("Error decoding base64 value")
 
 
+def decode_protected(protected_b64: str) -> dict:
+    """Decode the base64-URL protected headers of a JWE envelope."""
+    try:
+        protected = json.loads(from_b64url(protected_b64))
+    except json.JSONDecodeError:
+        raise ValidationError(
+            "Invalid JWE: invalid JSON for protected headers"
+        ) from None
+    if not isinstance(protected, dict):
+        raise ValidationError("Invalid JWE: invalid protected headers")
+    return protected
+
+
 class B64Value(fields.Str):
     """A marshmallow-compatible wrapper for base64-URL values."""
 
@@ -67,6 +80,50 @@ class JweRecipientSchema(Schema):
     header = fields.Dict(required=False, metadata={"many": True})
 
 
+# field name: (value type, required, base64-URL encoded)
+ENVELOPE_FIELDS: Mapping[str, Tuple[type, bool, bool]] = {
+    IDENT_PROTECTED: (str, True, False),
+    "unprotected": (dict, False, False),
+    IDENT_RECIPIENTS: (list, False, False),
+    "ciphertext": (str, True, True),
+    "iv": (str, True, True),
+    "tag": (str, True, True),
+    "aad": (str, False, True),
+    IDENT_HEADER: (dict, False, False),
+    IDENT_ENC_KEY: (str, False, True),
+}
+RECIPIENT_FIELDS: Mapping[str, Tuple[type, bool, bool]] = {
+    IDENT_ENC_KEY: (str, True, True),
+    IDENT_HEADER: (dict, False, False),
+}
+
+
+def load_fields(
+    values: Mapping[str, Any], fields: Mapping[str, Tuple[type, bool, bool]]
+) -> dict:
+    """Validate and decode the fields of a parsed JWE structure.
+
+    This applies the same rules as `JweSchema` and `JweRecipientSchema`, without
+    the overhead of marshmallow for every inbound message.
+    """
+    if not isinstance(values, Mapping):
+        raise ValidationError("Invalid JWE: expected an object")
+    unknown = values.keys() - fields.keys()
+    if unknown:
+        raise ValidationError(f"Invalid JWE: unknown fields {sorted(unknown)}")
+    loaded = {}
+    for name, (value_type, required, encoded) in fields.items():
+        if name not in values:
+            if required:
+                raise ValidationError(f"Invalid JWE: missing field '{name}'")
+            continue
+        value = values[name]
+        if not isinstance(value, value_type):
+            raise ValidationError(f"Invalid JWE: invalid field '{name}'")
+        loaded[name] = from_b64url(value) if encoded else value
+    return loaded
+
+
 class JweRecipient:
     """A single message recipient."""
 
@@ -78,7 +135,7 @@ class JweRecipient:
     @classmethod
     def deserialize(cls, entry: Mapping[str, Any]) -> "JweRecipient":
         """Deserialize a JWE recipient from a mapping."""
-        vals = JweRecipientSchema().load(entry)
+        vals = load_fields(entry, RECIPIENT_FIELDS)
         return cls(**vals)
 
     def serialize(self) -> dict:
@@ -121,24 +178,33 @@ class JweEnvelope:
     def from_json(cls, message: Union[bytes, str]) -> "JweEnvelope":
         """Decode a JWE envelope from a JSON string or bytes value."""
         try:
-            return cls._deserialize(JweSchema().loads(message))
+            return cls.deserialize(json.loads(message))
         except json.JSONDecodeError:
             raise ValidationError("Invalid JWE: not JSON")
 
     @classmethod
-    def deserialize(cls, message: Mapping[str, Any]) -> "JweEnvelope":
-        """Deserialize a JWE envelope from a mapping."""
-        return cls._deserialize(JweSchema().load(message))
+    def deserialize(
+        cls, message: Mapping[str, Any], protected: dict = None
+    ) -> "JweEnvelope":
+        """Deserialize a JWE envelope from a mapping.
+
+        Args:
+            message: the parsed JSON envelope
+            protected: the protected headers, if already decoded
+
+        """
+        return cls._deserialize(load_fields(message, ENVELOPE_FIELDS), protected)
 
     @classmethod
-    def _deserialize(cls, parsed: Mapping[str, Any]) -> "JweEnvelope":
+    def _deserialize(
+        cls, parsed: Mapping[str, Any], protected: dict = None
+    ) -> "JweEnvelope":
         protected_b64 = parsed[IDENT_PROTECTED]
-        try:
-            protected: dict = json.loads(from_b64url(protected_b64))
-        except json.JSONDecodeError:
-            raise ValidationError(
-                "Invalid JWE: invalid JSON for protected headers"
-            ) from None
+        if protected is None:
+            protected = decode_protected(protected_b64)
+        else:
+            # recipients are removed from the headers below
+            protected = protected.copy()
         unprotected = parsed.get("unprotected") or {}
         if protected.keys() & unprotected.keys():
             raise ValidationError("Invalid JWE: duplicate header")
@@ -133,6 +133,11 @@ class Collector:
                     start = time.perf_counter() - duration
                 self._log_file.write(f"{name} {start:.5f} {duration:.5f}\n")
 
+    def record(self, name: str, value: float):
+        """Record a sampled value, such as a queue depth, if the collector is enabled."""
+        if self._enabled:
+            self._stats.log(name, value)
+
     def mark(self, *names):
         """Make a custom decorator function for adding to the set of groups."""
         return lambda fn: self(fn, names)
@@ -0,0 +1,62 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from .. import concurrency as test_module
+
+
+class TestGatherKeyed(IsolatedAsyncioTestCase):
+    async def test_gather(self):
+        calls = []
+        active = []
+        max_active = []
+
+        async def fetch(key):
+            calls.append(key)
+            active.append(key)
+            max_active.append(len(active))
+            await asyncio.sleep(0.01)
+            active.remove(key)
+            return key * 2
+
+        assert await test_module.gather_keyed(fetch, []) == {}
+        assert await test_module.gather_keyed(fetch, [1]) == {1: 2}
+        calls.clear()
+
+        results = await test_module.gather_keyed(fetch, [3, 1, 2, 3, 1], limit=2)
+        assert list(results.items()) == [(3, 6), (1, 2), (2, 4)]
+        assert sorted(calls) == [1, 2, 3]
+        assert max(max_active) == 2
+
+    async def test_gather_shared_semaphore(self):
+        semaphore = asyncio.Semaphore(1)
+        active = []
+
+        async def fetch(key):
+            active.append(key)
+            assert len(active) == 1
+            await asyncio.sleep(0)
+            active.remove(key)
+            return key
+
+        results = await asyncio.gather(
+            test_module.gather_keyed(fetch, ["a", "b"], semaphore=semaphore),
+            test_module.gather_keyed(fetch, ["c"], semaphore=semaphore),
+        )
+        assert results == [{"a": "a", "b": "b"}, {"c": "c"}]
+
+    async def test_gather_x(self):
+        cancelled = []
+
+        async def fetch(key):
+            if key == "fail":
+                raise ValueError(key)
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(key)
+                raise
+
+        with self.assertRaises(ValueError):
+            await test_module.gather_keyed(fetch, ["slow", "fail"])
+        await asyncio.sleep(0)
+        assert cancelled == ["slow"]
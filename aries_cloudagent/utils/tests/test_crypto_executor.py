@@ -0,0 +1,159 @@
+import asyncio
+import os
+import pickle
+import threading
+from concurrent.futures.process import BrokenProcessPool
+from unittest import IsolatedAsyncioTestCase
+
+import pytest
+
+from ...core.in_memory import InMemoryProfile
+from ..crypto_executor import (
+    MODE_PROCESS,
+    OP_ISSUE,
+    OP_PROVE,
+    OP_VERIFY,
+    CryptoExecutor,
+    register_object_pickling,
+    run_crypto,
+)
+from ..stats import Collector
+
+
+def _create_schema(name: str, version: str):
+    from anoncreds import Schema
+
+    return Schema.create(name, version, "did:example:issuer", ["name", "age"])
+
+
+def _load_schema(value: str):
+    from anoncreds import Schema
+
+    return Schema.load(value)
+
+
+def _exit_worker():
+    os._exit(1)
+
+
+class TestCryptoExecutor(IsolatedAsyncioTestCase):
+    async def test_run_thread_pools(self):
+        executor = CryptoExecutor(workers={OP_ISSUE: 2})
+        assert executor.workers[OP_ISSUE] == 2
+        assert executor.workers[OP_VERIFY] >= 1
+
+        issue_thread = await executor.run(
+            OP_ISSUE, lambda: threading.current_thread().name
+        )
+        verify_thread = await executor.run(
+            OP_VERIFY, lambda: threading.current_thread().name
+        )
+        assert issue_thread.startswith("crypto-issue")
+        assert verify_thread.startswith("crypto-verify")
+        assert await executor.run(OP_PROVE, divmod, 7, 2) == (3, 1)
+
+        executor.shutdown()
+        assert not executor._pools
+
+    async def test_run_unknown_operation(self):
+        executor = CryptoExecutor()
+        with self.assertRaises(ValueError):
+            await executor.run("unknown", print)
+        with self.assertRaises(ValueError):
+            CryptoExecutor("fork")
+
+    async def test_queue_saturated(self):
+        collector = Collector()
+        executor = CryptoExecutor(workers=1, queue_limit=2, collector=collector)
+        release = threading.Event()
+
+        tasks = [
+            asyncio.ensure_future(executor.run(OP_ISSUE, release.wait, 5))
+            for _ in range(3)
+        ]
+        while executor.queue_depth(OP_ISSUE) < 2:
+            await asyncio.sleep(0.01)
+        assert executor.queue_depth() == 2
+        assert executor.saturated
+
+        release.set()
+        assert await asyncio.gather(*tasks) == [True] * 3
+        assert executor.queue_depth() == 0
+        assert not executor.saturated
+        executor.shutdown()
+
+        assert {
+            "CryptoExecutor.queue_depth:issue",
+            "CryptoExecutor.wait:issue",
+            "CryptoExecutor.run:issue",
+        } <= set(collector.results["count"])
+        assert collector.results["count"]["CryptoExecutor.run:issue"] == 3
+        # depth on arrival: only the second call is waiting when the third arrives
+        assert collector.results["max"]["CryptoExecutor.queue_depth:issue"] == 1
+
+    async def test_run_crypto(self):
+        assert await run_crypto(None, OP_VERIFY, divmod, 7, 2) == (3, 1)
+
+        profile = InMemoryProfile.test_profile(
+            bind={CryptoExecutor: CryptoExecutor(workers=1)}
+        )
+        assert await run_crypto(profile, OP_VERIFY, divmod, 9, 4) == (2, 1)
+        assert profile.inject(CryptoExecutor)._pools
+        profile.inject(CryptoExecutor).shutdown()
+
+    @pytest.mark.anoncreds
+    async def test_run_process_pool(self):
+        executor = CryptoExecutor(MODE_PROCESS, workers=1)
+        schema = await executor.run(OP_ISSUE, _create_schema, "test", "1.0")
+        executor.shutdown()
+        assert schema.to_dict()["name"] == "test"
+
+    @pytest.mark.anoncreds
+    async def test_run_process_pool_error(self):
+        from anoncreds import AnoncredsError
+
+        executor = CryptoExecutor(MODE_PROCESS, workers=1)
+        try:
+            for _ in range(2):
+                with self.assertRaises(AnoncredsError):
+                    await executor.run(OP_ISSUE, _load_schema, "notjson")
+            schema = await executor.run(OP_ISSUE, _create_schema, "test", "1.0")
+            assert schema.to_dict()["name"] == "test"
+        finally:
+            executor.shutdown()
+
+    async def test_run_process_pool_broken(self):
+        executor = CryptoExecutor(MODE_PROCESS, workers=1)
+        try:
+            with self.assertRaises(BrokenProcessPool):
+                await executor.run(OP_VERIFY, _exit_worker)
+            assert OP_VERIFY not in executor._pools
+            assert await executor.run(OP_VERIFY, divmod, 7, 2) == (3, 1)
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.anoncreds
+    def test_error_pickling(self):
+        from anoncreds import AnoncredsError, AnoncredsErrorCode
+        from indy_credx import CredxError, CredxErrorCode
+
+        register_object_pickling()
+        for err in (
+            AnoncredsError(AnoncredsErrorCode.INPUT, "bad input", "extra"),
+            CredxError(CredxErrorCode.INPUT, "bad input", "extra"),
+        ):
+            loaded = pickle.loads(pickle.dumps(err))
+            assert type(loaded) is type(err)
+            assert (loaded.code, str(loaded), loaded.extra) == (
+                err.code,
+                "bad input",
+                "extra",
+            )
+
+    @pytest.mark.anoncreds
+    def test_object_pickling(self):
+        register_object_pickling()
+        schema = _create_schema("test", "1.0")
+        loaded = pickle.loads(pickle.dumps(schema))
+        assert type(loaded) is type(schema)
+        assert loaded.to_dict() == schema.to_dict()
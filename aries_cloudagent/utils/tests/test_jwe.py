@@ -2,6 +2,8 @@ import json
 
 from unittest import TestCase
 
+from marshmallow import ValidationError
+
 from ..jwe import b64url, JweEnvelope, JweRecipient, from_b64url
 
 IV = b"test nonce"
@@ -156,3 +158,44 @@ class TestJwe(TestCase):
         assert recips[0].header == {"alg": "MyAlg", "abc": "ABC", "def": "DEF"}
         assert recips[1].encrypted_key == ENC_KEY_2
         assert recips[1].header == {"alg": "MyAlg", "abc": "ABC", "ghi": "GHI"}
+
+    def test_envelope_load_invalid(self):
+        message = {
+            "protected": b64url(json.dumps(PARAMS)),
+            "encrypted_key": b64url(ENC_KEY_1),
+            "iv": b64url(IV),
+            "ciphertext": b64url(CIPHERTEXT),
+            "tag": b64url(TAG),
+        }
+        assert JweEnvelope.deserialize(message).protected == PARAMS
+        assert JweEnvelope.from_json(json.dumps(message)).protected == PARAMS
+
+        for invalid in (
+            [],
+            {**message, "other": "value"},
+            {k: v for k, v in message.items() if k != "tag"},
+            {**message, "iv": 1},
+            {**message, "protected": b64url("[]")},
+            {**message, "encrypted_key": None},
+        ):
+            with self.assertRaises(ValidationError):
+                JweEnvelope.deserialize(invalid)
+        with self.assertRaises(ValidationError):
+            JweEnvelope.from_json("{...")
+        with self.assertRaises(ValidationError):
+            JweRecipient.deserialize({"header": {}})
+
+    def test_envelope_load_decoded_protected(self):
+        protected = dict(PARAMS, recipients=[{"encrypted_key": b64url(ENC_KEY_1)}])
+        message = {
+            "protected": b64url(json.dumps(protected)),
+            "iv": b64url(IV),
+            "ciphertext": b64url(CIPHERTEXT),
+            "tag": b64url(TAG),
+        }
+        loaded = JweEnvelope.deserialize(message, protected)
+        assert loaded.protected == PARAMS
+        assert loaded.with_protected_recipients
+        assert [recip.encrypted_key for recip in loaded.recipients] == [ENC_KEY_1]
+        # the decoded headers passed in are not modified
+        assert "recipients" in protected
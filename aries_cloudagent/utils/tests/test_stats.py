@@ -97,3 +97,14 @@ class TestStats(IsolatedAsyncioTestCase):
 
         stats.reset()
         assert not stats.results["avg"]
+
+    async def test_record(self):
+        stats = Collector()
+        stats.record("depth", 2)
+        stats.record("depth", 4)
+        assert stats.results["count"] == {"depth": 2}
+        assert stats.results["max"] == {"depth": 4}
+
+        stats.enabled = False
+        stats.record("depth", 8)
+        assert stats.results["count"] == {"depth": 2}
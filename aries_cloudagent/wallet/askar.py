@@ -16,13 +16,14 @@ from aries_askar import (
 )
 
 from .did_parameters_validation import DIDParametersValidation
-from ..askar.didcomm.v1 import pack_message, unpack_message
+from ..askar.didcomm.v1 import fetch_key, pack_message, unpack_message
 from ..askar.profile import AskarProfileSession
 from ..ledger.base import BaseLedger
 from ..ledger.endpoint_type import EndpointType
 from ..ledger.error import LedgerConfigError
 from ..storage.askar import AskarStorage
 from ..storage.base import StorageRecord, StorageDuplicateError, StorageNotFoundError
+from ..utils.jwe import JweEnvelope
 
 from .base import BaseWallet, KeyInfo, DIDInfo
 from .crypto import (
@@ -720,25 +721,27 @@ class AskarWallet(BaseWallet):
         """
         if message is None:
             raise WalletError("Message not provided")
+        key_cache = self._session.profile.key_cache
         try:
             if from_verkey:
-                from_key_entry = await self._session.handle.fetch_key(from_verkey)
-                if not from_key_entry:
+                from_key = await fetch_key(self._session.handle, from_verkey, key_cache)
+                if not from_key:
                     raise WalletNotFoundError("Missing key for pack operation")
-                from_key = from_key_entry.key
             else:
                 from_key = None
             return await asyncio.get_event_loop().run_in_executor(
-                None, pack_message, to_verkeys, from_key, message
+                None, pack_message, to_verkeys, from_key, message, key_cache
             )
         except AskarError as err:
             raise WalletError("Exception when packing message") from err
 
-    async def unpack_message(self, enc_message: bytes) -> Tuple[str, str, str]:
+    async def unpack_message(
+        self, enc_message: Union[bytes, JweEnvelope]
+    ) -> Tuple[str, str, str]:
         """Unpack a message.
 
         Args:
-            enc_message: The packed message bytes
+            enc_message: The packed message bytes, or its already parsed envelope
 
         Returns:
             A tuple: (message, from_verkey, to_verkey)
@@ -755,7 +758,9 @@ class AskarWallet(BaseWallet):
                 unpacked_json,
                 recipient,
                 sender,
-            ) = await unpack_message(self._session.handle, enc_message)
+            ) = await unpack_message(
+                self._session.handle, enc_message, self._session.profile.key_cache
+            )
         except AskarError as err:
             raise WalletError("Exception when unpacking message") from err
         return unpacked_json.decode("utf-8"), sender, recipient
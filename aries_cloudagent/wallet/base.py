@@ -5,6 +5,7 @@ from typing import List, Optional, Sequence, Tuple, Union
 
 from ..ledger.base import BaseLedger
 from ..ledger.endpoint_type import EndpointType
+from ..utils.jwe import JweEnvelope
 from .did_info import DIDInfo, KeyInfo
 from .did_method import SOV, DIDMethod
 from .error import WalletError
@@ -328,11 +329,13 @@ class BaseWallet(ABC):
         """
 
     @abstractmethod
-    async def unpack_message(self, enc_message: bytes) -> Tuple[str, str, str]:
+    async def unpack_message(
+        self, enc_message: Union[bytes, JweEnvelope]
+    ) -> Tuple[str, str, str]:
         """Unpack a message.
 
         Args:
-            enc_message: The encrypted message
+            enc_message: The encrypted message, or its already parsed envelope
 
         Returns:
             A tuple: (message, from_verkey, to_verkey)
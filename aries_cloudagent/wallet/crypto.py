@@ -367,7 +367,7 @@ def encode_pack_message(
 
 
 def decode_pack_message(
-    enc_message: bytes, find_key: Callable
+    enc_message: Union[bytes, JweEnvelope], find_key: Callable
 ) -> Tuple[str, Optional[str], str]:
     """Decode a packed message.
 
@@ -376,7 +376,7 @@ def decode_pack_message(
     recipient.
 
     Args:
-        enc_message: The encrypted message
+        enc_message: The encrypted message, or its parsed envelope
         find_key: Function to retrieve private key
 
     Returns:
@@ -408,20 +408,25 @@ def decode_pack_message(
     return message, sender_vk, recip_vk
 
 
-def decode_pack_message_outer(enc_message: bytes) -> Tuple[dict, dict, bool]:
+def decode_pack_message_outer(
+    enc_message: Union[bytes, JweEnvelope]
+) -> Tuple[dict, dict, bool]:
     """Decode the outer wrapper of a packed message and extract the recipients.
 
     Args:
-        enc_message: The encrypted message
+        enc_message: The encrypted message, or its parsed envelope
 
     Returns: a tuple of the decoded wrapper, recipients, and authcrypt flag
 
     """
-    try:
-        wrapper = JweEnvelope.from_json(enc_message)
-    except ValidationError as err:
-        print(err)
-        raise ValueError("Invalid packed message")
+    if isinstance(enc_message, JweEnvelope):
+        wrapper = enc_message
+    else:
+        try:
+            wrapper = JweEnvelope.from_json(enc_message)
+        except ValidationError as err:
+            print(err)
+            raise ValueError("Invalid packed message")
 
     alg = wrapper.protected.get("alg")
     is_authcrypt = alg == "Authcrypt"
@@ -5,6 +5,7 @@ from typing import List, Optional, Sequence, Tuple, Union
 
 from .did_parameters_validation import DIDParametersValidation
 from ..core.in_memory import InMemoryProfile
+from ..utils.jwe import JweEnvelope
 
 from .base import BaseWallet
 from .crypto import (
@@ -524,11 +525,13 @@ class InMemoryWallet(BaseWallet):
         )
         return result
 
-    async def unpack_message(self, enc_message: bytes) -> Tuple[str, str, str]:
+    async def unpack_message(
+        self, enc_message: Union[bytes, JweEnvelope]
+    ) -> Tuple[str, str, str]:
         """Unpack a message.
 
         Args:
-            enc_message: The packed message bytes
+            enc_message: The packed message bytes, or its already parsed envelope
 
         Returns:
             A tuple: (message, from_verkey, to_verkey)
@@ -21,6 +21,7 @@ from ..ledger.error import LedgerConfigError
 from ..storage.indy import IndySdkStorage
 from ..storage.error import StorageDuplicateError, StorageNotFoundError
 from ..storage.record import StorageRecord
+from ..utils.jwe import JweEnvelope
 
 from .base import BaseWallet
 from .crypto import (
@@ -919,11 +920,13 @@ class IndySdkWallet(BaseWallet):
 
         return result
 
-    async def unpack_message(self, enc_message: bytes) -> Tuple[str, str, str]:
+    async def unpack_message(
+        self, enc_message: Union[bytes, JweEnvelope]
+    ) -> Tuple[str, str, str]:
         """Unpack a message.
 
         Args:
-            enc_message: The packed message bytes
+            enc_message: The packed message bytes, or its already parsed envelope
 
         Returns:
             A tuple: (message, from_verkey, to_verkey)
@@ -935,6 +938,8 @@ class IndySdkWallet(BaseWallet):
         """
         if not enc_message:
             raise WalletError("Message not provided")
+        if isinstance(enc_message, JweEnvelope):
+            enc_message = enc_message.to_json().encode("utf-8")
         try:
             unpacked_json = await indy.crypto.unpack_message(
                 self.opened.handle, enc_message